@@ -1,16 +1,36 @@
+import threading as _threading
+
 def parse_coordinates(coordinates):
-    # Convert DMS coordinates to decimal degrees
-    latitudes, longitudes = [], []
-    for lat_str, lon_str in coordinates:
-        lat_deg = round(float(lat_str[:2]) + float(lat_str[2:4]) / 60, 5)
-        lon_deg = round(float(lon_str[:3]) + float(lon_str[3:5]) / 60, 5)
-        if lat_str.endswith('S'):
-            lat_deg *= -1
-        if lon_str.endswith('W'):
-            lon_deg *= -1
-        latitudes.append(lat_deg)
-        longitudes.append(lon_deg)
-    return latitudes, longitudes
+    """Converts DMS coordinates to decimal degrees; see coordinates.parse_coordinates (imported on first use, with numpy)."""
+    from coordinates import parse_coordinates
+    return parse_coordinates(coordinates)
+
+# FIR, sector and waypoint tables are declared as builder functions and only built on
+# first access through the module-level __getattr__ (PEP 562), so importing this module
+# for STARs/SIDs or a runway does not materialise every neighbouring FIR polygon.
+_dataset_builders = {}
+_dataset_lock = _threading.RLock()     # builders may load other datasets
+
+def _dataset(builder):
+    """Registers a lazily built dataset under the builder's name without its leading underscore."""
+    _dataset_builders[builder.__name__.lstrip('_')] = builder
+    return builder
+
+def _load(name):
+    """Returns a dataset, building and caching it in the module namespace on first access (once, across threads)."""
+    if name not in globals():
+        with _dataset_lock:
+            if name not in globals():
+                globals()[name] = _dataset_builders[name]()
+    return globals()[name]
+
+def __getattr__(name):
+    if name not in _dataset_builders:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _load(name)
+
+def __dir__():
+    return sorted(set(globals()) | set(_dataset_builders))
 
 def round_latlon(latitude, longitude):
     # round the latitude, longitude coordinate to 5 decimal places
@@ -29,5122 +49,5150 @@ WSSS_coordinates = [('012133N', '1035922E')]
 
 #region FIRs
 #region Singapore FIR - WSJC
-SG_FIR_coordinates = [
-    ('082500N', '1163000E'), 
-    ('025050N', '1091629E'), 
-    ('045700N', '1081619E'), 
-    ('050012N', '1080132E'), 
-    ('045904N', '1075525E'), 
-    ('045203N', '1074625E'), 
-    ('043820N', '1073315E'), 
-    ('041312N', '1071743E'), 
-    ('033045N', '1055130E'), 
-    ('031727N', '1052959E'), 
-    ('031453N', '1052619E'), 
-    ('025010N', '1051210E'), 
-    ('024348N', '1050854E'), 
-    ('023641N', '1051311E'),
-    ('022710N', '1051753E'),       # SG - KL merge point
-    ('021838N', '1052205E'), 
-    ('011947N', '1044606E'), 
-    ('012921N', '1043441E'), 
-    ('011800N', '1043000E'), 
-    ('011500N', '1040000E'), 
-    ('010800N', '1034500E'), 
-    ('011046N', '1034015E'), 
-    ('011200N', '1033900E'), 
-    ('011408N', '1033142E'), 
+@_dataset
+def _SG_FIR_coordinates():
+    return [
+        ('082500N', '1163000E'), 
+        ('025050N', '1091629E'), 
+        ('045700N', '1081619E'), 
+        ('050012N', '1080132E'), 
+        ('045904N', '1075525E'), 
+        ('045203N', '1074625E'), 
+        ('043820N', '1073315E'), 
+        ('041312N', '1071743E'), 
+        ('033045N', '1055130E'), 
+        ('031727N', '1052959E'), 
+        ('031453N', '1052619E'), 
+        ('025010N', '1051210E'), 
+        ('024348N', '1050854E'), 
+        ('023641N', '1051311E'),
+        ('022710N', '1051753E'),       # SG - KL merge point
+        ('021838N', '1052205E'), 
+        ('011947N', '1044606E'), 
+        ('012921N', '1043441E'), 
+        ('011800N', '1043000E'), 
+        ('011500N', '1040000E'), 
+        ('010800N', '1034500E'), 
+        ('011046N', '1034015E'), 
+        ('011200N', '1033900E'), 
+        ('011408N', '1033142E'), 
     
-    ('011650N', '1033610E'),    # SG - MY boundary
-    ('011917N', '1033659E'),    # SG - MY boundary
-    ('012102N', '1033800E'),    # SG - MY boundary
-    ('012121N', '1033807E'),    # SG - MY boundary
-    ('012227N', '1033847E'),    # SG - MY boundary
-    ('012251N', '1033855E'),    # SG - MY boundary
-    ('012251N', '1033855E'),    # SG - MY boundary
-    ('012320N', '1033910E'),    # SG - MY boundary
-    ('012402N', '1033923E'),    # SG - MY boundary
-    ('012402N', '1033923E'),    # SG - MY boundary
-    ('012458N', '1034006E'),    # SG - MY boundary
-    ('012542N', '1034022E'),    # SG - MY boundary
-    ('012614N', '1034055E'),    # SG - MY boundary
-    ('012627N', '1034134E'),    # SG - MY boundary
-    ('012640N', '1034152E'),    # SG - MY boundary
-    ('012702N', '1034211E'),    # SG - MY boundary
-    ('012728N', '1034248E'),    # SG - MY boundary
-    ('012730N', '1034325E'),    # SG - MY boundary
-    ('012721N', '1034336E'),    # SG - MY boundary
-    ('012704N', '1034415E'),    # SG - MY boundary
-    ('012647N', '1034442E'),    # SG - MY boundary
-    ('012642N', '1034504E'),    # SG - MY boundary
-    ('012642N', '1034504E'),    # SG - MY boundary
-    ('012644N', '1034516E'),    # SG - MY boundary
-    ('012709N', '1034609E'),    # SG - MY boundary
-    ('012732N', '1034652E'),    # SG - MY boundary
-    ('012757N', '1034727E'),    # SG - MY boundary
-    ('012834N', '1034812E'),    # SG - MY boundary
-    ('012843N', '1034846E'),    # SG - MY boundary
-    ('012835N', '1034923E'),    # SG - MY boundary
-    ('012835N', '1034923E'),    # SG - MY boundary
-    ('012816N', '1035020E'),    # SG - MY boundary
-    ('012755N', '1035113E'),    # SG - MY boundary
-    ('012733N', '1035152E'),    # SG - MY boundary
-    ('012719N', '1035208E'),    # SG - MY boundary
-    ('012649N', '1035236E'),    # SG - MY boundary
-    ('012606N', '1035310E'),    # SG - MY boundary
-    ('012542N', '1035353E'),    # SG - MY boundary
-    ('012540N', '1035407E'),    # SG - MY boundary
-    ('012538N', '1035511E'),    # SG - MY boundary
-    ('012549N', '1035601E'),    # SG - MY boundary
-    ('012549N', '1035616E'),    # SG - MY boundary
-    ('012541N', '1035631E'),    # SG - MY boundary
-    ('012541N', '1035631E'),    # SG - MY boundary
-    ('012536N', '1035645E'),    # SG - MY boundary
-    ('012527N', '1035726E'),    # SG - MY boundary
-    ('012527N', '1035739E'),    # SG - MY boundary
-    ('012520N', '1035759E'),    # SG - MY boundary
-    ('012520N', '1035821E'),    # SG - MY boundary
-    ('012527N', '1035847E'),    # SG - MY boundary
-    ('012529N', '1035911E'),    # SG - MY boundary
-    ('012529N', '1035911E'),    # SG - MY boundary
-    ('012529N', '1035935E'),    # SG - MY boundary
-    ('012529N', '1035935E'),    # SG - MY boundary
-    ('012539N', '1040000E'),    # SG - MY boundary
-    ('012631N', '1040119E'),    # SG - MY boundary
-    ('012647N', '1040226E'),    # SG - MY boundary
-    ('012630N', '1040312E'),    # SG - MY boundary
-    ('012619N', '1040342E'),    # SG - MY boundary
-    ('012608N', '1040417E'),    # SG - MY boundary
-    ('012608N', '1040417E'),    # SG - MY boundary
-    ('012552N', '1040440E'),    # SG - MY boundary
-    ('012503N', '1040521E'),    # SG - MY boundary
-    ('012444N', '1040530E'),    # SG - MY boundary
-    ('012422N', '1040534E'),    # SG - MY boundary
-    ('012422N', '1040535E'),    # SG - MY boundary
-    ('012403N', '1040536E'),    # SG - MY boundary
-    ('012336N', '1040534E'),    # SG - MY boundary
-    ('012336N', '1040534E'),    # SG - MY boundary
-    ('012259N', '1040522E'),    # SG - MY boundary
-    ('012208N', '1040502E'),    # SG - MY boundary
-    ('012127N', '1040453E'),    # SG - MY boundary
-    ('012003N', '1040536E'),    # SG - MY boundary
-    ('012003N', '1040536E'),    # SG - MY boundary
-    ('012000N', '1040600E'),    # SG - MY boundary
-    ('012000N', '1042000E'),    # SG - MY boundary
+        ('011650N', '1033610E'),    # SG - MY boundary
+        ('011917N', '1033659E'),    # SG - MY boundary
+        ('012102N', '1033800E'),    # SG - MY boundary
+        ('012121N', '1033807E'),    # SG - MY boundary
+        ('012227N', '1033847E'),    # SG - MY boundary
+        ('012251N', '1033855E'),    # SG - MY boundary
+        ('012251N', '1033855E'),    # SG - MY boundary
+        ('012320N', '1033910E'),    # SG - MY boundary
+        ('012402N', '1033923E'),    # SG - MY boundary
+        ('012402N', '1033923E'),    # SG - MY boundary
+        ('012458N', '1034006E'),    # SG - MY boundary
+        ('012542N', '1034022E'),    # SG - MY boundary
+        ('012614N', '1034055E'),    # SG - MY boundary
+        ('012627N', '1034134E'),    # SG - MY boundary
+        ('012640N', '1034152E'),    # SG - MY boundary
+        ('012702N', '1034211E'),    # SG - MY boundary
+        ('012728N', '1034248E'),    # SG - MY boundary
+        ('012730N', '1034325E'),    # SG - MY boundary
+        ('012721N', '1034336E'),    # SG - MY boundary
+        ('012704N', '1034415E'),    # SG - MY boundary
+        ('012647N', '1034442E'),    # SG - MY boundary
+        ('012642N', '1034504E'),    # SG - MY boundary
+        ('012642N', '1034504E'),    # SG - MY boundary
+        ('012644N', '1034516E'),    # SG - MY boundary
+        ('012709N', '1034609E'),    # SG - MY boundary
+        ('012732N', '1034652E'),    # SG - MY boundary
+        ('012757N', '1034727E'),    # SG - MY boundary
+        ('012834N', '1034812E'),    # SG - MY boundary
+        ('012843N', '1034846E'),    # SG - MY boundary
+        ('012835N', '1034923E'),    # SG - MY boundary
+        ('012835N', '1034923E'),    # SG - MY boundary
+        ('012816N', '1035020E'),    # SG - MY boundary
+        ('012755N', '1035113E'),    # SG - MY boundary
+        ('012733N', '1035152E'),    # SG - MY boundary
+        ('012719N', '1035208E'),    # SG - MY boundary
+        ('012649N', '1035236E'),    # SG - MY boundary
+        ('012606N', '1035310E'),    # SG - MY boundary
+        ('012542N', '1035353E'),    # SG - MY boundary
+        ('012540N', '1035407E'),    # SG - MY boundary
+        ('012538N', '1035511E'),    # SG - MY boundary
+        ('012549N', '1035601E'),    # SG - MY boundary
+        ('012549N', '1035616E'),    # SG - MY boundary
+        ('012541N', '1035631E'),    # SG - MY boundary
+        ('012541N', '1035631E'),    # SG - MY boundary
+        ('012536N', '1035645E'),    # SG - MY boundary
+        ('012527N', '1035726E'),    # SG - MY boundary
+        ('012527N', '1035739E'),    # SG - MY boundary
+        ('012520N', '1035759E'),    # SG - MY boundary
+        ('012520N', '1035821E'),    # SG - MY boundary
+        ('012527N', '1035847E'),    # SG - MY boundary
+        ('012529N', '1035911E'),    # SG - MY boundary
+        ('012529N', '1035911E'),    # SG - MY boundary
+        ('012529N', '1035935E'),    # SG - MY boundary
+        ('012529N', '1035935E'),    # SG - MY boundary
+        ('012539N', '1040000E'),    # SG - MY boundary
+        ('012631N', '1040119E'),    # SG - MY boundary
+        ('012647N', '1040226E'),    # SG - MY boundary
+        ('012630N', '1040312E'),    # SG - MY boundary
+        ('012619N', '1040342E'),    # SG - MY boundary
+        ('012608N', '1040417E'),    # SG - MY boundary
+        ('012608N', '1040417E'),    # SG - MY boundary
+        ('012552N', '1040440E'),    # SG - MY boundary
+        ('012503N', '1040521E'),    # SG - MY boundary
+        ('012444N', '1040530E'),    # SG - MY boundary
+        ('012422N', '1040534E'),    # SG - MY boundary
+        ('012422N', '1040535E'),    # SG - MY boundary
+        ('012403N', '1040536E'),    # SG - MY boundary
+        ('012336N', '1040534E'),    # SG - MY boundary
+        ('012336N', '1040534E'),    # SG - MY boundary
+        ('012259N', '1040522E'),    # SG - MY boundary
+        ('012208N', '1040502E'),    # SG - MY boundary
+        ('012127N', '1040453E'),    # SG - MY boundary
+        ('012003N', '1040536E'),    # SG - MY boundary
+        ('012003N', '1040536E'),    # SG - MY boundary
+        ('012000N', '1040600E'),    # SG - MY boundary
+        ('012000N', '1042000E'),    # SG - MY boundary
 
-    ('023600N', '1044500E'),    # merge point of diff sectors 
-    ('034000N', '1034000E'), 
-    ('045000N', '1034400E'), 
-    ('060000N', '1030504E'),    # SG - KL merge point
-    ('064500N', '1024000E'), 
-    ('070000N', '1030000E'), 
-    ('070000N', '1080000E'), 
-    ('103000N', '1140000E'), 
-    ('082500N', '1163000E')
-]
+        ('023600N', '1044500E'),    # merge point of diff sectors 
+        ('034000N', '1034000E'), 
+        ('045000N', '1034400E'), 
+        ('060000N', '1030504E'),    # SG - KL merge point
+        ('064500N', '1024000E'), 
+        ('070000N', '1030000E'), 
+        ('070000N', '1080000E'), 
+        ('103000N', '1140000E'), 
+        ('082500N', '1163000E')
+    ]
 
-KL_FIR_vested1_coordinates = [
-    ('023600N', '1044500E'),
-    ('023200N', '1050000E'),
-    ('060000N', '1050000E'), 
-    ('060000N', '1030504E'),    # SG - KL merge point
-    ('045000N', '1034400E'), 
-    ('034000N', '1034000E'), 
-    ('023600N', '1044500E')
-]
+@_dataset
+def _KL_FIR_vested1_coordinates():
+    return [
+        ('023600N', '1044500E'),
+        ('023200N', '1050000E'),
+        ('060000N', '1050000E'), 
+        ('060000N', '1030504E'),    # SG - KL merge point
+        ('045000N', '1034400E'), 
+        ('034000N', '1034000E'), 
+        ('023600N', '1044500E')
+    ]
 
-KL_FIR_vested2_coordinates = [
-    # ('022739N', '1051737E'),    # test new point
-    ('023200N', '1050000E'),
-    ('060000N', '1050000E'), 
-    ('060000N', '1132122E'),      # SG - KL merge point
-    ('025050N', '1091629E'), 
-    ('045700N', '1081619E'), 
-    ('050012N', '1080132E'), 
-    ('045904N', '1075525E'), 
-    ('045203N', '1074625E'), 
-    ('043820N', '1073315E'), 
-    ('041312N', '1071743E'), 
-    ('033045N', '1055130E'), 
-    ('031727N', '1052959E'), 
-    ('031453N', '1052619E'), 
-    ('025010N', '1051210E'), 
-    ('024348N', '1050854E'), 
-    ('023641N', '1051311E'),
-    ('022710N', '1051753E'),       # SG - KL merge point
-    ('023200N', '1050000E'),
-]
+@_dataset
+def _KL_FIR_vested2_coordinates():
+    return [
+        # ('022739N', '1051737E'),    # test new point
+        ('023200N', '1050000E'),
+        ('060000N', '1050000E'), 
+        ('060000N', '1132122E'),      # SG - KL merge point
+        ('025050N', '1091629E'), 
+        ('045700N', '1081619E'), 
+        ('050012N', '1080132E'), 
+        ('045904N', '1075525E'), 
+        ('045203N', '1074625E'), 
+        ('043820N', '1073315E'), 
+        ('041312N', '1071743E'), 
+        ('033045N', '1055130E'), 
+        ('031727N', '1052959E'), 
+        ('031453N', '1052619E'), 
+        ('025010N', '1051210E'), 
+        ('024348N', '1050854E'), 
+        ('023641N', '1051311E'),
+        ('022710N', '1051753E'),       # SG - KL merge point
+        ('023200N', '1050000E'),
+    ]
 
-JAKARTA_FIR_delegated_coordinates = [
-    ('031727N', '1052959E'),
-    ('012450N', '1061648E'),
-    ('001030N', '1045656E'),
-    ('000000N', '1050340E'),
-    ('000000N', '1044330E'),
-    ('001113S', '1042205E'), # Arc of airspace
-    ('001620S', '1035827E'), # Arc of airspace
-    ('001458S', '1033419E'), # Arc of airspace
-    ('000714S', '1031124E'), # Arc of airspace
-    ('000618N', '1025123E'), # Arc of airspace
-    ('002442N', '1023541E'), # Arc of airspace
-    ('004636N', '1022528E'), # Arc of airspace
-    ('011026N', '1022126E'), # Arc of airspace
-    ('013430N', '1022353E'),
-    ('011300N', '1033000E'),
-    ('011408N', '1033142E'),
-    ('011200N', '1033900E'),
-    ('011046N', '1034015E'),
-    ('010800N', '1034500E'),
-    ('011500N', '1040000E'),
-    ('011800N', '1043000E'),
-    ('012921N', '1043441E'),
-    ('011947N', '1044606E'),
-    ('021838N', '1052205E'),
-    ('023641N', '1051311E'),
-    ('024348N', '1050854E'),
-    ('025010N', '1051210E'),
-    ('031453N', '1052619E'), # added
-    ('031727N', '1052959E')
-]
+@_dataset
+def _JAKARTA_FIR_delegated_coordinates():
+    return [
+        ('031727N', '1052959E'),
+        ('012450N', '1061648E'),
+        ('001030N', '1045656E'),
+        ('000000N', '1050340E'),
+        ('000000N', '1044330E'),
+        ('001113S', '1042205E'), # Arc of airspace
+        ('001620S', '1035827E'), # Arc of airspace
+        ('001458S', '1033419E'), # Arc of airspace
+        ('000714S', '1031124E'), # Arc of airspace
+        ('000618N', '1025123E'), # Arc of airspace
+        ('002442N', '1023541E'), # Arc of airspace
+        ('004636N', '1022528E'), # Arc of airspace
+        ('011026N', '1022126E'), # Arc of airspace
+        ('013430N', '1022353E'),
+        ('011300N', '1033000E'),
+        ('011408N', '1033142E'),
+        ('011200N', '1033900E'),
+        ('011046N', '1034015E'),
+        ('010800N', '1034500E'),
+        ('011500N', '1040000E'),
+        ('011800N', '1043000E'),
+        ('012921N', '1043441E'),
+        ('011947N', '1044606E'),
+        ('021838N', '1052205E'),
+        ('023641N', '1051311E'),
+        ('024348N', '1050854E'),
+        ('025010N', '1051210E'),
+        ('031453N', '1052619E'), # added
+        ('031727N', '1052959E')
+    ]
 
-SG_JHR_airspace_complex_coordinates = [
-    ('022600N', '1025605E'),
-    ('022600N', '1043400E'),
-    ('004300N', '1043400E'),
-    ('004300N', '1025605E'),
-    ('022600N', '1025605E')
-]
+@_dataset
+def _SG_JHR_airspace_complex_coordinates():
+    return [
+        ('022600N', '1025605E'),
+        ('022600N', '1043400E'),
+        ('004300N', '1043400E'),
+        ('004300N', '1025605E'),
+        ('022600N', '1025605E')
+    ]
 
 #endregion
 
 #region Kuala Lumpur FIR - WMFC
 
-KL_FIR_coordinates = [
-    ('064500N', '1024000E'),
-    ('045000N', '1034400E'),
-    ('034000N', '1034000E'),
-    ('023600N', '1044500E'),
-    ('012000N', '1042000E'),
-    ('012000N', '1041224E'),  # Approximate endpoint before INTL BDRY
+@_dataset
+def _KL_FIR_coordinates():
+    return [
+        ('064500N', '1024000E'),
+        ('045000N', '1034400E'),
+        ('034000N', '1034000E'),
+        ('023600N', '1044500E'),
+        ('012000N', '1042000E'),
+        ('012000N', '1041224E'),  # Approximate endpoint before INTL BDRY
     
-    # SG - MY boundary
-    ('012000N', '1042000E'),    # SG - MY boundary
-    ('012000N', '1040600E'),    # SG - MY boundary
-    ('012003N', '1040536E'),    # SG - MY boundary
-    ('012003N', '1040536E'),    # SG - MY boundary
-    ('012127N', '1040453E'),    # SG - MY boundary
-    ('012208N', '1040502E'),    # SG - MY boundary
-    ('012259N', '1040522E'),    # SG - MY boundary
-    ('012336N', '1040534E'),    # SG - MY boundary
-    ('012336N', '1040534E'),    # SG - MY boundary
-    ('012403N', '1040536E'),    # SG - MY boundary
-    ('012422N', '1040535E'),    # SG - MY boundary
-    ('012422N', '1040534E'),    # SG - MY boundary
-    ('012444N', '1040530E'),    # SG - MY boundary
-    ('012503N', '1040521E'),    # SG - MY boundary
-    ('012552N', '1040440E'),    # SG - MY boundary
-    ('012608N', '1040417E'),    # SG - MY boundary
-    ('012608N', '1040417E'),    # SG - MY boundary
-    ('012619N', '1040342E'),    # SG - MY boundary
-    ('012630N', '1040312E'),    # SG - MY boundary
-    ('012647N', '1040226E'),    # SG - MY boundary
-    ('012631N', '1040119E'),    # SG - MY boundary
-    ('012539N', '1040000E'),    # SG - MY boundary
-    ('012529N', '1035935E'),    # SG - MY boundary
-    ('012529N', '1035935E'),    # SG - MY boundary
-    ('012529N', '1035911E'),    # SG - MY boundary
-    ('012529N', '1035911E'),    # SG - MY boundary
-    ('012527N', '1035847E'),    # SG - MY boundary
-    ('012520N', '1035821E'),    # SG - MY boundary
-    ('012520N', '1035759E'),    # SG - MY boundary
-    ('012527N', '1035739E'),    # SG - MY boundary
-    ('012527N', '1035726E'),    # SG - MY boundary
-    ('012536N', '1035645E'),    # SG - MY boundary
-    ('012541N', '1035631E'),    # SG - MY boundary
-    ('012541N', '1035631E'),    # SG - MY boundary
-    ('012549N', '1035616E'),    # SG - MY boundary
-    ('012549N', '1035601E'),    # SG - MY boundary
-    ('012538N', '1035511E'),    # SG - MY boundary
-    ('012540N', '1035407E'),    # SG - MY boundary
-    ('012542N', '1035353E'),    # SG - MY boundary
-    ('012606N', '1035310E'),    # SG - MY boundary
-    ('012649N', '1035236E'),    # SG - MY boundary
-    ('012719N', '1035208E'),    # SG - MY boundary
-    ('012733N', '1035152E'),    # SG - MY boundary
-    ('012755N', '1035113E'),    # SG - MY boundary
-    ('012816N', '1035020E'),    # SG - MY boundary
-    ('012835N', '1034923E'),    # SG - MY boundary
-    ('012835N', '1034923E'),    # SG - MY boundary
-    ('012843N', '1034846E'),    # SG - MY boundary
-    ('012834N', '1034812E'),    # SG - MY boundary
-    ('012757N', '1034727E'),    # SG - MY boundary
-    ('012732N', '1034652E'),    # SG - MY boundary
-    ('012709N', '1034609E'),    # SG - MY boundary
-    ('012644N', '1034516E'),    # SG - MY boundary
-    ('012642N', '1034504E'),    # SG - MY boundary
-    ('012642N', '1034504E'),    # SG - MY boundary
-    ('012647N', '1034442E'),    # SG - MY boundary
-    ('012704N', '1034415E'),    # SG - MY boundary
-    ('012721N', '1034336E'),    # SG - MY boundary
-    ('012730N', '1034325E'),    # SG - MY boundary
-    ('012728N', '1034248E'),    # SG - MY boundary
-    ('012702N', '1034211E'),    # SG - MY boundary
-    ('012640N', '1034152E'),    # SG - MY boundary
-    ('012627N', '1034134E'),    # SG - MY boundary
-    ('012614N', '1034055E'),    # SG - MY boundary
-    ('012542N', '1034022E'),    # SG - MY boundary
-    ('012458N', '1034006E'),    # SG - MY boundary
-    ('012402N', '1033923E'),    # SG - MY boundary
-    ('012402N', '1033923E'),    # SG - MY boundary
-    ('012320N', '1033910E'),    # SG - MY boundary
-    ('012251N', '1033855E'),    # SG - MY boundary
-    ('012251N', '1033855E'),    # SG - MY boundary
-    ('012227N', '1033847E'),    # SG - MY boundary
-    ('012121N', '1033807E'),    # SG - MY boundary
-    ('012102N', '1033800E'),    # SG - MY boundary
-    ('011917N', '1033659E'),    # SG - MY boundary
-    ('011650N', '1033610E'),    # SG - MY boundary
+        # SG - MY boundary
+        ('012000N', '1042000E'),    # SG - MY boundary
+        ('012000N', '1040600E'),    # SG - MY boundary
+        ('012003N', '1040536E'),    # SG - MY boundary
+        ('012003N', '1040536E'),    # SG - MY boundary
+        ('012127N', '1040453E'),    # SG - MY boundary
+        ('012208N', '1040502E'),    # SG - MY boundary
+        ('012259N', '1040522E'),    # SG - MY boundary
+        ('012336N', '1040534E'),    # SG - MY boundary
+        ('012336N', '1040534E'),    # SG - MY boundary
+        ('012403N', '1040536E'),    # SG - MY boundary
+        ('012422N', '1040535E'),    # SG - MY boundary
+        ('012422N', '1040534E'),    # SG - MY boundary
+        ('012444N', '1040530E'),    # SG - MY boundary
+        ('012503N', '1040521E'),    # SG - MY boundary
+        ('012552N', '1040440E'),    # SG - MY boundary
+        ('012608N', '1040417E'),    # SG - MY boundary
+        ('012608N', '1040417E'),    # SG - MY boundary
+        ('012619N', '1040342E'),    # SG - MY boundary
+        ('012630N', '1040312E'),    # SG - MY boundary
+        ('012647N', '1040226E'),    # SG - MY boundary
+        ('012631N', '1040119E'),    # SG - MY boundary
+        ('012539N', '1040000E'),    # SG - MY boundary
+        ('012529N', '1035935E'),    # SG - MY boundary
+        ('012529N', '1035935E'),    # SG - MY boundary
+        ('012529N', '1035911E'),    # SG - MY boundary
+        ('012529N', '1035911E'),    # SG - MY boundary
+        ('012527N', '1035847E'),    # SG - MY boundary
+        ('012520N', '1035821E'),    # SG - MY boundary
+        ('012520N', '1035759E'),    # SG - MY boundary
+        ('012527N', '1035739E'),    # SG - MY boundary
+        ('012527N', '1035726E'),    # SG - MY boundary
+        ('012536N', '1035645E'),    # SG - MY boundary
+        ('012541N', '1035631E'),    # SG - MY boundary
+        ('012541N', '1035631E'),    # SG - MY boundary
+        ('012549N', '1035616E'),    # SG - MY boundary
+        ('012549N', '1035601E'),    # SG - MY boundary
+        ('012538N', '1035511E'),    # SG - MY boundary
+        ('012540N', '1035407E'),    # SG - MY boundary
+        ('012542N', '1035353E'),    # SG - MY boundary
+        ('012606N', '1035310E'),    # SG - MY boundary
+        ('012649N', '1035236E'),    # SG - MY boundary
+        ('012719N', '1035208E'),    # SG - MY boundary
+        ('012733N', '1035152E'),    # SG - MY boundary
+        ('012755N', '1035113E'),    # SG - MY boundary
+        ('012816N', '1035020E'),    # SG - MY boundary
+        ('012835N', '1034923E'),    # SG - MY boundary
+        ('012835N', '1034923E'),    # SG - MY boundary
+        ('012843N', '1034846E'),    # SG - MY boundary
+        ('012834N', '1034812E'),    # SG - MY boundary
+        ('012757N', '1034727E'),    # SG - MY boundary
+        ('012732N', '1034652E'),    # SG - MY boundary
+        ('012709N', '1034609E'),    # SG - MY boundary
+        ('012644N', '1034516E'),    # SG - MY boundary
+        ('012642N', '1034504E'),    # SG - MY boundary
+        ('012642N', '1034504E'),    # SG - MY boundary
+        ('012647N', '1034442E'),    # SG - MY boundary
+        ('012704N', '1034415E'),    # SG - MY boundary
+        ('012721N', '1034336E'),    # SG - MY boundary
+        ('012730N', '1034325E'),    # SG - MY boundary
+        ('012728N', '1034248E'),    # SG - MY boundary
+        ('012702N', '1034211E'),    # SG - MY boundary
+        ('012640N', '1034152E'),    # SG - MY boundary
+        ('012627N', '1034134E'),    # SG - MY boundary
+        ('012614N', '1034055E'),    # SG - MY boundary
+        ('012542N', '1034022E'),    # SG - MY boundary
+        ('012458N', '1034006E'),    # SG - MY boundary
+        ('012402N', '1033923E'),    # SG - MY boundary
+        ('012402N', '1033923E'),    # SG - MY boundary
+        ('012320N', '1033910E'),    # SG - MY boundary
+        ('012251N', '1033855E'),    # SG - MY boundary
+        ('012251N', '1033855E'),    # SG - MY boundary
+        ('012227N', '1033847E'),    # SG - MY boundary
+        ('012121N', '1033807E'),    # SG - MY boundary
+        ('012102N', '1033800E'),    # SG - MY boundary
+        ('011917N', '1033659E'),    # SG - MY boundary
+        ('011650N', '1033610E'),    # SG - MY boundary
     
-    # Assuming manually traced INTL BDRY continues here
-    # ('011700N', '1033600E'),
-    ('011408N', '1033142E'),
-    ('011300N', '1033000E'),
+        # Assuming manually traced INTL BDRY continues here
+        # ('011700N', '1033600E'),
+        ('011408N', '1033142E'),
+        ('011300N', '1033000E'),
     
-    ('013900N', '1021000E'),
-    ('060000N', '0973000E'),
-    ('060000N', '0942500E'),
-    ('100000N', '0942500E'),
-    ('100000N', '0963000E'),
-    ('071500N', '0980000E'),
-    ('063000N', '0993000E'),
+        ('013900N', '1021000E'),
+        ('060000N', '0973000E'),
+        ('060000N', '0942500E'),
+        ('100000N', '0942500E'),
+        ('100000N', '0963000E'),
+        ('071500N', '0980000E'),
+        ('063000N', '0993000E'),
     
-    # Thailand - Malaysia boundary
-    ('062632N', '1000738E'),    # Thailand - Malaysia boundary
-    ('062727N', '1000808E'),    # Thailand - Malaysia boundary
-    ('062846N', '1000839E'),    # Thailand - Malaysia boundary
-    ('063016N', '1000854E'),    # Thailand - Malaysia boundary
-    ('063047N', '1000853E'),    # Thailand - Malaysia boundary
-    ('063150N', '1000841E'),    # Thailand - Malaysia boundary
-    ('063222N', '1000844E'),    # Thailand - Malaysia boundary
-    ('063259N', '1000908E'),    # Thailand - Malaysia boundary
-    ('063326N', '1000940E'),    # Thailand - Malaysia boundary
-    ('063358N', '1001001E'),    # Thailand - Malaysia boundary
-    ('063449N', '1000954E'),    # Thailand - Malaysia boundary
-    ('063612N', '1000925E'),    # Thailand - Malaysia boundary
-    ('063714N', '1000921E'),    # Thailand - Malaysia boundary
-    ('063940N', '1000945E'),    # Thailand - Malaysia boundary
-    ('064101N', '1000950E'),    # Thailand - Malaysia boundary
-    ('064142N', '1001000E'),    # Thailand - Malaysia boundary
-    ('064212N', '1001023E'),    # Thailand - Malaysia boundary
-    ('064228N', '1001115E'),    # Thailand - Malaysia boundary
-    ('064208N', '1001147E'),    # Thailand - Malaysia boundary
-    ('064157N', '1001157E'),    # Thailand - Malaysia boundary
-    ('064137N', '1001213E'),    # Thailand - Malaysia boundary
-    ('064121N', '1001244E'),    # Thailand - Malaysia boundary
-    ('064119N', '1001339E'),    # Thailand - Malaysia boundary
-    ('064126N', '1001339E'),    # Thailand - Malaysia boundary
-    ('064200N', '1001433E'),    # Thailand - Malaysia boundary
-    ('064203N', '1001506E'),    # Thailand - Malaysia boundary
-    ('064200N', '1001547E'),    # Thailand - Malaysia boundary
-    ('064146N', '1001626E'),    # Thailand - Malaysia boundary
-    ('064120N', '1001650E'),    # Thailand - Malaysia boundary
-    ('063436N', '1001904E'),    # Thailand - Malaysia boundary
-    ('063327N', '1001945E'),    # Thailand - Malaysia boundary
-    ('063226N', '1002055E'),    # Thailand - Malaysia boundary
-    ('063136N', '1002239E'),    # Thailand - Malaysia boundary
-    ('063119N', '1002314E'),    # Thailand - Malaysia boundary
-    ('063054N', '1002434E'),    # Thailand - Malaysia boundary
-    ('063050N', '1002535E'),    # Thailand - Malaysia boundary
-    ('063100N', '1002708E'),    # Thailand - Malaysia boundary
-    ('063047N', '1002802E'),    # Thailand - Malaysia boundary
-    ('062925N', '1002957E'),    # Thailand - Malaysia boundary
-    ('062854N', '1003102E'),    # Thailand - Malaysia boundary
-    ('062751N', '1003442E'),    # Thailand - Malaysia boundary
-    ('062657N', '1003645E'),    # Thailand - Malaysia boundary
-    ('062641N', '1003750E'),    # Thailand - Malaysia boundary
-    ('062649N', '1003854E'),    # Thailand - Malaysia boundary
-    ('062934N', '1004246E'),    # Thailand - Malaysia boundary
-    ('062935N', '1004347E'),    # Thailand - Malaysia boundary
-    ('062913N', '1004353E'),    # Thailand - Malaysia boundary
-    ('062753N', '1004352E'),    # Thailand - Malaysia boundary
-    ('062722N', '1004401E'),    # Thailand - Malaysia boundary
-    ('062700N', '1004432E'),    # Thailand - Malaysia boundary
-    ('062655N', '1004505E'),    # Thailand - Malaysia boundary
-    ('062656N', '1004542E'),    # Thailand - Malaysia boundary
-    ('062650N', '1004623E'),    # Thailand - Malaysia boundary
-    ('062602N', '1004746E'),    # Thailand - Malaysia boundary
-    ('062453N', '1004820E'),    # Thailand - Malaysia boundary
-    ('062202N', '1004830E'),    # Thailand - Malaysia boundary
-    ('062120N', '1004838E'),    # Thailand - Malaysia boundary
-    ('062041N', '1004854E'),    # Thailand - Malaysia boundary
-    ('061928N', '1004937E'),    # Thailand - Malaysia boundary
-    ('061858N', '1004944E'),    # Thailand - Malaysia boundary
-    ('061825N', '1004936E'),    # Thailand - Malaysia boundary
-    ('061754N', '1004925E'),    # Thailand - Malaysia boundary
-    ('061751N', '1004924E'),    # Thailand - Malaysia boundary
-    ('061719N', '1004917E'),    # Thailand - Malaysia boundary
-    ('061535N', '1004919E'),    # Thailand - Malaysia boundary
-    ('061505N', '1004928E'),    # Thailand - Malaysia boundary
-    ('061412N', '1004958E'),    # Thailand - Malaysia boundary
-    ('061413N', '1005014E'),    # Thailand - Malaysia boundary
-    ('061438N', '1005034E'),    # Thailand - Malaysia boundary
-    ('061452N', '1005118E'),    # Thailand - Malaysia boundary
-    ('061446N', '1005206E'),    # Thailand - Malaysia boundary
-    ('061408N', '1005436E'),    # Thailand - Malaysia boundary
-    ('061426N', '1005544E'),    # Thailand - Malaysia boundary
-    ('061607N', '1005718E'),    # Thailand - Malaysia boundary
-    ('061621N', '1005827E'),    # Thailand - Malaysia boundary
-    ('061446N', '1010023E'),    # Thailand - Malaysia boundary
-    ('061427N', '1010123E'),    # Thailand - Malaysia boundary
-    ('061503N', '1010408E'),    # Thailand - Malaysia boundary
-    ('061447N', '1010453E'),    # Thailand - Malaysia boundary
-    ('061400N', '1010517E'),    # Thailand - Malaysia boundary
-    ('061247N', '1010527E'),    # Thailand - Malaysia boundary
-    ('061119N', '1010520E'),    # Thailand - Malaysia boundary
-    ('061049N', '1010448E'),    # Thailand - Malaysia boundary
-    ('061027N', '1010400E'),    # Thailand - Malaysia boundary
-    ('060927N', '1010312E'),    # Thailand - Malaysia boundary
-    ('060804N', '1010309E'),    # Thailand - Malaysia boundary
-    ('060710N', '1010406E'),    # Thailand - Malaysia boundary
-    ('060620N', '1010513E'),    # Thailand - Malaysia boundary
-    ('060508N', '1010539E'),    # Thailand - Malaysia boundary
-    ('060247N', '1010520E'),    # Thailand - Malaysia boundary
-    ('055922N', '1010514E'),    # Thailand - Malaysia boundary
-    ('055725N', '1010449E'),    # Thailand - Malaysia boundary
-    ('055617N', '1010443E'),    # Thailand - Malaysia boundary
-    ('055511N', '1010416E'),    # Thailand - Malaysia boundary
-    ('055447N', '1010310E'),    # Thailand - Malaysia boundary
-    ('055432N', '1010154E'),    # Thailand - Malaysia boundary
-    ('055354N', '1010055E'),    # Thailand - Malaysia boundary
-    ('054855N', '1005827E'),    # Thailand - Malaysia boundary
-    ('054814N', '1005803E'),    # Thailand - Malaysia boundary
-    ('054732N', '1005755E'),    # Thailand - Malaysia boundary
-    ('054651N', '1005801E'),    # Thailand - Malaysia boundary
-    ('054622N', '1005820E'),    # Thailand - Malaysia boundary
-    ('054539N', '1005848E'),    # Thailand - Malaysia boundary
-    ('054414N', '1005930E'),    # Thailand - Malaysia boundary
-    ('054346N', '1005955E'),    # Thailand - Malaysia boundary
-    ('054332N', '1010030E'),    # Thailand - Malaysia boundary
-    ('054335N', '1010138E'),    # Thailand - Malaysia boundary
-    ('054328N', '1010214E'),    # Thailand - Malaysia boundary
-    ('054234N', '1010335E'),    # Thailand - Malaysia boundary
-    ('054115N', '1010443E'),    # Thailand - Malaysia boundary
-    ('053945N', '1010538E'),    # Thailand - Malaysia boundary
-    ('053815N', '1010619E'),    # Thailand - Malaysia boundary
-    ('053747N', '1010719E'),    # Thailand - Malaysia boundary
-    ('053819N', '1010859E'),    # Thailand - Malaysia boundary
-    ('054000N', '1011148E'),    # Thailand - Malaysia boundary
-    ('054053N', '1011244E'),    # Thailand - Malaysia boundary
-    ('054157N', '1011330E'),    # Thailand - Malaysia boundary
-    ('054309N', '1011400E'),    # Thailand - Malaysia boundary
-    ('054429N', '1011411E'),    # Thailand - Malaysia boundary
-    ('054713N', '1011456E'),    # Thailand - Malaysia boundary
-    ('054810N', '1011646E'),    # Thailand - Malaysia boundary
-    ('054836N', '1011908E'),    # Thailand - Malaysia boundary
-    ('054942N', '1012127E'),    # Thailand - Malaysia boundary
-    ('055103N', '1012333E'),    # Thailand - Malaysia boundary
-    ('055333N', '1013000E'),    # Thailand - Malaysia boundary
-    ('055421N', '1013204E'),    # Thailand - Malaysia boundary
-    ('055440N', '1013328E'),    # Thailand - Malaysia boundary
-    ('055422N', '1013445E'),    # Thailand - Malaysia boundary
-    ('055307N', '1013542E'),    # Thailand - Malaysia boundary
-    ('055226N', '1013559E'),    # Thailand - Malaysia boundary
-    ('055157N', '1013618E'),    # Thailand - Malaysia boundary
-    ('055140N', '1013646E'),    # Thailand - Malaysia boundary
-    ('055133N', '1013728E'),    # Thailand - Malaysia boundary
-    ('055120N', '1013802E'),    # Thailand - Malaysia boundary
-    ('055050N', '1013803E'),    # Thailand - Malaysia boundary
-    ('055014N', '1013752E'),    # Thailand - Malaysia boundary
-    ('054942N', '1013750E'),    # Thailand - Malaysia boundary
-    ('054657N', '1013901E'),    # Thailand - Malaysia boundary
-    ('054556N', '1013957E'),    # Thailand - Malaysia boundary
-    ('054540N', '1014112E'),    # Thailand - Malaysia boundary
-    ('054558N', '1014147E'),    # Thailand - Malaysia boundary
-    ('054601N', '1014151E'),    # Thailand - Malaysia boundary
-    ('054658N', '1014253E'),    # Thailand - Malaysia boundary
-    ('054711N', '1014336E'),    # Thailand - Malaysia boundary
-    ('054656N', '1014424E'),    # Thailand - Malaysia boundary
-    ('054620N', '1014452E'),    # Thailand - Malaysia boundary
-    ('054536N', '1014515E'),    # Thailand - Malaysia boundary
-    ('054458N', '1014546E'),    # Thailand - Malaysia boundary
-    ('054417N', '1014702E'),    # Thailand - Malaysia boundary
-    ('054423N', '1014801E'),    # Thailand - Malaysia boundary
-    ('054509N', '1014844E'),    # Thailand - Malaysia boundary
-    ('054625N', '1014912E'),    # Thailand - Malaysia boundary
-    ('054647N', '1014931E'),    # Thailand - Malaysia boundary
-    ('054751N', '1015117E'),    # Thailand - Malaysia boundary
-    ('054823N', '1015139E'),    # Thailand - Malaysia boundary
-    ('054855N', '1015151E'),    # Thailand - Malaysia boundary
-    ('054925N', '1015209E'),    # Thailand - Malaysia boundary
-    ('054951N', '1015249E'),    # Thailand - Malaysia boundary
-    ('055133N', '1015446E'),    # Thailand - Malaysia boundary
-    ('055351N', '1015509E'),    # Thailand - Malaysia boundary
-    ('055624N', '1015511E'),    # Thailand - Malaysia boundary
-    ('055854N', '1015605E'),    # Thailand - Malaysia boundary
-    ('060041N', '1015733E'),    # Thailand - Malaysia boundary
-    ('060406N', '1020200E'),    # Thailand - Malaysia boundary
-    ('060541N', '1020336E'),    # Thailand - Malaysia boundary
-    ('060735N', '1020416E'),    # Thailand - Malaysia boundary
-    ('061217N', '1020500E'),    # Thailand - Malaysia boundary
-    # ('061527N', '1020423E'),    # Thailand - Malaysia boundary
-    ('061500N', '1020545E'),    # Thailand - Malaysia boundary
-    ('061500N', '1021500E'),    # Thailand - Malaysia boundary
+        # Thailand - Malaysia boundary
+        ('062632N', '1000738E'),    # Thailand - Malaysia boundary
+        ('062727N', '1000808E'),    # Thailand - Malaysia boundary
+        ('062846N', '1000839E'),    # Thailand - Malaysia boundary
+        ('063016N', '1000854E'),    # Thailand - Malaysia boundary
+        ('063047N', '1000853E'),    # Thailand - Malaysia boundary
+        ('063150N', '1000841E'),    # Thailand - Malaysia boundary
+        ('063222N', '1000844E'),    # Thailand - Malaysia boundary
+        ('063259N', '1000908E'),    # Thailand - Malaysia boundary
+        ('063326N', '1000940E'),    # Thailand - Malaysia boundary
+        ('063358N', '1001001E'),    # Thailand - Malaysia boundary
+        ('063449N', '1000954E'),    # Thailand - Malaysia boundary
+        ('063612N', '1000925E'),    # Thailand - Malaysia boundary
+        ('063714N', '1000921E'),    # Thailand - Malaysia boundary
+        ('063940N', '1000945E'),    # Thailand - Malaysia boundary
+        ('064101N', '1000950E'),    # Thailand - Malaysia boundary
+        ('064142N', '1001000E'),    # Thailand - Malaysia boundary
+        ('064212N', '1001023E'),    # Thailand - Malaysia boundary
+        ('064228N', '1001115E'),    # Thailand - Malaysia boundary
+        ('064208N', '1001147E'),    # Thailand - Malaysia boundary
+        ('064157N', '1001157E'),    # Thailand - Malaysia boundary
+        ('064137N', '1001213E'),    # Thailand - Malaysia boundary
+        ('064121N', '1001244E'),    # Thailand - Malaysia boundary
+        ('064119N', '1001339E'),    # Thailand - Malaysia boundary
+        ('064126N', '1001339E'),    # Thailand - Malaysia boundary
+        ('064200N', '1001433E'),    # Thailand - Malaysia boundary
+        ('064203N', '1001506E'),    # Thailand - Malaysia boundary
+        ('064200N', '1001547E'),    # Thailand - Malaysia boundary
+        ('064146N', '1001626E'),    # Thailand - Malaysia boundary
+        ('064120N', '1001650E'),    # Thailand - Malaysia boundary
+        ('063436N', '1001904E'),    # Thailand - Malaysia boundary
+        ('063327N', '1001945E'),    # Thailand - Malaysia boundary
+        ('063226N', '1002055E'),    # Thailand - Malaysia boundary
+        ('063136N', '1002239E'),    # Thailand - Malaysia boundary
+        ('063119N', '1002314E'),    # Thailand - Malaysia boundary
+        ('063054N', '1002434E'),    # Thailand - Malaysia boundary
+        ('063050N', '1002535E'),    # Thailand - Malaysia boundary
+        ('063100N', '1002708E'),    # Thailand - Malaysia boundary
+        ('063047N', '1002802E'),    # Thailand - Malaysia boundary
+        ('062925N', '1002957E'),    # Thailand - Malaysia boundary
+        ('062854N', '1003102E'),    # Thailand - Malaysia boundary
+        ('062751N', '1003442E'),    # Thailand - Malaysia boundary
+        ('062657N', '1003645E'),    # Thailand - Malaysia boundary
+        ('062641N', '1003750E'),    # Thailand - Malaysia boundary
+        ('062649N', '1003854E'),    # Thailand - Malaysia boundary
+        ('062934N', '1004246E'),    # Thailand - Malaysia boundary
+        ('062935N', '1004347E'),    # Thailand - Malaysia boundary
+        ('062913N', '1004353E'),    # Thailand - Malaysia boundary
+        ('062753N', '1004352E'),    # Thailand - Malaysia boundary
+        ('062722N', '1004401E'),    # Thailand - Malaysia boundary
+        ('062700N', '1004432E'),    # Thailand - Malaysia boundary
+        ('062655N', '1004505E'),    # Thailand - Malaysia boundary
+        ('062656N', '1004542E'),    # Thailand - Malaysia boundary
+        ('062650N', '1004623E'),    # Thailand - Malaysia boundary
+        ('062602N', '1004746E'),    # Thailand - Malaysia boundary
+        ('062453N', '1004820E'),    # Thailand - Malaysia boundary
+        ('062202N', '1004830E'),    # Thailand - Malaysia boundary
+        ('062120N', '1004838E'),    # Thailand - Malaysia boundary
+        ('062041N', '1004854E'),    # Thailand - Malaysia boundary
+        ('061928N', '1004937E'),    # Thailand - Malaysia boundary
+        ('061858N', '1004944E'),    # Thailand - Malaysia boundary
+        ('061825N', '1004936E'),    # Thailand - Malaysia boundary
+        ('061754N', '1004925E'),    # Thailand - Malaysia boundary
+        ('061751N', '1004924E'),    # Thailand - Malaysia boundary
+        ('061719N', '1004917E'),    # Thailand - Malaysia boundary
+        ('061535N', '1004919E'),    # Thailand - Malaysia boundary
+        ('061505N', '1004928E'),    # Thailand - Malaysia boundary
+        ('061412N', '1004958E'),    # Thailand - Malaysia boundary
+        ('061413N', '1005014E'),    # Thailand - Malaysia boundary
+        ('061438N', '1005034E'),    # Thailand - Malaysia boundary
+        ('061452N', '1005118E'),    # Thailand - Malaysia boundary
+        ('061446N', '1005206E'),    # Thailand - Malaysia boundary
+        ('061408N', '1005436E'),    # Thailand - Malaysia boundary
+        ('061426N', '1005544E'),    # Thailand - Malaysia boundary
+        ('061607N', '1005718E'),    # Thailand - Malaysia boundary
+        ('061621N', '1005827E'),    # Thailand - Malaysia boundary
+        ('061446N', '1010023E'),    # Thailand - Malaysia boundary
+        ('061427N', '1010123E'),    # Thailand - Malaysia boundary
+        ('061503N', '1010408E'),    # Thailand - Malaysia boundary
+        ('061447N', '1010453E'),    # Thailand - Malaysia boundary
+        ('061400N', '1010517E'),    # Thailand - Malaysia boundary
+        ('061247N', '1010527E'),    # Thailand - Malaysia boundary
+        ('061119N', '1010520E'),    # Thailand - Malaysia boundary
+        ('061049N', '1010448E'),    # Thailand - Malaysia boundary
+        ('061027N', '1010400E'),    # Thailand - Malaysia boundary
+        ('060927N', '1010312E'),    # Thailand - Malaysia boundary
+        ('060804N', '1010309E'),    # Thailand - Malaysia boundary
+        ('060710N', '1010406E'),    # Thailand - Malaysia boundary
+        ('060620N', '1010513E'),    # Thailand - Malaysia boundary
+        ('060508N', '1010539E'),    # Thailand - Malaysia boundary
+        ('060247N', '1010520E'),    # Thailand - Malaysia boundary
+        ('055922N', '1010514E'),    # Thailand - Malaysia boundary
+        ('055725N', '1010449E'),    # Thailand - Malaysia boundary
+        ('055617N', '1010443E'),    # Thailand - Malaysia boundary
+        ('055511N', '1010416E'),    # Thailand - Malaysia boundary
+        ('055447N', '1010310E'),    # Thailand - Malaysia boundary
+        ('055432N', '1010154E'),    # Thailand - Malaysia boundary
+        ('055354N', '1010055E'),    # Thailand - Malaysia boundary
+        ('054855N', '1005827E'),    # Thailand - Malaysia boundary
+        ('054814N', '1005803E'),    # Thailand - Malaysia boundary
+        ('054732N', '1005755E'),    # Thailand - Malaysia boundary
+        ('054651N', '1005801E'),    # Thailand - Malaysia boundary
+        ('054622N', '1005820E'),    # Thailand - Malaysia boundary
+        ('054539N', '1005848E'),    # Thailand - Malaysia boundary
+        ('054414N', '1005930E'),    # Thailand - Malaysia boundary
+        ('054346N', '1005955E'),    # Thailand - Malaysia boundary
+        ('054332N', '1010030E'),    # Thailand - Malaysia boundary
+        ('054335N', '1010138E'),    # Thailand - Malaysia boundary
+        ('054328N', '1010214E'),    # Thailand - Malaysia boundary
+        ('054234N', '1010335E'),    # Thailand - Malaysia boundary
+        ('054115N', '1010443E'),    # Thailand - Malaysia boundary
+        ('053945N', '1010538E'),    # Thailand - Malaysia boundary
+        ('053815N', '1010619E'),    # Thailand - Malaysia boundary
+        ('053747N', '1010719E'),    # Thailand - Malaysia boundary
+        ('053819N', '1010859E'),    # Thailand - Malaysia boundary
+        ('054000N', '1011148E'),    # Thailand - Malaysia boundary
+        ('054053N', '1011244E'),    # Thailand - Malaysia boundary
+        ('054157N', '1011330E'),    # Thailand - Malaysia boundary
+        ('054309N', '1011400E'),    # Thailand - Malaysia boundary
+        ('054429N', '1011411E'),    # Thailand - Malaysia boundary
+        ('054713N', '1011456E'),    # Thailand - Malaysia boundary
+        ('054810N', '1011646E'),    # Thailand - Malaysia boundary
+        ('054836N', '1011908E'),    # Thailand - Malaysia boundary
+        ('054942N', '1012127E'),    # Thailand - Malaysia boundary
+        ('055103N', '1012333E'),    # Thailand - Malaysia boundary
+        ('055333N', '1013000E'),    # Thailand - Malaysia boundary
+        ('055421N', '1013204E'),    # Thailand - Malaysia boundary
+        ('055440N', '1013328E'),    # Thailand - Malaysia boundary
+        ('055422N', '1013445E'),    # Thailand - Malaysia boundary
+        ('055307N', '1013542E'),    # Thailand - Malaysia boundary
+        ('055226N', '1013559E'),    # Thailand - Malaysia boundary
+        ('055157N', '1013618E'),    # Thailand - Malaysia boundary
+        ('055140N', '1013646E'),    # Thailand - Malaysia boundary
+        ('055133N', '1013728E'),    # Thailand - Malaysia boundary
+        ('055120N', '1013802E'),    # Thailand - Malaysia boundary
+        ('055050N', '1013803E'),    # Thailand - Malaysia boundary
+        ('055014N', '1013752E'),    # Thailand - Malaysia boundary
+        ('054942N', '1013750E'),    # Thailand - Malaysia boundary
+        ('054657N', '1013901E'),    # Thailand - Malaysia boundary
+        ('054556N', '1013957E'),    # Thailand - Malaysia boundary
+        ('054540N', '1014112E'),    # Thailand - Malaysia boundary
+        ('054558N', '1014147E'),    # Thailand - Malaysia boundary
+        ('054601N', '1014151E'),    # Thailand - Malaysia boundary
+        ('054658N', '1014253E'),    # Thailand - Malaysia boundary
+        ('054711N', '1014336E'),    # Thailand - Malaysia boundary
+        ('054656N', '1014424E'),    # Thailand - Malaysia boundary
+        ('054620N', '1014452E'),    # Thailand - Malaysia boundary
+        ('054536N', '1014515E'),    # Thailand - Malaysia boundary
+        ('054458N', '1014546E'),    # Thailand - Malaysia boundary
+        ('054417N', '1014702E'),    # Thailand - Malaysia boundary
+        ('054423N', '1014801E'),    # Thailand - Malaysia boundary
+        ('054509N', '1014844E'),    # Thailand - Malaysia boundary
+        ('054625N', '1014912E'),    # Thailand - Malaysia boundary
+        ('054647N', '1014931E'),    # Thailand - Malaysia boundary
+        ('054751N', '1015117E'),    # Thailand - Malaysia boundary
+        ('054823N', '1015139E'),    # Thailand - Malaysia boundary
+        ('054855N', '1015151E'),    # Thailand - Malaysia boundary
+        ('054925N', '1015209E'),    # Thailand - Malaysia boundary
+        ('054951N', '1015249E'),    # Thailand - Malaysia boundary
+        ('055133N', '1015446E'),    # Thailand - Malaysia boundary
+        ('055351N', '1015509E'),    # Thailand - Malaysia boundary
+        ('055624N', '1015511E'),    # Thailand - Malaysia boundary
+        ('055854N', '1015605E'),    # Thailand - Malaysia boundary
+        ('060041N', '1015733E'),    # Thailand - Malaysia boundary
+        ('060406N', '1020200E'),    # Thailand - Malaysia boundary
+        ('060541N', '1020336E'),    # Thailand - Malaysia boundary
+        ('060735N', '1020416E'),    # Thailand - Malaysia boundary
+        ('061217N', '1020500E'),    # Thailand - Malaysia boundary
+        # ('061527N', '1020423E'),    # Thailand - Malaysia boundary
+        ('061500N', '1020545E'),    # Thailand - Malaysia boundary
+        ('061500N', '1021500E'),    # Thailand - Malaysia boundary
 
-    ('064500N', '1024000E')  # Closing the loop
-]
+        ('064500N', '1024000E')  # Closing the loop
+    ]
 
 #endregion
 
 #region Bangkok FIR - VTBB
 
-BKK_FIR_coordinates = [
-    # Starting at a point on the Thai border at:
-    ('100010N', '0984000E'),  # Approximated western anchor point
+@_dataset
+def _BKK_FIR_coordinates():
+    return [
+        # Starting at a point on the Thai border at:
+        ('100010N', '0984000E'),  # Approximated western anchor point
     
-    # Land border with Myanmar/Laos/Cambodia
-    ('100409N', '0983852E'),
-    ('100506N', '0983944E'),
-    ('100943N', '0984122E'),
-    ('101219N', '0984246E'),
-    ('101340N', '0984313E'),
-    ('101505N', '0984331E'),
-    ('101619N', '0984337E'),
-    ('101730N', '0984350E'),
-    ('101944N', '0984446E'),
-    ('102101N', '0984450E'),
-    ('102440N', '0984559E'),
-    ('102743N', '0984635E'),
-    ('103000N', '0984725E'),
-    ('103113N', '0984728E'),
-    ('103459N', '0984638E'),
-    ('103538N', '0984614E'),
-    ('103637N', '0984505E'),
-    ('103723N', '0984452E'),
-    ('103957N', '0984524E'),
-    ('104119N', '0984600E'),
-    ('104447N', '0984839E'),
-    ('104548N', '0984948E'),
-    ('104559N', '0985022E'),
-    ('104603N', '0985139E'),
-    ('104611N', '0985205E'),
-    ('104643N', '0985231E'),
-    ('104717N', '0985245E'),
-    ('104757N', '0985300E'),
-    ('104830N', '0985331E'),
-    ('104851N', '0985419E'),
-    ('104844N', '0985452E'),
-    ('104829N', '0985523E'),
-    ('104827N', '0985602E'),
-    ('104923N', '0985810E'),
-    ('104927N', '0985828E'),
-    ('104956N', '0985854E'),
-    ('105025N', '0985910E'),
-    ('105137N', '0985923E'),
-    ('105230N', '0985923E'),
-    ('105343N', '0985854E'),
-    ('105427N', '0985846E'),
-    ('105504N', '0985848E'),
-    ('105544N', '0985857E'),
-    ('105621N', '0985911E'),
-    ('105652N', '0985932E'),
-    ('105727N', '0990005E'),
-    ('105731N', '0990020E'),
-    ('105722N', '0990038E'),
-    ('105715N', '0990124E'),
-    ('105703N', '0990204E'),
-    ('105643N', '0990242E'),
-    ('105642N', '0990318E'),
-    ('105726N', '0990349E'),
-    ('105915N', '0990421E'),
-    ('105947N', '0990436E'),
-    ('110046N', '0990535E'),
-    ('110200N', '0990759E'),
-    ('110221N', '0990827E'),
-    ('110251N', '0990906E'),
-    ('110326N', '0990929E'),
-    ('110440N', '0991003E'),
-    ('110514N', '0991030E'),
-    ('110534N', '0991105E'),
-    ('110600N', '0991222E'),
-    ('110629N', '0991246E'),
-    ('111151N', '0991435E'),
-    ('111311N', '0991522E'),
-    ('111529N', '0991718E'),
-    ('111650N', '0991801E'),
-    ('111914N', '0991856E'),
-    ('112010N', '0991934E'),
-    ('112236N', '0992151E'),
-    ('112336N', '0992213E'),
-    ('112439N', '0992219E'),
-    ('112607N', '0992239E'),
-    ('112705N', '0992313E'),
-    ('112848N', '0992457E'),
-    ('112948N', '0992541E'),
-    ('113100N', '0992614E'),
-    ('113200N', '0992627E'),
-    ('113426N', '0992621E'),
-    ('113550N', '0992626E'),
-    ('113649N', '0992659E'),
-    ('113726N', '0992757E'),
-    ('113742N', '0992920E'),
-    ('113751N', '0993150E'),
-    ('113825N', '0993233E'),
-    ('114332N', '0993624E'),
-    ('114457N', '0993655E'),
-    ('114856N', '0993748E'),
-    ('114931N', '0993740E'),
-    ('114948N', '0993639E'),
-    ('115032N', '0993530E'),
-    ('115127N', '0993425E'),
-    ('115222N', '0993341E'),
-    ('115342N', '0993314E'),
-    ('115456N', '0993326E'),
-    ('115721N', '0993422E'),
-    ('115834N', '0993426E'),
-    ('115935N', '0993401E'),
-    ('120019N', '0993312E'),
-    ('120041N', '0993203E'),
-    ('120133N', '0993106E'),
-    ('120313N', '0993118E'),
-    ('120603N', '0993215E'),
-    ('120644N', '0993221E'),
-    ('120720N', '0993236E'),
-    ('120754N', '0993244E'),
-    ('120826N', '0993229E'),
-    ('120840N', '0993158E'),
-    ('120839N', '0993121E'),
-    ('120733N', '0992758E'),
-    ('120745N', '0992708E'),
-    ('120849N', '0992655E'),
-    ('120924N', '0992714E'),
-    ('120952N', '0992749E'),
-    ('121025N', '0992819E'),
-    ('121114N', '0992825E'),
-    ('121150N', '0992812E'),
-    ('121301N', '0992733E'),
-    ('121339N', '0992720E'),
-    ('121417N', '0992717E'),
-    ('121523N', '0992725E'),
-    ('121602N', '0992715E'),
-    ('121641N', '0992651E'),
-    ('121747N', '0992555E'),
-    ('121831N', '0992536E'),
-    ('121939N', '0992524E'),
-    ('122300N', '0992514E'),
-    ('122418N', '0992450E'),
-    ('122643N', '0992328E'),
-    ('122757N', '0992313E'),
-    ('122833N', '0992322E'),
-    ('122950N', '0992400E'),
-    ('123029N', '0992415E'),
-    ('123148N', '0992425E'),
-    ('123305N', '0992426E'),
-    ('123400N', '0992417E'),
-    ('123433N', '0992411E'),
-    ('123523N', '0992337E'),
-    ('123700N', '0992040E'),
-    ('123731N', '0992000E'),
-    ('123807N', '0991924E'),
-    ('123845N', '0991901E'),
-    ('123912N', '0991835E'),
-    ('123936N', '0991710E'),
-    ('123956N', '0991636E'),
-    ('124024N', '0991624E'),
-    ('124137N', '0991616E'),
-    ('124210N', '0991600E'),
-    ('124234N', '0991522E'),
-    ('124247N', '0991400E'),
-    ('124302N', '0991328E'),
-    ('124404N', '0991250E'),
-    ('124509N', '0991247E'),
-    ('124618N', '0991251E'),
-    ('124732N', '0991238E'),
-    ('124813N', '0991211E'),
-    ('124921N', '0991059E'),
-    ('125000N', '0991030E'),
-    ('125035N', '0991018E'),
-    ('125226N', '0991006E'),
-    ('125416N', '0990919E'),
-    ('125448N', '0990911E'),
-    ('125535N', '0990915E'),
-    ('125609N', '0990928E'),
-    ('125640N', '0990947E'),
-    ('125721N', '0991002E'),
-    ('125831N', '0990953E'),
-    ('125941N', '0990903E'),
-    ('130039N', '0990756E'),
-    ('130117N', '0990655E'),
-    ('130217N', '0990535E'),
-    ('130330N', '0990518E'),
-    ('130450N', '0990537E'),
-    ('130615N', '0990609E'),
-    ('130746N', '0990619E'),
-    ('130906N', '0990607E'),
-    ('131016N', '0990607E'),
-    ('131117N', '0990650E'),
-    ('131142N', '0990759E'),
-    ('131158N', '0991022E'),
-    ('131241N', '0991111E'),
-    ('131244N', '0991114E'),
-    ('131346N', '0991124E'),
-    ('131459N', '0991109E'),
-    ('131714N', '0991024E'),
-    ('131803N', '0991022E'),
-    ('131837N', '0991036E'),
-    ('131907N', '0991057E'),
-    ('131944N', '0991113E'),
-    ('132019N', '0991113E'),
-    ('132128N', '0991101E'),
-    ('132428N', '0991119E'),
-    ('132537N', '0991116E'),
-    ('133455N', '0990907E'),
-    ('133957N', '0990858E'),
-    ('134119N', '0990910E'),
-    ('134253N', '0990909E'),
-    ('134325N', '0990848E'),
-    ('134355N', '0990828E'),
-    ('134545N', '0990631E'),
-    ('134643N', '0990604E'),
-    ('134935N', '0990523E'),
-    ('135038N', '0990522E'),
-    ('135121N', '0990530E'),
-    ('135148N', '0990531E'),
-    ('135212N', '0990524E'),
-    ('135242N', '0990505E'),
-    ('135253N', '0990449E'),
-    ('135307N', '0990358E'),
-    ('135316N', '0990339E'),
-    ('135338N', '0990325E'),
-    ('135432N', '0990307E'),
-    ('135453N', '0990251E'),
-    ('135616N', '0990058E'),
-    ('135658N', '0990025E'),
-    ('135817N', '0985949E'),
-    ('135926N', '0985905E'),
-    ('140140N', '0985710E'),
-    ('140247N', '0985651E'),
-    ('140408N', '0985643E'),
-    ('140507N', '0985607E'),
-    ('140546N', '0985503E'),
-    ('140611N', '0985337E'),
-    ('140644N', '0985220E'),
-    ('141200N', '0984513E'),
-    ('141324N', '0984351E'),
-    ('141611N', '0984225E'),
-    ('141616N', '0984150E'),
-    ('141602N', '0984108E'),
-    ('141604N', '0984013E'),
-    ('141622N', '0983948E'),
-    ('141721N', '0983902E'),
-    ('141744N', '0983839E'),
-    ('141756N', '0983812E'),
-    ('141808N', '0983717E'),
-    ('141818N', '0983652E'),
-    ('141849N', '0983605E'),
-    ('141917N', '0983535E'),
-    ('142239N', '0983251E'),
-    ('143059N', '0982841E'),
-    ('143124N', '0982754E'),
-    ('143140N', '0982710E'),
-    ('143231N', '0982643E'),
-    ('143358N', '0982624E'),
-    ('143516N', '0982552E'),
-    ('143627N', '0982505E'),
-    ('144316N', '0981750E'),
-    ('144818N', '0981436E'),
-    ('144928N', '0981407E'),
-    ('145020N', '0981419E'),
-    ('145038N', '0981420E'),
-    ('145101N', '0981409E'),
-    ('145132N', '0981330E'),
-    ('145151N', '0981319E'),
-    ('145306N', '0981313E'),
-    ('145516N', '0981317E'),
-    ('145635N', '0981253E'),
-    ('145839N', '0981142E'),
-    ('145917N', '0981128E'),
-    ('145935N', '0981128E'),
-    ('150004N', '0981128E'),
-    ('150038N', '0981144E'),
-    ('150109N', '0981204E'),
-    ('150146N', '0981215E'),
-    ('150304N', '0981156E'),
-    ('150305N', '0981155E'),
-    ('150457N', '0981005E'),
-    ('150622N', '0980937E'),
-    ('150732N', '0980953E'),
-    ('150938N', '0981108E'),
-    ('151045N', '0981126E'),
-    ('151135N', '0981104E'),
-    ('151231N', '0981040E'),
-    ('151232N', '0981040E'),
-    ('151314N', '0981037E'),
-    ('151309N', '0981227E'),
-    ('151307N', '0981255E'),
-    ('151336N', '0981358E'),
-    ('151427N', '0981451E'),
-    ('151723N', '0981658E'),
-    ('151733N', '0981742E'),
-    ('151720N', '0981904E'),
-    ('151655N', '0982009E'),
-    ('151542N', '0982212E'),
-    ('151522N', '0982306E'),
-    ('151529N', '0982332E'),
-    ('151553N', '0982341E'),
-    ('151648N', '0982341E'),
-    ('151709N', '0982331E'),
-    ('151725N', '0982309E'),
-    ('151737N', '0982247E'),
-    ('151747N', '0982238E'),
-    ('151805N', '0982243E'),
-    ('151823N', '0982252E'),
-    ('151837N', '0982301E'),
-    ('151840N', '0982305E'),
-    ('151858N', '0982337E'),
-    ('151918N', '0982356E'),
-    ('151950N', '0982401E'),
-    ('152051N', '0982346E'),
-    ('152120N', '0982348E'),
-    ('152136N', '0982412E'),
-    ('152203N', '0982621E'),
-    ('152225N', '0982719E'),
-    ('152300N', '0982828E'),
-    ('152229N', '0982942E'),
-    ('152148N', '0983055E'),
-    ('152051N', '0983148E'),
-    ('151933N', '0983200E'),
-    ('152119N', '0983335E'),
-    ('152407N', '0983408E'),
-    ('152709N', '0983401E'),
-    ('153605N', '0983237E'),
-    ('153931N', '0983244E'),
-    ('154030N', '0983238E'),
-    ('154243N', '0983224E'),
-    ('154407N', '0983235E'),
-    ('155009N', '0983427E'),
-    ('155115N', '0983435E'),
-    ('155346N', '0983409E'),
-    ('155512N', '0983406E'),
-    ('155732N', '0983450E'),
-    ('155837N', '0983501E'),
-    ('155948N', '0983437E'),
-    ('160203N', '0983300E'),
-    ('160250N', '0983249E'),
-    ('160319N', '0983321E'),
-    ('160314N', '0983403E'),
-    ('160255N', '0983447E'),
-    ('160244N', '0983524E'),
-    ('160245N', '0983611E'),
-    ('160248N', '0983641E'),
-    ('160303N', '0983708E'),
-    ('160336N', '0983748E'),
-    ('160446N', '0983838E'),
-    ('160558N', '0983901E'),
-    ('160658N', '0983931E'),
-    ('160734N', '0984046E'),
-    ('160736N', '0984149E'),
-    ('160709N', '0984530E'),
-    ('160649N', '0984613E'),
-    ('160624N', '0984633E'),
-    ('160608N', '0984658E'),
-    ('160616N', '0984754E'),
-    ('160637N', '0984826E'),
-    ('160808N', '0984950E'),
-    ('160840N', '0985007E'),
-    ('161003N', '0985004E'),
-    ('161120N', '0985012E'),
-    ('161231N', '0985035E'),
-    ('161337N', '0985120E'),
-    ('161531N', '0985301E'),
-    ('161628N', '0985319E'),
-    ('161911N', '0985336E'),
-    ('162148N', '0985412E'),
-    ('162253N', '0985409E'),
-    ('162422N', '0985306E'),
-    ('162514N', '0985143E'),
-    ('162618N', '0985036E'),
-    ('162820N', '0985022E'),
-    ('162720N', '0984907E'),
-    ('162622N', '0984837E'),
-    ('162353N', '0984807E'),
-    ('162228N', '0984719E'),
-    ('161941N', '0984341E'),
-    ('161705N', '0984154E'),
-    ('161624N', '0984056E'),
-    ('161711N', '0983947E'),
-    ('161805N', '0983925E'),
-    ('162225N', '0983832E'),
-    ('162409N', '0983746E'),
-    ('162448N', '0983741E'),
-    ('162604N', '0983817E'),
-    ('162641N', '0983823E'),
-    ('162747N', '0983753E'),
-    ('163229N', '0983413E'),
-    ('163307N', '0983351E'),
-    ('163345N', '0983350E'),
-    ('163423N', '0983402E'),
-    ('163457N', '0983403E'),
-    ('163529N', '0983356E'),
-    ('163606N', '0983341E'),
-    ('163712N', '0983249E'),
-    ('163835N', '0983044E'),
-    ('163944N', '0982954E'),
-    ('164123N', '0982928E'),
-    ('164203N', '0982910E'),
-    ('164323N', '0982723E'),
-    ('164427N', '0982716E'),
-    ('164536N', '0982745E'),
-    ('164635N', '0982828E'),
-    ('164650N', '0982921E'),
-    ('164726N', '0983019E'),
-    ('164810N', '0983103E'),
-    ('164850N', '0983113E'),
-    ('164919N', '0983047E'),
-    ('164933N', '0983012E'),
-    ('164952N', '0982939E'),
-    ('165035N', '0982924E'),
-    ('165126N', '0982933E'),
-    ('165144N', '0983002E'),
-    ('165133N', '0983043E'),
-    ('165101N', '0983128E'),
-    ('165244N', '0983057E'),
-    ('165333N', '0983034E'),
-    ('165356N', '0983000E'),
-    ('165421N', '0982904E'),
-    ('165514N', '0982850E'),
-    ('165614N', '0982849E'),
-    ('165701N', '0982828E'),
-    ('165749N', '0982749E'),
-    ('165946N', '0982648E'),
-    ('170041N', '0982610E'),
-    ('170144N', '0982504E'),
-    ('170224N', '0982359E'),
-    ('170244N', '0982247E'),
-    ('170248N', '0981950E'),
-    ('170307N', '0981847E'),
-    ('170353N', '0981758E'),
-    ('170514N', '0981710E'),
-    ('170527N', '0981724E'),
-    ('170559N', '0981743E'),
-    ('170627N', '0981739E'),
-    ('170627N', '0981606E'),
-    ('170658N', '0981558E'),
-    ('170740N', '0981614E'),
-    ('170811N', '0981644E'),
-    ('170905N', '0981522E'),
-    ('171202N', '0981315E'),
-    ('171256N', '0981206E'),
-    ('171327N', '0981110E'),
-    ('171809N', '0980602E'),
-    ('171844N', '0980533E'),
-    ('171930N', '0980525E'),
-    ('172046N', '0980538E'),
-    ('172131N', '0980540E'),
-    ('172222N', '0980519E'),
-    ('172248N', '0980436E'),
-    ('172305N', '0980344E'),
-    ('172329N', '0980255E'),
-    ('172418N', '0980207E'),
-    ('172507N', '0980142E'),
-    ('172650N', '0980105E'),
-    ('172850N', '0975946E'),
-    ('172944N', '0975930E'),
-    ('173019N', '0975858E'),
-    ('173042N', '0975820E'),
-    ('173120N', '0975654E'),
-    ('173154N', '0975601E'),
-    ('173317N', '0975428E'),
-    ('174045N', '0974608E'),
-    ('174129N', '0974533E'),
-    ('174219N', '0974511E'),
-    ('174305N', '0974506E'),
-    ('174346N', '0974505E'),
-    ('174423N', '0974458E'),
-    ('174500N', '0974427E'),
-    ('174611N', '0974300E'),
-    ('174652N', '0974240E'),
-    ('174741N', '0974223E'),
-    ('174823N', '0974147E'),
-    ('174859N', '0974102E'),
-    ('174949N', '0974034E'),
-    ('174959N', '0974156E'),
-    ('175250N', '0974107E'),
-    ('175344N', '0974130E'),
-    ('175635N', '0974312E'),
-    ('175739N', '0974451E'),
-    ('175749N', '0974503E'),
-    ('175808N', '0974514E'),
-    ('175850N', '0974506E'),
-    ('175932N', '0974450E'),
-    ('175952N', '0974438E'),
-    ('180010N', '0974423E'),
-    ('180212N', '0974330E'),
-    ('180256N', '0974319E'),
-    ('180311N', '0974312E'),
-    ('180333N', '0974223E'),
-    ('180342N', '0974207E'),
-    ('180338N', '0974151E'),
-    ('180341N', '0974139E'),
-    ('180412N', '0974133E'),
-    ('180430N', '0974137E'),
-    ('180504N', '0974152E'),
-    ('180526N', '0974156E'),
-    ('180605N', '0974148E'),
-    ('180711N', '0974115E'),
-    ('180753N', '0974107E'),
-    ('180824N', '0974107E'),
-    ('180845N', '0974103E'),
-    ('180909N', '0974049E'),
-    ('181315N', '0973744E'),
-    ('181430N', '0973704E'),
-    ('181503N', '0973714E'),
-    ('181527N', '0973808E'),
-    ('181622N', '0973835E'),
-    ('181728N', '0973837E'),
-    ('181822N', '0973815E'),
-    ('181848N', '0973728E'),
-    ('181959N', '0973425E'),
-    ('181949N', '0973344E'),
-    ('181941N', '0973338E'),
-    ('181648N', '0973231E'),
-    ('181621N', '0973215E'),
-    ('181555N', '0973142E'),
-    ('181635N', '0973029E'),
-    ('181731N', '0972911E'),
-    ('181841N', '0972759E'),
-    ('182000N', '0972709E'),
-    ('182129N', '0972648E'),
-    ('182252N', '0972647E'),
-    ('182412N', '0972635E'),
-    ('182628N', '0972503E'),
-    ('182913N', '0972340E'),
-    ('183006N', '0972325E'),
-    ('183114N', '0972244E'),
-    ('183223N', '0972127E'),
-    ('183304N', '0972105E'),
-    ('183255N', '0972222E'),
-    ('183251N', '0972248E'),
-    ('183232N', '0972320E'),
-    ('183040N', '0972433E'),
-    ('183010N', '0972443E'),
-    ('182945N', '0972459E'),
-    ('182922N', '0972538E'),
-    ('182917N', '0972617E'),
-    ('182932N', '0972746E'),
-    ('182928N', '0973034E'),
-    ('183032N', '0973254E'),
-    ('183311N', '0973704E'),
-    ('183333N', '0973814E'),
-    ('183328N', '0974125E'),
-    ('183413N', '0974416E'),
-    ('183409N', '0974434E'),
-    ('183415N', '0974444E'),
-    ('183456N', '0974506E'),
-    ('183722N', '0974535E'),
-    ('183948N', '0974509E'),
-    ('184211N', '0974428E'),
-    ('184426N', '0974410E'),
-    ('184545N', '0974408E'),
-    ('184649N', '0974357E'),
-    ('184903N', '0974313E'),
-    ('184933N', '0974309E'),
-    ('185107N', '0974324E'),
-    ('185152N', '0974308E'),
-    ('185230N', '0974230E'),
-    ('185332N', '0974103E'),
-    ('185449N', '0973942E'),
-    ('185532N', '0973928E'),
-    ('185607N', '0974005E'),
-    ('185659N', '0974120E'),
-    ('185751N', '0974211E'),
-    ('185847N', '0974237E'),
-    ('190105N', '0974301E'),
-    ('190213N', '0974340E'),
-    ('190457N', '0974723E'),
-    ('190552N', '0974814E'),
-    ('190643N', '0974838E'),
-    ('191126N', '0974854E'),
-    ('191230N', '0974845E'),
-    ('191338N', '0974818E'),
-    ('191412N', '0974746E'),
-    ('191526N', '0974610E'),
-    ('191559N', '0974550E'),
-    ('191637N', '0974604E'),
-    ('191643N', '0974638E'),
-    ('191639N', '0974719E'),
-    ('191653N', '0974753E'),
-    ('191803N', '0974822E'),
-    ('191906N', '0974749E'),
-    ('192013N', '0974659E'),
-    ('192139N', '0974636E'),
-    ('192215N', '0974630E'),
-    ('192325N', '0974603E'),
-    ('192351N', '0974601E'),
-    ('192626N', '0974801E'),
-    ('192807N', '0975000E'),
-    ('192845N', '0975031E'),
-    ('192938N', '0975055E'),
-    ('192958N', '0975053E'),
-    ('193016N', '0975039E'),
-    ('193101N', '0975027E'),
-    ('193213N', '0975020E'),
-    ('193319N', '0975023E'),
-    ('193403N', '0975055E'),
-    ('193413N', '0975208E'),
-    ('193422N', '0975309E'),
-    ('193608N', '0975653E'),
-    ('193633N', '0975722E'),
-    ('193733N', '0975814E'),
-    ('193759N', '0975846E'),
-    ('193811N', '0975925E'),
-    ('193810N', '0980000E'),
-    ('193820N', '0980029E'),
-    ('193906N', '0980048E'),
-    ('194010N', '0980050E'),
-    ('194220N', '0980020E'),
-    ('194326N', '0980016E'),
-    ('194721N', '0980104E'),
-    ('194810N', '0980128E'),
-    ('194827N', '0980244E'),
-    ('194738N', '0980338E'),
-    ('194638N', '0980422E'),
-    ('194623N', '0980509E'),
-    ('194637N', '0980640E'),
-    ('194557N', '0980756E'),
-    ('194353N', '0981019E'),
-    ('194317N', '0981221E'),
-    ('194303N', '0981247E'),
-    ('194228N', '0981304E'),
-    ('194114N', '0981300E'),
-    ('194037N', '0981308E'),
-    ('193952N', '0981415E'),
-    ('194011N', '0981545E'),
-    ('194123N', '0981826E'),
-    ('194126N', '0982051E'),
-    ('194110N', '0982339E'),
-    ('194115N', '0982622E'),
-    ('194219N', '0982828E'),
-    ('194220N', '0982840E'),
-    ('194224N', '0982919E'),
-    ('194202N', '0982951E'),
-    ('194129N', '0983018E'),
-    ('194100N', '0983055E'),
-    ('194033N', '0983157E'),
-    ('194037N', '0983211E'),
-    ('194102N', '0983216E'),
-    ('194133N', '0983253E'),
-    ('194159N', '0983405E'),
-    ('194214N', '0983526E'),
-    ('194232N', '0983554E'),
-    ('194347N', '0983655E'),
-    ('194415N', '0983725E'),
-    ('194441N', '0983828E'),
-    ('194526N', '0984348E'),
-    ('194548N', '0984457E'),
-    ('194823N', '0984828E'),
-    ('194736N', '0985016E'),
-    ('194702N', '0985106E'),
-    ('194623N', '0985152E'),
-    ('194443N', '0985301E'),
-    ('194455N', '0985357E'),
-    ('194624N', '0985606E'),
-    ('194717N', '0985825E'),
-    ('194757N', '0985915E'),
-    ('194915N', '0990003E'),
-    ('195045N', '0990031E'),
-    ('195153N', '0990027E'),
-    ('195300N', '0990009E'),
-    ('195427N', '0985957E'),
-    ('195504N', '0990005E'),
-    ('195529N', '0990022E'),
-    ('195548N', '0990039E'),
-    ('195605N', '0990048E'),
-    ('195639N', '0990046E'),
-    ('195744N', '0990025E'),
-    ('195820N', '0990021E'),
-    ('200227N', '0990100E'),
-    ('200430N', '0990211E'),
-    ('200604N', '0990424E'),
-    ('200704N', '0990702E'),
-    ('200724N', '0990930E'),
-    ('200718N', '0991039E'),
-    ('200637N', '0991308E'),
-    ('200609N', '0991411E'),
-    ('200419N', '0991631E'),
-    ('200344N', '0991744E'),
-    ('200358N', '0991916E'),
-    ('200605N', '0992629E'),
-    ('200741N', '0992828E'),
-    ('200828N', '0992914E'),
-    ('200848N', '0992957E'),
-    ('200910N', '0993031E'),
-    ('200913N', '0993037E'),
-    ('201015N', '0993114E'),
-    ('201146N', '0993133E'),
-    ('201243N', '0993108E'),
-    ('201443N', '0992910E'),
-    ('201813N', '0992829E'),
-    ('201919N', '0992759E'),
-    ('202131N', '0992546E'),
-    ('202231N', '0992514E'),
-    ('202255N', '0992623E'),
-    ('202237N', '0992714E'),
-    ('202042N', '0993010E'),
-    ('201916N', '0993446E'),
-    ('201914N', '0993521E'),
-    ('201923N', '0993627E'),
-    ('201920N', '0993704E'),
-    ('201907N', '0993737E'),
-    ('201831N', '0993831E'),
-    ('201824N', '0993906E'),
-    ('201836N', '0994016E'),
-    ('201930N', '0994230E'),
-    ('201942N', '0994344E'),
-    ('201942N', '0994610E'),
-    ('202002N', '0994713E'),
-    ('202056N', '0994814E'),
-    ('202154N', '0994846E'),
-    ('202405N', '0994934E'),
-    ('202500N', '0995015E'),
-    ('202541N', '0995120E'),
-    ('202606N', '0995240E'),
-    ('202633N', '0995556E'),
-    ('202642N', '0995613E'),
-    ('202638N', '0995631E'),
-    ('202610N', '0995708E'),
-    ('202538N', '0995731E'),
-    ('202504N', '0995740E'),
-    ('202431N', '0995753E'),
-    ('202402N', '0995827E'),
-    ('202313N', '0995909E'),
-    ('202300N', '0995948E'),
-    ('202300N', '1000030E'),
-    ('202250N', '1000122E'),
-    ('202223N', '1000210E'),
-    ('202153N', '1000233E'),
-    ('202118N', '1000251E'),
-    ('202039N', '1000319E'),
-    ('201904N', '1000557E'),
-    ('201659N', '1000550E'),
-    ('201548N', '1000610E'),
-    ('201452N', '1000659E'),
-    ('201420N', '1000804E'),
-    ('201420N', '1000909E'),
-    ('201513N', '1001003E'),
-    ('201733N', '1001001E'),
-    ('201802N', '1001035E'),
-    ('201808N', '1001046E'),
-    ('201837N', '1001206E'),
-    ('201840N', '1001225E'),
-    ('201846N', '1001232E'),
-    ('202056N', '1001314E'),
-    ('202222N', '1001425E'),
-    ('202330N', '1001612E'),
-    ('202358N', '1001823E'),
-    ('202323N', '1002039E'),
-    ('202208N', '1002151E'),
-    ('201500N', '1002517E'),
-    ('201304N', '1002650E'),
-    ('201236N', '1002707E'),
-    ('201147N', '1002726E'),
-    ('201126N', '1002739E'),
-    ('201108N', '1002807E'),
-    ('201043N', '1002908E'),
-    ('201024N', '1002920E'),
-    ('200953N', '1002946E'),
-    ('200919N', '1003046E'),
-    ('200859N', '1003145E'),
-    ('200912N', '1003212E'),
-    ('201000N', '1003231E'),
-    ('201004N', '1003247E'),
-    ('200928N', '1003255E'),
-    ('200623N', '1003302E'),
-    ('200359N', '1003236E'),
-    ('195943N', '1003106E'),
-    ('195553N', '1002933E'),
-    ('195349N', '1002916E'),
-    ('195250N', '1002902E'),
-    ('195155N', '1002827E'),
-    ('195135N', '1002756E'),
-    ('195107N', '1002646E'),
-    ('195049N', '1002618E'),
-    ('195017N', '1002553E'),
-    ('194837N', '1002513E'),
-    ('194739N', '1002427E'),
-    ('194549N', '1002300E'),
-    ('194444N', '1002245E'),
-    ('194355N', '1002301E'),
-    ('194327N', '1002324E'),
-    ('194241N', '1002401E'),
-    ('194159N', '1002426E'),
-    ('194103N', '1002437E'),
-    ('193905N', '1002446E'),
-    ('193803N', '1002507E'),
-    ('193718N', '1002537E'),
-    ('193551N', '1002650E'),
-    ('193504N', '1002719E'),
-    ('193405N', '1002732E'),
-    ('193306N', '1002732E'),
-    ('193213N', '1002743E'),
-    ('193129N', '1002827E'),
-    ('193052N', '1002930E'),
-    ('193009N', '1003114E'),
-    ('192940N', '1003257E'),
-    ('192944N', '1003359E'),
-    ('193030N', '1003429E'),
-    ('193133N', '1003509E'),
-    ('193227N', '1003625E'),
-    ('193231N', '1003759E'),
-    ('193044N', '1004253E'),
-    ('193016N', '1004345E'),
-    ('192942N', '1004417E'),
-    ('192906N', '1004443E'),
-    ('192856N', '1004510E'),
+        # Land border with Myanmar/Laos/Cambodia
+        ('100409N', '0983852E'),
+        ('100506N', '0983944E'),
+        ('100943N', '0984122E'),
+        ('101219N', '0984246E'),
+        ('101340N', '0984313E'),
+        ('101505N', '0984331E'),
+        ('101619N', '0984337E'),
+        ('101730N', '0984350E'),
+        ('101944N', '0984446E'),
+        ('102101N', '0984450E'),
+        ('102440N', '0984559E'),
+        ('102743N', '0984635E'),
+        ('103000N', '0984725E'),
+        ('103113N', '0984728E'),
+        ('103459N', '0984638E'),
+        ('103538N', '0984614E'),
+        ('103637N', '0984505E'),
+        ('103723N', '0984452E'),
+        ('103957N', '0984524E'),
+        ('104119N', '0984600E'),
+        ('104447N', '0984839E'),
+        ('104548N', '0984948E'),
+        ('104559N', '0985022E'),
+        ('104603N', '0985139E'),
+        ('104611N', '0985205E'),
+        ('104643N', '0985231E'),
+        ('104717N', '0985245E'),
+        ('104757N', '0985300E'),
+        ('104830N', '0985331E'),
+        ('104851N', '0985419E'),
+        ('104844N', '0985452E'),
+        ('104829N', '0985523E'),
+        ('104827N', '0985602E'),
+        ('104923N', '0985810E'),
+        ('104927N', '0985828E'),
+        ('104956N', '0985854E'),
+        ('105025N', '0985910E'),
+        ('105137N', '0985923E'),
+        ('105230N', '0985923E'),
+        ('105343N', '0985854E'),
+        ('105427N', '0985846E'),
+        ('105504N', '0985848E'),
+        ('105544N', '0985857E'),
+        ('105621N', '0985911E'),
+        ('105652N', '0985932E'),
+        ('105727N', '0990005E'),
+        ('105731N', '0990020E'),
+        ('105722N', '0990038E'),
+        ('105715N', '0990124E'),
+        ('105703N', '0990204E'),
+        ('105643N', '0990242E'),
+        ('105642N', '0990318E'),
+        ('105726N', '0990349E'),
+        ('105915N', '0990421E'),
+        ('105947N', '0990436E'),
+        ('110046N', '0990535E'),
+        ('110200N', '0990759E'),
+        ('110221N', '0990827E'),
+        ('110251N', '0990906E'),
+        ('110326N', '0990929E'),
+        ('110440N', '0991003E'),
+        ('110514N', '0991030E'),
+        ('110534N', '0991105E'),
+        ('110600N', '0991222E'),
+        ('110629N', '0991246E'),
+        ('111151N', '0991435E'),
+        ('111311N', '0991522E'),
+        ('111529N', '0991718E'),
+        ('111650N', '0991801E'),
+        ('111914N', '0991856E'),
+        ('112010N', '0991934E'),
+        ('112236N', '0992151E'),
+        ('112336N', '0992213E'),
+        ('112439N', '0992219E'),
+        ('112607N', '0992239E'),
+        ('112705N', '0992313E'),
+        ('112848N', '0992457E'),
+        ('112948N', '0992541E'),
+        ('113100N', '0992614E'),
+        ('113200N', '0992627E'),
+        ('113426N', '0992621E'),
+        ('113550N', '0992626E'),
+        ('113649N', '0992659E'),
+        ('113726N', '0992757E'),
+        ('113742N', '0992920E'),
+        ('113751N', '0993150E'),
+        ('113825N', '0993233E'),
+        ('114332N', '0993624E'),
+        ('114457N', '0993655E'),
+        ('114856N', '0993748E'),
+        ('114931N', '0993740E'),
+        ('114948N', '0993639E'),
+        ('115032N', '0993530E'),
+        ('115127N', '0993425E'),
+        ('115222N', '0993341E'),
+        ('115342N', '0993314E'),
+        ('115456N', '0993326E'),
+        ('115721N', '0993422E'),
+        ('115834N', '0993426E'),
+        ('115935N', '0993401E'),
+        ('120019N', '0993312E'),
+        ('120041N', '0993203E'),
+        ('120133N', '0993106E'),
+        ('120313N', '0993118E'),
+        ('120603N', '0993215E'),
+        ('120644N', '0993221E'),
+        ('120720N', '0993236E'),
+        ('120754N', '0993244E'),
+        ('120826N', '0993229E'),
+        ('120840N', '0993158E'),
+        ('120839N', '0993121E'),
+        ('120733N', '0992758E'),
+        ('120745N', '0992708E'),
+        ('120849N', '0992655E'),
+        ('120924N', '0992714E'),
+        ('120952N', '0992749E'),
+        ('121025N', '0992819E'),
+        ('121114N', '0992825E'),
+        ('121150N', '0992812E'),
+        ('121301N', '0992733E'),
+        ('121339N', '0992720E'),
+        ('121417N', '0992717E'),
+        ('121523N', '0992725E'),
+        ('121602N', '0992715E'),
+        ('121641N', '0992651E'),
+        ('121747N', '0992555E'),
+        ('121831N', '0992536E'),
+        ('121939N', '0992524E'),
+        ('122300N', '0992514E'),
+        ('122418N', '0992450E'),
+        ('122643N', '0992328E'),
+        ('122757N', '0992313E'),
+        ('122833N', '0992322E'),
+        ('122950N', '0992400E'),
+        ('123029N', '0992415E'),
+        ('123148N', '0992425E'),
+        ('123305N', '0992426E'),
+        ('123400N', '0992417E'),
+        ('123433N', '0992411E'),
+        ('123523N', '0992337E'),
+        ('123700N', '0992040E'),
+        ('123731N', '0992000E'),
+        ('123807N', '0991924E'),
+        ('123845N', '0991901E'),
+        ('123912N', '0991835E'),
+        ('123936N', '0991710E'),
+        ('123956N', '0991636E'),
+        ('124024N', '0991624E'),
+        ('124137N', '0991616E'),
+        ('124210N', '0991600E'),
+        ('124234N', '0991522E'),
+        ('124247N', '0991400E'),
+        ('124302N', '0991328E'),
+        ('124404N', '0991250E'),
+        ('124509N', '0991247E'),
+        ('124618N', '0991251E'),
+        ('124732N', '0991238E'),
+        ('124813N', '0991211E'),
+        ('124921N', '0991059E'),
+        ('125000N', '0991030E'),
+        ('125035N', '0991018E'),
+        ('125226N', '0991006E'),
+        ('125416N', '0990919E'),
+        ('125448N', '0990911E'),
+        ('125535N', '0990915E'),
+        ('125609N', '0990928E'),
+        ('125640N', '0990947E'),
+        ('125721N', '0991002E'),
+        ('125831N', '0990953E'),
+        ('125941N', '0990903E'),
+        ('130039N', '0990756E'),
+        ('130117N', '0990655E'),
+        ('130217N', '0990535E'),
+        ('130330N', '0990518E'),
+        ('130450N', '0990537E'),
+        ('130615N', '0990609E'),
+        ('130746N', '0990619E'),
+        ('130906N', '0990607E'),
+        ('131016N', '0990607E'),
+        ('131117N', '0990650E'),
+        ('131142N', '0990759E'),
+        ('131158N', '0991022E'),
+        ('131241N', '0991111E'),
+        ('131244N', '0991114E'),
+        ('131346N', '0991124E'),
+        ('131459N', '0991109E'),
+        ('131714N', '0991024E'),
+        ('131803N', '0991022E'),
+        ('131837N', '0991036E'),
+        ('131907N', '0991057E'),
+        ('131944N', '0991113E'),
+        ('132019N', '0991113E'),
+        ('132128N', '0991101E'),
+        ('132428N', '0991119E'),
+        ('132537N', '0991116E'),
+        ('133455N', '0990907E'),
+        ('133957N', '0990858E'),
+        ('134119N', '0990910E'),
+        ('134253N', '0990909E'),
+        ('134325N', '0990848E'),
+        ('134355N', '0990828E'),
+        ('134545N', '0990631E'),
+        ('134643N', '0990604E'),
+        ('134935N', '0990523E'),
+        ('135038N', '0990522E'),
+        ('135121N', '0990530E'),
+        ('135148N', '0990531E'),
+        ('135212N', '0990524E'),
+        ('135242N', '0990505E'),
+        ('135253N', '0990449E'),
+        ('135307N', '0990358E'),
+        ('135316N', '0990339E'),
+        ('135338N', '0990325E'),
+        ('135432N', '0990307E'),
+        ('135453N', '0990251E'),
+        ('135616N', '0990058E'),
+        ('135658N', '0990025E'),
+        ('135817N', '0985949E'),
+        ('135926N', '0985905E'),
+        ('140140N', '0985710E'),
+        ('140247N', '0985651E'),
+        ('140408N', '0985643E'),
+        ('140507N', '0985607E'),
+        ('140546N', '0985503E'),
+        ('140611N', '0985337E'),
+        ('140644N', '0985220E'),
+        ('141200N', '0984513E'),
+        ('141324N', '0984351E'),
+        ('141611N', '0984225E'),
+        ('141616N', '0984150E'),
+        ('141602N', '0984108E'),
+        ('141604N', '0984013E'),
+        ('141622N', '0983948E'),
+        ('141721N', '0983902E'),
+        ('141744N', '0983839E'),
+        ('141756N', '0983812E'),
+        ('141808N', '0983717E'),
+        ('141818N', '0983652E'),
+        ('141849N', '0983605E'),
+        ('141917N', '0983535E'),
+        ('142239N', '0983251E'),
+        ('143059N', '0982841E'),
+        ('143124N', '0982754E'),
+        ('143140N', '0982710E'),
+        ('143231N', '0982643E'),
+        ('143358N', '0982624E'),
+        ('143516N', '0982552E'),
+        ('143627N', '0982505E'),
+        ('144316N', '0981750E'),
+        ('144818N', '0981436E'),
+        ('144928N', '0981407E'),
+        ('145020N', '0981419E'),
+        ('145038N', '0981420E'),
+        ('145101N', '0981409E'),
+        ('145132N', '0981330E'),
+        ('145151N', '0981319E'),
+        ('145306N', '0981313E'),
+        ('145516N', '0981317E'),
+        ('145635N', '0981253E'),
+        ('145839N', '0981142E'),
+        ('145917N', '0981128E'),
+        ('145935N', '0981128E'),
+        ('150004N', '0981128E'),
+        ('150038N', '0981144E'),
+        ('150109N', '0981204E'),
+        ('150146N', '0981215E'),
+        ('150304N', '0981156E'),
+        ('150305N', '0981155E'),
+        ('150457N', '0981005E'),
+        ('150622N', '0980937E'),
+        ('150732N', '0980953E'),
+        ('150938N', '0981108E'),
+        ('151045N', '0981126E'),
+        ('151135N', '0981104E'),
+        ('151231N', '0981040E'),
+        ('151232N', '0981040E'),
+        ('151314N', '0981037E'),
+        ('151309N', '0981227E'),
+        ('151307N', '0981255E'),
+        ('151336N', '0981358E'),
+        ('151427N', '0981451E'),
+        ('151723N', '0981658E'),
+        ('151733N', '0981742E'),
+        ('151720N', '0981904E'),
+        ('151655N', '0982009E'),
+        ('151542N', '0982212E'),
+        ('151522N', '0982306E'),
+        ('151529N', '0982332E'),
+        ('151553N', '0982341E'),
+        ('151648N', '0982341E'),
+        ('151709N', '0982331E'),
+        ('151725N', '0982309E'),
+        ('151737N', '0982247E'),
+        ('151747N', '0982238E'),
+        ('151805N', '0982243E'),
+        ('151823N', '0982252E'),
+        ('151837N', '0982301E'),
+        ('151840N', '0982305E'),
+        ('151858N', '0982337E'),
+        ('151918N', '0982356E'),
+        ('151950N', '0982401E'),
+        ('152051N', '0982346E'),
+        ('152120N', '0982348E'),
+        ('152136N', '0982412E'),
+        ('152203N', '0982621E'),
+        ('152225N', '0982719E'),
+        ('152300N', '0982828E'),
+        ('152229N', '0982942E'),
+        ('152148N', '0983055E'),
+        ('152051N', '0983148E'),
+        ('151933N', '0983200E'),
+        ('152119N', '0983335E'),
+        ('152407N', '0983408E'),
+        ('152709N', '0983401E'),
+        ('153605N', '0983237E'),
+        ('153931N', '0983244E'),
+        ('154030N', '0983238E'),
+        ('154243N', '0983224E'),
+        ('154407N', '0983235E'),
+        ('155009N', '0983427E'),
+        ('155115N', '0983435E'),
+        ('155346N', '0983409E'),
+        ('155512N', '0983406E'),
+        ('155732N', '0983450E'),
+        ('155837N', '0983501E'),
+        ('155948N', '0983437E'),
+        ('160203N', '0983300E'),
+        ('160250N', '0983249E'),
+        ('160319N', '0983321E'),
+        ('160314N', '0983403E'),
+        ('160255N', '0983447E'),
+        ('160244N', '0983524E'),
+        ('160245N', '0983611E'),
+        ('160248N', '0983641E'),
+        ('160303N', '0983708E'),
+        ('160336N', '0983748E'),
+        ('160446N', '0983838E'),
+        ('160558N', '0983901E'),
+        ('160658N', '0983931E'),
+        ('160734N', '0984046E'),
+        ('160736N', '0984149E'),
+        ('160709N', '0984530E'),
+        ('160649N', '0984613E'),
+        ('160624N', '0984633E'),
+        ('160608N', '0984658E'),
+        ('160616N', '0984754E'),
+        ('160637N', '0984826E'),
+        ('160808N', '0984950E'),
+        ('160840N', '0985007E'),
+        ('161003N', '0985004E'),
+        ('161120N', '0985012E'),
+        ('161231N', '0985035E'),
+        ('161337N', '0985120E'),
+        ('161531N', '0985301E'),
+        ('161628N', '0985319E'),
+        ('161911N', '0985336E'),
+        ('162148N', '0985412E'),
+        ('162253N', '0985409E'),
+        ('162422N', '0985306E'),
+        ('162514N', '0985143E'),
+        ('162618N', '0985036E'),
+        ('162820N', '0985022E'),
+        ('162720N', '0984907E'),
+        ('162622N', '0984837E'),
+        ('162353N', '0984807E'),
+        ('162228N', '0984719E'),
+        ('161941N', '0984341E'),
+        ('161705N', '0984154E'),
+        ('161624N', '0984056E'),
+        ('161711N', '0983947E'),
+        ('161805N', '0983925E'),
+        ('162225N', '0983832E'),
+        ('162409N', '0983746E'),
+        ('162448N', '0983741E'),
+        ('162604N', '0983817E'),
+        ('162641N', '0983823E'),
+        ('162747N', '0983753E'),
+        ('163229N', '0983413E'),
+        ('163307N', '0983351E'),
+        ('163345N', '0983350E'),
+        ('163423N', '0983402E'),
+        ('163457N', '0983403E'),
+        ('163529N', '0983356E'),
+        ('163606N', '0983341E'),
+        ('163712N', '0983249E'),
+        ('163835N', '0983044E'),
+        ('163944N', '0982954E'),
+        ('164123N', '0982928E'),
+        ('164203N', '0982910E'),
+        ('164323N', '0982723E'),
+        ('164427N', '0982716E'),
+        ('164536N', '0982745E'),
+        ('164635N', '0982828E'),
+        ('164650N', '0982921E'),
+        ('164726N', '0983019E'),
+        ('164810N', '0983103E'),
+        ('164850N', '0983113E'),
+        ('164919N', '0983047E'),
+        ('164933N', '0983012E'),
+        ('164952N', '0982939E'),
+        ('165035N', '0982924E'),
+        ('165126N', '0982933E'),
+        ('165144N', '0983002E'),
+        ('165133N', '0983043E'),
+        ('165101N', '0983128E'),
+        ('165244N', '0983057E'),
+        ('165333N', '0983034E'),
+        ('165356N', '0983000E'),
+        ('165421N', '0982904E'),
+        ('165514N', '0982850E'),
+        ('165614N', '0982849E'),
+        ('165701N', '0982828E'),
+        ('165749N', '0982749E'),
+        ('165946N', '0982648E'),
+        ('170041N', '0982610E'),
+        ('170144N', '0982504E'),
+        ('170224N', '0982359E'),
+        ('170244N', '0982247E'),
+        ('170248N', '0981950E'),
+        ('170307N', '0981847E'),
+        ('170353N', '0981758E'),
+        ('170514N', '0981710E'),
+        ('170527N', '0981724E'),
+        ('170559N', '0981743E'),
+        ('170627N', '0981739E'),
+        ('170627N', '0981606E'),
+        ('170658N', '0981558E'),
+        ('170740N', '0981614E'),
+        ('170811N', '0981644E'),
+        ('170905N', '0981522E'),
+        ('171202N', '0981315E'),
+        ('171256N', '0981206E'),
+        ('171327N', '0981110E'),
+        ('171809N', '0980602E'),
+        ('171844N', '0980533E'),
+        ('171930N', '0980525E'),
+        ('172046N', '0980538E'),
+        ('172131N', '0980540E'),
+        ('172222N', '0980519E'),
+        ('172248N', '0980436E'),
+        ('172305N', '0980344E'),
+        ('172329N', '0980255E'),
+        ('172418N', '0980207E'),
+        ('172507N', '0980142E'),
+        ('172650N', '0980105E'),
+        ('172850N', '0975946E'),
+        ('172944N', '0975930E'),
+        ('173019N', '0975858E'),
+        ('173042N', '0975820E'),
+        ('173120N', '0975654E'),
+        ('173154N', '0975601E'),
+        ('173317N', '0975428E'),
+        ('174045N', '0974608E'),
+        ('174129N', '0974533E'),
+        ('174219N', '0974511E'),
+        ('174305N', '0974506E'),
+        ('174346N', '0974505E'),
+        ('174423N', '0974458E'),
+        ('174500N', '0974427E'),
+        ('174611N', '0974300E'),
+        ('174652N', '0974240E'),
+        ('174741N', '0974223E'),
+        ('174823N', '0974147E'),
+        ('174859N', '0974102E'),
+        ('174949N', '0974034E'),
+        ('174959N', '0974156E'),
+        ('175250N', '0974107E'),
+        ('175344N', '0974130E'),
+        ('175635N', '0974312E'),
+        ('175739N', '0974451E'),
+        ('175749N', '0974503E'),
+        ('175808N', '0974514E'),
+        ('175850N', '0974506E'),
+        ('175932N', '0974450E'),
+        ('175952N', '0974438E'),
+        ('180010N', '0974423E'),
+        ('180212N', '0974330E'),
+        ('180256N', '0974319E'),
+        ('180311N', '0974312E'),
+        ('180333N', '0974223E'),
+        ('180342N', '0974207E'),
+        ('180338N', '0974151E'),
+        ('180341N', '0974139E'),
+        ('180412N', '0974133E'),
+        ('180430N', '0974137E'),
+        ('180504N', '0974152E'),
+        ('180526N', '0974156E'),
+        ('180605N', '0974148E'),
+        ('180711N', '0974115E'),
+        ('180753N', '0974107E'),
+        ('180824N', '0974107E'),
+        ('180845N', '0974103E'),
+        ('180909N', '0974049E'),
+        ('181315N', '0973744E'),
+        ('181430N', '0973704E'),
+        ('181503N', '0973714E'),
+        ('181527N', '0973808E'),
+        ('181622N', '0973835E'),
+        ('181728N', '0973837E'),
+        ('181822N', '0973815E'),
+        ('181848N', '0973728E'),
+        ('181959N', '0973425E'),
+        ('181949N', '0973344E'),
+        ('181941N', '0973338E'),
+        ('181648N', '0973231E'),
+        ('181621N', '0973215E'),
+        ('181555N', '0973142E'),
+        ('181635N', '0973029E'),
+        ('181731N', '0972911E'),
+        ('181841N', '0972759E'),
+        ('182000N', '0972709E'),
+        ('182129N', '0972648E'),
+        ('182252N', '0972647E'),
+        ('182412N', '0972635E'),
+        ('182628N', '0972503E'),
+        ('182913N', '0972340E'),
+        ('183006N', '0972325E'),
+        ('183114N', '0972244E'),
+        ('183223N', '0972127E'),
+        ('183304N', '0972105E'),
+        ('183255N', '0972222E'),
+        ('183251N', '0972248E'),
+        ('183232N', '0972320E'),
+        ('183040N', '0972433E'),
+        ('183010N', '0972443E'),
+        ('182945N', '0972459E'),
+        ('182922N', '0972538E'),
+        ('182917N', '0972617E'),
+        ('182932N', '0972746E'),
+        ('182928N', '0973034E'),
+        ('183032N', '0973254E'),
+        ('183311N', '0973704E'),
+        ('183333N', '0973814E'),
+        ('183328N', '0974125E'),
+        ('183413N', '0974416E'),
+        ('183409N', '0974434E'),
+        ('183415N', '0974444E'),
+        ('183456N', '0974506E'),
+        ('183722N', '0974535E'),
+        ('183948N', '0974509E'),
+        ('184211N', '0974428E'),
+        ('184426N', '0974410E'),
+        ('184545N', '0974408E'),
+        ('184649N', '0974357E'),
+        ('184903N', '0974313E'),
+        ('184933N', '0974309E'),
+        ('185107N', '0974324E'),
+        ('185152N', '0974308E'),
+        ('185230N', '0974230E'),
+        ('185332N', '0974103E'),
+        ('185449N', '0973942E'),
+        ('185532N', '0973928E'),
+        ('185607N', '0974005E'),
+        ('185659N', '0974120E'),
+        ('185751N', '0974211E'),
+        ('185847N', '0974237E'),
+        ('190105N', '0974301E'),
+        ('190213N', '0974340E'),
+        ('190457N', '0974723E'),
+        ('190552N', '0974814E'),
+        ('190643N', '0974838E'),
+        ('191126N', '0974854E'),
+        ('191230N', '0974845E'),
+        ('191338N', '0974818E'),
+        ('191412N', '0974746E'),
+        ('191526N', '0974610E'),
+        ('191559N', '0974550E'),
+        ('191637N', '0974604E'),
+        ('191643N', '0974638E'),
+        ('191639N', '0974719E'),
+        ('191653N', '0974753E'),
+        ('191803N', '0974822E'),
+        ('191906N', '0974749E'),
+        ('192013N', '0974659E'),
+        ('192139N', '0974636E'),
+        ('192215N', '0974630E'),
+        ('192325N', '0974603E'),
+        ('192351N', '0974601E'),
+        ('192626N', '0974801E'),
+        ('192807N', '0975000E'),
+        ('192845N', '0975031E'),
+        ('192938N', '0975055E'),
+        ('192958N', '0975053E'),
+        ('193016N', '0975039E'),
+        ('193101N', '0975027E'),
+        ('193213N', '0975020E'),
+        ('193319N', '0975023E'),
+        ('193403N', '0975055E'),
+        ('193413N', '0975208E'),
+        ('193422N', '0975309E'),
+        ('193608N', '0975653E'),
+        ('193633N', '0975722E'),
+        ('193733N', '0975814E'),
+        ('193759N', '0975846E'),
+        ('193811N', '0975925E'),
+        ('193810N', '0980000E'),
+        ('193820N', '0980029E'),
+        ('193906N', '0980048E'),
+        ('194010N', '0980050E'),
+        ('194220N', '0980020E'),
+        ('194326N', '0980016E'),
+        ('194721N', '0980104E'),
+        ('194810N', '0980128E'),
+        ('194827N', '0980244E'),
+        ('194738N', '0980338E'),
+        ('194638N', '0980422E'),
+        ('194623N', '0980509E'),
+        ('194637N', '0980640E'),
+        ('194557N', '0980756E'),
+        ('194353N', '0981019E'),
+        ('194317N', '0981221E'),
+        ('194303N', '0981247E'),
+        ('194228N', '0981304E'),
+        ('194114N', '0981300E'),
+        ('194037N', '0981308E'),
+        ('193952N', '0981415E'),
+        ('194011N', '0981545E'),
+        ('194123N', '0981826E'),
+        ('194126N', '0982051E'),
+        ('194110N', '0982339E'),
+        ('194115N', '0982622E'),
+        ('194219N', '0982828E'),
+        ('194220N', '0982840E'),
+        ('194224N', '0982919E'),
+        ('194202N', '0982951E'),
+        ('194129N', '0983018E'),
+        ('194100N', '0983055E'),
+        ('194033N', '0983157E'),
+        ('194037N', '0983211E'),
+        ('194102N', '0983216E'),
+        ('194133N', '0983253E'),
+        ('194159N', '0983405E'),
+        ('194214N', '0983526E'),
+        ('194232N', '0983554E'),
+        ('194347N', '0983655E'),
+        ('194415N', '0983725E'),
+        ('194441N', '0983828E'),
+        ('194526N', '0984348E'),
+        ('194548N', '0984457E'),
+        ('194823N', '0984828E'),
+        ('194736N', '0985016E'),
+        ('194702N', '0985106E'),
+        ('194623N', '0985152E'),
+        ('194443N', '0985301E'),
+        ('194455N', '0985357E'),
+        ('194624N', '0985606E'),
+        ('194717N', '0985825E'),
+        ('194757N', '0985915E'),
+        ('194915N', '0990003E'),
+        ('195045N', '0990031E'),
+        ('195153N', '0990027E'),
+        ('195300N', '0990009E'),
+        ('195427N', '0985957E'),
+        ('195504N', '0990005E'),
+        ('195529N', '0990022E'),
+        ('195548N', '0990039E'),
+        ('195605N', '0990048E'),
+        ('195639N', '0990046E'),
+        ('195744N', '0990025E'),
+        ('195820N', '0990021E'),
+        ('200227N', '0990100E'),
+        ('200430N', '0990211E'),
+        ('200604N', '0990424E'),
+        ('200704N', '0990702E'),
+        ('200724N', '0990930E'),
+        ('200718N', '0991039E'),
+        ('200637N', '0991308E'),
+        ('200609N', '0991411E'),
+        ('200419N', '0991631E'),
+        ('200344N', '0991744E'),
+        ('200358N', '0991916E'),
+        ('200605N', '0992629E'),
+        ('200741N', '0992828E'),
+        ('200828N', '0992914E'),
+        ('200848N', '0992957E'),
+        ('200910N', '0993031E'),
+        ('200913N', '0993037E'),
+        ('201015N', '0993114E'),
+        ('201146N', '0993133E'),
+        ('201243N', '0993108E'),
+        ('201443N', '0992910E'),
+        ('201813N', '0992829E'),
+        ('201919N', '0992759E'),
+        ('202131N', '0992546E'),
+        ('202231N', '0992514E'),
+        ('202255N', '0992623E'),
+        ('202237N', '0992714E'),
+        ('202042N', '0993010E'),
+        ('201916N', '0993446E'),
+        ('201914N', '0993521E'),
+        ('201923N', '0993627E'),
+        ('201920N', '0993704E'),
+        ('201907N', '0993737E'),
+        ('201831N', '0993831E'),
+        ('201824N', '0993906E'),
+        ('201836N', '0994016E'),
+        ('201930N', '0994230E'),
+        ('201942N', '0994344E'),
+        ('201942N', '0994610E'),
+        ('202002N', '0994713E'),
+        ('202056N', '0994814E'),
+        ('202154N', '0994846E'),
+        ('202405N', '0994934E'),
+        ('202500N', '0995015E'),
+        ('202541N', '0995120E'),
+        ('202606N', '0995240E'),
+        ('202633N', '0995556E'),
+        ('202642N', '0995613E'),
+        ('202638N', '0995631E'),
+        ('202610N', '0995708E'),
+        ('202538N', '0995731E'),
+        ('202504N', '0995740E'),
+        ('202431N', '0995753E'),
+        ('202402N', '0995827E'),
+        ('202313N', '0995909E'),
+        ('202300N', '0995948E'),
+        ('202300N', '1000030E'),
+        ('202250N', '1000122E'),
+        ('202223N', '1000210E'),
+        ('202153N', '1000233E'),
+        ('202118N', '1000251E'),
+        ('202039N', '1000319E'),
+        ('201904N', '1000557E'),
+        ('201659N', '1000550E'),
+        ('201548N', '1000610E'),
+        ('201452N', '1000659E'),
+        ('201420N', '1000804E'),
+        ('201420N', '1000909E'),
+        ('201513N', '1001003E'),
+        ('201733N', '1001001E'),
+        ('201802N', '1001035E'),
+        ('201808N', '1001046E'),
+        ('201837N', '1001206E'),
+        ('201840N', '1001225E'),
+        ('201846N', '1001232E'),
+        ('202056N', '1001314E'),
+        ('202222N', '1001425E'),
+        ('202330N', '1001612E'),
+        ('202358N', '1001823E'),
+        ('202323N', '1002039E'),
+        ('202208N', '1002151E'),
+        ('201500N', '1002517E'),
+        ('201304N', '1002650E'),
+        ('201236N', '1002707E'),
+        ('201147N', '1002726E'),
+        ('201126N', '1002739E'),
+        ('201108N', '1002807E'),
+        ('201043N', '1002908E'),
+        ('201024N', '1002920E'),
+        ('200953N', '1002946E'),
+        ('200919N', '1003046E'),
+        ('200859N', '1003145E'),
+        ('200912N', '1003212E'),
+        ('201000N', '1003231E'),
+        ('201004N', '1003247E'),
+        ('200928N', '1003255E'),
+        ('200623N', '1003302E'),
+        ('200359N', '1003236E'),
+        ('195943N', '1003106E'),
+        ('195553N', '1002933E'),
+        ('195349N', '1002916E'),
+        ('195250N', '1002902E'),
+        ('195155N', '1002827E'),
+        ('195135N', '1002756E'),
+        ('195107N', '1002646E'),
+        ('195049N', '1002618E'),
+        ('195017N', '1002553E'),
+        ('194837N', '1002513E'),
+        ('194739N', '1002427E'),
+        ('194549N', '1002300E'),
+        ('194444N', '1002245E'),
+        ('194355N', '1002301E'),
+        ('194327N', '1002324E'),
+        ('194241N', '1002401E'),
+        ('194159N', '1002426E'),
+        ('194103N', '1002437E'),
+        ('193905N', '1002446E'),
+        ('193803N', '1002507E'),
+        ('193718N', '1002537E'),
+        ('193551N', '1002650E'),
+        ('193504N', '1002719E'),
+        ('193405N', '1002732E'),
+        ('193306N', '1002732E'),
+        ('193213N', '1002743E'),
+        ('193129N', '1002827E'),
+        ('193052N', '1002930E'),
+        ('193009N', '1003114E'),
+        ('192940N', '1003257E'),
+        ('192944N', '1003359E'),
+        ('193030N', '1003429E'),
+        ('193133N', '1003509E'),
+        ('193227N', '1003625E'),
+        ('193231N', '1003759E'),
+        ('193044N', '1004253E'),
+        ('193016N', '1004345E'),
+        ('192942N', '1004417E'),
+        ('192906N', '1004443E'),
+        ('192856N', '1004510E'),
     
-    # Part 2
+        # Part 2
         
-    ('192943N', '1004545E'),
-    ('193211N', '1004830E'),
-    ('193457N', '1005056E'),
-    ('193609N', '1005140E'),
-    ('193625N', '1005154E'),
-    ('193646N', '1005228E'),
-    ('193648N', '1005247E'),
-    ('193644N', '1005308E'),
-    ('193648N', '1005827E'),
-    ('193638N', '1010009E'),
-    ('193610N', '1010127E'),
-    ('193437N', '1010405E'),
-    ('193402N', '1010544E'),
-    ('193354N', '1010728E'),
-    ('193406N', '1010909E'),
-    ('193429N', '1011036E'),
-    ('193450N', '1011117E'),
-    ('193512N', '1011150E'),
-    ('193522N', '1011228E'),
-    ('193506N', '1011330E'),
-    ('193441N', '1011417E'),
-    ('193413N', '1011446E'),
-    ('193337N', '1011503E'),
-    ('193249N', '1011517E'),
-    ('193122N', '1011525E'),
-    ('192939N', '1011506E'),
-    ('192820N', '1011417E'),
-    ('192758N', '1011255E'),
-    ('192710N', '1011134E'),
-    ('192501N', '1011040E'),
-    ('192235N', '1011020E'),
-    ('192047N', '1011042E'),
-    ('192031N', '1011106E'),
-    ('192019N', '1011207E'),
-    ('192004N', '1011227E'),
-    ('191934N', '1011240E'),
-    ('191914N', '1011239E'),
-    ('191856N', '1011233E'),
-    ('191833N', '1011234E'),
-    ('191332N', '1011347E'),
-    ('191001N', '1011336E'),
-    ('190836N', '1011344E'),
-    ('190741N', '1011408E'),
-    ('190656N', '1011450E'),
-    ('190444N', '1011728E'),
-    ('190300N', '1011904E'),
-    ('190113N', '1011935E'),
-    ('185853N', '1011702E'),
-    ('185801N', '1011637E'),
-    ('185604N', '1011602E'),
-    ('185510N', '1011526E'),
-    ('185333N', '1011358E'),
-    ('185229N', '1011329E'),
-    ('185119N', '1011323E'),
-    ('184744N', '1011343E'),
-    ('184642N', '1011326E'),
-    ('184446N', '1011233E'),
-    ('184348N', '1011221E'),
-    ('184242N', '1011240E'),
-    ('184122N', '1011405E'),
-    ('184025N', '1011424E'),
-    ('183930N', '1011405E'),
-    ('183831N', '1011318E'),
-    ('183700N', '1011138E'),
-    ('183645N', '1011107E'),
-    ('183622N', '1011003E'),
-    ('183559N', '1010939E'),
-    ('183523N', '1010929E'),
-    ('183403N', '1010932E'),
-    ('183324N', '1010919E'),
-    ('183239N', '1010831E'),
-    ('183037N', '1010440E'),
-    ('183020N', '1010425E'),
-    ('182944N', '1010419E'),
-    ('182835N', '1010352E'),
-    ('182652N', '1010208E'),
-    ('182540N', '1010149E'),
-    ('182437N', '1010213E'),
-    ('182332N', '1010303E'),
-    ('182217N', '1010426E'),
-    ('182151N', '1010456E'),
-    ('182010N', '1010843E'),
-    ('181922N', '1010919E'),
-    ('181858N', '1010908E'),
-    ('181754N', '1010807E'),
-    ('181728N', '1010748E'),
-    ('181651N', '1010740E'),
-    ('181444N', '1010742E'),
-    ('181419N', '1010754E'),
-    ('181307N', '1010822E'),
-    ('181246N', '1010843E'),
-    ('181232N', '1010909E'),
-    ('181214N', '1010933E'),
-    ('181143N', '1010946E'),
-    ('181046N', '1010937E'),
-    ('180830N', '1010844E'),
-    ('180726N', '1010829E'),
-    ('180617N', '1010841E'),
-    ('180402N', '1010943E'),
-    ('180312N', '1010954E'),
-    ('180225N', '1010927E'),
-    ('180116N', '1010731E'),
-    ('180040N', '1010644E'),
-    ('175903N', '1010541E'),
-    ('175730N', '1010455E'),
-    ('175602N', '1010358E'),
-    ('175443N', '1010223E'),
-    ('175342N', '1010029E'),
-    ('175305N', '1010003E'),
-    ('175152N', '1005949E'),
-    ('174949N', '1010000E'),
-    ('174903N', '1005941E'),
-    ('174833N', '1005827E'),
-    ('174813N', '1005801E'),
-    ('174751N', '1005754E'),
-    ('174727N', '1005803E'),
-    ('174702N', '1005827E'),
-    ('174654N', '1005830E'),
-    ('174647N', '1005831E'),
-    ('174639N', '1005830E'),
-    ('174631N', '1005827E'),
-    ('174614N', '1005753E'),
-    ('174550N', '1005730E'),
-    ('174521N', '1005723E'),
-    ('174444N', '1005731E'),
-    ('174332N', '1005738E'),
-    ('174227N', '1005721E'),
-    ('174159N', '1005713E'),
-    ('173916N', '1005558E'),
-    ('173701N', '1005358E'),
-    ('173545N', '1005308E'),
-    ('173425N', '1005309E'),
-    ('173342N', '1005406E'),
-    ('173319N', '1005615E'),
-    ('173251N', '1005853E'),
-    ('173217N', '1010003E'),
-    ('173135N', '1010108E'),
-    ('173045N', '1010207E'),
-    ('172944N', '1010257E'),
-    ('172931N', '1010358E'),
-    ('172830N', '1010545E'),
-    ('172750N', '1010728E'),
-    ('172740N', '1010744E'),
-    ('172742N', '1010756E'),
-    ('172801N', '1010830E'),
-    ('172820N', '1010849E'),
-    ('172944N', '1010951E'),
-    ('173038N', '1011000E'),
-    ('173059N', '1011037E'),
-    ('173107N', '1011125E'),
-    ('173123N', '1011207E'),
-    ('173152N', '1011230E'),
-    ('173406N', '1011343E'),
-    ('173531N', '1011449E'),
-    ('174044N', '1012126E'),
-    ('174059N', '1012211E'),
-    ('174057N', '1012238E'),
-    ('174105N', '1012301E'),
-    ('174224N', '1012405E'),
-    ('174234N', '1012411E'),
-    ('174256N', '1012414E'),
-    ('174301N', '1012355E'),
-    ('174304N', '1012318E'),
-    ('174314N', '1012254E'),
-    ('174345N', '1012316E'),
-    ('174401N', '1012406E'),
-    ('174356N', '1012501E'),
-    ('174400N', '1012555E'),
-    ('174444N', '1012642E'),
-    ('174457N', '1012659E'),
-    ('174503N', '1012712E'),
-    ('174500N', '1012721E'),
-    ('174444N', '1012726E'),
-    ('174422N', '1012732E'),
-    ('174313N', '1012805E'),
-    ('174321N', '1012813E'),
-    ('174350N', '1012827E'),
-    ('174416N', '1012844E'),
-    ('174444N', '1012858E'),
-    ('174555N', '1013009E'),
-    ('174644N', '1013211E'),
-    ('174731N', '1013322E'),
-    ('174834N', '1013202E'),
-    ('174849N', '1013243E'),
-    ('174913N', '1013350E'),
-    ('174943N', '1013413E'),
-    ('175023N', '1013430E'),
-    ('175110N', '1013439E'),
-    ('175205N', '1013439E'),
-    ('175115N', '1013601E'),
-    ('175155N', '1013640E'),
-    ('175304N', '1013711E'),
-    ('175341N', '1013810E'),
-    ('175443N', '1014344E'),
-    ('175555N', '1014357E'),
-    ('175952N', '1014524E'),
-    ('180225N', '1014556E'),
-    ('180330N', '1014626E'),
-    ('180424N', '1014725E'),
-    ('180424N', '1014747E'),
-    ('180344N', '1014821E'),
-    ('180307N', '1015042E'),
-    ('180151N', '1015301E'),
-    ('180213N', '1015415E'),
-    ('181132N', '1020319E'),
-    ('181230N', '1020416E'),
-    ('181249N', '1020442E'),
-    ('181244N', '1020626E'),
-    ('181236N', '1020912E'),
-    ('181201N', '1021018E'),
-    ('181109N', '1021042E'),
-    ('181009N', '1021055E'),
-    ('180907N', '1021129E'),
-    ('180753N', '1021318E'),
-    ('180741N', '1021332E'),
-    ('180726N', '1021359E'),
-    ('180538N', '1021523E'),
-    ('180305N', '1021824E'),
-    ('180213N', '1022011E'),
-    ('180219N', '1022159E'),
-    ('180057N', '1022306E'),
-    ('175939N', '1022444E'),
-    ('175839N', '1022643E'),
-    ('175816N', '1022855E'),
-    ('175815N', '1023403E'),
-    ('175718N', '1023558E'),
-    ('175455N', '1023644E'),
-    ('175100N', '1023544E'),
-    ('175026N', '1023542E'),
-    ('175013N', '1023633E'),
-    ('174846N', '1023938E'),
-    ('174836N', '1024058E'),
-    ('174902N', '1024058E'),
-    ('174954N', '1024024E'),
-    ('175100N', '1024003E'),
-    ('175155N', '1024022E'),
-    ('175224N', '1024112E'),
-    ('175254N', '1024319E'),
-    ('175325N', '1024414E'),
-    ('175521N', '1024626E'),
-    ('175711N', '1024954E'),
-    ('175749N', '1025016E'),
-    ('175819N', '1025109E'),
-    ('180032N', '1025618E'),
-    ('180043N', '1025717E'),
-    ('180027N', '1025822E'),
-    ('175918N', '1030013E'),
-    ('175903N', '1030113E'),
-    ('175926N', '1030216E'),
-    ('180018N', '1030257E'),
-    ('180109N', '1030329E'),
-    ('180132N', '1030405E'),
-    ('180207N', '1030423E'),
-    ('180538N', '1030353E'),
-    ('180644N', '1030358E'),
-    ('180732N', '1030416E'),
-    ('180805N', '1030447E'),
-    ('180819N', '1030515E'),
-    ('180827N', '1030531E'),
-    ('180828N', '1030533E'),
-    ('180812N', '1030526E'),
-    ('180810N', '1030524E'),
-    ('180806N', '1030521E'),
-    ('180805N', '1030520E'),
-    ('180830N', '1030636E'),
-    ('180906N', '1030735E'),
-    ('181000N', '1030818E'),
-    ('181116N', '1030842E'),
-    ('181317N', '1030903E'),
-    ('181413N', '1030926E'),
-    ('181459N', '1031005E'),
-    ('181517N', '1031036E'),
-    ('181527N', '1031106E'),
-    ('181544N', '1031253E'),
-    ('181611N', '1031412E'),
-    ('181633N', '1031624E'),
-    ('181649N', '1031710E'),
-    ('181715N', '1031743E'),
-    ('181748N', '1031747E'),
-    ('181818N', '1031725E'),
-    ('181957N', '1031455E'),
-    ('182009N', '1031424E'),
-    ('182029N', '1031416E'),
-    ('182042N', '1031407E'),
-    ('182057N', '1031401E'),
-    ('182120N', '1031402E'),
-    ('182248N', '1031438E'),
-    ('182400N', '1031538E'),
-    ('182456N', '1031657E'),
-    ('182532N', '1031824E'),
-    ('182629N', '1032311E'),
-    ('182629N', '1032348E'),
-    ('182531N', '1032705E'),
-    ('182519N', '1032811E'),
-    ('182519N', '1032829E'),
-    ('182527N', '1032920E'),
-    ('182525N', '1032951E'),
-    ('182503N', '1033123E'),
-    ('182455N', '1033255E'),
-    ('182401N', '1033625E'),
-    ('182326N', '1033716E'),
-    ('182259N', '1033747E'),
-    ('182240N', '1033819E'),
-    ('182111N', '1034144E'),
-    ('182058N', '1034232E'),
-    ('182048N', '1034601E'),
-    ('182038N', '1034704E'),
-    ('182017N', '1034805E'),
-    ('181949N', '1034902E'),
-    ('181914N', '1034955E'),
-    ('181832N', '1035031E'),
-    ('181746N', '1035056E'),
-    ('181711N', '1035127E'),
-    ('181659N', '1035226E'),
-    ('181703N', '1035252E'),
-    ('181713N', '1035309E'),
-    ('181728N', '1035322E'),
-    ('181750N', '1035337E'),
-    ('181855N', '1035436E'),
-    ('181939N', '1035545E'),
-    ('181958N', '1035704E'),
-    ('181950N', '1035831E'),
-    ('181906N', '1040000E'),
-    ('181756N', '1040107E'),
-    ('181255N', '1040406E'),
-    ('180652N', '1040639E'),
-    ('180543N', '1040720E'),
-    ('180446N', '1040808E'),
-    ('180132N', '1041153E'),
-    ('180107N', '1041211E'),
-    ('180031N', '1041239E'),
-    ('175453N', '1041518E'),
-    ('175304N', '1041551E'),
-    ('175226N', '1041613E'),
-    ('175152N', '1041641E'),
-    ('175141N', '1041655E'),
-    ('175124N', '1041715E'),
-    ('174909N', '1042109E'),
-    ('174802N', '1042203E'),
-    ('174525N', '1042325E'),
-    ('174423N', '1042417E'),
-    ('174401N', '1042432E'),
-    ('174338N', '1042441E'),
-    ('174227N', '1042504E'),
-    ('174159N', '1042520E'),
-    ('173957N', '1042707E'),
-    ('173825N', '1042852E'),
-    ('173344N', '1043810E'),
-    ('173321N', '1043918E'),
-    ('173138N', '1044209E'),
-    ('173054N', '1044252E'),
-    ('172912N', '1044403E'),
-    ('172729N', '1044458E'),
-    ('172659N', '1044524E'),
-    ('172639N', '1044552E'),
-    ('172606N', '1044653E'),
-    ('172544N', '1044720E'),
-    ('172524N', '1044733E'),
-    ('172222N', '1044859E'),
-    ('172139N', '1044909E'),
-    ('172056N', '1044911E'),
-    ('171800N', '1044859E'),
-    ('171424N', '1044906E'),
-    ('171138N', '1044852E'),
-    ('171017N', '1044835E'),
-    ('170129N', '1044443E'),
-    ('170009N', '1044425E'),
-    ('165636N', '1044446E'),
-    ('165438N', '1044458E'),
-    ('165359N', '1044510E'),
-    ('165244N', '1044546E'),
-    ('165205N', '1044559E'),
-    ('165122N', '1044601E'),
-    ('165040N', '1044554E'),
-    ('164918N', '1044530E'),
-    ('164908N', '1044528E'),
-    ('164835N', '1044522E'),
-    ('164754N', '1044524E'),
-    ('164256N', '1044642E'),
-    ('164217N', '1044644E'),
-    ('164138N', '1044639E'),
-    ('163924N', '1044549E'),
-    ('163653N', '1044510E'),
-    ('163418N', '1044454E'),
-    ('163257N', '1044458E'),
-    ('163144N', '1044516E'),
-    ('163040N', '1044554E'),
-    ('162949N', '1044657E'),
-    ('162803N', '1045019E'),
-    ('162714N', '1045119E'),
-    ('162618N', '1045208E'),
-    ('162518N', '1045246E'),
-    ('162414N', '1045315E'),
-    ('162221N', '1045349E'),
-    ('162144N', '1045405E'),
-    ('162112N', '1045428E'),
-    ('162044N', '1045502E'),
-    ('161951N', '1045638E'),
-    ('161927N', '1045707E'),
-    ('161815N', '1045817E'),
-    ('161755N', '1045845E'),
-    ('161738N', '1045916E'),
-    ('161700N', '1050026E'),
-    ('161636N', '1050055E'),
-    ('161527N', '1050134E'),
-    ('161409N', '1050147E'),
-    ('161129N', '1050143E'),
-    ('160954N', '1050157E'),
-    ('160829N', '1050232E'),
-    ('160716N', '1050329E'),
-    ('160619N', '1050445E'),
-    ('160545N', '1050625E'),
-    ('160302N', '1051414E'),
-    ('160256N', '1051450E'),
-    ('160250N', '1051718E'),
-    ('160107N', '1052417E'),
-    ('160054N', '1052452E'),
-    ('160035N', '1052519E'),
-    ('160018N', '1052523E'),
-    ('160007N', '1052526E'),
-    ('155941N', '1052505E'),
-    ('155920N', '1052426E'),
-    ('155850N', '1052311E'),
-    ('155717N', '1052144E'),
-    ('155509N', '1052138E'),
-    ('155255N', '1052221E'),
-    ('154759N', '1052443E'),
-    ('154702N', '1052522E'),
-    ('154617N', '1052608E'),
-    ('154553N', '1052652E'),
-    ('154546N', '1052744E'),
-    ('154558N', '1053012E'),
-    ('154548N', '1053131E'),
-    ('154457N', '1053406E'),
-    ('154317N', '1053646E'),
-    ('154055N', '1053827E'),
-    ('153804N', '1053903E'),
-    ('153459N', '1053827E'),
-    ('153116N', '1053658E'),
-    ('152958N', '1053643E'),
-    ('152725N', '1053637E'),
-    ('152621N', '1053615E'),
-    ('152539N', '1053532E'),
-    ('152525N', '1053518E'),
-    ('152407N', '1053310E'),
-    ('152315N', '1053022E'),
-    ('152229N', '1052910E'),
-    ('152110N', '1052838E'),
-    ('152004N', '1052859E'),
-    ('151928N', '1052956E'),
-    ('151915N', '1053109E'),
-    ('151917N', '1053218E'),
-    ('151930N', '1053328E'),
-    ('151915N', '1053341E'),
-    ('151758N', '1053353E'),
-    ('151621N', '1053350E'),
-    ('151615N', '1053336E'),
-    ('151510N', '1053153E'),
-    ('151351N', '1053014E'),
-    ('151121N', '1052747E'),
-    ('151031N', '1052715E'),
-    ('150919N', '1052651E'),
-    ('150801N', '1052637E'),
-    ('150640N', '1052637E'),
-    ('150541N', '1052706E'),
-    ('150526N', '1052825E'),
-    ('150358N', '1052953E'),
-    ('150353N', '1053012E'),
-    ('150401N', '1053059E'),
-    ('150358N', '1053115E'),
-    ('150340N', '1053123E'),
-    ('150300N', '1053122E'),
-    ('150245N', '1053127E'),
-    ('150019N', '1053312E'),
-    ('145945N', '1053358E'),
-    ('145945N', '1053358E'),
-    ('145945N', '1053359E'),
-    ('145926N', '1053535E'),
-    ('145839N', '1053500E'),
-    ('145711N', '1053238E'),
-    ('145602N', '1053202E'),
-    ('145408N', '1053302E'),
-    ('145248N', '1053234E'),
-    ('145240N', '1053215E'),
-    ('145243N', '1053118E'),
-    ('145239N', '1053103E'),
-    ('145218N', '1053057E'),
-    ('145123N', '1053101E'),
-    ('145033N', '1053126E'),
-    ('145014N', '1053127E'),
-    ('145000N', '1053112E'),
-    ('144949N', '1053022E'),
-    ('144938N', '1053005E'),
-    ('144832N', '1052937E'),
-    ('144710N', '1052920E'),
-    ('144549N', '1052926E'),
-    ('144445N', '1053005E'),
-    ('144410N', '1053018E'),
-    ('144125N', '1052950E'),
-    ('143935N', '1052944E'),
-    ('143536N', '1053036E'),
-    ('143350N', '1053027E'),
-    ('143213N', '1052943E'),
-    ('142945N', '1052749E'),
-    ('142831N', '1052625E'),
-    ('142804N', '1052601E'),
-    ('142729N', '1052544E'),
-    ('142606N', '1052513E'),
-    ('142541N', '1052457E'),
-    ('142522N', '1052420E'),
-    ('142505N', '1052245E'),
-    ('142452N', '1052203E'),
-    ('142429N', '1052134E'),
-    ('142324N', '1052027E'),
-    ('142308N', '1052006E'),
-    ('142310N', '1051920E'),
-    ('142353N', '1051816E'),
-    ('142356N', '1051741E'),
-    ('142335N', '1051715E'),
-    ('142219N', '1051632E'),
-    ('142151N', '1051606E'),
-    ('142125N', '1051501E'),
-    ('142042N', '1051153E'),
-    ('142044N', '1051103E'),    # Thailand - Cambodia boundary
-    ('141949N', '1050918E'),
-    ('141650N', '1050755E'),
-    ('141349N', '1050605E'),
-    ('141250N', '1050250E'),
-    ('141327N', '1050131E'),
-    ('141437N', '1050027E'),
-    ('141804N', '1045833E'),
-    ('141834N', '1045827E'),
-    ('142117N', '1045844E'),
-    ('142206N', '1045843E'),
-    ('142250N', '1045825E'),
-    ('142310N', '1045718E'),
-    ('142335N', '1045456E'),
-    ('142346N', '1045353E'),
-    ('142400N', '1045324E'),
-    ('142438N', '1045227E'),
-    ('142449N', '1045159E'),
-    ('142450N', '1045126E'),
-    ('142441N', '1045018E'),
-    ('142442N', '1044953E'),
-    ('142511N', '1044854E'),
-    ('142548N', '1044806E'),
-    ('142617N', '1044717E'),
-    ('142623N', '1044618E'),
-    ('142558N', '1044528E'),
-    ('142435N', '1044340E'),
-    ('142424N', '1044246E'),
-    ('142444N', '1044222E'),
-    ('142548N', '1044203E'),
-    ('142602N', '1044134E'),
-    ('142550N', '1044104E'),
-    ('142452N', '1044029E'),
-    ('142434N', '1044006E'),
-    ('142432N', '1043904E'),
-    ('142509N', '1043735E'),
-    ('142508N', '1043637E'),
-    ('142436N', '1043540E'),
-    ('142344N', '1043500E'),
-    ('142249N', '1043425E'),
-    ('142206N', '1043346E'),
-    ('142137N', '1043234E'),
-    ('142148N', '1043135E'),
-    ('142213N', '1043038E'),
-    ('142226N', '1042933E'),
-    ('142216N', '1042855E'),
-    ('142156N', '1042826E'),
-    ('142136N', '1042803E'),
-    ('142125N', '1042743E'),
-    ('142125N', '1042730E'),
-    ('142124N', '1042709E'),
-    ('142131N', '1042645E'),
-    ('142141N', '1042621E'),
-    ('142239N', '1041931E'),
-    ('142356N', '1041616E'),
-    ('142403N', '1041450E'),
-    ('142335N', '1041356E'),
-    ('142258N', '1041308E'),
-    ('142240N', '1041204E'),
-    ('142256N', '1041121E'),
-    ('142329N', '1041100E'),
-    ('142401N', '1041057E'),
-    ('142414N', '1041108E'),
-    ('142415N', '1041037E'),
-    ('142404N', '1041029E'),
-    ('142345N', '1041023E'),
-    ('142210N', '1040854E'),
-    ('142157N', '1040827E'),
-    ('142158N', '1040742E'),
-    ('142217N', '1040716E'),
-    ('142238N', '1040658E'),
-    ('142249N', '1040636E'),
-    ('142214N', '1040425E'),
-    ('142126N', '1040244E'),
-    ('142125N', '1040242E'),
-    ('142109N', '1040209E'),
-    ('142042N', '1040004E'),
-    ('142202N', '1035826E'),
-    ('142152N', '1035511E'),
-    ('142122N', '1035437E'),
-    ('142053N', '1035428E'),
-    ('142032N', '1035410E'),
-    ('142025N', '1035306E'),
-    ('142035N', '1035213E'),
-    ('142058N', '1035133E'),
-    ('142125N', '1035057E'),
-    ('142148N', '1035018E'),
-    ('142204N', '1034926E'),
-    ('142204N', '1034855E'),
-    ('142157N', '1034826E'),
-    ('142153N', '1034739E'),
-    ('142201N', '1034630E'),
-    ('142253N', '1034259E'),
-    ('142301N', '1034056E'),
-    ('142311N', '1034029E'),
-    ('142344N', '1034018E'),
-    ('142509N', '1034025E'),
-    ('142546N', '1034017E'),
-    ('142609N', '1033955E'),
-    ('142628N', '1033925E'),
-    ('142638N', '1033849E'),
-    ('142635N', '1033813E'),
-    ('142616N', '1033738E'),
-    ('142550N', '1033728E'),
-    ('142520N', '1033722E'),
-    ('142452N', '1033700E'),
-    ('142415N', '1033546E'),
-    ('142426N', '1033453E'),
-    ('142457N', '1033405E'),
-    ('142518N', '1033300E'),
-    ('142508N', '1033200E'),
-    ('142359N', '1032941E'),
-    ('142227N', '1032725E'),
-    ('142217N', '1032658E'),
-    ('142222N', '1032621E'),
-    ('142239N', '1032553E'),
-    ('142257N', '1032534E'),
-    ('142305N', '1032521E'),
-    ('142250N', '1032429E'),
-    ('142139N', '1032248E'),
-    ('142112N', '1032146E'),
-    ('142103N', '1032028E'),
-    ('142103N', '1031625E'),
-    ('142030N', '1031435E'),
-    ('141942N', '1031154E'),
-    ('141911N', '1030817E'),
-    ('141847N', '1030704E'),
-    ('141744N', '1030506E'),
-    ('141419N', '1030100E'),
-    ('141343N', '1030017E'),
-    ('141308N', '1025916E'),
-    ('141231N', '1025703E'),
-    ('141203N', '1025602E'),
-    ('141107N', '1025506E'),
-    ('141009N', '1025450E'),
-    ('140953N', '1025450E'),
-    ('140906N', '1025449E'),
-    ('140755N', '1025440E'),
-    ('140657N', '1025414E'),
-    ('140513N', '1025259E'),
-    ('140416N', '1025234E'),
-    ('140254N', '1025222E'),
-    ('140200N', '1025224E'),
-    ('140114N', '1025211E'),
-    ('140014N', '1025117E'),
-    ('135736N', '1024750E'),
-    ('135609N', '1024622E'),
-    ('135414N', '1024515E'),
-    ('135058N', '1024413E'),
-    ('134955N', '1024344E'),
-    ('134837N', '1024240E'),
-    ('134807N', '1024223E'),
-    ('134730N', '1024214E'),
-    ('134616N', '1024209E'),
-    ('134542N', '1024155E'),
-    ('134430N', '1024029E'),
-    ('134138N', '1023427E'),
-    ('134010N', '1023232E'),
-    ('133854N', '1023227E'),
-    ('133740N', '1023345E'),
-    ('133619N', '1023551E'),
-    ('133601N', '1023446E'),
-    ('133425N', '1023157E'),
-    ('133401N', '1023047E'),
-    ('133343N', '1022708E'),
-    ('133408N', '1022216E'),
-    ('133352N', '1021956E'),
-    ('133227N', '1021848E'),
-    ('133149N', '1021853E'),
-    ('133048N', '1021931E'),
-    ('133015N', '1021945E'),
-    ('132946N', '1021948E'),
-    ('132904N', '1021946E'),
-    ('132854N', '1021945E'),
-    ('132422N', '1022001E'),
-    ('132043N', '1021937E'),
-    ('131630N', '1021941E'),
-    ('131621N', '1021945E'),
-    ('130811N', '1022255E'),
-    ('130610N', '1022406E'),
-    ('130302N', '1022650E'),
-    ('130109N', '1022747E'),
-    ('130022N', '1022823E'),
-    ('125945N', '1022924E'),
-    ('125942N', '1022924E'),
-    ('125923N', '1022923E'),
-    ('125905N', '1022911E'),
-    ('125849N', '1022852E'),
-    ('125837N', '1022826E'),
-    ('125824N', '1022807E'),
-    ('125810N', '1022801E'),
-    ('125754N', '1022808E'),
-    ('125726N', '1022839E'),
-    ('125713N', '1022844E'),
-    ('125659N', '1022839E'),
-    ('125616N', '1022758E'),
-    ('125539N', '1022753E'),
-    ('125458N', '1022804E'),
-    ('125418N', '1022826E'),
-    ('125255N', '1022845E'),
-    ('125037N', '1022900E'),
-    ('124923N', '1022923E'),
-    ('124845N', '1022943E'),
-    ('124823N', '1023001E'),
-    ('124759N', '1023015E'),
-    ('124715N', '1023023E'),
-    ('124639N', '1023020E'),
-    ('124445N', '1022942E'),
-    ('124445N', '1022942E'),
-    ('124406N', '1022857E'),
-    ('124310N', '1022840E'),
-    ('124154N', '1022836E'),
-    ('124037N', '1022845E'),
-    ('123940N', '1022910E'),
-    ('123914N', '1022945E'),
-    ('123859N', '1023006E'),
-    ('123752N', '1023331E'),
-    ('123635N', '1023518E'),
-    ('123203N', '1023953E'),
-    ('123110N', '1024123E'),
-    ('123047N', '1024148E'),
-    ('123017N', '1024201E'),
-    ('122917N', '1024207E'),
-    ('122849N', '1024217E'),
-    ('122757N', '1024306E'),
-    ('122656N', '1024502E'),
-    ('122609N', '1024543E'),
-    ('122530N', '1024549E'),
-    ('122458N', '1024554E'),
-    ('122408N', '1024523E'),
-    ('122248N', '1024350E'),
-    ('122140N', '1024312E'),
-    ('122031N', '1024254E'),
-    ('121042N', '1024131E'),
-    ('120819N', '1024159E'),
-    ('120339N', '1024504E'),
-    ('120240N', '1024554E'),
-    ('120214N', '1024615E'),
-    ('120009N', '1024713E'),
-    ('115710N', '1024749E'),
-    ('115157N', '1025034E'),
-    ('114827N', '1025306E'),
-    ('114555N', '1025449E'),
-    ('114332N', '1025530E'),
-    ('114007N', '1025543E'),
-    ('113845N', '1025448E'),    # Thailand - Cambodia boundary
+        ('192943N', '1004545E'),
+        ('193211N', '1004830E'),
+        ('193457N', '1005056E'),
+        ('193609N', '1005140E'),
+        ('193625N', '1005154E'),
+        ('193646N', '1005228E'),
+        ('193648N', '1005247E'),
+        ('193644N', '1005308E'),
+        ('193648N', '1005827E'),
+        ('193638N', '1010009E'),
+        ('193610N', '1010127E'),
+        ('193437N', '1010405E'),
+        ('193402N', '1010544E'),
+        ('193354N', '1010728E'),
+        ('193406N', '1010909E'),
+        ('193429N', '1011036E'),
+        ('193450N', '1011117E'),
+        ('193512N', '1011150E'),
+        ('193522N', '1011228E'),
+        ('193506N', '1011330E'),
+        ('193441N', '1011417E'),
+        ('193413N', '1011446E'),
+        ('193337N', '1011503E'),
+        ('193249N', '1011517E'),
+        ('193122N', '1011525E'),
+        ('192939N', '1011506E'),
+        ('192820N', '1011417E'),
+        ('192758N', '1011255E'),
+        ('192710N', '1011134E'),
+        ('192501N', '1011040E'),
+        ('192235N', '1011020E'),
+        ('192047N', '1011042E'),
+        ('192031N', '1011106E'),
+        ('192019N', '1011207E'),
+        ('192004N', '1011227E'),
+        ('191934N', '1011240E'),
+        ('191914N', '1011239E'),
+        ('191856N', '1011233E'),
+        ('191833N', '1011234E'),
+        ('191332N', '1011347E'),
+        ('191001N', '1011336E'),
+        ('190836N', '1011344E'),
+        ('190741N', '1011408E'),
+        ('190656N', '1011450E'),
+        ('190444N', '1011728E'),
+        ('190300N', '1011904E'),
+        ('190113N', '1011935E'),
+        ('185853N', '1011702E'),
+        ('185801N', '1011637E'),
+        ('185604N', '1011602E'),
+        ('185510N', '1011526E'),
+        ('185333N', '1011358E'),
+        ('185229N', '1011329E'),
+        ('185119N', '1011323E'),
+        ('184744N', '1011343E'),
+        ('184642N', '1011326E'),
+        ('184446N', '1011233E'),
+        ('184348N', '1011221E'),
+        ('184242N', '1011240E'),
+        ('184122N', '1011405E'),
+        ('184025N', '1011424E'),
+        ('183930N', '1011405E'),
+        ('183831N', '1011318E'),
+        ('183700N', '1011138E'),
+        ('183645N', '1011107E'),
+        ('183622N', '1011003E'),
+        ('183559N', '1010939E'),
+        ('183523N', '1010929E'),
+        ('183403N', '1010932E'),
+        ('183324N', '1010919E'),
+        ('183239N', '1010831E'),
+        ('183037N', '1010440E'),
+        ('183020N', '1010425E'),
+        ('182944N', '1010419E'),
+        ('182835N', '1010352E'),
+        ('182652N', '1010208E'),
+        ('182540N', '1010149E'),
+        ('182437N', '1010213E'),
+        ('182332N', '1010303E'),
+        ('182217N', '1010426E'),
+        ('182151N', '1010456E'),
+        ('182010N', '1010843E'),
+        ('181922N', '1010919E'),
+        ('181858N', '1010908E'),
+        ('181754N', '1010807E'),
+        ('181728N', '1010748E'),
+        ('181651N', '1010740E'),
+        ('181444N', '1010742E'),
+        ('181419N', '1010754E'),
+        ('181307N', '1010822E'),
+        ('181246N', '1010843E'),
+        ('181232N', '1010909E'),
+        ('181214N', '1010933E'),
+        ('181143N', '1010946E'),
+        ('181046N', '1010937E'),
+        ('180830N', '1010844E'),
+        ('180726N', '1010829E'),
+        ('180617N', '1010841E'),
+        ('180402N', '1010943E'),
+        ('180312N', '1010954E'),
+        ('180225N', '1010927E'),
+        ('180116N', '1010731E'),
+        ('180040N', '1010644E'),
+        ('175903N', '1010541E'),
+        ('175730N', '1010455E'),
+        ('175602N', '1010358E'),
+        ('175443N', '1010223E'),
+        ('175342N', '1010029E'),
+        ('175305N', '1010003E'),
+        ('175152N', '1005949E'),
+        ('174949N', '1010000E'),
+        ('174903N', '1005941E'),
+        ('174833N', '1005827E'),
+        ('174813N', '1005801E'),
+        ('174751N', '1005754E'),
+        ('174727N', '1005803E'),
+        ('174702N', '1005827E'),
+        ('174654N', '1005830E'),
+        ('174647N', '1005831E'),
+        ('174639N', '1005830E'),
+        ('174631N', '1005827E'),
+        ('174614N', '1005753E'),
+        ('174550N', '1005730E'),
+        ('174521N', '1005723E'),
+        ('174444N', '1005731E'),
+        ('174332N', '1005738E'),
+        ('174227N', '1005721E'),
+        ('174159N', '1005713E'),
+        ('173916N', '1005558E'),
+        ('173701N', '1005358E'),
+        ('173545N', '1005308E'),
+        ('173425N', '1005309E'),
+        ('173342N', '1005406E'),
+        ('173319N', '1005615E'),
+        ('173251N', '1005853E'),
+        ('173217N', '1010003E'),
+        ('173135N', '1010108E'),
+        ('173045N', '1010207E'),
+        ('172944N', '1010257E'),
+        ('172931N', '1010358E'),
+        ('172830N', '1010545E'),
+        ('172750N', '1010728E'),
+        ('172740N', '1010744E'),
+        ('172742N', '1010756E'),
+        ('172801N', '1010830E'),
+        ('172820N', '1010849E'),
+        ('172944N', '1010951E'),
+        ('173038N', '1011000E'),
+        ('173059N', '1011037E'),
+        ('173107N', '1011125E'),
+        ('173123N', '1011207E'),
+        ('173152N', '1011230E'),
+        ('173406N', '1011343E'),
+        ('173531N', '1011449E'),
+        ('174044N', '1012126E'),
+        ('174059N', '1012211E'),
+        ('174057N', '1012238E'),
+        ('174105N', '1012301E'),
+        ('174224N', '1012405E'),
+        ('174234N', '1012411E'),
+        ('174256N', '1012414E'),
+        ('174301N', '1012355E'),
+        ('174304N', '1012318E'),
+        ('174314N', '1012254E'),
+        ('174345N', '1012316E'),
+        ('174401N', '1012406E'),
+        ('174356N', '1012501E'),
+        ('174400N', '1012555E'),
+        ('174444N', '1012642E'),
+        ('174457N', '1012659E'),
+        ('174503N', '1012712E'),
+        ('174500N', '1012721E'),
+        ('174444N', '1012726E'),
+        ('174422N', '1012732E'),
+        ('174313N', '1012805E'),
+        ('174321N', '1012813E'),
+        ('174350N', '1012827E'),
+        ('174416N', '1012844E'),
+        ('174444N', '1012858E'),
+        ('174555N', '1013009E'),
+        ('174644N', '1013211E'),
+        ('174731N', '1013322E'),
+        ('174834N', '1013202E'),
+        ('174849N', '1013243E'),
+        ('174913N', '1013350E'),
+        ('174943N', '1013413E'),
+        ('175023N', '1013430E'),
+        ('175110N', '1013439E'),
+        ('175205N', '1013439E'),
+        ('175115N', '1013601E'),
+        ('175155N', '1013640E'),
+        ('175304N', '1013711E'),
+        ('175341N', '1013810E'),
+        ('175443N', '1014344E'),
+        ('175555N', '1014357E'),
+        ('175952N', '1014524E'),
+        ('180225N', '1014556E'),
+        ('180330N', '1014626E'),
+        ('180424N', '1014725E'),
+        ('180424N', '1014747E'),
+        ('180344N', '1014821E'),
+        ('180307N', '1015042E'),
+        ('180151N', '1015301E'),
+        ('180213N', '1015415E'),
+        ('181132N', '1020319E'),
+        ('181230N', '1020416E'),
+        ('181249N', '1020442E'),
+        ('181244N', '1020626E'),
+        ('181236N', '1020912E'),
+        ('181201N', '1021018E'),
+        ('181109N', '1021042E'),
+        ('181009N', '1021055E'),
+        ('180907N', '1021129E'),
+        ('180753N', '1021318E'),
+        ('180741N', '1021332E'),
+        ('180726N', '1021359E'),
+        ('180538N', '1021523E'),
+        ('180305N', '1021824E'),
+        ('180213N', '1022011E'),
+        ('180219N', '1022159E'),
+        ('180057N', '1022306E'),
+        ('175939N', '1022444E'),
+        ('175839N', '1022643E'),
+        ('175816N', '1022855E'),
+        ('175815N', '1023403E'),
+        ('175718N', '1023558E'),
+        ('175455N', '1023644E'),
+        ('175100N', '1023544E'),
+        ('175026N', '1023542E'),
+        ('175013N', '1023633E'),
+        ('174846N', '1023938E'),
+        ('174836N', '1024058E'),
+        ('174902N', '1024058E'),
+        ('174954N', '1024024E'),
+        ('175100N', '1024003E'),
+        ('175155N', '1024022E'),
+        ('175224N', '1024112E'),
+        ('175254N', '1024319E'),
+        ('175325N', '1024414E'),
+        ('175521N', '1024626E'),
+        ('175711N', '1024954E'),
+        ('175749N', '1025016E'),
+        ('175819N', '1025109E'),
+        ('180032N', '1025618E'),
+        ('180043N', '1025717E'),
+        ('180027N', '1025822E'),
+        ('175918N', '1030013E'),
+        ('175903N', '1030113E'),
+        ('175926N', '1030216E'),
+        ('180018N', '1030257E'),
+        ('180109N', '1030329E'),
+        ('180132N', '1030405E'),
+        ('180207N', '1030423E'),
+        ('180538N', '1030353E'),
+        ('180644N', '1030358E'),
+        ('180732N', '1030416E'),
+        ('180805N', '1030447E'),
+        ('180819N', '1030515E'),
+        ('180827N', '1030531E'),
+        ('180828N', '1030533E'),
+        ('180812N', '1030526E'),
+        ('180810N', '1030524E'),
+        ('180806N', '1030521E'),
+        ('180805N', '1030520E'),
+        ('180830N', '1030636E'),
+        ('180906N', '1030735E'),
+        ('181000N', '1030818E'),
+        ('181116N', '1030842E'),
+        ('181317N', '1030903E'),
+        ('181413N', '1030926E'),
+        ('181459N', '1031005E'),
+        ('181517N', '1031036E'),
+        ('181527N', '1031106E'),
+        ('181544N', '1031253E'),
+        ('181611N', '1031412E'),
+        ('181633N', '1031624E'),
+        ('181649N', '1031710E'),
+        ('181715N', '1031743E'),
+        ('181748N', '1031747E'),
+        ('181818N', '1031725E'),
+        ('181957N', '1031455E'),
+        ('182009N', '1031424E'),
+        ('182029N', '1031416E'),
+        ('182042N', '1031407E'),
+        ('182057N', '1031401E'),
+        ('182120N', '1031402E'),
+        ('182248N', '1031438E'),
+        ('182400N', '1031538E'),
+        ('182456N', '1031657E'),
+        ('182532N', '1031824E'),
+        ('182629N', '1032311E'),
+        ('182629N', '1032348E'),
+        ('182531N', '1032705E'),
+        ('182519N', '1032811E'),
+        ('182519N', '1032829E'),
+        ('182527N', '1032920E'),
+        ('182525N', '1032951E'),
+        ('182503N', '1033123E'),
+        ('182455N', '1033255E'),
+        ('182401N', '1033625E'),
+        ('182326N', '1033716E'),
+        ('182259N', '1033747E'),
+        ('182240N', '1033819E'),
+        ('182111N', '1034144E'),
+        ('182058N', '1034232E'),
+        ('182048N', '1034601E'),
+        ('182038N', '1034704E'),
+        ('182017N', '1034805E'),
+        ('181949N', '1034902E'),
+        ('181914N', '1034955E'),
+        ('181832N', '1035031E'),
+        ('181746N', '1035056E'),
+        ('181711N', '1035127E'),
+        ('181659N', '1035226E'),
+        ('181703N', '1035252E'),
+        ('181713N', '1035309E'),
+        ('181728N', '1035322E'),
+        ('181750N', '1035337E'),
+        ('181855N', '1035436E'),
+        ('181939N', '1035545E'),
+        ('181958N', '1035704E'),
+        ('181950N', '1035831E'),
+        ('181906N', '1040000E'),
+        ('181756N', '1040107E'),
+        ('181255N', '1040406E'),
+        ('180652N', '1040639E'),
+        ('180543N', '1040720E'),
+        ('180446N', '1040808E'),
+        ('180132N', '1041153E'),
+        ('180107N', '1041211E'),
+        ('180031N', '1041239E'),
+        ('175453N', '1041518E'),
+        ('175304N', '1041551E'),
+        ('175226N', '1041613E'),
+        ('175152N', '1041641E'),
+        ('175141N', '1041655E'),
+        ('175124N', '1041715E'),
+        ('174909N', '1042109E'),
+        ('174802N', '1042203E'),
+        ('174525N', '1042325E'),
+        ('174423N', '1042417E'),
+        ('174401N', '1042432E'),
+        ('174338N', '1042441E'),
+        ('174227N', '1042504E'),
+        ('174159N', '1042520E'),
+        ('173957N', '1042707E'),
+        ('173825N', '1042852E'),
+        ('173344N', '1043810E'),
+        ('173321N', '1043918E'),
+        ('173138N', '1044209E'),
+        ('173054N', '1044252E'),
+        ('172912N', '1044403E'),
+        ('172729N', '1044458E'),
+        ('172659N', '1044524E'),
+        ('172639N', '1044552E'),
+        ('172606N', '1044653E'),
+        ('172544N', '1044720E'),
+        ('172524N', '1044733E'),
+        ('172222N', '1044859E'),
+        ('172139N', '1044909E'),
+        ('172056N', '1044911E'),
+        ('171800N', '1044859E'),
+        ('171424N', '1044906E'),
+        ('171138N', '1044852E'),
+        ('171017N', '1044835E'),
+        ('170129N', '1044443E'),
+        ('170009N', '1044425E'),
+        ('165636N', '1044446E'),
+        ('165438N', '1044458E'),
+        ('165359N', '1044510E'),
+        ('165244N', '1044546E'),
+        ('165205N', '1044559E'),
+        ('165122N', '1044601E'),
+        ('165040N', '1044554E'),
+        ('164918N', '1044530E'),
+        ('164908N', '1044528E'),
+        ('164835N', '1044522E'),
+        ('164754N', '1044524E'),
+        ('164256N', '1044642E'),
+        ('164217N', '1044644E'),
+        ('164138N', '1044639E'),
+        ('163924N', '1044549E'),
+        ('163653N', '1044510E'),
+        ('163418N', '1044454E'),
+        ('163257N', '1044458E'),
+        ('163144N', '1044516E'),
+        ('163040N', '1044554E'),
+        ('162949N', '1044657E'),
+        ('162803N', '1045019E'),
+        ('162714N', '1045119E'),
+        ('162618N', '1045208E'),
+        ('162518N', '1045246E'),
+        ('162414N', '1045315E'),
+        ('162221N', '1045349E'),
+        ('162144N', '1045405E'),
+        ('162112N', '1045428E'),
+        ('162044N', '1045502E'),
+        ('161951N', '1045638E'),
+        ('161927N', '1045707E'),
+        ('161815N', '1045817E'),
+        ('161755N', '1045845E'),
+        ('161738N', '1045916E'),
+        ('161700N', '1050026E'),
+        ('161636N', '1050055E'),
+        ('161527N', '1050134E'),
+        ('161409N', '1050147E'),
+        ('161129N', '1050143E'),
+        ('160954N', '1050157E'),
+        ('160829N', '1050232E'),
+        ('160716N', '1050329E'),
+        ('160619N', '1050445E'),
+        ('160545N', '1050625E'),
+        ('160302N', '1051414E'),
+        ('160256N', '1051450E'),
+        ('160250N', '1051718E'),
+        ('160107N', '1052417E'),
+        ('160054N', '1052452E'),
+        ('160035N', '1052519E'),
+        ('160018N', '1052523E'),
+        ('160007N', '1052526E'),
+        ('155941N', '1052505E'),
+        ('155920N', '1052426E'),
+        ('155850N', '1052311E'),
+        ('155717N', '1052144E'),
+        ('155509N', '1052138E'),
+        ('155255N', '1052221E'),
+        ('154759N', '1052443E'),
+        ('154702N', '1052522E'),
+        ('154617N', '1052608E'),
+        ('154553N', '1052652E'),
+        ('154546N', '1052744E'),
+        ('154558N', '1053012E'),
+        ('154548N', '1053131E'),
+        ('154457N', '1053406E'),
+        ('154317N', '1053646E'),
+        ('154055N', '1053827E'),
+        ('153804N', '1053903E'),
+        ('153459N', '1053827E'),
+        ('153116N', '1053658E'),
+        ('152958N', '1053643E'),
+        ('152725N', '1053637E'),
+        ('152621N', '1053615E'),
+        ('152539N', '1053532E'),
+        ('152525N', '1053518E'),
+        ('152407N', '1053310E'),
+        ('152315N', '1053022E'),
+        ('152229N', '1052910E'),
+        ('152110N', '1052838E'),
+        ('152004N', '1052859E'),
+        ('151928N', '1052956E'),
+        ('151915N', '1053109E'),
+        ('151917N', '1053218E'),
+        ('151930N', '1053328E'),
+        ('151915N', '1053341E'),
+        ('151758N', '1053353E'),
+        ('151621N', '1053350E'),
+        ('151615N', '1053336E'),
+        ('151510N', '1053153E'),
+        ('151351N', '1053014E'),
+        ('151121N', '1052747E'),
+        ('151031N', '1052715E'),
+        ('150919N', '1052651E'),
+        ('150801N', '1052637E'),
+        ('150640N', '1052637E'),
+        ('150541N', '1052706E'),
+        ('150526N', '1052825E'),
+        ('150358N', '1052953E'),
+        ('150353N', '1053012E'),
+        ('150401N', '1053059E'),
+        ('150358N', '1053115E'),
+        ('150340N', '1053123E'),
+        ('150300N', '1053122E'),
+        ('150245N', '1053127E'),
+        ('150019N', '1053312E'),
+        ('145945N', '1053358E'),
+        ('145945N', '1053358E'),
+        ('145945N', '1053359E'),
+        ('145926N', '1053535E'),
+        ('145839N', '1053500E'),
+        ('145711N', '1053238E'),
+        ('145602N', '1053202E'),
+        ('145408N', '1053302E'),
+        ('145248N', '1053234E'),
+        ('145240N', '1053215E'),
+        ('145243N', '1053118E'),
+        ('145239N', '1053103E'),
+        ('145218N', '1053057E'),
+        ('145123N', '1053101E'),
+        ('145033N', '1053126E'),
+        ('145014N', '1053127E'),
+        ('145000N', '1053112E'),
+        ('144949N', '1053022E'),
+        ('144938N', '1053005E'),
+        ('144832N', '1052937E'),
+        ('144710N', '1052920E'),
+        ('144549N', '1052926E'),
+        ('144445N', '1053005E'),
+        ('144410N', '1053018E'),
+        ('144125N', '1052950E'),
+        ('143935N', '1052944E'),
+        ('143536N', '1053036E'),
+        ('143350N', '1053027E'),
+        ('143213N', '1052943E'),
+        ('142945N', '1052749E'),
+        ('142831N', '1052625E'),
+        ('142804N', '1052601E'),
+        ('142729N', '1052544E'),
+        ('142606N', '1052513E'),
+        ('142541N', '1052457E'),
+        ('142522N', '1052420E'),
+        ('142505N', '1052245E'),
+        ('142452N', '1052203E'),
+        ('142429N', '1052134E'),
+        ('142324N', '1052027E'),
+        ('142308N', '1052006E'),
+        ('142310N', '1051920E'),
+        ('142353N', '1051816E'),
+        ('142356N', '1051741E'),
+        ('142335N', '1051715E'),
+        ('142219N', '1051632E'),
+        ('142151N', '1051606E'),
+        ('142125N', '1051501E'),
+        ('142042N', '1051153E'),
+        ('142044N', '1051103E'),    # Thailand - Cambodia boundary
+        ('141949N', '1050918E'),
+        ('141650N', '1050755E'),
+        ('141349N', '1050605E'),
+        ('141250N', '1050250E'),
+        ('141327N', '1050131E'),
+        ('141437N', '1050027E'),
+        ('141804N', '1045833E'),
+        ('141834N', '1045827E'),
+        ('142117N', '1045844E'),
+        ('142206N', '1045843E'),
+        ('142250N', '1045825E'),
+        ('142310N', '1045718E'),
+        ('142335N', '1045456E'),
+        ('142346N', '1045353E'),
+        ('142400N', '1045324E'),
+        ('142438N', '1045227E'),
+        ('142449N', '1045159E'),
+        ('142450N', '1045126E'),
+        ('142441N', '1045018E'),
+        ('142442N', '1044953E'),
+        ('142511N', '1044854E'),
+        ('142548N', '1044806E'),
+        ('142617N', '1044717E'),
+        ('142623N', '1044618E'),
+        ('142558N', '1044528E'),
+        ('142435N', '1044340E'),
+        ('142424N', '1044246E'),
+        ('142444N', '1044222E'),
+        ('142548N', '1044203E'),
+        ('142602N', '1044134E'),
+        ('142550N', '1044104E'),
+        ('142452N', '1044029E'),
+        ('142434N', '1044006E'),
+        ('142432N', '1043904E'),
+        ('142509N', '1043735E'),
+        ('142508N', '1043637E'),
+        ('142436N', '1043540E'),
+        ('142344N', '1043500E'),
+        ('142249N', '1043425E'),
+        ('142206N', '1043346E'),
+        ('142137N', '1043234E'),
+        ('142148N', '1043135E'),
+        ('142213N', '1043038E'),
+        ('142226N', '1042933E'),
+        ('142216N', '1042855E'),
+        ('142156N', '1042826E'),
+        ('142136N', '1042803E'),
+        ('142125N', '1042743E'),
+        ('142125N', '1042730E'),
+        ('142124N', '1042709E'),
+        ('142131N', '1042645E'),
+        ('142141N', '1042621E'),
+        ('142239N', '1041931E'),
+        ('142356N', '1041616E'),
+        ('142403N', '1041450E'),
+        ('142335N', '1041356E'),
+        ('142258N', '1041308E'),
+        ('142240N', '1041204E'),
+        ('142256N', '1041121E'),
+        ('142329N', '1041100E'),
+        ('142401N', '1041057E'),
+        ('142414N', '1041108E'),
+        ('142415N', '1041037E'),
+        ('142404N', '1041029E'),
+        ('142345N', '1041023E'),
+        ('142210N', '1040854E'),
+        ('142157N', '1040827E'),
+        ('142158N', '1040742E'),
+        ('142217N', '1040716E'),
+        ('142238N', '1040658E'),
+        ('142249N', '1040636E'),
+        ('142214N', '1040425E'),
+        ('142126N', '1040244E'),
+        ('142125N', '1040242E'),
+        ('142109N', '1040209E'),
+        ('142042N', '1040004E'),
+        ('142202N', '1035826E'),
+        ('142152N', '1035511E'),
+        ('142122N', '1035437E'),
+        ('142053N', '1035428E'),
+        ('142032N', '1035410E'),
+        ('142025N', '1035306E'),
+        ('142035N', '1035213E'),
+        ('142058N', '1035133E'),
+        ('142125N', '1035057E'),
+        ('142148N', '1035018E'),
+        ('142204N', '1034926E'),
+        ('142204N', '1034855E'),
+        ('142157N', '1034826E'),
+        ('142153N', '1034739E'),
+        ('142201N', '1034630E'),
+        ('142253N', '1034259E'),
+        ('142301N', '1034056E'),
+        ('142311N', '1034029E'),
+        ('142344N', '1034018E'),
+        ('142509N', '1034025E'),
+        ('142546N', '1034017E'),
+        ('142609N', '1033955E'),
+        ('142628N', '1033925E'),
+        ('142638N', '1033849E'),
+        ('142635N', '1033813E'),
+        ('142616N', '1033738E'),
+        ('142550N', '1033728E'),
+        ('142520N', '1033722E'),
+        ('142452N', '1033700E'),
+        ('142415N', '1033546E'),
+        ('142426N', '1033453E'),
+        ('142457N', '1033405E'),
+        ('142518N', '1033300E'),
+        ('142508N', '1033200E'),
+        ('142359N', '1032941E'),
+        ('142227N', '1032725E'),
+        ('142217N', '1032658E'),
+        ('142222N', '1032621E'),
+        ('142239N', '1032553E'),
+        ('142257N', '1032534E'),
+        ('142305N', '1032521E'),
+        ('142250N', '1032429E'),
+        ('142139N', '1032248E'),
+        ('142112N', '1032146E'),
+        ('142103N', '1032028E'),
+        ('142103N', '1031625E'),
+        ('142030N', '1031435E'),
+        ('141942N', '1031154E'),
+        ('141911N', '1030817E'),
+        ('141847N', '1030704E'),
+        ('141744N', '1030506E'),
+        ('141419N', '1030100E'),
+        ('141343N', '1030017E'),
+        ('141308N', '1025916E'),
+        ('141231N', '1025703E'),
+        ('141203N', '1025602E'),
+        ('141107N', '1025506E'),
+        ('141009N', '1025450E'),
+        ('140953N', '1025450E'),
+        ('140906N', '1025449E'),
+        ('140755N', '1025440E'),
+        ('140657N', '1025414E'),
+        ('140513N', '1025259E'),
+        ('140416N', '1025234E'),
+        ('140254N', '1025222E'),
+        ('140200N', '1025224E'),
+        ('140114N', '1025211E'),
+        ('140014N', '1025117E'),
+        ('135736N', '1024750E'),
+        ('135609N', '1024622E'),
+        ('135414N', '1024515E'),
+        ('135058N', '1024413E'),
+        ('134955N', '1024344E'),
+        ('134837N', '1024240E'),
+        ('134807N', '1024223E'),
+        ('134730N', '1024214E'),
+        ('134616N', '1024209E'),
+        ('134542N', '1024155E'),
+        ('134430N', '1024029E'),
+        ('134138N', '1023427E'),
+        ('134010N', '1023232E'),
+        ('133854N', '1023227E'),
+        ('133740N', '1023345E'),
+        ('133619N', '1023551E'),
+        ('133601N', '1023446E'),
+        ('133425N', '1023157E'),
+        ('133401N', '1023047E'),
+        ('133343N', '1022708E'),
+        ('133408N', '1022216E'),
+        ('133352N', '1021956E'),
+        ('133227N', '1021848E'),
+        ('133149N', '1021853E'),
+        ('133048N', '1021931E'),
+        ('133015N', '1021945E'),
+        ('132946N', '1021948E'),
+        ('132904N', '1021946E'),
+        ('132854N', '1021945E'),
+        ('132422N', '1022001E'),
+        ('132043N', '1021937E'),
+        ('131630N', '1021941E'),
+        ('131621N', '1021945E'),
+        ('130811N', '1022255E'),
+        ('130610N', '1022406E'),
+        ('130302N', '1022650E'),
+        ('130109N', '1022747E'),
+        ('130022N', '1022823E'),
+        ('125945N', '1022924E'),
+        ('125942N', '1022924E'),
+        ('125923N', '1022923E'),
+        ('125905N', '1022911E'),
+        ('125849N', '1022852E'),
+        ('125837N', '1022826E'),
+        ('125824N', '1022807E'),
+        ('125810N', '1022801E'),
+        ('125754N', '1022808E'),
+        ('125726N', '1022839E'),
+        ('125713N', '1022844E'),
+        ('125659N', '1022839E'),
+        ('125616N', '1022758E'),
+        ('125539N', '1022753E'),
+        ('125458N', '1022804E'),
+        ('125418N', '1022826E'),
+        ('125255N', '1022845E'),
+        ('125037N', '1022900E'),
+        ('124923N', '1022923E'),
+        ('124845N', '1022943E'),
+        ('124823N', '1023001E'),
+        ('124759N', '1023015E'),
+        ('124715N', '1023023E'),
+        ('124639N', '1023020E'),
+        ('124445N', '1022942E'),
+        ('124445N', '1022942E'),
+        ('124406N', '1022857E'),
+        ('124310N', '1022840E'),
+        ('124154N', '1022836E'),
+        ('124037N', '1022845E'),
+        ('123940N', '1022910E'),
+        ('123914N', '1022945E'),
+        ('123859N', '1023006E'),
+        ('123752N', '1023331E'),
+        ('123635N', '1023518E'),
+        ('123203N', '1023953E'),
+        ('123110N', '1024123E'),
+        ('123047N', '1024148E'),
+        ('123017N', '1024201E'),
+        ('122917N', '1024207E'),
+        ('122849N', '1024217E'),
+        ('122757N', '1024306E'),
+        ('122656N', '1024502E'),
+        ('122609N', '1024543E'),
+        ('122530N', '1024549E'),
+        ('122458N', '1024554E'),
+        ('122408N', '1024523E'),
+        ('122248N', '1024350E'),
+        ('122140N', '1024312E'),
+        ('122031N', '1024254E'),
+        ('121042N', '1024131E'),
+        ('120819N', '1024159E'),
+        ('120339N', '1024504E'),
+        ('120240N', '1024554E'),
+        ('120214N', '1024615E'),
+        ('120009N', '1024713E'),
+        ('115710N', '1024749E'),
+        ('115157N', '1025034E'),
+        ('114827N', '1025306E'),
+        ('114555N', '1025449E'),
+        ('114332N', '1025530E'),
+        ('114007N', '1025543E'),
+        ('113845N', '1025448E'),    # Thailand - Cambodia boundary
     
-    # First defined point:
-    ('100007N', '1021448E'),
-    ('070000N', '1030000E'),
-    ('064500N', '1024000E'),
-    ('061500N', '1021500E'),
+        # First defined point:
+        ('100007N', '1021448E'),
+        ('070000N', '1030000E'),
+        ('064500N', '1024000E'),
+        ('061500N', '1021500E'),
 
     
-    # Westward along Thailand–Malaysia border
-    # ('061500N', '1020423E'),    # Thailand - Malaysia boundary
-    ('061500N', '1020545E'),    # Thailand - Malaysia boundary        
-    ('061217N', '1020500E'),    # Thailand - Malaysia boundary
-    ('060735N', '1020416E'),    # Thailand - Malaysia boundary
-    ('060541N', '1020336E'),    # Thailand - Malaysia boundary
-    ('060406N', '1020200E'),    # Thailand - Malaysia boundary
-    ('060041N', '1015733E'),    # Thailand - Malaysia boundary
-    ('055854N', '1015605E'),    # Thailand - Malaysia boundary
-    ('055624N', '1015511E'),    # Thailand - Malaysia boundary
-    ('055351N', '1015509E'),    # Thailand - Malaysia boundary
-    ('055133N', '1015446E'),    # Thailand - Malaysia boundary
-    ('054951N', '1015249E'),    # Thailand - Malaysia boundary
-    ('054925N', '1015209E'),    # Thailand - Malaysia boundary
-    ('054855N', '1015151E'),    # Thailand - Malaysia boundary
-    ('054823N', '1015139E'),    # Thailand - Malaysia boundary
-    ('054751N', '1015117E'),    # Thailand - Malaysia boundary
-    ('054647N', '1014931E'),    # Thailand - Malaysia boundary
-    ('054625N', '1014912E'),    # Thailand - Malaysia boundary
-    ('054509N', '1014844E'),    # Thailand - Malaysia boundary
-    ('054423N', '1014801E'),    # Thailand - Malaysia boundary
-    ('054417N', '1014702E'),    # Thailand - Malaysia boundary
-    ('054458N', '1014546E'),    # Thailand - Malaysia boundary
-    ('054536N', '1014515E'),    # Thailand - Malaysia boundary
-    ('054620N', '1014452E'),    # Thailand - Malaysia boundary
-    ('054656N', '1014424E'),    # Thailand - Malaysia boundary
-    ('054711N', '1014336E'),    # Thailand - Malaysia boundary
-    ('054658N', '1014253E'),    # Thailand - Malaysia boundary
-    ('054601N', '1014151E'),    # Thailand - Malaysia boundary
-    ('054558N', '1014147E'),    # Thailand - Malaysia boundary
-    ('054540N', '1014112E'),    # Thailand - Malaysia boundary
-    ('054556N', '1013957E'),    # Thailand - Malaysia boundary
-    ('054657N', '1013901E'),    # Thailand - Malaysia boundary
-    ('054942N', '1013750E'),    # Thailand - Malaysia boundary
-    ('055014N', '1013752E'),    # Thailand - Malaysia boundary
-    ('055050N', '1013803E'),    # Thailand - Malaysia boundary
-    ('055120N', '1013802E'),    # Thailand - Malaysia boundary
-    ('055133N', '1013728E'),    # Thailand - Malaysia boundary
-    ('055140N', '1013646E'),    # Thailand - Malaysia boundary
-    ('055157N', '1013618E'),    # Thailand - Malaysia boundary
-    ('055226N', '1013559E'),    # Thailand - Malaysia boundary
-    ('055307N', '1013542E'),    # Thailand - Malaysia boundary
-    ('055422N', '1013445E'),    # Thailand - Malaysia boundary
-    ('055440N', '1013328E'),    # Thailand - Malaysia boundary
-    ('055421N', '1013204E'),    # Thailand - Malaysia boundary
-    ('055333N', '1013000E'),    # Thailand - Malaysia boundary
-    ('055103N', '1012333E'),    # Thailand - Malaysia boundary
-    ('054942N', '1012127E'),    # Thailand - Malaysia boundary
-    ('054836N', '1011908E'),    # Thailand - Malaysia boundary
-    ('054810N', '1011646E'),    # Thailand - Malaysia boundary
-    ('054713N', '1011456E'),    # Thailand - Malaysia boundary
-    ('054429N', '1011411E'),    # Thailand - Malaysia boundary
-    ('054309N', '1011400E'),    # Thailand - Malaysia boundary
-    ('054157N', '1011330E'),    # Thailand - Malaysia boundary
-    ('054053N', '1011244E'),    # Thailand - Malaysia boundary
-    ('054000N', '1011148E'),    # Thailand - Malaysia boundary
-    ('053819N', '1010859E'),    # Thailand - Malaysia boundary
-    ('053747N', '1010719E'),    # Thailand - Malaysia boundary
-    ('053815N', '1010619E'),    # Thailand - Malaysia boundary
-    ('053945N', '1010538E'),    # Thailand - Malaysia boundary
-    ('054115N', '1010443E'),    # Thailand - Malaysia boundary
-    ('054234N', '1010335E'),    # Thailand - Malaysia boundary
-    ('054328N', '1010214E'),    # Thailand - Malaysia boundary
-    ('054335N', '1010138E'),    # Thailand - Malaysia boundary
-    ('054332N', '1010030E'),    # Thailand - Malaysia boundary
-    ('054346N', '1005955E'),    # Thailand - Malaysia boundary
-    ('054414N', '1005930E'),    # Thailand - Malaysia boundary
-    ('054539N', '1005848E'),    # Thailand - Malaysia boundary
-    ('054622N', '1005820E'),    # Thailand - Malaysia boundary
-    ('054651N', '1005801E'),    # Thailand - Malaysia boundary
-    ('054732N', '1005755E'),    # Thailand - Malaysia boundary
-    ('054814N', '1005803E'),    # Thailand - Malaysia boundary
-    ('054855N', '1005827E'),    # Thailand - Malaysia boundary
-    ('055354N', '1010055E'),    # Thailand - Malaysia boundary
-    ('055432N', '1010154E'),    # Thailand - Malaysia boundary
-    ('055447N', '1010310E'),    # Thailand - Malaysia boundary
-    ('055511N', '1010416E'),    # Thailand - Malaysia boundary
-    ('055617N', '1010443E'),    # Thailand - Malaysia boundary
-    ('055725N', '1010449E'),    # Thailand - Malaysia boundary
-    ('055922N', '1010514E'),    # Thailand - Malaysia boundary
-    ('060247N', '1010520E'),    # Thailand - Malaysia boundary
-    ('060508N', '1010539E'),    # Thailand - Malaysia boundary
-    ('060620N', '1010513E'),    # Thailand - Malaysia boundary
-    ('060710N', '1010406E'),    # Thailand - Malaysia boundary
-    ('060804N', '1010309E'),    # Thailand - Malaysia boundary
-    ('060927N', '1010312E'),    # Thailand - Malaysia boundary
-    ('061027N', '1010400E'),    # Thailand - Malaysia boundary
-    ('061049N', '1010448E'),    # Thailand - Malaysia boundary
-    ('061119N', '1010520E'),    # Thailand - Malaysia boundary
-    ('061247N', '1010527E'),    # Thailand - Malaysia boundary
-    ('061400N', '1010517E'),    # Thailand - Malaysia boundary
-    ('061447N', '1010453E'),    # Thailand - Malaysia boundary
-    ('061503N', '1010408E'),    # Thailand - Malaysia boundary
-    ('061427N', '1010123E'),    # Thailand - Malaysia boundary
-    ('061446N', '1010023E'),    # Thailand - Malaysia boundary
-    ('061621N', '1005827E'),    # Thailand - Malaysia boundary
-    ('061607N', '1005718E'),    # Thailand - Malaysia boundary
-    ('061426N', '1005544E'),    # Thailand - Malaysia boundary
-    ('061408N', '1005436E'),    # Thailand - Malaysia boundary
-    ('061446N', '1005206E'),    # Thailand - Malaysia boundary
-    ('061452N', '1005118E'),    # Thailand - Malaysia boundary
-    ('061438N', '1005034E'),    # Thailand - Malaysia boundary
-    ('061413N', '1005014E'),    # Thailand - Malaysia boundary
-    ('061412N', '1004958E'),    # Thailand - Malaysia boundary
-    ('061505N', '1004928E'),    # Thailand - Malaysia boundary
-    ('061535N', '1004919E'),    # Thailand - Malaysia boundary
-    ('061719N', '1004917E'),    # Thailand - Malaysia boundary
-    ('061751N', '1004924E'),    # Thailand - Malaysia boundary
-    ('061754N', '1004925E'),    # Thailand - Malaysia boundary
-    ('061825N', '1004936E'),    # Thailand - Malaysia boundary
-    ('061858N', '1004944E'),    # Thailand - Malaysia boundary
-    ('061928N', '1004937E'),    # Thailand - Malaysia boundary
-    ('062041N', '1004854E'),    # Thailand - Malaysia boundary
-    ('062120N', '1004838E'),    # Thailand - Malaysia boundary
-    ('062202N', '1004830E'),    # Thailand - Malaysia boundary
-    ('062453N', '1004820E'),    # Thailand - Malaysia boundary
-    ('062602N', '1004746E'),    # Thailand - Malaysia boundary
-    ('062650N', '1004623E'),    # Thailand - Malaysia boundary
-    ('062656N', '1004542E'),    # Thailand - Malaysia boundary
-    ('062655N', '1004505E'),    # Thailand - Malaysia boundary
-    ('062700N', '1004432E'),    # Thailand - Malaysia boundary
-    ('062722N', '1004401E'),    # Thailand - Malaysia boundary
-    ('062753N', '1004352E'),    # Thailand - Malaysia boundary
-    ('062913N', '1004353E'),    # Thailand - Malaysia boundary
-    ('062935N', '1004347E'),    # Thailand - Malaysia boundary
-    ('062934N', '1004246E'),    # Thailand - Malaysia boundary
-    ('062649N', '1003854E'),    # Thailand - Malaysia boundary
-    ('062641N', '1003750E'),    # Thailand - Malaysia boundary
-    ('062657N', '1003645E'),    # Thailand - Malaysia boundary
-    ('062751N', '1003442E'),    # Thailand - Malaysia boundary
-    ('062854N', '1003102E'),    # Thailand - Malaysia boundary
-    ('062925N', '1002957E'),    # Thailand - Malaysia boundary
-    ('063047N', '1002802E'),    # Thailand - Malaysia boundary
-    ('063100N', '1002708E'),    # Thailand - Malaysia boundary
-    ('063050N', '1002535E'),    # Thailand - Malaysia boundary
-    ('063054N', '1002434E'),    # Thailand - Malaysia boundary
-    ('063119N', '1002314E'),    # Thailand - Malaysia boundary
-    ('063136N', '1002239E'),    # Thailand - Malaysia boundary
-    ('063226N', '1002055E'),    # Thailand - Malaysia boundary
-    ('063327N', '1001945E'),    # Thailand - Malaysia boundary
-    ('063436N', '1001904E'),    # Thailand - Malaysia boundary
-    ('064120N', '1001650E'),    # Thailand - Malaysia boundary
-    ('064146N', '1001626E'),    # Thailand - Malaysia boundary
-    ('064200N', '1001547E'),    # Thailand - Malaysia boundary
-    ('064203N', '1001506E'),    # Thailand - Malaysia boundary
-    ('064200N', '1001433E'),    # Thailand - Malaysia boundary
-    ('064126N', '1001339E'),    # Thailand - Malaysia boundary
-    ('064119N', '1001339E'),    # Thailand - Malaysia boundary
-    ('064121N', '1001244E'),    # Thailand - Malaysia boundary
-    ('064137N', '1001213E'),    # Thailand - Malaysia boundary
-    ('064157N', '1001157E'),    # Thailand - Malaysia boundary
-    ('064208N', '1001147E'),    # Thailand - Malaysia boundary
-    ('064228N', '1001115E'),    # Thailand - Malaysia boundary
-    ('064212N', '1001023E'),    # Thailand - Malaysia boundary
-    ('064142N', '1001000E'),    # Thailand - Malaysia boundary
-    ('064101N', '1000950E'),    # Thailand - Malaysia boundary
-    ('063940N', '1000945E'),    # Thailand - Malaysia boundary
-    ('063714N', '1000921E'),    # Thailand - Malaysia boundary
-    ('063612N', '1000925E'),    # Thailand - Malaysia boundary
-    ('063449N', '1000954E'),    # Thailand - Malaysia boundary
-    ('063358N', '1001001E'),    # Thailand - Malaysia boundary
-    ('063326N', '1000940E'),    # Thailand - Malaysia boundary
-    ('063259N', '1000908E'),    # Thailand - Malaysia boundary
-    ('063222N', '1000844E'),    # Thailand - Malaysia boundary
-    ('063150N', '1000841E'),    # Thailand - Malaysia boundary
-    ('063047N', '1000853E'),    # Thailand - Malaysia boundary
-    ('063016N', '1000854E'),    # Thailand - Malaysia boundary
-    ('062846N', '1000839E'),    # Thailand - Malaysia boundary
-    ('062727N', '1000808E'),    # Thailand - Malaysia boundary
-    ('062632N', '1000738E'),    # Thailand - Malaysia boundary
+        # Westward along Thailand–Malaysia border
+        # ('061500N', '1020423E'),    # Thailand - Malaysia boundary
+        ('061500N', '1020545E'),    # Thailand - Malaysia boundary        
+        ('061217N', '1020500E'),    # Thailand - Malaysia boundary
+        ('060735N', '1020416E'),    # Thailand - Malaysia boundary
+        ('060541N', '1020336E'),    # Thailand - Malaysia boundary
+        ('060406N', '1020200E'),    # Thailand - Malaysia boundary
+        ('060041N', '1015733E'),    # Thailand - Malaysia boundary
+        ('055854N', '1015605E'),    # Thailand - Malaysia boundary
+        ('055624N', '1015511E'),    # Thailand - Malaysia boundary
+        ('055351N', '1015509E'),    # Thailand - Malaysia boundary
+        ('055133N', '1015446E'),    # Thailand - Malaysia boundary
+        ('054951N', '1015249E'),    # Thailand - Malaysia boundary
+        ('054925N', '1015209E'),    # Thailand - Malaysia boundary
+        ('054855N', '1015151E'),    # Thailand - Malaysia boundary
+        ('054823N', '1015139E'),    # Thailand - Malaysia boundary
+        ('054751N', '1015117E'),    # Thailand - Malaysia boundary
+        ('054647N', '1014931E'),    # Thailand - Malaysia boundary
+        ('054625N', '1014912E'),    # Thailand - Malaysia boundary
+        ('054509N', '1014844E'),    # Thailand - Malaysia boundary
+        ('054423N', '1014801E'),    # Thailand - Malaysia boundary
+        ('054417N', '1014702E'),    # Thailand - Malaysia boundary
+        ('054458N', '1014546E'),    # Thailand - Malaysia boundary
+        ('054536N', '1014515E'),    # Thailand - Malaysia boundary
+        ('054620N', '1014452E'),    # Thailand - Malaysia boundary
+        ('054656N', '1014424E'),    # Thailand - Malaysia boundary
+        ('054711N', '1014336E'),    # Thailand - Malaysia boundary
+        ('054658N', '1014253E'),    # Thailand - Malaysia boundary
+        ('054601N', '1014151E'),    # Thailand - Malaysia boundary
+        ('054558N', '1014147E'),    # Thailand - Malaysia boundary
+        ('054540N', '1014112E'),    # Thailand - Malaysia boundary
+        ('054556N', '1013957E'),    # Thailand - Malaysia boundary
+        ('054657N', '1013901E'),    # Thailand - Malaysia boundary
+        ('054942N', '1013750E'),    # Thailand - Malaysia boundary
+        ('055014N', '1013752E'),    # Thailand - Malaysia boundary
+        ('055050N', '1013803E'),    # Thailand - Malaysia boundary
+        ('055120N', '1013802E'),    # Thailand - Malaysia boundary
+        ('055133N', '1013728E'),    # Thailand - Malaysia boundary
+        ('055140N', '1013646E'),    # Thailand - Malaysia boundary
+        ('055157N', '1013618E'),    # Thailand - Malaysia boundary
+        ('055226N', '1013559E'),    # Thailand - Malaysia boundary
+        ('055307N', '1013542E'),    # Thailand - Malaysia boundary
+        ('055422N', '1013445E'),    # Thailand - Malaysia boundary
+        ('055440N', '1013328E'),    # Thailand - Malaysia boundary
+        ('055421N', '1013204E'),    # Thailand - Malaysia boundary
+        ('055333N', '1013000E'),    # Thailand - Malaysia boundary
+        ('055103N', '1012333E'),    # Thailand - Malaysia boundary
+        ('054942N', '1012127E'),    # Thailand - Malaysia boundary
+        ('054836N', '1011908E'),    # Thailand - Malaysia boundary
+        ('054810N', '1011646E'),    # Thailand - Malaysia boundary
+        ('054713N', '1011456E'),    # Thailand - Malaysia boundary
+        ('054429N', '1011411E'),    # Thailand - Malaysia boundary
+        ('054309N', '1011400E'),    # Thailand - Malaysia boundary
+        ('054157N', '1011330E'),    # Thailand - Malaysia boundary
+        ('054053N', '1011244E'),    # Thailand - Malaysia boundary
+        ('054000N', '1011148E'),    # Thailand - Malaysia boundary
+        ('053819N', '1010859E'),    # Thailand - Malaysia boundary
+        ('053747N', '1010719E'),    # Thailand - Malaysia boundary
+        ('053815N', '1010619E'),    # Thailand - Malaysia boundary
+        ('053945N', '1010538E'),    # Thailand - Malaysia boundary
+        ('054115N', '1010443E'),    # Thailand - Malaysia boundary
+        ('054234N', '1010335E'),    # Thailand - Malaysia boundary
+        ('054328N', '1010214E'),    # Thailand - Malaysia boundary
+        ('054335N', '1010138E'),    # Thailand - Malaysia boundary
+        ('054332N', '1010030E'),    # Thailand - Malaysia boundary
+        ('054346N', '1005955E'),    # Thailand - Malaysia boundary
+        ('054414N', '1005930E'),    # Thailand - Malaysia boundary
+        ('054539N', '1005848E'),    # Thailand - Malaysia boundary
+        ('054622N', '1005820E'),    # Thailand - Malaysia boundary
+        ('054651N', '1005801E'),    # Thailand - Malaysia boundary
+        ('054732N', '1005755E'),    # Thailand - Malaysia boundary
+        ('054814N', '1005803E'),    # Thailand - Malaysia boundary
+        ('054855N', '1005827E'),    # Thailand - Malaysia boundary
+        ('055354N', '1010055E'),    # Thailand - Malaysia boundary
+        ('055432N', '1010154E'),    # Thailand - Malaysia boundary
+        ('055447N', '1010310E'),    # Thailand - Malaysia boundary
+        ('055511N', '1010416E'),    # Thailand - Malaysia boundary
+        ('055617N', '1010443E'),    # Thailand - Malaysia boundary
+        ('055725N', '1010449E'),    # Thailand - Malaysia boundary
+        ('055922N', '1010514E'),    # Thailand - Malaysia boundary
+        ('060247N', '1010520E'),    # Thailand - Malaysia boundary
+        ('060508N', '1010539E'),    # Thailand - Malaysia boundary
+        ('060620N', '1010513E'),    # Thailand - Malaysia boundary
+        ('060710N', '1010406E'),    # Thailand - Malaysia boundary
+        ('060804N', '1010309E'),    # Thailand - Malaysia boundary
+        ('060927N', '1010312E'),    # Thailand - Malaysia boundary
+        ('061027N', '1010400E'),    # Thailand - Malaysia boundary
+        ('061049N', '1010448E'),    # Thailand - Malaysia boundary
+        ('061119N', '1010520E'),    # Thailand - Malaysia boundary
+        ('061247N', '1010527E'),    # Thailand - Malaysia boundary
+        ('061400N', '1010517E'),    # Thailand - Malaysia boundary
+        ('061447N', '1010453E'),    # Thailand - Malaysia boundary
+        ('061503N', '1010408E'),    # Thailand - Malaysia boundary
+        ('061427N', '1010123E'),    # Thailand - Malaysia boundary
+        ('061446N', '1010023E'),    # Thailand - Malaysia boundary
+        ('061621N', '1005827E'),    # Thailand - Malaysia boundary
+        ('061607N', '1005718E'),    # Thailand - Malaysia boundary
+        ('061426N', '1005544E'),    # Thailand - Malaysia boundary
+        ('061408N', '1005436E'),    # Thailand - Malaysia boundary
+        ('061446N', '1005206E'),    # Thailand - Malaysia boundary
+        ('061452N', '1005118E'),    # Thailand - Malaysia boundary
+        ('061438N', '1005034E'),    # Thailand - Malaysia boundary
+        ('061413N', '1005014E'),    # Thailand - Malaysia boundary
+        ('061412N', '1004958E'),    # Thailand - Malaysia boundary
+        ('061505N', '1004928E'),    # Thailand - Malaysia boundary
+        ('061535N', '1004919E'),    # Thailand - Malaysia boundary
+        ('061719N', '1004917E'),    # Thailand - Malaysia boundary
+        ('061751N', '1004924E'),    # Thailand - Malaysia boundary
+        ('061754N', '1004925E'),    # Thailand - Malaysia boundary
+        ('061825N', '1004936E'),    # Thailand - Malaysia boundary
+        ('061858N', '1004944E'),    # Thailand - Malaysia boundary
+        ('061928N', '1004937E'),    # Thailand - Malaysia boundary
+        ('062041N', '1004854E'),    # Thailand - Malaysia boundary
+        ('062120N', '1004838E'),    # Thailand - Malaysia boundary
+        ('062202N', '1004830E'),    # Thailand - Malaysia boundary
+        ('062453N', '1004820E'),    # Thailand - Malaysia boundary
+        ('062602N', '1004746E'),    # Thailand - Malaysia boundary
+        ('062650N', '1004623E'),    # Thailand - Malaysia boundary
+        ('062656N', '1004542E'),    # Thailand - Malaysia boundary
+        ('062655N', '1004505E'),    # Thailand - Malaysia boundary
+        ('062700N', '1004432E'),    # Thailand - Malaysia boundary
+        ('062722N', '1004401E'),    # Thailand - Malaysia boundary
+        ('062753N', '1004352E'),    # Thailand - Malaysia boundary
+        ('062913N', '1004353E'),    # Thailand - Malaysia boundary
+        ('062935N', '1004347E'),    # Thailand - Malaysia boundary
+        ('062934N', '1004246E'),    # Thailand - Malaysia boundary
+        ('062649N', '1003854E'),    # Thailand - Malaysia boundary
+        ('062641N', '1003750E'),    # Thailand - Malaysia boundary
+        ('062657N', '1003645E'),    # Thailand - Malaysia boundary
+        ('062751N', '1003442E'),    # Thailand - Malaysia boundary
+        ('062854N', '1003102E'),    # Thailand - Malaysia boundary
+        ('062925N', '1002957E'),    # Thailand - Malaysia boundary
+        ('063047N', '1002802E'),    # Thailand - Malaysia boundary
+        ('063100N', '1002708E'),    # Thailand - Malaysia boundary
+        ('063050N', '1002535E'),    # Thailand - Malaysia boundary
+        ('063054N', '1002434E'),    # Thailand - Malaysia boundary
+        ('063119N', '1002314E'),    # Thailand - Malaysia boundary
+        ('063136N', '1002239E'),    # Thailand - Malaysia boundary
+        ('063226N', '1002055E'),    # Thailand - Malaysia boundary
+        ('063327N', '1001945E'),    # Thailand - Malaysia boundary
+        ('063436N', '1001904E'),    # Thailand - Malaysia boundary
+        ('064120N', '1001650E'),    # Thailand - Malaysia boundary
+        ('064146N', '1001626E'),    # Thailand - Malaysia boundary
+        ('064200N', '1001547E'),    # Thailand - Malaysia boundary
+        ('064203N', '1001506E'),    # Thailand - Malaysia boundary
+        ('064200N', '1001433E'),    # Thailand - Malaysia boundary
+        ('064126N', '1001339E'),    # Thailand - Malaysia boundary
+        ('064119N', '1001339E'),    # Thailand - Malaysia boundary
+        ('064121N', '1001244E'),    # Thailand - Malaysia boundary
+        ('064137N', '1001213E'),    # Thailand - Malaysia boundary
+        ('064157N', '1001157E'),    # Thailand - Malaysia boundary
+        ('064208N', '1001147E'),    # Thailand - Malaysia boundary
+        ('064228N', '1001115E'),    # Thailand - Malaysia boundary
+        ('064212N', '1001023E'),    # Thailand - Malaysia boundary
+        ('064142N', '1001000E'),    # Thailand - Malaysia boundary
+        ('064101N', '1000950E'),    # Thailand - Malaysia boundary
+        ('063940N', '1000945E'),    # Thailand - Malaysia boundary
+        ('063714N', '1000921E'),    # Thailand - Malaysia boundary
+        ('063612N', '1000925E'),    # Thailand - Malaysia boundary
+        ('063449N', '1000954E'),    # Thailand - Malaysia boundary
+        ('063358N', '1001001E'),    # Thailand - Malaysia boundary
+        ('063326N', '1000940E'),    # Thailand - Malaysia boundary
+        ('063259N', '1000908E'),    # Thailand - Malaysia boundary
+        ('063222N', '1000844E'),    # Thailand - Malaysia boundary
+        ('063150N', '1000841E'),    # Thailand - Malaysia boundary
+        ('063047N', '1000853E'),    # Thailand - Malaysia boundary
+        ('063016N', '1000854E'),    # Thailand - Malaysia boundary
+        ('062846N', '1000839E'),    # Thailand - Malaysia boundary
+        ('062727N', '1000808E'),    # Thailand - Malaysia boundary
+        ('062632N', '1000738E'),    # Thailand - Malaysia boundary
     
     
-    ('063008N', '0992949E'),
-    ('071508N', '0975949E'),
-    ('100007N', '0962950E'),
+        ('063008N', '0992949E'),
+        ('071508N', '0975949E'),
+        ('100007N', '0962950E'),
     
-    # Close loop eastward back to 100010.2N (approximated as entry point)
-    ('100010N', '0984000E'),  # Approximated western anchor point
-]
+        # Close loop eastward back to 100010.2N (approximated as entry point)
+        ('100010N', '0984000E'),  # Approximated western anchor point
+    ]
 
 #endregion
 
 #region Phonm Penh FIR - VDPF
 
-PP_FIR_coordinates = [
-    ('070000N', '1030000E'), # Go clockwise from here
-    ('100007N', '1021448E'),
+@_dataset
+def _PP_FIR_coordinates():
+    return [
+        ('070000N', '1030000E'), # Go clockwise from here
+        ('100007N', '1021448E'),
     
-    # Thailand - Cambodia boundary
-    ('113845N', '1025448E'),
-    ('114007N', '1025543E'),
-    ('114332N', '1025530E'),
-    ('114555N', '1025449E'),
-    ('114827N', '1025306E'),
-    ('115157N', '1025034E'),
-    ('115710N', '1024749E'),
-    ('120009N', '1024713E'),
-    ('120214N', '1024615E'),
-    ('120240N', '1024554E'),
-    ('120339N', '1024504E'),
-    ('120819N', '1024159E'),
-    ('121042N', '1024131E'),
-    ('122031N', '1024254E'),
-    ('122140N', '1024312E'),
-    ('122248N', '1024350E'),
-    ('122408N', '1024523E'),
-    ('122458N', '1024554E'),
-    ('122530N', '1024549E'),
-    ('122609N', '1024543E'),
-    ('122656N', '1024502E'),
-    ('122757N', '1024306E'),
-    ('122849N', '1024217E'),
-    ('122917N', '1024207E'),
-    ('123017N', '1024201E'),
-    ('123047N', '1024148E'),
-    ('123110N', '1024123E'),
-    ('123203N', '1023953E'),
-    ('123635N', '1023518E'),
-    ('123752N', '1023331E'),
-    ('123859N', '1023006E'),
-    ('123914N', '1022945E'),
-    ('123940N', '1022910E'),
-    ('124037N', '1022845E'),
-    ('124154N', '1022836E'),
-    ('124310N', '1022840E'),
-    ('124406N', '1022857E'),
-    ('124445N', '1022942E'),
-    ('124445N', '1022942E'),
-    ('124639N', '1023020E'),
-    ('124715N', '1023023E'),
-    ('124759N', '1023015E'),
-    ('124823N', '1023001E'),
-    ('124845N', '1022943E'),
-    ('124923N', '1022923E'),
-    ('125037N', '1022900E'),
-    ('125255N', '1022845E'),
-    ('125418N', '1022826E'),
-    ('125458N', '1022804E'),
-    ('125539N', '1022753E'),
-    ('125616N', '1022758E'),
-    ('125659N', '1022839E'),
-    ('125713N', '1022844E'),
-    ('125726N', '1022839E'),
-    ('125754N', '1022808E'),
-    ('125810N', '1022801E'),
-    ('125824N', '1022807E'),
-    ('125837N', '1022826E'),
-    ('125849N', '1022852E'),
-    ('125905N', '1022911E'),
-    ('125923N', '1022923E'),
-    ('125942N', '1022924E'),
-    ('125945N', '1022924E'),
-    ('130022N', '1022823E'),
-    ('130109N', '1022747E'),
-    ('130302N', '1022650E'),
-    ('130610N', '1022406E'),
-    ('130811N', '1022255E'),
-    ('131621N', '1021945E'),
-    ('131630N', '1021941E'),
-    ('132043N', '1021937E'),
-    ('132422N', '1022001E'),
-    ('132854N', '1021945E'),
-    ('132904N', '1021946E'),
-    ('132946N', '1021948E'),
-    ('133015N', '1021945E'),
-    ('133048N', '1021931E'),
-    ('133149N', '1021853E'),
-    ('133227N', '1021848E'),
-    ('133352N', '1021956E'),
-    ('133408N', '1022216E'),
-    ('133343N', '1022708E'),
-    ('133401N', '1023047E'),
-    ('133425N', '1023157E'),
-    ('133601N', '1023446E'),
-    ('133619N', '1023551E'),
-    ('133740N', '1023345E'),
-    ('133854N', '1023227E'),
-    ('134010N', '1023232E'),
-    ('134138N', '1023427E'),
-    ('134430N', '1024029E'),
-    ('134542N', '1024155E'),
-    ('134616N', '1024209E'),
-    ('134730N', '1024214E'),
-    ('134807N', '1024223E'),
-    ('134837N', '1024240E'),
-    ('134955N', '1024344E'),
-    ('135058N', '1024413E'),
-    ('135414N', '1024515E'),
-    ('135609N', '1024622E'),
-    ('135736N', '1024750E'),
-    ('140014N', '1025117E'),
-    ('140114N', '1025211E'),
-    ('140200N', '1025224E'),
-    ('140254N', '1025222E'),
-    ('140416N', '1025234E'),
-    ('140513N', '1025259E'),
-    ('140657N', '1025414E'),
-    ('140755N', '1025440E'),
-    ('140906N', '1025449E'),
-    ('140953N', '1025450E'),
-    ('141009N', '1025450E'),
-    ('141107N', '1025506E'),
-    ('141203N', '1025602E'),
-    ('141231N', '1025703E'),
-    ('141308N', '1025916E'),
-    ('141343N', '1030017E'),
-    ('141419N', '1030100E'),
-    ('141744N', '1030506E'),
-    ('141847N', '1030704E'),
-    ('141911N', '1030817E'),
-    ('141942N', '1031154E'),
-    ('142030N', '1031435E'),
-    ('142103N', '1031625E'),
-    ('142103N', '1032028E'),
-    ('142112N', '1032146E'),
-    ('142139N', '1032248E'),
-    ('142250N', '1032429E'),
-    ('142305N', '1032521E'),
-    ('142257N', '1032534E'),
-    ('142239N', '1032553E'),
-    ('142222N', '1032621E'),
-    ('142217N', '1032658E'),
-    ('142227N', '1032725E'),
-    ('142359N', '1032941E'),
-    ('142508N', '1033200E'),
-    ('142518N', '1033300E'),
-    ('142457N', '1033405E'),
-    ('142426N', '1033453E'),
-    ('142415N', '1033546E'),
-    ('142452N', '1033700E'),
-    ('142520N', '1033722E'),
-    ('142550N', '1033728E'),
-    ('142616N', '1033738E'),
-    ('142635N', '1033813E'),
-    ('142638N', '1033849E'),
-    ('142628N', '1033925E'),
-    ('142609N', '1033955E'),
-    ('142546N', '1034017E'),
-    ('142509N', '1034025E'),
-    ('142344N', '1034018E'),
-    ('142311N', '1034029E'),
-    ('142301N', '1034056E'),
-    ('142253N', '1034259E'),
-    ('142201N', '1034630E'),
-    ('142153N', '1034739E'),
-    ('142157N', '1034826E'),
-    ('142204N', '1034855E'),
-    ('142204N', '1034926E'),
-    ('142148N', '1035018E'),
-    ('142125N', '1035057E'),
-    ('142058N', '1035133E'),
-    ('142035N', '1035213E'),
-    ('142025N', '1035306E'),
-    ('142032N', '1035410E'),
-    ('142053N', '1035428E'),
-    ('142122N', '1035437E'),
-    ('142152N', '1035511E'),
-    ('142202N', '1035826E'),
-    ('142042N', '1040004E'),
-    ('142109N', '1040209E'),
-    ('142125N', '1040242E'),
-    ('142126N', '1040244E'),
-    ('142214N', '1040425E'),
-    ('142249N', '1040636E'),
-    ('142238N', '1040658E'),
-    ('142217N', '1040716E'),
-    ('142158N', '1040742E'),
-    ('142157N', '1040827E'),
-    ('142210N', '1040854E'),
-    ('142345N', '1041023E'),
-    ('142404N', '1041029E'),
-    ('142415N', '1041037E'),
-    ('142414N', '1041108E'),
-    ('142401N', '1041057E'),
-    ('142329N', '1041100E'),
-    ('142256N', '1041121E'),
-    ('142240N', '1041204E'),
-    ('142258N', '1041308E'),
-    ('142335N', '1041356E'),
-    ('142403N', '1041450E'),
-    ('142356N', '1041616E'),
-    ('142239N', '1041931E'),
-    ('142141N', '1042621E'),
-    ('142131N', '1042645E'),
-    ('142124N', '1042709E'),
-    ('142125N', '1042730E'),
-    ('142125N', '1042743E'),
-    ('142136N', '1042803E'),
-    ('142156N', '1042826E'),
-    ('142216N', '1042855E'),
-    ('142226N', '1042933E'),
-    ('142213N', '1043038E'),
-    ('142148N', '1043135E'),
-    ('142137N', '1043234E'),
-    ('142206N', '1043346E'),
-    ('142249N', '1043425E'),
-    ('142344N', '1043500E'),
-    ('142436N', '1043540E'),
-    ('142508N', '1043637E'),
-    ('142509N', '1043735E'),
-    ('142432N', '1043904E'),
-    ('142434N', '1044006E'),
-    ('142452N', '1044029E'),
-    ('142550N', '1044104E'),
-    ('142602N', '1044134E'),
-    ('142548N', '1044203E'),
-    ('142444N', '1044222E'),
-    ('142424N', '1044246E'),
-    ('142435N', '1044340E'),
-    ('142558N', '1044528E'),
-    ('142623N', '1044618E'),
-    ('142617N', '1044717E'),
-    ('142548N', '1044806E'),
-    ('142511N', '1044854E'),
-    ('142442N', '1044953E'),
-    ('142441N', '1045018E'),
-    ('142450N', '1045126E'),
-    ('142449N', '1045159E'),
-    ('142438N', '1045227E'),
-    ('142400N', '1045324E'),
-    ('142346N', '1045353E'),
-    ('142335N', '1045456E'),
-    ('142310N', '1045718E'),
-    ('142250N', '1045825E'),
-    ('142206N', '1045843E'),
-    ('142117N', '1045844E'),
-    ('141834N', '1045827E'),
-    ('141804N', '1045833E'),
-    ('141437N', '1050027E'),
-    ('141327N', '1050131E'),
-    ('141250N', '1050250E'),
-    ('141349N', '1050605E'),
-    ('141650N', '1050755E'),
-    ('141949N', '1050918E'),
-    ('142044N', '1051103E'),
+        # Thailand - Cambodia boundary
+        ('113845N', '1025448E'),
+        ('114007N', '1025543E'),
+        ('114332N', '1025530E'),
+        ('114555N', '1025449E'),
+        ('114827N', '1025306E'),
+        ('115157N', '1025034E'),
+        ('115710N', '1024749E'),
+        ('120009N', '1024713E'),
+        ('120214N', '1024615E'),
+        ('120240N', '1024554E'),
+        ('120339N', '1024504E'),
+        ('120819N', '1024159E'),
+        ('121042N', '1024131E'),
+        ('122031N', '1024254E'),
+        ('122140N', '1024312E'),
+        ('122248N', '1024350E'),
+        ('122408N', '1024523E'),
+        ('122458N', '1024554E'),
+        ('122530N', '1024549E'),
+        ('122609N', '1024543E'),
+        ('122656N', '1024502E'),
+        ('122757N', '1024306E'),
+        ('122849N', '1024217E'),
+        ('122917N', '1024207E'),
+        ('123017N', '1024201E'),
+        ('123047N', '1024148E'),
+        ('123110N', '1024123E'),
+        ('123203N', '1023953E'),
+        ('123635N', '1023518E'),
+        ('123752N', '1023331E'),
+        ('123859N', '1023006E'),
+        ('123914N', '1022945E'),
+        ('123940N', '1022910E'),
+        ('124037N', '1022845E'),
+        ('124154N', '1022836E'),
+        ('124310N', '1022840E'),
+        ('124406N', '1022857E'),
+        ('124445N', '1022942E'),
+        ('124445N', '1022942E'),
+        ('124639N', '1023020E'),
+        ('124715N', '1023023E'),
+        ('124759N', '1023015E'),
+        ('124823N', '1023001E'),
+        ('124845N', '1022943E'),
+        ('124923N', '1022923E'),
+        ('125037N', '1022900E'),
+        ('125255N', '1022845E'),
+        ('125418N', '1022826E'),
+        ('125458N', '1022804E'),
+        ('125539N', '1022753E'),
+        ('125616N', '1022758E'),
+        ('125659N', '1022839E'),
+        ('125713N', '1022844E'),
+        ('125726N', '1022839E'),
+        ('125754N', '1022808E'),
+        ('125810N', '1022801E'),
+        ('125824N', '1022807E'),
+        ('125837N', '1022826E'),
+        ('125849N', '1022852E'),
+        ('125905N', '1022911E'),
+        ('125923N', '1022923E'),
+        ('125942N', '1022924E'),
+        ('125945N', '1022924E'),
+        ('130022N', '1022823E'),
+        ('130109N', '1022747E'),
+        ('130302N', '1022650E'),
+        ('130610N', '1022406E'),
+        ('130811N', '1022255E'),
+        ('131621N', '1021945E'),
+        ('131630N', '1021941E'),
+        ('132043N', '1021937E'),
+        ('132422N', '1022001E'),
+        ('132854N', '1021945E'),
+        ('132904N', '1021946E'),
+        ('132946N', '1021948E'),
+        ('133015N', '1021945E'),
+        ('133048N', '1021931E'),
+        ('133149N', '1021853E'),
+        ('133227N', '1021848E'),
+        ('133352N', '1021956E'),
+        ('133408N', '1022216E'),
+        ('133343N', '1022708E'),
+        ('133401N', '1023047E'),
+        ('133425N', '1023157E'),
+        ('133601N', '1023446E'),
+        ('133619N', '1023551E'),
+        ('133740N', '1023345E'),
+        ('133854N', '1023227E'),
+        ('134010N', '1023232E'),
+        ('134138N', '1023427E'),
+        ('134430N', '1024029E'),
+        ('134542N', '1024155E'),
+        ('134616N', '1024209E'),
+        ('134730N', '1024214E'),
+        ('134807N', '1024223E'),
+        ('134837N', '1024240E'),
+        ('134955N', '1024344E'),
+        ('135058N', '1024413E'),
+        ('135414N', '1024515E'),
+        ('135609N', '1024622E'),
+        ('135736N', '1024750E'),
+        ('140014N', '1025117E'),
+        ('140114N', '1025211E'),
+        ('140200N', '1025224E'),
+        ('140254N', '1025222E'),
+        ('140416N', '1025234E'),
+        ('140513N', '1025259E'),
+        ('140657N', '1025414E'),
+        ('140755N', '1025440E'),
+        ('140906N', '1025449E'),
+        ('140953N', '1025450E'),
+        ('141009N', '1025450E'),
+        ('141107N', '1025506E'),
+        ('141203N', '1025602E'),
+        ('141231N', '1025703E'),
+        ('141308N', '1025916E'),
+        ('141343N', '1030017E'),
+        ('141419N', '1030100E'),
+        ('141744N', '1030506E'),
+        ('141847N', '1030704E'),
+        ('141911N', '1030817E'),
+        ('141942N', '1031154E'),
+        ('142030N', '1031435E'),
+        ('142103N', '1031625E'),
+        ('142103N', '1032028E'),
+        ('142112N', '1032146E'),
+        ('142139N', '1032248E'),
+        ('142250N', '1032429E'),
+        ('142305N', '1032521E'),
+        ('142257N', '1032534E'),
+        ('142239N', '1032553E'),
+        ('142222N', '1032621E'),
+        ('142217N', '1032658E'),
+        ('142227N', '1032725E'),
+        ('142359N', '1032941E'),
+        ('142508N', '1033200E'),
+        ('142518N', '1033300E'),
+        ('142457N', '1033405E'),
+        ('142426N', '1033453E'),
+        ('142415N', '1033546E'),
+        ('142452N', '1033700E'),
+        ('142520N', '1033722E'),
+        ('142550N', '1033728E'),
+        ('142616N', '1033738E'),
+        ('142635N', '1033813E'),
+        ('142638N', '1033849E'),
+        ('142628N', '1033925E'),
+        ('142609N', '1033955E'),
+        ('142546N', '1034017E'),
+        ('142509N', '1034025E'),
+        ('142344N', '1034018E'),
+        ('142311N', '1034029E'),
+        ('142301N', '1034056E'),
+        ('142253N', '1034259E'),
+        ('142201N', '1034630E'),
+        ('142153N', '1034739E'),
+        ('142157N', '1034826E'),
+        ('142204N', '1034855E'),
+        ('142204N', '1034926E'),
+        ('142148N', '1035018E'),
+        ('142125N', '1035057E'),
+        ('142058N', '1035133E'),
+        ('142035N', '1035213E'),
+        ('142025N', '1035306E'),
+        ('142032N', '1035410E'),
+        ('142053N', '1035428E'),
+        ('142122N', '1035437E'),
+        ('142152N', '1035511E'),
+        ('142202N', '1035826E'),
+        ('142042N', '1040004E'),
+        ('142109N', '1040209E'),
+        ('142125N', '1040242E'),
+        ('142126N', '1040244E'),
+        ('142214N', '1040425E'),
+        ('142249N', '1040636E'),
+        ('142238N', '1040658E'),
+        ('142217N', '1040716E'),
+        ('142158N', '1040742E'),
+        ('142157N', '1040827E'),
+        ('142210N', '1040854E'),
+        ('142345N', '1041023E'),
+        ('142404N', '1041029E'),
+        ('142415N', '1041037E'),
+        ('142414N', '1041108E'),
+        ('142401N', '1041057E'),
+        ('142329N', '1041100E'),
+        ('142256N', '1041121E'),
+        ('142240N', '1041204E'),
+        ('142258N', '1041308E'),
+        ('142335N', '1041356E'),
+        ('142403N', '1041450E'),
+        ('142356N', '1041616E'),
+        ('142239N', '1041931E'),
+        ('142141N', '1042621E'),
+        ('142131N', '1042645E'),
+        ('142124N', '1042709E'),
+        ('142125N', '1042730E'),
+        ('142125N', '1042743E'),
+        ('142136N', '1042803E'),
+        ('142156N', '1042826E'),
+        ('142216N', '1042855E'),
+        ('142226N', '1042933E'),
+        ('142213N', '1043038E'),
+        ('142148N', '1043135E'),
+        ('142137N', '1043234E'),
+        ('142206N', '1043346E'),
+        ('142249N', '1043425E'),
+        ('142344N', '1043500E'),
+        ('142436N', '1043540E'),
+        ('142508N', '1043637E'),
+        ('142509N', '1043735E'),
+        ('142432N', '1043904E'),
+        ('142434N', '1044006E'),
+        ('142452N', '1044029E'),
+        ('142550N', '1044104E'),
+        ('142602N', '1044134E'),
+        ('142548N', '1044203E'),
+        ('142444N', '1044222E'),
+        ('142424N', '1044246E'),
+        ('142435N', '1044340E'),
+        ('142558N', '1044528E'),
+        ('142623N', '1044618E'),
+        ('142617N', '1044717E'),
+        ('142548N', '1044806E'),
+        ('142511N', '1044854E'),
+        ('142442N', '1044953E'),
+        ('142441N', '1045018E'),
+        ('142450N', '1045126E'),
+        ('142449N', '1045159E'),
+        ('142438N', '1045227E'),
+        ('142400N', '1045324E'),
+        ('142346N', '1045353E'),
+        ('142335N', '1045456E'),
+        ('142310N', '1045718E'),
+        ('142250N', '1045825E'),
+        ('142206N', '1045843E'),
+        ('142117N', '1045844E'),
+        ('141834N', '1045827E'),
+        ('141804N', '1045833E'),
+        ('141437N', '1050027E'),
+        ('141327N', '1050131E'),
+        ('141250N', '1050250E'),
+        ('141349N', '1050605E'),
+        ('141650N', '1050755E'),
+        ('141949N', '1050918E'),
+        ('142044N', '1051103E'),
     
     
-    # Laos - Cambodia boundary
-    # ('141250N', '1050250E'),
-    # ('141349N', '1050605E'),
-    # ('141650N', '1050755E'),
-    # ('141949N', '1050918E'),
-    # ('142044N', '1051103E'),
-    ('141850N', '1051103E'),
-    ('141727N', '1051116E'),
-    ('141613N', '1051150E'),
-    ('141056N', '1051524E'),
-    ('140953N', '1051631E'),
-    ('140940N', '1051655E'),
-    ('140924N', '1051747E'),
-    ('140908N', '1051814E'),
-    ('140703N', '1051946E'),
-    ('140635N', '1052016E'),
-    ('140621N', '1052052E'),
-    ('140614N', '1052150E'),
-    ('140613N', '1052332E'),
-    ('140628N', '1052519E'),
-    ('140701N', '1052700E'),
-    ('140757N', '1052825E'),
-    ('140812N', '1052925E'),
-    ('140842N', '1053018E'),
-    ('140951N', '1053159E'),
-    ('140933N', '1053228E'),
-    ('140911N', '1053256E'),
-    ('140845N', '1053319E'),
-    ('140817N', '1053341E'),
-    ('140838N', '1053435E'),
-    ('140810N', '1053540E'),
-    ('140714N', '1053635E'),
-    ('140610N', '1053702E'),
-    ('140650N', '1053758E'),
-    ('140648N', '1053835E'),
-    ('140625N', '1053911E'),
-    ('140601N', '1054009E'),
-    ('140555N', '1054101E'),
-    ('140607N', '1054218E'),
-    ('140605N', '1054257E'),
-    ('140513N', '1054438E'),
-    ('140344N', '1054532E'),
-    ('140204N', '1054612E'),
-    ('140036N', '1054713E'),
-    ('135612N', '1055222E'),
-    ('135529N', '1055344E'),
-    ('135521N', '1055358E'),
-    ('135501N', '1055528E'),
-    ('135510N', '1055657E'),
-    ('135545N', '1055826E'),
-    ('135541N', '1055950E'),
-    ('135455N', '1060257E'),
-    ('135459N', '1060408E'),
-    ('135602N', '1060501E'),
-    ('135851N', '1060455E'),
-    ('135946N', '1060538E'),
-    ('140037N', '1060630E'),
-    ('140119N', '1060735E'),
-    ('140206N', '1060831E'),
-    ('140312N', '1060858E'),
-    ('140420N', '1060840E'),
-    ('140513N', '1060752E'),
-    ('140601N', '1060654E'),
-    ('140654N', '1060606E'),
-    ('141028N', '1060434E'),
-    ('141130N', '1060338E'),
-    ('141246N', '1060134E'),
-    ('141332N', '1060044E'),
-    ('141445N', '1060014E'),
-    ('141614N', '1060028E'),
-    ('141723N', '1060016E'),
-    ('141821N', '1055936E'),
-    ('141916N', '1055826E'),
-    ('141955N', '1055809E'),
-    ('142036N', '1055804E'),
-    ('142117N', '1055809E'),
-    ('142157N', '1055826E'),
-    ('142144N', '1055938E'),
-    ('142051N', '1060217E'),
-    ('142054N', '1060319E'),
-    ('142111N', '1060329E'),
-    ('142207N', '1060338E'),
-    ('142222N', '1060348E'),
-    ('142224N', '1060407E'),
-    ('142221N', '1060446E'),
-    ('142225N', '1060542E'),
-    ('142210N', '1060708E'),
-    ('142203N', '1060914E'),
-    ('142210N', '1061023E'),
-    ('142244N', '1061120E'),
-    ('142359N', '1061214E'),
-    ('142517N', '1061238E'),
-    ('142824N', '1061314E'),
-    ('142925N', '1061348E'),
-    ('142903N', '1061409E'),
-    ('142652N', '1061748E'),
-    ('142643N', '1061823E'),
-    ('142640N', '1061912E'),
-    ('142653N', '1062000E'),
-    ('142656N', '1062023E'),
-    ('142722N', '1062337E'),
-    ('142759N', '1062509E'),
-    ('142909N', '1062546E'),
-    ('142911N', '1062600E'),
-    ('142933N', '1062626E'),
-    ('142958N', '1062642E'),
-    ('143020N', '1062600E'),
-    ('143044N', '1062557E'),
-    ('143110N', '1062603E'),
-    ('143125N', '1062611E'),
-    ('143144N', '1062644E'),
-    ('143140N', '1062724E'),
-    ('143128N', '1062810E'),
-    ('143125N', '1062905E'),
-    ('143148N', '1062905E'),
-    ('143157N', '1062839E'),
-    ('143214N', '1062823E'),
-    ('143240N', '1062815E'),
-    ('143315N', '1062814E'),
-    ('143350N', '1062820E'),
-    ('143400N', '1062837E'),
-    ('143402N', '1062901E'),
-    ('143415N', '1062927E'),
-    ('143525N', '1063044E'),
-    ('143506N', '1063106E'),
-    ('143357N', '1063151E'),
-    ('143311N', '1063205E'),
-    ('143118N', '1063224E'),
-    ('143043N', '1063237E'),
-    ('143025N', '1063308E'),
-    ('143007N', '1063431E'),
-    ('142945N', '1063508E'),
-    ('142759N', '1063619E'),
-    ('142727N', '1063719E'),
-    ('142703N', '1063803E'),
-    ('142545N', '1064225E'),
-    ('142533N', '1064241E'),
-    ('142504N', '1064309E'),
-    ('142441N', '1064326E'),
-    ('142348N', '1064353E'),
-    ('142053N', '1064600E'),
-    ('141921N', '1064734E'),
-    ('141846N', '1064824E'),
-    ('141827N', '1064915E'),
-    ('141825N', '1065009E'),
-    ('141942N', '1065228E'),
-    ('141957N', '1065245E'),
-    ('142007N', '1065306E'),
-    ('142010N', '1065344E'),
-    ('141959N', '1065417E'),
-    ('141918N', '1065524E'),
-    ('141912N', '1065600E'),
-    ('141924N', '1065646E'),
-    ('141943N', '1065659E'),
-    ('142005N', '1065700E'),
-    ('142137N', '1065739E'),
-    ('142146N', '1065825E'),
-    ('142155N', '1065840E'),
-    ('142342N', '1065950E'),
-    ('142548N', '1070135E'),
-    ('142606N', '1070138E'),
-    ('142609N', '1070149E'),
-    ('142550N', '1070234E'),
-    ('142504N', '1070333E'),
-    ('142422N', '1070404E'),
-    ('142402N', '1070442E'),
-    ('142427N', '1070602E'),
-    ('142539N', '1070753E'),
-    ('142705N', '1070931E'),
-    ('142801N', '1071000E'),
-    ('142903N', '1071020E'),
-    ('142946N', '1071050E'),
-    ('142946N', '1071143E'),
-    ('142945N', '1071144E'),
-    ('142945N', '1071144E'),
-    ('142945N', '1071145E'),
-    ('142936N', '1071240E'),
-    ('142952N', '1071311E'),
-    ('143105N', '1071349E'),
-    ('143217N', '1071356E'),
-    ('143241N', '1071402E'),
-    ('143259N', '1071416E'),
-    ('143323N', '1071458E'),
-    ('143339N', '1071516E'),
-    ('143507N', '1071619E'),
-    ('143554N', '1071714E'),
-    ('143550N', '1071820E'),
-    ('143441N', '1071957E'),
-    ('143341N', '1072105E'),
-    ('143328N', '1072140E'),
-    ('143314N', '1072248E'),
-    ('143238N', '1072412E'),
-    ('143236N', '1072453E'),
-    ('143313N', '1072540E'),
-    ('143340N', '1072551E'),
-    ('143411N', '1072551E'),
-    ('143442N', '1072547E'),
-    ('143510N', '1072549E'),
-    ('143539N', '1072559E'),
-    ('143614N', '1072625E'),
-    ('143634N', '1072637E'),
-    ('143755N', '1072706E'),
-    ('143819N', '1072729E'),
-    ('143846N', '1072825E'),
-    ('144136N', '1073024E'),
-    ('144216N', '1073113E'),
+        # Laos - Cambodia boundary
+        # ('141250N', '1050250E'),
+        # ('141349N', '1050605E'),
+        # ('141650N', '1050755E'),
+        # ('141949N', '1050918E'),
+        # ('142044N', '1051103E'),
+        ('141850N', '1051103E'),
+        ('141727N', '1051116E'),
+        ('141613N', '1051150E'),
+        ('141056N', '1051524E'),
+        ('140953N', '1051631E'),
+        ('140940N', '1051655E'),
+        ('140924N', '1051747E'),
+        ('140908N', '1051814E'),
+        ('140703N', '1051946E'),
+        ('140635N', '1052016E'),
+        ('140621N', '1052052E'),
+        ('140614N', '1052150E'),
+        ('140613N', '1052332E'),
+        ('140628N', '1052519E'),
+        ('140701N', '1052700E'),
+        ('140757N', '1052825E'),
+        ('140812N', '1052925E'),
+        ('140842N', '1053018E'),
+        ('140951N', '1053159E'),
+        ('140933N', '1053228E'),
+        ('140911N', '1053256E'),
+        ('140845N', '1053319E'),
+        ('140817N', '1053341E'),
+        ('140838N', '1053435E'),
+        ('140810N', '1053540E'),
+        ('140714N', '1053635E'),
+        ('140610N', '1053702E'),
+        ('140650N', '1053758E'),
+        ('140648N', '1053835E'),
+        ('140625N', '1053911E'),
+        ('140601N', '1054009E'),
+        ('140555N', '1054101E'),
+        ('140607N', '1054218E'),
+        ('140605N', '1054257E'),
+        ('140513N', '1054438E'),
+        ('140344N', '1054532E'),
+        ('140204N', '1054612E'),
+        ('140036N', '1054713E'),
+        ('135612N', '1055222E'),
+        ('135529N', '1055344E'),
+        ('135521N', '1055358E'),
+        ('135501N', '1055528E'),
+        ('135510N', '1055657E'),
+        ('135545N', '1055826E'),
+        ('135541N', '1055950E'),
+        ('135455N', '1060257E'),
+        ('135459N', '1060408E'),
+        ('135602N', '1060501E'),
+        ('135851N', '1060455E'),
+        ('135946N', '1060538E'),
+        ('140037N', '1060630E'),
+        ('140119N', '1060735E'),
+        ('140206N', '1060831E'),
+        ('140312N', '1060858E'),
+        ('140420N', '1060840E'),
+        ('140513N', '1060752E'),
+        ('140601N', '1060654E'),
+        ('140654N', '1060606E'),
+        ('141028N', '1060434E'),
+        ('141130N', '1060338E'),
+        ('141246N', '1060134E'),
+        ('141332N', '1060044E'),
+        ('141445N', '1060014E'),
+        ('141614N', '1060028E'),
+        ('141723N', '1060016E'),
+        ('141821N', '1055936E'),
+        ('141916N', '1055826E'),
+        ('141955N', '1055809E'),
+        ('142036N', '1055804E'),
+        ('142117N', '1055809E'),
+        ('142157N', '1055826E'),
+        ('142144N', '1055938E'),
+        ('142051N', '1060217E'),
+        ('142054N', '1060319E'),
+        ('142111N', '1060329E'),
+        ('142207N', '1060338E'),
+        ('142222N', '1060348E'),
+        ('142224N', '1060407E'),
+        ('142221N', '1060446E'),
+        ('142225N', '1060542E'),
+        ('142210N', '1060708E'),
+        ('142203N', '1060914E'),
+        ('142210N', '1061023E'),
+        ('142244N', '1061120E'),
+        ('142359N', '1061214E'),
+        ('142517N', '1061238E'),
+        ('142824N', '1061314E'),
+        ('142925N', '1061348E'),
+        ('142903N', '1061409E'),
+        ('142652N', '1061748E'),
+        ('142643N', '1061823E'),
+        ('142640N', '1061912E'),
+        ('142653N', '1062000E'),
+        ('142656N', '1062023E'),
+        ('142722N', '1062337E'),
+        ('142759N', '1062509E'),
+        ('142909N', '1062546E'),
+        ('142911N', '1062600E'),
+        ('142933N', '1062626E'),
+        ('142958N', '1062642E'),
+        ('143020N', '1062600E'),
+        ('143044N', '1062557E'),
+        ('143110N', '1062603E'),
+        ('143125N', '1062611E'),
+        ('143144N', '1062644E'),
+        ('143140N', '1062724E'),
+        ('143128N', '1062810E'),
+        ('143125N', '1062905E'),
+        ('143148N', '1062905E'),
+        ('143157N', '1062839E'),
+        ('143214N', '1062823E'),
+        ('143240N', '1062815E'),
+        ('143315N', '1062814E'),
+        ('143350N', '1062820E'),
+        ('143400N', '1062837E'),
+        ('143402N', '1062901E'),
+        ('143415N', '1062927E'),
+        ('143525N', '1063044E'),
+        ('143506N', '1063106E'),
+        ('143357N', '1063151E'),
+        ('143311N', '1063205E'),
+        ('143118N', '1063224E'),
+        ('143043N', '1063237E'),
+        ('143025N', '1063308E'),
+        ('143007N', '1063431E'),
+        ('142945N', '1063508E'),
+        ('142759N', '1063619E'),
+        ('142727N', '1063719E'),
+        ('142703N', '1063803E'),
+        ('142545N', '1064225E'),
+        ('142533N', '1064241E'),
+        ('142504N', '1064309E'),
+        ('142441N', '1064326E'),
+        ('142348N', '1064353E'),
+        ('142053N', '1064600E'),
+        ('141921N', '1064734E'),
+        ('141846N', '1064824E'),
+        ('141827N', '1064915E'),
+        ('141825N', '1065009E'),
+        ('141942N', '1065228E'),
+        ('141957N', '1065245E'),
+        ('142007N', '1065306E'),
+        ('142010N', '1065344E'),
+        ('141959N', '1065417E'),
+        ('141918N', '1065524E'),
+        ('141912N', '1065600E'),
+        ('141924N', '1065646E'),
+        ('141943N', '1065659E'),
+        ('142005N', '1065700E'),
+        ('142137N', '1065739E'),
+        ('142146N', '1065825E'),
+        ('142155N', '1065840E'),
+        ('142342N', '1065950E'),
+        ('142548N', '1070135E'),
+        ('142606N', '1070138E'),
+        ('142609N', '1070149E'),
+        ('142550N', '1070234E'),
+        ('142504N', '1070333E'),
+        ('142422N', '1070404E'),
+        ('142402N', '1070442E'),
+        ('142427N', '1070602E'),
+        ('142539N', '1070753E'),
+        ('142705N', '1070931E'),
+        ('142801N', '1071000E'),
+        ('142903N', '1071020E'),
+        ('142946N', '1071050E'),
+        ('142946N', '1071143E'),
+        ('142945N', '1071144E'),
+        ('142945N', '1071144E'),
+        ('142945N', '1071145E'),
+        ('142936N', '1071240E'),
+        ('142952N', '1071311E'),
+        ('143105N', '1071349E'),
+        ('143217N', '1071356E'),
+        ('143241N', '1071402E'),
+        ('143259N', '1071416E'),
+        ('143323N', '1071458E'),
+        ('143339N', '1071516E'),
+        ('143507N', '1071619E'),
+        ('143554N', '1071714E'),
+        ('143550N', '1071820E'),
+        ('143441N', '1071957E'),
+        ('143341N', '1072105E'),
+        ('143328N', '1072140E'),
+        ('143314N', '1072248E'),
+        ('143238N', '1072412E'),
+        ('143236N', '1072453E'),
+        ('143313N', '1072540E'),
+        ('143340N', '1072551E'),
+        ('143411N', '1072551E'),
+        ('143442N', '1072547E'),
+        ('143510N', '1072549E'),
+        ('143539N', '1072559E'),
+        ('143614N', '1072625E'),
+        ('143634N', '1072637E'),
+        ('143755N', '1072706E'),
+        ('143819N', '1072729E'),
+        ('143846N', '1072825E'),
+        ('144136N', '1073024E'),
+        ('144216N', '1073113E'),
     
-    # Vietnam - Cambodia boundary
-    ('144040N', '1073156E'),
-    ('143910N', '1073138E'),
-    ('143607N', '1073014E'),
-    ('143511N', '1073009E'),
-    ('143324N', '1073023E'),
-    ('143227N', '1073018E'),
-    ('143147N', '1073000E'),
-    ('143034N', '1072908E'),
-    ('142945N', '1072852E'),
-    ('142919N', '1072849E'),
-    ('142830N', '1072836E'),
-    ('142656N', '1072753E'),
-    ('142601N', '1072720E'),
-    ('142525N', '1072635E'),
-    ('142508N', '1072525E'),
-    ('142519N', '1072502E'),
-    ('142543N', '1072449E'),
-    ('142558N', '1072428E'),
-    ('142544N', '1072341E'),
-    ('142518N', '1072312E'),
-    ('142449N', '1072301E'),
-    ('142416N', '1072256E'),
-    ('142343N', '1072245E'),
-    ('142137N', '1072132E'),
-    ('142031N', '1072106E'),
-    ('141917N', '1072059E'),
-    ('141845N', '1072107E'),
-    ('141735N', '1072139E'),
-    ('141659N', '1072149E'),
-    ('141625N', '1072148E'),
-    ('141419N', '1072130E'),
-    ('140837N', '1071929E'),
-    ('140711N', '1071911E'),
-    ('140629N', '1071927E'),
-    ('140554N', '1072001E'),
-    ('140452N', '1072041E'),
-    ('140342N', '1072048E'),
-    ('140227N', '1072036E'),
-    ('140114N', '1072035E'),
-    ('140008N', '1072116E'),
-    ('135946N', '1072217E'),
-    ('135959N', '1072432E'),
-    ('135938N', '1072528E'),
-    ('135904N', '1072550E'),
-    ('135828N', '1072552E'),
-    ('135754N', '1072548E'),
-    ('135721N', '1072551E'),
-    ('135535N', '1072642E'),
-    ('135517N', '1072645E'),
-    ('135433N', '1072652E'),
-    ('135352N', '1072643E'),
-    ('135311N', '1072623E'),
-    ('135210N', '1072607E'),
-    ('135021N', '1072646E'),
-    ('134949N', '1072641E'),
-    ('134832N', '1072618E'),
-    ('134754N', '1072617E'),
-    ('134700N', '1072635E'),
-    ('134540N', '1072744E'),
-    ('134445N', '1072818E'),
-    ('134429N', '1072825E'),
-    ('134301N', '1072948E'),
-    ('134133N', '1073051E'),
-    ('133206N', '1073548E'),
-    ('132954N', '1073615E'),
-    ('132401N', '1073637E'),
-    ('132211N', '1073625E'),
-    ('131737N', '1073429E'),
-    ('131543N', '1073341E'),
-    ('130117N', '1072737E'),
-    ('130026N', '1072746E'),
-    ('125945N', '1072842E'),
-    ('125919N', '1072851E'),
-    ('125856N', '1072852E'),
-    ('125836N', '1072844E'),
-    ('125822N', '1072825E'),
-    ('125746N', '1072804E'),
-    ('125707N', '1072757E'),
-    ('125627N', '1072806E'),
-    ('125457N', '1072846E'),
-    ('125308N', '1072900E'),
-    ('125214N', '1072914E'),
-    ('125131N', '1072939E'),
-    ('124938N', '1073120E'),
-    ('124758N', '1073209E'),
-    ('124624N', '1073219E'),
-    ('124447N', '1073215E'),
-    ('124300N', '1073224E'),
-    ('123623N', '1073354E'),
-    ('123426N', '1073401E'),
-    ('123237N', '1073348E'),
-    ('123151N', '1073328E'),
-    ('123112N', '1073306E'),
-    ('123033N', '1073258E'),
-    ('122946N', '1073324E'),
-    ('122945N', '1073324E'),
-    ('122821N', '1073324E'),
-    ('122328N', '1073138E'),
-    ('122159N', '1073120E'),
-    ('122037N', '1073051E'),
-    ('121932N', '1072958E'),
-    ('121855N', '1072825E'),
-    ('121756N', '1072658E'),
-    ('121514N', '1072457E'),
-    ('121510N', '1072334E'),
-    ('121609N', '1072225E'),
-    ('121854N', '1072037E'),
-    ('121945N', '1071912E'),
-    ('121931N', '1071634E'),
-    ('121838N', '1071340E'),
-    ('121820N', '1071242E'),
-    ('121637N', '1070909E'),
-    ('121446N', '1070722E'),
-    ('121355N', '1070658E'),
-    ('121316N', '1070615E'),
-    ('121209N', '1070439E'),
-    ('120951N', '1070245E'),
-    ('120550N', '1065839E'),
-    ('120451N', '1065712E'),
-    ('120400N', '1065458E'),
-    ('120345N', '1065245E'),
-    ('120406N', '1064810E'),
-    ('120402N', '1064726E'),
-    ('120356N', '1064619E'),
-    ('120308N', '1064457E'),
-    ('120143N', '1064358E'),
-    ('115946N', '1064316E'),
-    ('115814N', '1064205E'),
-    ('115754N', '1064049E'),
-    ('115834N', '1063750E'),
-    ('115740N', '1063818E'),
-    ('115822N', '1063308E'),
-    ('115824N', '1063016E'),
-    ('115707N', '1062825E'),
-    ('115710N', '1062737E'),
-    ('115735N', '1062718E'),
-    ('115806N', '1062703E'),
-    ('115829N', '1062631E'),
-    ('115836N', '1062544E'),
-    ('115833N', '1062502E'),
-    ('115811N', '1062338E'),
-    ('115756N', '1062343E'),
-    ('115634N', '1062412E'),
-    ('115318N', '1062559E'),
-    ('115149N', '1062619E'),
-    ('115140N', '1062610E'),
-    ('115015N', '1062517E'),
-    ('114951N', '1062512E'),
-    ('114843N', '1062510E'),
-    ('114812N', '1062505E'),
-    ('114720N', '1062440E'),
-    ('114633N', '1062411E'),
-    ('114543N', '1062351E'),
-    ('114446N', '1062355E'),
-    ('114201N', '1062533E'),
-    ('114042N', '1062604E'),
-    ('114038N', '1062606E'),
-    ('113943N', '1062533E'),
-    ('113942N', '1062446E'),
-    ('114006N', '1062400E'),
-    ('114101N', '1062241E'),
-    ('114118N', '1062151E'),
-    ('114124N', '1062115E'),
-    ('114120N', '1062037E'),
-    ('114028N', '1061714E'),
-    ('114036N', '1061626E'),
-    ('114102N', '1061554E'),
-    ('114221N', '1061502E'),
-    ('114252N', '1061435E'),
-    ('114329N', '1061325E'),
-    ('114446N', '1060916E'),
-    ('114449N', '1060647E'),
-    ('114546N', '1060340E'),
-    ('114613N', '1060055E'),
-    ('114446N', '1055931E'),
-    ('114356N', '1055928E'),
-    ('114308N', '1055919E'),
-    ('114224N', '1055859E'),
-    ('114040N', '1055718E'),
-    ('113925N', '1055646E'),
-    ('113834N', '1055602E'),
-    ('113839N', '1055419E'),
-    ('113941N', '1055128E'),
-    ('113929N', '1055027E'),
-    ('113829N', '1054915E'),
-    ('113820N', '1054904E'),
-    ('113729N', '1054817E'),
-    ('113626N', '1054736E'),
-    ('113514N', '1054725E'),
-    ('113458N', '1054735E'),
-    ('113358N', '1054812E'),
-    ('113335N', '1054855E'),
-    ('113317N', '1055031E'),
-    ('113248N', '1055111E'),
-    ('113208N', '1055128E'),
-    ('113120N', '1055131E'),
-    ('112946N', '1055124E'),
-    ('112636N', '1055219E'),
-    ('112541N', '1055225E'),
-    ('112447N', '1055215E'),
-    ('112245N', '1055135E'),
-    ('111814N', '1055036E'),
-    ('111723N', '1055039E'),
-    ('111647N', '1055125E'),
-    ('111633N', '1055224E'),
-    ('111604N', '1055312E'),
+        # Vietnam - Cambodia boundary
+        ('144040N', '1073156E'),
+        ('143910N', '1073138E'),
+        ('143607N', '1073014E'),
+        ('143511N', '1073009E'),
+        ('143324N', '1073023E'),
+        ('143227N', '1073018E'),
+        ('143147N', '1073000E'),
+        ('143034N', '1072908E'),
+        ('142945N', '1072852E'),
+        ('142919N', '1072849E'),
+        ('142830N', '1072836E'),
+        ('142656N', '1072753E'),
+        ('142601N', '1072720E'),
+        ('142525N', '1072635E'),
+        ('142508N', '1072525E'),
+        ('142519N', '1072502E'),
+        ('142543N', '1072449E'),
+        ('142558N', '1072428E'),
+        ('142544N', '1072341E'),
+        ('142518N', '1072312E'),
+        ('142449N', '1072301E'),
+        ('142416N', '1072256E'),
+        ('142343N', '1072245E'),
+        ('142137N', '1072132E'),
+        ('142031N', '1072106E'),
+        ('141917N', '1072059E'),
+        ('141845N', '1072107E'),
+        ('141735N', '1072139E'),
+        ('141659N', '1072149E'),
+        ('141625N', '1072148E'),
+        ('141419N', '1072130E'),
+        ('140837N', '1071929E'),
+        ('140711N', '1071911E'),
+        ('140629N', '1071927E'),
+        ('140554N', '1072001E'),
+        ('140452N', '1072041E'),
+        ('140342N', '1072048E'),
+        ('140227N', '1072036E'),
+        ('140114N', '1072035E'),
+        ('140008N', '1072116E'),
+        ('135946N', '1072217E'),
+        ('135959N', '1072432E'),
+        ('135938N', '1072528E'),
+        ('135904N', '1072550E'),
+        ('135828N', '1072552E'),
+        ('135754N', '1072548E'),
+        ('135721N', '1072551E'),
+        ('135535N', '1072642E'),
+        ('135517N', '1072645E'),
+        ('135433N', '1072652E'),
+        ('135352N', '1072643E'),
+        ('135311N', '1072623E'),
+        ('135210N', '1072607E'),
+        ('135021N', '1072646E'),
+        ('134949N', '1072641E'),
+        ('134832N', '1072618E'),
+        ('134754N', '1072617E'),
+        ('134700N', '1072635E'),
+        ('134540N', '1072744E'),
+        ('134445N', '1072818E'),
+        ('134429N', '1072825E'),
+        ('134301N', '1072948E'),
+        ('134133N', '1073051E'),
+        ('133206N', '1073548E'),
+        ('132954N', '1073615E'),
+        ('132401N', '1073637E'),
+        ('132211N', '1073625E'),
+        ('131737N', '1073429E'),
+        ('131543N', '1073341E'),
+        ('130117N', '1072737E'),
+        ('130026N', '1072746E'),
+        ('125945N', '1072842E'),
+        ('125919N', '1072851E'),
+        ('125856N', '1072852E'),
+        ('125836N', '1072844E'),
+        ('125822N', '1072825E'),
+        ('125746N', '1072804E'),
+        ('125707N', '1072757E'),
+        ('125627N', '1072806E'),
+        ('125457N', '1072846E'),
+        ('125308N', '1072900E'),
+        ('125214N', '1072914E'),
+        ('125131N', '1072939E'),
+        ('124938N', '1073120E'),
+        ('124758N', '1073209E'),
+        ('124624N', '1073219E'),
+        ('124447N', '1073215E'),
+        ('124300N', '1073224E'),
+        ('123623N', '1073354E'),
+        ('123426N', '1073401E'),
+        ('123237N', '1073348E'),
+        ('123151N', '1073328E'),
+        ('123112N', '1073306E'),
+        ('123033N', '1073258E'),
+        ('122946N', '1073324E'),
+        ('122945N', '1073324E'),
+        ('122821N', '1073324E'),
+        ('122328N', '1073138E'),
+        ('122159N', '1073120E'),
+        ('122037N', '1073051E'),
+        ('121932N', '1072958E'),
+        ('121855N', '1072825E'),
+        ('121756N', '1072658E'),
+        ('121514N', '1072457E'),
+        ('121510N', '1072334E'),
+        ('121609N', '1072225E'),
+        ('121854N', '1072037E'),
+        ('121945N', '1071912E'),
+        ('121931N', '1071634E'),
+        ('121838N', '1071340E'),
+        ('121820N', '1071242E'),
+        ('121637N', '1070909E'),
+        ('121446N', '1070722E'),
+        ('121355N', '1070658E'),
+        ('121316N', '1070615E'),
+        ('121209N', '1070439E'),
+        ('120951N', '1070245E'),
+        ('120550N', '1065839E'),
+        ('120451N', '1065712E'),
+        ('120400N', '1065458E'),
+        ('120345N', '1065245E'),
+        ('120406N', '1064810E'),
+        ('120402N', '1064726E'),
+        ('120356N', '1064619E'),
+        ('120308N', '1064457E'),
+        ('120143N', '1064358E'),
+        ('115946N', '1064316E'),
+        ('115814N', '1064205E'),
+        ('115754N', '1064049E'),
+        ('115834N', '1063750E'),
+        ('115740N', '1063818E'),
+        ('115822N', '1063308E'),
+        ('115824N', '1063016E'),
+        ('115707N', '1062825E'),
+        ('115710N', '1062737E'),
+        ('115735N', '1062718E'),
+        ('115806N', '1062703E'),
+        ('115829N', '1062631E'),
+        ('115836N', '1062544E'),
+        ('115833N', '1062502E'),
+        ('115811N', '1062338E'),
+        ('115756N', '1062343E'),
+        ('115634N', '1062412E'),
+        ('115318N', '1062559E'),
+        ('115149N', '1062619E'),
+        ('115140N', '1062610E'),
+        ('115015N', '1062517E'),
+        ('114951N', '1062512E'),
+        ('114843N', '1062510E'),
+        ('114812N', '1062505E'),
+        ('114720N', '1062440E'),
+        ('114633N', '1062411E'),
+        ('114543N', '1062351E'),
+        ('114446N', '1062355E'),
+        ('114201N', '1062533E'),
+        ('114042N', '1062604E'),
+        ('114038N', '1062606E'),
+        ('113943N', '1062533E'),
+        ('113942N', '1062446E'),
+        ('114006N', '1062400E'),
+        ('114101N', '1062241E'),
+        ('114118N', '1062151E'),
+        ('114124N', '1062115E'),
+        ('114120N', '1062037E'),
+        ('114028N', '1061714E'),
+        ('114036N', '1061626E'),
+        ('114102N', '1061554E'),
+        ('114221N', '1061502E'),
+        ('114252N', '1061435E'),
+        ('114329N', '1061325E'),
+        ('114446N', '1060916E'),
+        ('114449N', '1060647E'),
+        ('114546N', '1060340E'),
+        ('114613N', '1060055E'),
+        ('114446N', '1055931E'),
+        ('114356N', '1055928E'),
+        ('114308N', '1055919E'),
+        ('114224N', '1055859E'),
+        ('114040N', '1055718E'),
+        ('113925N', '1055646E'),
+        ('113834N', '1055602E'),
+        ('113839N', '1055419E'),
+        ('113941N', '1055128E'),
+        ('113929N', '1055027E'),
+        ('113829N', '1054915E'),
+        ('113820N', '1054904E'),
+        ('113729N', '1054817E'),
+        ('113626N', '1054736E'),
+        ('113514N', '1054725E'),
+        ('113458N', '1054735E'),
+        ('113358N', '1054812E'),
+        ('113335N', '1054855E'),
+        ('113317N', '1055031E'),
+        ('113248N', '1055111E'),
+        ('113208N', '1055128E'),
+        ('113120N', '1055131E'),
+        ('112946N', '1055124E'),
+        ('112636N', '1055219E'),
+        ('112541N', '1055225E'),
+        ('112447N', '1055215E'),
+        ('112245N', '1055135E'),
+        ('111814N', '1055036E'),
+        ('111723N', '1055039E'),
+        ('111647N', '1055125E'),
+        ('111633N', '1055224E'),
+        ('111604N', '1055312E'),
     
-    # Missing part
-    # ('112245N', '1055135E'),
-    # ('111814N', '1055036E'),
-    # ('111723N', '1055039E'),
-    # ('111647N', '1055125E'),
-    # ('111633N', '1055224E'),
-    ('111604N', '1055312E'),
-    ('111447N', '1055321E'),
-    ('111446N', '1055321E'),
-    ('111306N', '1055359E'),
-    ('111211N', '1055513E'),
-    ('111125N', '1055826E'),
-    ('111037N', '1055919E'),
-    ('110821N', '1060047E'),
-    ('110721N', '1060141E'),
-    ('110535N', '1060347E'),
-    ('110437N', '1060435E'),
-    ('110322N', '1060511E'),
-    ('110440N', '1060553E'),
-    ('110512N', '1060648E'),
-    ('110503N', '1060751E'),
-    ('110414N', '1060855E'),
-    ('110312N', '1060937E'),
-    ('105946N', '1061035E'),
-    ('105834N', '1061116E'),
-    ('105812N', '1061051E'),
-    ('105814N', '1061013E'),
-    ('105816N', '1060856E'),
-    ('105809N', '1060753E'),
-    ('105756N', '1060741E'),
-    ('105719N', '1060720E'),
-    ('105711N', '1060728E'),
-    ('105538N', '1060724E'),
-    ('105530N', '1060718E'),
-    ('105432N', '1060736E'),
-    ('105146N', '1060905E'),
-    ('104600N', '1061038E'),
-    ('104705N', '1060918E'),
-    ('104728N', '1060743E'),
-    ('104748N', '1060419E'),
-    ('104821N', '1060244E'),
-    ('104911N', '1060104E'),
-    ('105016N', '1055933E'),
-    ('105131N', '1055826E'),
-    ('105210N', '1055752E'),
-    ('105346N', '1055552E'),
-    ('105248N', '1055547E'),
-    ('105129N', '1055513E'),
-    ('105018N', '1055431E'),
-    ('104942N', '1055357E'),
-    ('104941N', '1055243E'),
-    ('105021N', '1055139E'),
-    ('105119N', '1055051E'),
-    ('105210N', '1055024E'),
-    ('105416N', '1054942E'),
-    ('105510N', '1054917E'),
-    ('105757N', '1054714E'),
-    ('105947N', '1054610E'),
+        # Missing part
+        # ('112245N', '1055135E'),
+        # ('111814N', '1055036E'),
+        # ('111723N', '1055039E'),
+        # ('111647N', '1055125E'),
+        # ('111633N', '1055224E'),
+        ('111604N', '1055312E'),
+        ('111447N', '1055321E'),
+        ('111446N', '1055321E'),
+        ('111306N', '1055359E'),
+        ('111211N', '1055513E'),
+        ('111125N', '1055826E'),
+        ('111037N', '1055919E'),
+        ('110821N', '1060047E'),
+        ('110721N', '1060141E'),
+        ('110535N', '1060347E'),
+        ('110437N', '1060435E'),
+        ('110322N', '1060511E'),
+        ('110440N', '1060553E'),
+        ('110512N', '1060648E'),
+        ('110503N', '1060751E'),
+        ('110414N', '1060855E'),
+        ('110312N', '1060937E'),
+        ('105946N', '1061035E'),
+        ('105834N', '1061116E'),
+        ('105812N', '1061051E'),
+        ('105814N', '1061013E'),
+        ('105816N', '1060856E'),
+        ('105809N', '1060753E'),
+        ('105756N', '1060741E'),
+        ('105719N', '1060720E'),
+        ('105711N', '1060728E'),
+        ('105538N', '1060724E'),
+        ('105530N', '1060718E'),
+        ('105432N', '1060736E'),
+        ('105146N', '1060905E'),
+        ('104600N', '1061038E'),
+        ('104705N', '1060918E'),
+        ('104728N', '1060743E'),
+        ('104748N', '1060419E'),
+        ('104821N', '1060244E'),
+        ('104911N', '1060104E'),
+        ('105016N', '1055933E'),
+        ('105131N', '1055826E'),
+        ('105210N', '1055752E'),
+        ('105346N', '1055552E'),
+        ('105248N', '1055547E'),
+        ('105129N', '1055513E'),
+        ('105018N', '1055431E'),
+        ('104942N', '1055357E'),
+        ('104941N', '1055243E'),
+        ('105021N', '1055139E'),
+        ('105119N', '1055051E'),
+        ('105210N', '1055024E'),
+        ('105416N', '1054942E'),
+        ('105510N', '1054917E'),
+        ('105757N', '1054714E'),
+        ('105947N', '1054610E'),
 
-    ('110056N', '1054510E'),
-    ('110106N', '1054334E'),
-    ('110036N', '1054150E'),
-    ('105947N', '1054026E'),
-    ('105946N', '1054025E'),
-    ('105903N', '1053917E'),
-    ('105826N', '1053755E'),
-    ('105815N', '1053702E'),
-    ('105704N', '1053124E'),
-    ('105627N', '1052825E'),
-    ('105630N', '1052756E'),
-    ('105710N', '1052636E'),
-    ('105738N', '1052454E'),
-    ('105746N', '1052437E'),
-    ('105716N', '1052352E'),
-    ('105428N', '1052126E'),
-    ('105053N', '1051939E'),
-    ('105019N', '1051904E'),
-    ('105038N', '1051810E'),
-    ('105225N', '1051607E'),
-    ('105300N', '1051511E'),
-    ('105329N', '1051232E'),
-    ('105434N', '1050642E'),
-    ('105451N', '1050551E'),
-    ('105546N', '1050509E'),
-    ('105633N', '1050501E'),
-    ('105648N', '1050440E'),
-    ('105607N', '1050320E'),
-    ('105534N', '1050233E'),
-    ('105521N', '1050218E'),
-    ('105450N', '1050144E'),
-    ('105358N', '1050104E'),
-    ('105301N', '1050041E'),
-    ('105057N', '1050053E'),
-    ('104841N', '1050149E'),
-    ('104447N', '1050358E'),
-    ('104250N', '1050400E'),
-    ('104126N', '1050232E'),
-    ('103829N', '1045639E'),
-    ('103750N', '1045552E'),
-    ('103704N', '1045511E'),
-    ('103321N', '1045242E'),
-    ('103152N', '1045115E'),
-    ('103101N', '1044907E'),
-    ('103055N', '1044625E'),
-    ('103116N', '1044327E'),
-    ('103127N', '1044202E'),
-    ('103200N', '1043731E'),
-    ('103153N', '1043457E'),
-    ('103141N', '1043400E'),
-    ('103105N', '1043314E'),
-    ('103013N', '1043239E'),
-    ('102916N', '1043209E'),
-    ('102539N', '1042939E'),
-    ('102504N', '1042901E'),
-    ('102545N', '1042810E'),
-    ('102530N', '1042704E'),
-]
+        ('110056N', '1054510E'),
+        ('110106N', '1054334E'),
+        ('110036N', '1054150E'),
+        ('105947N', '1054026E'),
+        ('105946N', '1054025E'),
+        ('105903N', '1053917E'),
+        ('105826N', '1053755E'),
+        ('105815N', '1053702E'),
+        ('105704N', '1053124E'),
+        ('105627N', '1052825E'),
+        ('105630N', '1052756E'),
+        ('105710N', '1052636E'),
+        ('105738N', '1052454E'),
+        ('105746N', '1052437E'),
+        ('105716N', '1052352E'),
+        ('105428N', '1052126E'),
+        ('105053N', '1051939E'),
+        ('105019N', '1051904E'),
+        ('105038N', '1051810E'),
+        ('105225N', '1051607E'),
+        ('105300N', '1051511E'),
+        ('105329N', '1051232E'),
+        ('105434N', '1050642E'),
+        ('105451N', '1050551E'),
+        ('105546N', '1050509E'),
+        ('105633N', '1050501E'),
+        ('105648N', '1050440E'),
+        ('105607N', '1050320E'),
+        ('105534N', '1050233E'),
+        ('105521N', '1050218E'),
+        ('105450N', '1050144E'),
+        ('105358N', '1050104E'),
+        ('105301N', '1050041E'),
+        ('105057N', '1050053E'),
+        ('104841N', '1050149E'),
+        ('104447N', '1050358E'),
+        ('104250N', '1050400E'),
+        ('104126N', '1050232E'),
+        ('103829N', '1045639E'),
+        ('103750N', '1045552E'),
+        ('103704N', '1045511E'),
+        ('103321N', '1045242E'),
+        ('103152N', '1045115E'),
+        ('103101N', '1044907E'),
+        ('103055N', '1044625E'),
+        ('103116N', '1044327E'),
+        ('103127N', '1044202E'),
+        ('103200N', '1043731E'),
+        ('103153N', '1043457E'),
+        ('103141N', '1043400E'),
+        ('103105N', '1043314E'),
+        ('103013N', '1043239E'),
+        ('102916N', '1043209E'),
+        ('102539N', '1042939E'),
+        ('102504N', '1042901E'),
+        ('102545N', '1042810E'),
+        ('102530N', '1042704E'),
+    ]
 #endregion
 
 #region Ho Chi Minh FIR - VVHM
 
-HCM_FIR_coordinates = [
-    ('102200N', '1034400E'),
+@_dataset
+def _HCM_FIR_coordinates():
+    return [
+        ('102200N', '1034400E'),
 
-    ('090000N', '1024000E'),
-    ('070000N', '1030000E'),
-    ('070000N', '1080000E'),
-    ('103000N', '1140000E'),
-    ('164000N', '1140000E'),
-    ('170000N', '1141500E'),
-    ('170000N', '1113000E'),
-    ('174000N', '1094000E'),
-    ('171300N', '1080000E'),
-    ('170000N', '1071800E'),
-    # ('170000N', '1062400E'),
+        ('090000N', '1024000E'),
+        ('070000N', '1030000E'),
+        ('070000N', '1080000E'),
+        ('103000N', '1140000E'),
+        ('164000N', '1140000E'),
+        ('170000N', '1141500E'),
+        ('170000N', '1113000E'),
+        ('174000N', '1094000E'),
+        ('171300N', '1080000E'),
+        ('170000N', '1071800E'),
+        # ('170000N', '1062400E'),
     
-    # VN–LA & VN–KH borders westward
+        # VN–LA & VN–KH borders westward
     
-    ('165428N', '1071259E'),
-    ('165603N', '1071111E'),
-    ('170035N', '1070757E'),
-    ('170106N', '1070716E'),
-    ('170335N', '1070737E'),
-    ('170517N', '1070642E'),
-    ('170943N', '1070026E'),
-    ('171219N', '1065647E'),
-    ('172007N', '1064550E'),
-    ('172546N', '1064034E'),
-    ('172650N', '1063948E'),
-    ('172659N', '1063933E'),
-    ('172713N', '1063929E'),
-    ('172808N', '1063818E'),
-    ('172813N', '1063804E'),
-    ('172911N', '1063733E'),
-    ('173107N', '1063653E'),
-    ('173552N', '1063357E'),
-    # ('173739N', '1063220E'),
-    # ('174011N', '1063053E'),
-    # ('174057N', '1063015E'),
-    # ('174441N', '1062532E'),
-    # ('174422N', '1062608E'),
-    # ('174257N', '1062655E'),
-    # ('174212N', '1062842E'),
-    ('174209N', '1062922E'),
-    ('174238N', '1062953E'),
-    ('174304N', '1062943E'),
-    ('174413N', '1062830E'),
-    ('174453N', '1062812E'),
-    ('174757N', '1062738E'),
-    ('174941N', '1062706E'),
-    ('175047N', '1062634E'),
-    ('175123N', '1062658E'),
-    ('175156N', '1062703E'),
-    ('175219N', '1062649E'),
-    ('175228N', '1062609E'),
-    ('175255N', '1062609E'),
-    ('175254N', '1062718E'),
-    ('175324N', '1062757E'),
-    ('175410N', '1062827E'),
-    ('175455N', '1062903E'),
-    ('175550N', '1063014E'),
-    ('175636N', '1063129E'),
-    ('175658N', '1063129E'),
-    ('175725N', '1063106E'),
-    ('175944N', '1053523E'),
-    ('175944N', '1053523E'),
-    ('175809N', '1053612E'),
-    ('175750N', '1053621E'),
-    ('175317N', '1053538E'),
-    ('175115N', '1053618E'),
-    ('174912N', '1053838E'),
-    ('174623N', '1054011E'),
-    ('174438N', '1054131E'),
-    ('174339N', '1054204E'),
-    ('174122N', '1054249E'),
-    ('174024N', '1054323E'),
-    ('173950N', '1054407E'),
-    ('173831N', '1054714E'),
-    ('173717N', '1054911E'),
-    ('173552N', '1055045E'),
-    ('173100N', '1055440E'),
-    ('172944N', '1055555E'),
-    ('172944N', '1055556E'),
-    ('172340N', '1060109E'),
-    ('171526N', '1061107E'),
-    ('171446N', '1061226E'),
-    ('171441N', '1061318E'),
-    ('171507N', '1061400E'),
-    ('171558N', '1061452E'),
-    ('171628N', '1061508E'),
-    ('171659N', '1061517E'),
-    ('171721N', '1061535E'),
-    ('171723N', '1061621E'),
-    ('171705N', '1061704E'),
-    ('171635N', '1061712E'),
-    ('171557N', '1061708E'),
-    ('171513N', '1061716E'),
-    ('171448N', '1061735E'),
-    ('171358N', '1061825E'),
-    ('171337N', '1061837E'),
-    ('171304N', '1061835E'),
-    ('171207N', '1061805E'),
-    ('171129N', '1061802E'),
-    ('171035N', '1061822E'),
-    ('170742N', '1062011E'),
-    ('170507N', '1062304E'),
-    ('170404N', '1062341E'),
-    ('170343N', '1062339E'),
-    ('170306N', '1062316E'),
-    ('170249N', '1062313E'),
-    ('170052N', '1062414E'),
-    ('170019N', '1062431E'),
-    ('165944N', '1062440E'),
-    ('165944N', '1062440E'),
-    ('165919N', '1062512E'),
-    ('165849N', '1062613E'),
-    ('165824N', '1062723E'),
-    ('165814N', '1062825E'),
-    ('165750N', '1062948E'),
-    ('165921N', '1063128E'),
-    ('165821N', '1063200E'),
-    ('165702N', '1063200E'),
-    ('164100N', '1063206E'),
-    ('163932N', '1063226E'),
-    ('163816N', '1063259E'),
-    ('163648N', '1063420E'),
-    ('163608N', '1063529E'),
-    ('163540N', '1063641E'),
-    ('163536N', '1063729E'),
-    ('163511N', '1063824E'),
-    ('163431N', '1063839E'),
-    ('163118N', '1063822E'),
-    ('163037N', '1063828E'),
-    ('162814N', '1063918E'),
-    ('162639N', '1064014E'),
-    ('162540N', '1064134E'),
-    ('162556N', '1064321E'),
-    ('162517N', '1064321E'),
-    ('162501N', '1064332E'),
-    ('162503N', '1064356E'),
-    ('162517N', '1064432E'),
-    ('162541N', '1064505E'),
-    ('162544N', '1064509E'),
-    ('162611N', '1064515E'),
-    ('162639N', '1064516E'),
-    ('162708N', '1064532E'),
-    ('162808N', '1064710E'),
-    ('162846N', '1064750E'),
-    ('162945N', '1064805E'),
-    ('163151N', '1064922E'),
-    ('163148N', '1065048E'),
-    ('163014N', '1065150E'),
-    ('162749N', '1065200E'),
-    ('162550N', '1065145E'),
-    ('162540N', '1065140E'),
-    ('162528N', '1065129E'),
-    ('162513N', '1065121E'),
-    ('162452N', '1065121E'),
-    ('162442N', '1065135E'),
-    ('162450N', '1065159E'),
-    ('162502N', '1065222E'),
-    ('162504N', '1065234E'),
-    ('162327N', '1065318E'),
-    ('162242N', '1065351E'),
-    ('162153N', '1065454E'),
-    ('162106N', '1065622E'),
-    ('162046N', '1065645E'),
-    ('162010N', '1065702E'),
-    ('161849N', '1065714E'),
-    ('161825N', '1065723E'),
-    ('161759N', '1065802E'),
-    ('161754N', '1065848E'),
-    ('161757N', '1070051E'),
-    ('161742N', '1070312E'),
-    ('161726N', '1070404E'),
-    ('161724N', '1070414E'),
-    ('161651N', '1070520E'),
-    ('161602N', '1070629E'),
-    ('161516N', '1070700E'),
-    ('161203N', '1070738E'),
-    ('161117N', '1070800E'),
-    ('161105N', '1070809E'),
-    ('161037N', '1070831E'),
-    ('160957N', '1070915E'),
-    ('160924N', '1071010E'),
-    ('160911N', '1071059E'),
-    ('160903N', '1071149E'),
-    ('160847N', '1071246E'),
-    ('160747N', '1071419E'),
-    ('160502N', '1071633E'),
-    ('160351N', '1071756E'),
-    ('160321N', '1071936E'),
-    ('160333N', '1072121E'),
-    ('160423N', '1072441E'),
-    ('160425N', '1072551E'),
-    ('160407N', '1072608E'),
-    ('160326N', '1072600E'),
-    ('160319N', '1072559E'),
-    ('160217N', '1072555E'),
-    ('160136N', '1072612E'),
-    ('160108N', '1072636E'),
-    ('160035N', '1072641E'),
-    ('155945N', '1072557E'),
-    ('155900N', '1072504E'),
-    ('155608N', '1072326E'),
-    ('155508N', '1072231E'),
-    ('155444N', '1072139E'),
-    ('155421N', '1071922E'),
-    ('155356N', '1071818E'),
-    ('155119N', '1071408E'),
-    ('155111N', '1071338E'),
-    ('155117N', '1071305E'),
-    ('155132N', '1071231E'),
-    ('155143N', '1071154E'),
-    ('155133N', '1071110E'),
-    ('155054N', '1071030E'),
-    ('154739N', '1070900E'),
-    ('154624N', '1070855E'),
-    ('154531N', '1070936E'),
-    ('154339N', '1071255E'),
-    ('154300N', '1071332E'),
-    ('154208N', '1071348E'),
-    ('153939N', '1071404E'),
-    ('153842N', '1071420E'),
-    ('153751N', '1071455E'),
-    ('153707N', '1071555E'),
-    ('153559N', '1071812E'),
-    ('153519N', '1071859E'),
-    ('152945N', '1072209E'),
-    ('152918N', '1072253E'),
-    ('152933N', '1072319E'),
-    ('153005N', '1072341E'),
-    ('153030N', '1072418E'),
-    ('153031N', '1072444E'),
-    ('153013N', '1072555E'),
-    ('153020N', '1072616E'),
-    ('153033N', '1072634E'),
-    ('153029N', '1072652E'),
-    ('152945N', '1072712E'),
-    ('152917N', '1072723E'),
-    ('152903N', '1072738E'),
-    ('152903N', '1072759E'),
-    ('152917N', '1072825E'),
-    ('152853N', '1072914E'),
-    ('152741N', '1072924E'),
-    ('152616N', '1072922E'),
-    ('152512N', '1072938E'),
-    ('152433N', '1073045E'),
-    ('152456N', '1073320E'),
-    ('152440N', '1073423E'),
-    ('152410N', '1073434E'),
-    ('152358N', '1073439E'),
-    ('152140N', '1073447E'),
-    ('152036N', '1073511E'),
-    ('151950N', '1073554E'),
-    ('151752N', '1073835E'),
-    ('151656N', '1073927E'),
-    ('151606N', '1073950E'),
-    ('151511N', '1073951E'),
-    ('151220N', '1073924E'),
-    ('151158N', '1073914E'),
-    ('151151N', '1073850E'),
-    ('151208N', '1073833E'),
-    ('151218N', '1073812E'),
-    ('151147N', '1073738E'),
-    ('151114N', '1073724E'),
-    ('150916N', '1073716E'),
-    ('150807N', '1073656E'),
-    ('150714N', '1073619E'),
-    ('150653N', '1073557E'),
-    ('150615N', '1073505E'),
-    ('150548N', '1073449E'),
-    ('150512N', '1073450E'),
-    ('150408N', '1073524E'),
-    ('150329N', '1073520E'),
-    ('150250N', '1073440E'),
-    ('150244N', '1073345E'),
-    ('150301N', '1073206E'),
-    ('150255N', '1073108E'),
-    ('150238N', '1073008E'),
-    ('150208N', '1072825E'),
-    ('150202N', '1072718E'),
-    ('150131N', '1072644E'),
-    ('150042N', '1072640E'),
-    ('145945N', '1072705E'),
-    ('145851N', '1072659E'),
-    ('145804N', '1072714E'),
-    ('145724N', '1072743E'),
-    ('145653N', '1072825E'),
-    ('145625N', '1072922E'),
-    ('145342N', '1073258E'),
-    ('145312N', '1073329E'),
-    ('145234N', '1073319E'),
-    ('145124N', '1073226E'),
-    ('144903N', '1072955E'),
-    ('144815N', '1072927E'),
-    ('144719N', '1072939E'),
-    ('144623N', '1073015E'),
-    ('144531N', '1073033E'),
-    ('144445N', '1072953E'),
-    ('144410N', '1073015E'),
-    ('144341N', '1073052E'),
-    ('144307N', '1073120E'),
+        ('165428N', '1071259E'),
+        ('165603N', '1071111E'),
+        ('170035N', '1070757E'),
+        ('170106N', '1070716E'),
+        ('170335N', '1070737E'),
+        ('170517N', '1070642E'),
+        ('170943N', '1070026E'),
+        ('171219N', '1065647E'),
+        ('172007N', '1064550E'),
+        ('172546N', '1064034E'),
+        ('172650N', '1063948E'),
+        ('172659N', '1063933E'),
+        ('172713N', '1063929E'),
+        ('172808N', '1063818E'),
+        ('172813N', '1063804E'),
+        ('172911N', '1063733E'),
+        ('173107N', '1063653E'),
+        ('173552N', '1063357E'),
+        # ('173739N', '1063220E'),
+        # ('174011N', '1063053E'),
+        # ('174057N', '1063015E'),
+        # ('174441N', '1062532E'),
+        # ('174422N', '1062608E'),
+        # ('174257N', '1062655E'),
+        # ('174212N', '1062842E'),
+        ('174209N', '1062922E'),
+        ('174238N', '1062953E'),
+        ('174304N', '1062943E'),
+        ('174413N', '1062830E'),
+        ('174453N', '1062812E'),
+        ('174757N', '1062738E'),
+        ('174941N', '1062706E'),
+        ('175047N', '1062634E'),
+        ('175123N', '1062658E'),
+        ('175156N', '1062703E'),
+        ('175219N', '1062649E'),
+        ('175228N', '1062609E'),
+        ('175255N', '1062609E'),
+        ('175254N', '1062718E'),
+        ('175324N', '1062757E'),
+        ('175410N', '1062827E'),
+        ('175455N', '1062903E'),
+        ('175550N', '1063014E'),
+        ('175636N', '1063129E'),
+        ('175658N', '1063129E'),
+        ('175725N', '1063106E'),
+        ('175944N', '1053523E'),
+        ('175944N', '1053523E'),
+        ('175809N', '1053612E'),
+        ('175750N', '1053621E'),
+        ('175317N', '1053538E'),
+        ('175115N', '1053618E'),
+        ('174912N', '1053838E'),
+        ('174623N', '1054011E'),
+        ('174438N', '1054131E'),
+        ('174339N', '1054204E'),
+        ('174122N', '1054249E'),
+        ('174024N', '1054323E'),
+        ('173950N', '1054407E'),
+        ('173831N', '1054714E'),
+        ('173717N', '1054911E'),
+        ('173552N', '1055045E'),
+        ('173100N', '1055440E'),
+        ('172944N', '1055555E'),
+        ('172944N', '1055556E'),
+        ('172340N', '1060109E'),
+        ('171526N', '1061107E'),
+        ('171446N', '1061226E'),
+        ('171441N', '1061318E'),
+        ('171507N', '1061400E'),
+        ('171558N', '1061452E'),
+        ('171628N', '1061508E'),
+        ('171659N', '1061517E'),
+        ('171721N', '1061535E'),
+        ('171723N', '1061621E'),
+        ('171705N', '1061704E'),
+        ('171635N', '1061712E'),
+        ('171557N', '1061708E'),
+        ('171513N', '1061716E'),
+        ('171448N', '1061735E'),
+        ('171358N', '1061825E'),
+        ('171337N', '1061837E'),
+        ('171304N', '1061835E'),
+        ('171207N', '1061805E'),
+        ('171129N', '1061802E'),
+        ('171035N', '1061822E'),
+        ('170742N', '1062011E'),
+        ('170507N', '1062304E'),
+        ('170404N', '1062341E'),
+        ('170343N', '1062339E'),
+        ('170306N', '1062316E'),
+        ('170249N', '1062313E'),
+        ('170052N', '1062414E'),
+        ('170019N', '1062431E'),
+        ('165944N', '1062440E'),
+        ('165944N', '1062440E'),
+        ('165919N', '1062512E'),
+        ('165849N', '1062613E'),
+        ('165824N', '1062723E'),
+        ('165814N', '1062825E'),
+        ('165750N', '1062948E'),
+        ('165921N', '1063128E'),
+        ('165821N', '1063200E'),
+        ('165702N', '1063200E'),
+        ('164100N', '1063206E'),
+        ('163932N', '1063226E'),
+        ('163816N', '1063259E'),
+        ('163648N', '1063420E'),
+        ('163608N', '1063529E'),
+        ('163540N', '1063641E'),
+        ('163536N', '1063729E'),
+        ('163511N', '1063824E'),
+        ('163431N', '1063839E'),
+        ('163118N', '1063822E'),
+        ('163037N', '1063828E'),
+        ('162814N', '1063918E'),
+        ('162639N', '1064014E'),
+        ('162540N', '1064134E'),
+        ('162556N', '1064321E'),
+        ('162517N', '1064321E'),
+        ('162501N', '1064332E'),
+        ('162503N', '1064356E'),
+        ('162517N', '1064432E'),
+        ('162541N', '1064505E'),
+        ('162544N', '1064509E'),
+        ('162611N', '1064515E'),
+        ('162639N', '1064516E'),
+        ('162708N', '1064532E'),
+        ('162808N', '1064710E'),
+        ('162846N', '1064750E'),
+        ('162945N', '1064805E'),
+        ('163151N', '1064922E'),
+        ('163148N', '1065048E'),
+        ('163014N', '1065150E'),
+        ('162749N', '1065200E'),
+        ('162550N', '1065145E'),
+        ('162540N', '1065140E'),
+        ('162528N', '1065129E'),
+        ('162513N', '1065121E'),
+        ('162452N', '1065121E'),
+        ('162442N', '1065135E'),
+        ('162450N', '1065159E'),
+        ('162502N', '1065222E'),
+        ('162504N', '1065234E'),
+        ('162327N', '1065318E'),
+        ('162242N', '1065351E'),
+        ('162153N', '1065454E'),
+        ('162106N', '1065622E'),
+        ('162046N', '1065645E'),
+        ('162010N', '1065702E'),
+        ('161849N', '1065714E'),
+        ('161825N', '1065723E'),
+        ('161759N', '1065802E'),
+        ('161754N', '1065848E'),
+        ('161757N', '1070051E'),
+        ('161742N', '1070312E'),
+        ('161726N', '1070404E'),
+        ('161724N', '1070414E'),
+        ('161651N', '1070520E'),
+        ('161602N', '1070629E'),
+        ('161516N', '1070700E'),
+        ('161203N', '1070738E'),
+        ('161117N', '1070800E'),
+        ('161105N', '1070809E'),
+        ('161037N', '1070831E'),
+        ('160957N', '1070915E'),
+        ('160924N', '1071010E'),
+        ('160911N', '1071059E'),
+        ('160903N', '1071149E'),
+        ('160847N', '1071246E'),
+        ('160747N', '1071419E'),
+        ('160502N', '1071633E'),
+        ('160351N', '1071756E'),
+        ('160321N', '1071936E'),
+        ('160333N', '1072121E'),
+        ('160423N', '1072441E'),
+        ('160425N', '1072551E'),
+        ('160407N', '1072608E'),
+        ('160326N', '1072600E'),
+        ('160319N', '1072559E'),
+        ('160217N', '1072555E'),
+        ('160136N', '1072612E'),
+        ('160108N', '1072636E'),
+        ('160035N', '1072641E'),
+        ('155945N', '1072557E'),
+        ('155900N', '1072504E'),
+        ('155608N', '1072326E'),
+        ('155508N', '1072231E'),
+        ('155444N', '1072139E'),
+        ('155421N', '1071922E'),
+        ('155356N', '1071818E'),
+        ('155119N', '1071408E'),
+        ('155111N', '1071338E'),
+        ('155117N', '1071305E'),
+        ('155132N', '1071231E'),
+        ('155143N', '1071154E'),
+        ('155133N', '1071110E'),
+        ('155054N', '1071030E'),
+        ('154739N', '1070900E'),
+        ('154624N', '1070855E'),
+        ('154531N', '1070936E'),
+        ('154339N', '1071255E'),
+        ('154300N', '1071332E'),
+        ('154208N', '1071348E'),
+        ('153939N', '1071404E'),
+        ('153842N', '1071420E'),
+        ('153751N', '1071455E'),
+        ('153707N', '1071555E'),
+        ('153559N', '1071812E'),
+        ('153519N', '1071859E'),
+        ('152945N', '1072209E'),
+        ('152918N', '1072253E'),
+        ('152933N', '1072319E'),
+        ('153005N', '1072341E'),
+        ('153030N', '1072418E'),
+        ('153031N', '1072444E'),
+        ('153013N', '1072555E'),
+        ('153020N', '1072616E'),
+        ('153033N', '1072634E'),
+        ('153029N', '1072652E'),
+        ('152945N', '1072712E'),
+        ('152917N', '1072723E'),
+        ('152903N', '1072738E'),
+        ('152903N', '1072759E'),
+        ('152917N', '1072825E'),
+        ('152853N', '1072914E'),
+        ('152741N', '1072924E'),
+        ('152616N', '1072922E'),
+        ('152512N', '1072938E'),
+        ('152433N', '1073045E'),
+        ('152456N', '1073320E'),
+        ('152440N', '1073423E'),
+        ('152410N', '1073434E'),
+        ('152358N', '1073439E'),
+        ('152140N', '1073447E'),
+        ('152036N', '1073511E'),
+        ('151950N', '1073554E'),
+        ('151752N', '1073835E'),
+        ('151656N', '1073927E'),
+        ('151606N', '1073950E'),
+        ('151511N', '1073951E'),
+        ('151220N', '1073924E'),
+        ('151158N', '1073914E'),
+        ('151151N', '1073850E'),
+        ('151208N', '1073833E'),
+        ('151218N', '1073812E'),
+        ('151147N', '1073738E'),
+        ('151114N', '1073724E'),
+        ('150916N', '1073716E'),
+        ('150807N', '1073656E'),
+        ('150714N', '1073619E'),
+        ('150653N', '1073557E'),
+        ('150615N', '1073505E'),
+        ('150548N', '1073449E'),
+        ('150512N', '1073450E'),
+        ('150408N', '1073524E'),
+        ('150329N', '1073520E'),
+        ('150250N', '1073440E'),
+        ('150244N', '1073345E'),
+        ('150301N', '1073206E'),
+        ('150255N', '1073108E'),
+        ('150238N', '1073008E'),
+        ('150208N', '1072825E'),
+        ('150202N', '1072718E'),
+        ('150131N', '1072644E'),
+        ('150042N', '1072640E'),
+        ('145945N', '1072705E'),
+        ('145851N', '1072659E'),
+        ('145804N', '1072714E'),
+        ('145724N', '1072743E'),
+        ('145653N', '1072825E'),
+        ('145625N', '1072922E'),
+        ('145342N', '1073258E'),
+        ('145312N', '1073329E'),
+        ('145234N', '1073319E'),
+        ('145124N', '1073226E'),
+        ('144903N', '1072955E'),
+        ('144815N', '1072927E'),
+        ('144719N', '1072939E'),
+        ('144623N', '1073015E'),
+        ('144531N', '1073033E'),
+        ('144445N', '1072953E'),
+        ('144410N', '1073015E'),
+        ('144341N', '1073052E'),
+        ('144307N', '1073120E'),
     
-    # Part 2
-    ('144216N', '1073113E'),
-    ('144040N', '1073156E'),
-    ('143910N', '1073138E'),
-    ('143607N', '1073014E'),
-    ('143511N', '1073009E'),
-    ('143324N', '1073023E'),
-    ('143227N', '1073018E'),
-    ('143147N', '1073000E'),
-    ('143034N', '1072908E'),
-    ('142945N', '1072852E'),
-    ('142919N', '1072849E'),
-    ('142830N', '1072836E'),
-    ('142656N', '1072753E'),
-    ('142601N', '1072720E'),
-    ('142525N', '1072635E'),
-    ('142508N', '1072525E'),
-    ('142519N', '1072502E'),
-    ('142543N', '1072449E'),
-    ('142558N', '1072428E'),
-    ('142544N', '1072341E'),
-    ('142518N', '1072312E'),
-    ('142449N', '1072301E'),
-    ('142416N', '1072256E'),
-    ('142343N', '1072245E'),
-    ('142137N', '1072132E'),
-    ('142031N', '1072106E'),
-    ('141917N', '1072059E'),
-    ('141845N', '1072107E'),
-    ('141735N', '1072139E'),
-    ('141659N', '1072149E'),
-    ('141625N', '1072148E'),
-    ('141419N', '1072130E'),
-    ('140837N', '1071929E'),
-    ('140711N', '1071911E'),
-    ('140629N', '1071927E'),
-    ('140554N', '1072001E'),
-    ('140452N', '1072041E'),
-    ('140342N', '1072048E'),
-    ('140227N', '1072036E'),
-    ('140114N', '1072035E'),
-    ('140008N', '1072116E'),
-    ('135946N', '1072217E'),
-    ('135959N', '1072432E'),
-    ('135938N', '1072528E'),
-    ('135904N', '1072550E'),
-    ('135828N', '1072552E'),
-    ('135754N', '1072548E'),
-    ('135721N', '1072551E'),
-    ('135535N', '1072642E'),
-    ('135517N', '1072645E'),
-    ('135433N', '1072652E'),
-    ('135352N', '1072643E'),
-    ('135311N', '1072623E'),
-    ('135210N', '1072607E'),
-    ('135021N', '1072646E'),
-    ('134949N', '1072641E'),
-    ('134832N', '1072618E'),
-    ('134754N', '1072617E'),
-    ('134700N', '1072635E'),
-    ('134540N', '1072744E'),
-    ('134445N', '1072818E'),
-    ('134429N', '1072825E'),
-    ('134301N', '1072948E'),
-    ('134133N', '1073051E'),
-    ('133206N', '1073548E'),
-    ('132954N', '1073615E'),
-    ('132401N', '1073637E'),
-    ('132211N', '1073625E'),
-    ('131737N', '1073429E'),
-    ('131543N', '1073341E'),
-    ('130117N', '1072737E'),
-    ('130026N', '1072746E'),
-    ('125945N', '1072842E'),
-    ('125919N', '1072851E'),
-    ('125856N', '1072852E'),
-    ('125836N', '1072844E'),
-    ('125822N', '1072825E'),
-    ('125746N', '1072804E'),
-    ('125707N', '1072757E'),
-    ('125627N', '1072806E'),
-    ('125457N', '1072846E'),
-    ('125308N', '1072900E'),
-    ('125214N', '1072914E'),
-    ('125131N', '1072939E'),
-    ('124938N', '1073120E'),
-    ('124758N', '1073209E'),
-    ('124624N', '1073219E'),
-    ('124447N', '1073215E'),
-    ('124300N', '1073224E'),
-    ('123623N', '1073354E'),
-    ('123426N', '1073401E'),
-    ('123237N', '1073348E'),
-    ('123151N', '1073328E'),
-    ('123112N', '1073306E'),
-    ('123033N', '1073258E'),
-    ('122946N', '1073324E'),
-    ('122945N', '1073324E'),
-    ('122821N', '1073324E'),
-    ('122328N', '1073138E'),
-    ('122159N', '1073120E'),
-    ('122037N', '1073051E'),
-    ('121932N', '1072958E'),
-    ('121855N', '1072825E'),
-    ('121756N', '1072658E'),
-    ('121514N', '1072457E'),
-    ('121510N', '1072334E'),
-    ('121609N', '1072225E'),
-    ('121854N', '1072037E'),
-    ('121945N', '1071912E'),
-    ('121931N', '1071634E'),
-    ('121838N', '1071340E'),
-    ('121820N', '1071242E'),
-    ('121637N', '1070909E'),
-    ('121446N', '1070722E'),
-    ('121355N', '1070658E'),
-    ('121316N', '1070615E'),
-    ('121209N', '1070439E'),
-    ('120951N', '1070245E'),
-    ('120550N', '1065839E'),
-    ('120451N', '1065712E'),
-    ('120400N', '1065458E'),
-    ('120345N', '1065245E'),
-    ('120406N', '1064810E'),
-    ('120402N', '1064726E'),
-    ('120356N', '1064619E'),
-    ('120308N', '1064457E'),
-    ('120143N', '1064358E'),
-    ('115946N', '1064316E'),
-    ('115814N', '1064205E'),
-    ('115754N', '1064049E'),
-    ('115834N', '1063750E'),
-    ('115740N', '1063818E'),
-    ('115822N', '1063308E'),
-    ('115824N', '1063016E'),
-    ('115707N', '1062825E'),
-    ('115710N', '1062737E'),
-    ('115735N', '1062718E'),
-    ('115806N', '1062703E'),
-    ('115829N', '1062631E'),
-    ('115836N', '1062544E'),
-    ('115833N', '1062502E'),
-    ('115811N', '1062338E'),
-    ('115756N', '1062343E'),
-    ('115634N', '1062412E'),
-    ('115318N', '1062559E'),
-    ('115149N', '1062619E'),
-    ('115140N', '1062610E'),
-    ('115015N', '1062517E'),
-    ('114951N', '1062512E'),
-    ('114843N', '1062510E'),
-    ('114812N', '1062505E'),
-    ('114720N', '1062440E'),
-    ('114633N', '1062411E'),
-    ('114543N', '1062351E'),
-    ('114446N', '1062355E'),
-    ('114201N', '1062533E'),
-    ('114042N', '1062604E'),
-    ('114038N', '1062606E'),
-    ('113943N', '1062533E'),
-    ('113942N', '1062446E'),
-    ('114006N', '1062400E'),
-    ('114101N', '1062241E'),
-    ('114118N', '1062151E'),
-    ('114124N', '1062115E'),
-    ('114120N', '1062037E'),
-    ('114028N', '1061714E'),
-    ('114036N', '1061626E'),
-    ('114102N', '1061554E'),
-    ('114221N', '1061502E'),
-    ('114252N', '1061435E'),
-    ('114329N', '1061325E'),
-    ('114446N', '1060916E'),
-    ('114449N', '1060647E'),
-    ('114546N', '1060340E'),
-    ('114613N', '1060055E'),
-    ('114446N', '1055931E'),
-    ('114356N', '1055928E'),
-    ('114308N', '1055919E'),
-    ('114224N', '1055859E'),
-    ('114040N', '1055718E'),
-    ('113925N', '1055646E'),
-    ('113834N', '1055602E'),
-    ('113839N', '1055419E'),
-    ('113941N', '1055128E'),
-    ('113929N', '1055027E'),
-    ('113829N', '1054915E'),
-    ('113820N', '1054904E'),
-    ('113729N', '1054817E'),
-    ('113626N', '1054736E'),
-    ('113514N', '1054725E'),
-    ('113458N', '1054735E'),
-    ('113358N', '1054812E'),
-    ('113335N', '1054855E'),
-    ('113317N', '1055031E'),
-    ('113248N', '1055111E'),
-    ('113208N', '1055128E'),
-    ('113120N', '1055131E'),
-    ('112946N', '1055124E'),
-    ('112636N', '1055219E'),
-    ('112541N', '1055225E'),
-    ('112447N', '1055215E'),
-    ('112245N', '1055135E'),
-    ('111814N', '1055036E'),
-    ('111723N', '1055039E'),
-    ('111647N', '1055125E'),
-    ('111633N', '1055224E'),
-    ('111604N', '1055312E'),
+        # Part 2
+        ('144216N', '1073113E'),
+        ('144040N', '1073156E'),
+        ('143910N', '1073138E'),
+        ('143607N', '1073014E'),
+        ('143511N', '1073009E'),
+        ('143324N', '1073023E'),
+        ('143227N', '1073018E'),
+        ('143147N', '1073000E'),
+        ('143034N', '1072908E'),
+        ('142945N', '1072852E'),
+        ('142919N', '1072849E'),
+        ('142830N', '1072836E'),
+        ('142656N', '1072753E'),
+        ('142601N', '1072720E'),
+        ('142525N', '1072635E'),
+        ('142508N', '1072525E'),
+        ('142519N', '1072502E'),
+        ('142543N', '1072449E'),
+        ('142558N', '1072428E'),
+        ('142544N', '1072341E'),
+        ('142518N', '1072312E'),
+        ('142449N', '1072301E'),
+        ('142416N', '1072256E'),
+        ('142343N', '1072245E'),
+        ('142137N', '1072132E'),
+        ('142031N', '1072106E'),
+        ('141917N', '1072059E'),
+        ('141845N', '1072107E'),
+        ('141735N', '1072139E'),
+        ('141659N', '1072149E'),
+        ('141625N', '1072148E'),
+        ('141419N', '1072130E'),
+        ('140837N', '1071929E'),
+        ('140711N', '1071911E'),
+        ('140629N', '1071927E'),
+        ('140554N', '1072001E'),
+        ('140452N', '1072041E'),
+        ('140342N', '1072048E'),
+        ('140227N', '1072036E'),
+        ('140114N', '1072035E'),
+        ('140008N', '1072116E'),
+        ('135946N', '1072217E'),
+        ('135959N', '1072432E'),
+        ('135938N', '1072528E'),
+        ('135904N', '1072550E'),
+        ('135828N', '1072552E'),
+        ('135754N', '1072548E'),
+        ('135721N', '1072551E'),
+        ('135535N', '1072642E'),
+        ('135517N', '1072645E'),
+        ('135433N', '1072652E'),
+        ('135352N', '1072643E'),
+        ('135311N', '1072623E'),
+        ('135210N', '1072607E'),
+        ('135021N', '1072646E'),
+        ('134949N', '1072641E'),
+        ('134832N', '1072618E'),
+        ('134754N', '1072617E'),
+        ('134700N', '1072635E'),
+        ('134540N', '1072744E'),
+        ('134445N', '1072818E'),
+        ('134429N', '1072825E'),
+        ('134301N', '1072948E'),
+        ('134133N', '1073051E'),
+        ('133206N', '1073548E'),
+        ('132954N', '1073615E'),
+        ('132401N', '1073637E'),
+        ('132211N', '1073625E'),
+        ('131737N', '1073429E'),
+        ('131543N', '1073341E'),
+        ('130117N', '1072737E'),
+        ('130026N', '1072746E'),
+        ('125945N', '1072842E'),
+        ('125919N', '1072851E'),
+        ('125856N', '1072852E'),
+        ('125836N', '1072844E'),
+        ('125822N', '1072825E'),
+        ('125746N', '1072804E'),
+        ('125707N', '1072757E'),
+        ('125627N', '1072806E'),
+        ('125457N', '1072846E'),
+        ('125308N', '1072900E'),
+        ('125214N', '1072914E'),
+        ('125131N', '1072939E'),
+        ('124938N', '1073120E'),
+        ('124758N', '1073209E'),
+        ('124624N', '1073219E'),
+        ('124447N', '1073215E'),
+        ('124300N', '1073224E'),
+        ('123623N', '1073354E'),
+        ('123426N', '1073401E'),
+        ('123237N', '1073348E'),
+        ('123151N', '1073328E'),
+        ('123112N', '1073306E'),
+        ('123033N', '1073258E'),
+        ('122946N', '1073324E'),
+        ('122945N', '1073324E'),
+        ('122821N', '1073324E'),
+        ('122328N', '1073138E'),
+        ('122159N', '1073120E'),
+        ('122037N', '1073051E'),
+        ('121932N', '1072958E'),
+        ('121855N', '1072825E'),
+        ('121756N', '1072658E'),
+        ('121514N', '1072457E'),
+        ('121510N', '1072334E'),
+        ('121609N', '1072225E'),
+        ('121854N', '1072037E'),
+        ('121945N', '1071912E'),
+        ('121931N', '1071634E'),
+        ('121838N', '1071340E'),
+        ('121820N', '1071242E'),
+        ('121637N', '1070909E'),
+        ('121446N', '1070722E'),
+        ('121355N', '1070658E'),
+        ('121316N', '1070615E'),
+        ('121209N', '1070439E'),
+        ('120951N', '1070245E'),
+        ('120550N', '1065839E'),
+        ('120451N', '1065712E'),
+        ('120400N', '1065458E'),
+        ('120345N', '1065245E'),
+        ('120406N', '1064810E'),
+        ('120402N', '1064726E'),
+        ('120356N', '1064619E'),
+        ('120308N', '1064457E'),
+        ('120143N', '1064358E'),
+        ('115946N', '1064316E'),
+        ('115814N', '1064205E'),
+        ('115754N', '1064049E'),
+        ('115834N', '1063750E'),
+        ('115740N', '1063818E'),
+        ('115822N', '1063308E'),
+        ('115824N', '1063016E'),
+        ('115707N', '1062825E'),
+        ('115710N', '1062737E'),
+        ('115735N', '1062718E'),
+        ('115806N', '1062703E'),
+        ('115829N', '1062631E'),
+        ('115836N', '1062544E'),
+        ('115833N', '1062502E'),
+        ('115811N', '1062338E'),
+        ('115756N', '1062343E'),
+        ('115634N', '1062412E'),
+        ('115318N', '1062559E'),
+        ('115149N', '1062619E'),
+        ('115140N', '1062610E'),
+        ('115015N', '1062517E'),
+        ('114951N', '1062512E'),
+        ('114843N', '1062510E'),
+        ('114812N', '1062505E'),
+        ('114720N', '1062440E'),
+        ('114633N', '1062411E'),
+        ('114543N', '1062351E'),
+        ('114446N', '1062355E'),
+        ('114201N', '1062533E'),
+        ('114042N', '1062604E'),
+        ('114038N', '1062606E'),
+        ('113943N', '1062533E'),
+        ('113942N', '1062446E'),
+        ('114006N', '1062400E'),
+        ('114101N', '1062241E'),
+        ('114118N', '1062151E'),
+        ('114124N', '1062115E'),
+        ('114120N', '1062037E'),
+        ('114028N', '1061714E'),
+        ('114036N', '1061626E'),
+        ('114102N', '1061554E'),
+        ('114221N', '1061502E'),
+        ('114252N', '1061435E'),
+        ('114329N', '1061325E'),
+        ('114446N', '1060916E'),
+        ('114449N', '1060647E'),
+        ('114546N', '1060340E'),
+        ('114613N', '1060055E'),
+        ('114446N', '1055931E'),
+        ('114356N', '1055928E'),
+        ('114308N', '1055919E'),
+        ('114224N', '1055859E'),
+        ('114040N', '1055718E'),
+        ('113925N', '1055646E'),
+        ('113834N', '1055602E'),
+        ('113839N', '1055419E'),
+        ('113941N', '1055128E'),
+        ('113929N', '1055027E'),
+        ('113829N', '1054915E'),
+        ('113820N', '1054904E'),
+        ('113729N', '1054817E'),
+        ('113626N', '1054736E'),
+        ('113514N', '1054725E'),
+        ('113458N', '1054735E'),
+        ('113358N', '1054812E'),
+        ('113335N', '1054855E'),
+        ('113317N', '1055031E'),
+        ('113248N', '1055111E'),
+        ('113208N', '1055128E'),
+        ('113120N', '1055131E'),
+        ('112946N', '1055124E'),
+        ('112636N', '1055219E'),
+        ('112541N', '1055225E'),
+        ('112447N', '1055215E'),
+        ('112245N', '1055135E'),
+        ('111814N', '1055036E'),
+        ('111723N', '1055039E'),
+        ('111647N', '1055125E'),
+        ('111633N', '1055224E'),
+        ('111604N', '1055312E'),
     
-    # Missing part
-    # ('112245N', '1055135E'),
-    # ('111814N', '1055036E'),
-    # ('111723N', '1055039E'),
-    # ('111647N', '1055125E'),
-    # ('111633N', '1055224E'),
-    ('111604N', '1055312E'),
-    ('111447N', '1055321E'),
-    ('111446N', '1055321E'),
-    ('111306N', '1055359E'),
-    ('111211N', '1055513E'),
-    ('111125N', '1055826E'),
-    ('111037N', '1055919E'),
-    ('110821N', '1060047E'),
-    ('110721N', '1060141E'),
-    ('110535N', '1060347E'),
-    ('110437N', '1060435E'),
-    ('110322N', '1060511E'),
-    ('110440N', '1060553E'),
-    ('110512N', '1060648E'),
-    ('110503N', '1060751E'),
-    ('110414N', '1060855E'),
-    ('110312N', '1060937E'),
-    ('105946N', '1061035E'),
-    ('105834N', '1061116E'),
-    ('105812N', '1061051E'),
-    ('105814N', '1061013E'),
-    ('105816N', '1060856E'),
-    ('105809N', '1060753E'),
-    ('105756N', '1060741E'),
-    ('105719N', '1060720E'),
-    ('105711N', '1060728E'),
-    ('105538N', '1060724E'),
-    ('105530N', '1060718E'),
-    ('105432N', '1060736E'),
-    ('105146N', '1060905E'),
-    ('104600N', '1061038E'),
-    ('104705N', '1060918E'),
-    ('104728N', '1060743E'),
-    ('104748N', '1060419E'),
-    ('104821N', '1060244E'),
-    ('104911N', '1060104E'),
-    ('105016N', '1055933E'),
-    ('105131N', '1055826E'),
-    ('105210N', '1055752E'),
-    ('105346N', '1055552E'),
-    ('105248N', '1055547E'),
-    ('105129N', '1055513E'),
-    ('105018N', '1055431E'),
-    ('104942N', '1055357E'),
-    ('104941N', '1055243E'),
-    ('105021N', '1055139E'),
-    ('105119N', '1055051E'),
-    ('105210N', '1055024E'),
-    ('105416N', '1054942E'),
-    ('105510N', '1054917E'),
-    ('105757N', '1054714E'),
-    ('105947N', '1054610E'),
+        # Missing part
+        # ('112245N', '1055135E'),
+        # ('111814N', '1055036E'),
+        # ('111723N', '1055039E'),
+        # ('111647N', '1055125E'),
+        # ('111633N', '1055224E'),
+        ('111604N', '1055312E'),
+        ('111447N', '1055321E'),
+        ('111446N', '1055321E'),
+        ('111306N', '1055359E'),
+        ('111211N', '1055513E'),
+        ('111125N', '1055826E'),
+        ('111037N', '1055919E'),
+        ('110821N', '1060047E'),
+        ('110721N', '1060141E'),
+        ('110535N', '1060347E'),
+        ('110437N', '1060435E'),
+        ('110322N', '1060511E'),
+        ('110440N', '1060553E'),
+        ('110512N', '1060648E'),
+        ('110503N', '1060751E'),
+        ('110414N', '1060855E'),
+        ('110312N', '1060937E'),
+        ('105946N', '1061035E'),
+        ('105834N', '1061116E'),
+        ('105812N', '1061051E'),
+        ('105814N', '1061013E'),
+        ('105816N', '1060856E'),
+        ('105809N', '1060753E'),
+        ('105756N', '1060741E'),
+        ('105719N', '1060720E'),
+        ('105711N', '1060728E'),
+        ('105538N', '1060724E'),
+        ('105530N', '1060718E'),
+        ('105432N', '1060736E'),
+        ('105146N', '1060905E'),
+        ('104600N', '1061038E'),
+        ('104705N', '1060918E'),
+        ('104728N', '1060743E'),
+        ('104748N', '1060419E'),
+        ('104821N', '1060244E'),
+        ('104911N', '1060104E'),
+        ('105016N', '1055933E'),
+        ('105131N', '1055826E'),
+        ('105210N', '1055752E'),
+        ('105346N', '1055552E'),
+        ('105248N', '1055547E'),
+        ('105129N', '1055513E'),
+        ('105018N', '1055431E'),
+        ('104942N', '1055357E'),
+        ('104941N', '1055243E'),
+        ('105021N', '1055139E'),
+        ('105119N', '1055051E'),
+        ('105210N', '1055024E'),
+        ('105416N', '1054942E'),
+        ('105510N', '1054917E'),
+        ('105757N', '1054714E'),
+        ('105947N', '1054610E'),
 
-    ('110056N', '1054510E'),
-    ('110106N', '1054334E'),
-    ('110036N', '1054150E'),
-    ('105947N', '1054026E'),
-    ('105946N', '1054025E'),
-    ('105903N', '1053917E'),
-    ('105826N', '1053755E'),
-    ('105815N', '1053702E'),
-    ('105704N', '1053124E'),
-    ('105627N', '1052825E'),
-    ('105630N', '1052756E'),
-    ('105710N', '1052636E'),
-    ('105738N', '1052454E'),
-    ('105746N', '1052437E'),
-    ('105716N', '1052352E'),
-    ('105428N', '1052126E'),
-    ('105053N', '1051939E'),
-    ('105019N', '1051904E'),
-    ('105038N', '1051810E'),
-    ('105225N', '1051607E'),
-    ('105300N', '1051511E'),
-    ('105329N', '1051232E'),
-    ('105434N', '1050642E'),
-    ('105451N', '1050551E'),
-    ('105546N', '1050509E'),
-    ('105633N', '1050501E'),
-    ('105648N', '1050440E'),
-    ('105607N', '1050320E'),
-    ('105534N', '1050233E'),
-    ('105521N', '1050218E'),
-    ('105450N', '1050144E'),
-    ('105358N', '1050104E'),
-    ('105301N', '1050041E'),
-    ('105057N', '1050053E'),
-    ('104841N', '1050149E'),
-    ('104447N', '1050358E'),
-    ('104250N', '1050400E'),
-    ('104126N', '1050232E'),
-    ('103829N', '1045639E'),
-    ('103750N', '1045552E'),
-    ('103704N', '1045511E'),
-    ('103321N', '1045242E'),
-    ('103152N', '1045115E'),
-    ('103101N', '1044907E'),
-    ('103055N', '1044625E'),
-    ('103116N', '1044327E'),
-    ('103127N', '1044202E'),
-    ('103200N', '1043731E'),
-    ('103153N', '1043457E'),
-    ('103141N', '1043400E'),
-    ('103105N', '1043314E'),
-    ('103013N', '1043239E'),
-    ('102916N', '1043209E'),
-    ('102539N', '1042939E'),
-    ('102504N', '1042901E'),
-    ('102545N', '1042810E'),
-    ('102530N', '1042704E'),
-    # ('102425N', '1042720E'),
-    # ('102326N', '1042711E'),
-    # ('102247N', '1042713E'),
-    # ('102242N', '1042810E'),
-    # ('102259N', '1042909E'),
-    # ('102330N', '1042956E'),
-    # ('102414N', '1043034E'),
-    # ('102509N', '1043102E'),
-    # ('102509N', '1043129E'),
-    # ('102432N', '1043149E'),
-    # ('102358N', '1043148E'),
-    # ('102323N', '1043130E'),
-    # ('102242N', '1043102E'),
-    # ('102221N', '1043032E'),
-    # ('102222N', '1043007E'),
-    # ('102214N', '1042956E'),
-    # ('102126N', '1043013E'),
+        ('110056N', '1054510E'),
+        ('110106N', '1054334E'),
+        ('110036N', '1054150E'),
+        ('105947N', '1054026E'),
+        ('105946N', '1054025E'),
+        ('105903N', '1053917E'),
+        ('105826N', '1053755E'),
+        ('105815N', '1053702E'),
+        ('105704N', '1053124E'),
+        ('105627N', '1052825E'),
+        ('105630N', '1052756E'),
+        ('105710N', '1052636E'),
+        ('105738N', '1052454E'),
+        ('105746N', '1052437E'),
+        ('105716N', '1052352E'),
+        ('105428N', '1052126E'),
+        ('105053N', '1051939E'),
+        ('105019N', '1051904E'),
+        ('105038N', '1051810E'),
+        ('105225N', '1051607E'),
+        ('105300N', '1051511E'),
+        ('105329N', '1051232E'),
+        ('105434N', '1050642E'),
+        ('105451N', '1050551E'),
+        ('105546N', '1050509E'),
+        ('105633N', '1050501E'),
+        ('105648N', '1050440E'),
+        ('105607N', '1050320E'),
+        ('105534N', '1050233E'),
+        ('105521N', '1050218E'),
+        ('105450N', '1050144E'),
+        ('105358N', '1050104E'),
+        ('105301N', '1050041E'),
+        ('105057N', '1050053E'),
+        ('104841N', '1050149E'),
+        ('104447N', '1050358E'),
+        ('104250N', '1050400E'),
+        ('104126N', '1050232E'),
+        ('103829N', '1045639E'),
+        ('103750N', '1045552E'),
+        ('103704N', '1045511E'),
+        ('103321N', '1045242E'),
+        ('103152N', '1045115E'),
+        ('103101N', '1044907E'),
+        ('103055N', '1044625E'),
+        ('103116N', '1044327E'),
+        ('103127N', '1044202E'),
+        ('103200N', '1043731E'),
+        ('103153N', '1043457E'),
+        ('103141N', '1043400E'),
+        ('103105N', '1043314E'),
+        ('103013N', '1043239E'),
+        ('102916N', '1043209E'),
+        ('102539N', '1042939E'),
+        ('102504N', '1042901E'),
+        ('102545N', '1042810E'),
+        ('102530N', '1042704E'),
+        # ('102425N', '1042720E'),
+        # ('102326N', '1042711E'),
+        # ('102247N', '1042713E'),
+        # ('102242N', '1042810E'),
+        # ('102259N', '1042909E'),
+        # ('102330N', '1042956E'),
+        # ('102414N', '1043034E'),
+        # ('102509N', '1043102E'),
+        # ('102509N', '1043129E'),
+        # ('102432N', '1043149E'),
+        # ('102358N', '1043148E'),
+        # ('102323N', '1043130E'),
+        # ('102242N', '1043102E'),
+        # ('102221N', '1043032E'),
+        # ('102222N', '1043007E'),
+        # ('102214N', '1042956E'),
+        # ('102126N', '1043013E'),
     
-    # Closing the loop
-    ('103800N', '1035345E'),
-    ('102200N', '1034400E')
-]
+        # Closing the loop
+        ('103800N', '1035345E'),
+        ('102200N', '1034400E')
+    ]
 
 #endregion
 
 #region Kota Kinabalu FIR - WBFC
 
-KOTA_KINABALU_FIR_coordinates = [
-    ('082500N', '1163000E'),
-    ('073000N', '1173000E'),
-    ('040000N', '1200000E'),
-    ('040000N', '1180000E'),
+@_dataset
+def _KOTA_KINABALU_FIR_coordinates():
+    return [
+        ('082500N', '1163000E'),
+        ('073000N', '1173000E'),
+        ('040000N', '1200000E'),
+        ('040000N', '1180000E'),
 
-    # International boundary
-    ('041000N', '1175400E'),
-    ('041000N', '1173605E'),
-    ('041034N', '1173401E'),
-    ('041003N', '1173329E'),
-    ('041025N', '1173231E'),
-    ('041018N', '1173052E'),
-    ('041021N', '1172954E'),
-    ('041040N', '1172751E'),
-    ('041108N', '1172611E'),
-    ('041200N', '1172446E'),
-    ('041534N', '1172123E'),
-    ('041803N', '1171632E'),
-    ('041936N', '1171419E'),
-    ('042013N', '1171350E'),
-    ('042047N', '1171329E'),
-    ('042112N', '1171301E'),
-    ('042121N', '1171209E'),
-    ('042110N', '1171125E'),
-    ('042018N', '1171027E'),
-    ('041959N', '1170952E'),
-    ('041946N', '1165850E'),
-    ('042041N', '1165527E'),
-    ('042041N', '1165258E'),
-    ('041948N', '1164816E'),
-    ('042018N', '1164558E'),
-    ('042152N', '1164345E'),
-    ('042200N', '1164241E'),
-    ('042023N', '1164048E'),
-    ('042003N', '1163940E'),
-    ('042001N', '1163830E'),
-    ('042038N', '1163655E'),
-    ('041952N', '1163524E'),
-    ('041955N', '1163436E'),
-    ('042343N', '1163159E'),
-    ('042348N', '1163119E'),
-    ('042302N', '1163055E'),
-    ('042147N', '1162939E'),
-    ('042055N', '1162911E'),
-    ('042018N', '1162913E'),
-    ('041952N', '1162930E'),
-    ('041929N', '1162938E'),
-    ('041900N', '1162909E'),
-    ('041844N', '1162806E'),
-    ('041900N', '1162725E'),
-    ('041902N', '1162646E'),
-    ('041730N', '1162518E'),
-    ('041719N', '1162440E'),
-    ('041723N', '1162403E'),
-    ('041740N', '1162327E'),
-    ('042015N', '1162155E'),
-    ('042101N', '1162142E'),
-    ('042119N', '1162129E'),
-    ('042128N', '1162104E'),
-    ('042124N', '1162039E'),
-    ('042126N', '1162015E'),
-    ('042300N', '1161838E'),
-    ('042242N', '1161706E'),
-    ('042150N', '1161526E'),
-    ('042122N', '1161343E'),
-    ('042128N', '1161254E'),
-    ('042211N', '1161012E'),
-    ('042216N', '1160848E'),
-    ('042222N', '1160811E'),
-    ('042244N', '1160732E'),
-    ('042126N', '1160702E'),
-    ('042042N', '1160635E'),
-    ('042011N', '1160557E'),
-    ('041931N', '1160452E'),
-    ('041639N', '1160159E'),
-    ('041615N', '1160114E'),
-    ('041636N', '1160014E'),
-    ('041720N', '1155936E'),
-    ('041817N', '1155914E'),
-    ('041917N', '1155900E'),
-    ('041943N', '1155838E'),
-    ('042007N', '1155753E'),
-    ('042039N', '1155627E'),
-    ('042049N', '1155355E'),
-    ('042107N', '1155243E'),
-    ('042200N', '1155209E'),
-    ('042257N', '1155153E'),
-    ('042326N', '1155122E'),
-    ('042321N', '1155038E'),
-    ('042234N', '1154951E'),
-    ('042039N', '1154916E'),
-    ('041840N', '1154918E'),
-    ('041652N', '1154902E'),
-    ('041456N', '1154645E'),
-    ('041409N', '1154631E'),
-    ('041332N', '1154614E'),
-    ('041319N', '1154524E'),
-    ('041339N', '1154449E'),
-    ('041410N', '1154424E'),
-    ('041421N', '1154357E'),
-    ('041159N', '1154123E'),
-    ('041126N', '1154058E'),
-    ('041102N', '1154033E'),
-    ('041043N', '1153921E'),
-    ('041008N', '1153848E'),
-    ('040845N', '1153820E'),
-    ('040742N', '1153759E'),
-    ('040224N', '1153719E'),
-    ('035948N', '1153634E'),
-    ('035728N', '1153525E'),
-    ('035648N', '1153451E'),
-    ('035539N', '1153245E'),
-    ('035514N', '1153219E'),
-    ('035352N', '1153217E'),
-    ('035300N', '1153314E'),
-    ('035219N', '1153428E'),
-    ('035127N', '1153519E'),
-    ('034928N', '1153521E'),
-    ('034229N', '1153301E'),
-    ('034008N', '1153240E'),
-    ('033744N', '1153239E'),
-    ('033619N', '1153254E'),
-    ('033242N', '1153424E'),
-    ('033204N', '1153428E'),
-    ('033051N', '1153420E'),
-    ('033014N', '1153421E'),
-    ('032930N', '1153434E'),
-    ('032743N', '1153533E'),
-    ('032628N', '1153602E'),
-    ('032548N', '1153604E'),
-    ('032515N', '1153543E'),
-    ('032500N', '1153506E'),
-    ('032509N', '1153433E'),
-    ('032525N', '1153401E'),
-    ('032531N', '1153325E'),
-    ('032413N', '1153208E'),
-    ('032125N', '1153103E'),
-    ('031223N', '1152858E'),
-    ('031120N', '1152900E'),
-    ('031011N', '1152957E'),
-    ('030953N', '1153051E'),
-    ('030926N', '1153101E'),
-    ('030639N', '1152855E'),
-    ('030534N', '1152833E'),
-    ('030301N', '1152819E'),
-    ('030150N', '1152750E'),
-    ('030126N', '1152652E'),
-    ('030110N', '1152424E'),
-    ('025928N', '1152029E'),
-    ('025909N', '1151835E'),
-    ('025958N', '1151652E'),
-    ('030214N', '1151521E'),
-    ('030229N', '1151431E'),
-    ('030057N', '1151330E'),
-    ('025850N', '1151228E'),
-    ('025803N', '1151147E'),
-    ('025542N', '1150820E'),
-    ('025446N', '1150722E'),
-    ('025331N', '1150634E'),
-    ('025249N', '1150618E'),
-    ('025211N', '1150609E'),
-    ('025134N', '1150556E'),
-    ('025053N', '1150528E'),
-    ('025011N', '1150439E'),
-    ('024957N', '1150408E'),
-    ('024941N', '1150400E'),
-    ('024853N', '1150418E'),
-    ('024651N', '1150553E'),
-    ('024541N', '1150616E'),
-    ('024413N', '1150536E'),
-    ('024346N', '1150457E'),
-    ('024338N', '1150419E'),
-    ('024325N', '1150347E'),
-    ('024240N', '1150325E'),
-    ('024205N', '1150328E'),
-    ('024053N', '1150407E'),
-    ('024018N', '1150418E'),
-    ('023904N', '1150402E'),
-    ('023743N', '1150331E'),
-    ('023631N', '1150323E'),
-    ('023540N', '1150417E'),
-    ('023539N', '1150457E'),
-    ('023617N', '1150614E'),
-    ('023628N', '1150653E'),
-    ('023624N', '1150736E'),
-    ('023610N', '1150823E'),
-    ('023549N', '1150907E'),
-    ('023525N', '1150942E'),
-    ('023426N', '1151037E'),
-    ('023303N', '1151132E'),
-    ('023139N', '1151213E'),
-    ('023035N', '1151222E'),
-    ('022925N', '1151133E'),
-    ('022859N', '1151018E'),
-    ('022845N', '1150735E'),
-    ('022756N', '1150618E'),
-    ('022523N', '1150402E'),
-    ('022450N', '1150307E'),
-    ('022423N', '1150205E'),
-    ('022211N', '1145931E'),
-    ('022126N', '1145822E'),
-    ('022138N', '1145604E'),
-    ('022114N', '1145519E'),
-    ('021955N', '1145455E'),
-    ('021840N', '1145500E'),
-    ('021744N', '1145510E'),
-    ('021702N', '1145447E'),
-    ('021630N', '1145311E'),
-    ('021552N', '1144832E'),
-    ('021449N', '1144643E'),
-    ('021229N', '1144548E'),
-    ('020912N', '1144507E'),
-    ('020805N', '1144510E'),
-    ('020733N', '1144524E'),
-    ('020636N', '1144604E'),
-    ('020600N', '1144613E'),
-    ('020359N', '1144609E'),
-    ('020329N', '1144613E'),
-    ('020209N', '1144650E'),
-    ('020205N', '1144731E'),
-    ('020231N', '1144829E'),
-    ('020241N', '1144952E'),
-    ('020217N', '1145027E'),
-    ('020129N', '1145043E'),
-    ('020035N', '1145042E'),
-    ('015949N', '1145033E'),
-    ('015836N', '1145001E'),
-    ('015735N', '1144945E'),
-    ('015633N', '1144945E'),
-    ('015516N', '1145001E'),
-    ('015409N', '1144955E'),
-    ('015325N', '1144908E'),
-    ('015207N', '1144546E'),
-    ('015143N', '1144232E'),
-    ('015128N', '1144157E'),
-    ('015100N', '1144119E'),
-    ('015026N', '1144046E'),
-    ('014954N', '1144027E'),
-    ('014915N', '1144016E'),
-    ('014850N', '1144021E'),
-    ('014824N', '1144032E'),
-    ('014739N', '1144044E'),
-    ('014547N', '1144048E'),
-    ('014138N', '1144008E'),
-    ('013829N', '1143901E'),
-    ('013555N', '1143728E'),
-    ('013453N', '1143634E'),
-    ('013312N', '1143428E'),
-    ('013211N', '1143347E'),
-    ('013044N', '1143347E'),
-    ('012927N', '1143403E'),
-    ('012809N', '1143404E'),
-    ('012700N', '1143341E'),
-    ('012605N', '1143244E'),
-    ('012545N', '1143120E'),
-    ('012609N', '1143002E'),
-    ('012931N', '1142516E'),
-    ('013012N', '1142353E'),
-    ('013024N', '1142229E'),
-    ('013007N', '1142120E'),
-    ('012621N', '1141226E'),
-    ('012618N', '1141217E'),
-    ('012524N', '1141059E'),
-    ('012513N', '1141024E'),
-    ('012529N', '1140937E'),
-    ('012603N', '1140900E'),
-    ('012642N', '1140827E'),
-    ('012715N', '1140751E'),
-    ('012756N', '1140539E'),
-    ('012754N', '1140314E'),
-    ('012632N', '1135434E'),
-    ('012605N', '1135328E'),
-    ('012455N', '1135205E'),
-    ('012022N', '1134829E'),
-    ('011359N', '1133858E'),
-    ('011339N', '1133729E'),
-    ('011300N', '1133500E'), # Jakarta FIR merge point
+        # International boundary
+        ('041000N', '1175400E'),
+        ('041000N', '1173605E'),
+        ('041034N', '1173401E'),
+        ('041003N', '1173329E'),
+        ('041025N', '1173231E'),
+        ('041018N', '1173052E'),
+        ('041021N', '1172954E'),
+        ('041040N', '1172751E'),
+        ('041108N', '1172611E'),
+        ('041200N', '1172446E'),
+        ('041534N', '1172123E'),
+        ('041803N', '1171632E'),
+        ('041936N', '1171419E'),
+        ('042013N', '1171350E'),
+        ('042047N', '1171329E'),
+        ('042112N', '1171301E'),
+        ('042121N', '1171209E'),
+        ('042110N', '1171125E'),
+        ('042018N', '1171027E'),
+        ('041959N', '1170952E'),
+        ('041946N', '1165850E'),
+        ('042041N', '1165527E'),
+        ('042041N', '1165258E'),
+        ('041948N', '1164816E'),
+        ('042018N', '1164558E'),
+        ('042152N', '1164345E'),
+        ('042200N', '1164241E'),
+        ('042023N', '1164048E'),
+        ('042003N', '1163940E'),
+        ('042001N', '1163830E'),
+        ('042038N', '1163655E'),
+        ('041952N', '1163524E'),
+        ('041955N', '1163436E'),
+        ('042343N', '1163159E'),
+        ('042348N', '1163119E'),
+        ('042302N', '1163055E'),
+        ('042147N', '1162939E'),
+        ('042055N', '1162911E'),
+        ('042018N', '1162913E'),
+        ('041952N', '1162930E'),
+        ('041929N', '1162938E'),
+        ('041900N', '1162909E'),
+        ('041844N', '1162806E'),
+        ('041900N', '1162725E'),
+        ('041902N', '1162646E'),
+        ('041730N', '1162518E'),
+        ('041719N', '1162440E'),
+        ('041723N', '1162403E'),
+        ('041740N', '1162327E'),
+        ('042015N', '1162155E'),
+        ('042101N', '1162142E'),
+        ('042119N', '1162129E'),
+        ('042128N', '1162104E'),
+        ('042124N', '1162039E'),
+        ('042126N', '1162015E'),
+        ('042300N', '1161838E'),
+        ('042242N', '1161706E'),
+        ('042150N', '1161526E'),
+        ('042122N', '1161343E'),
+        ('042128N', '1161254E'),
+        ('042211N', '1161012E'),
+        ('042216N', '1160848E'),
+        ('042222N', '1160811E'),
+        ('042244N', '1160732E'),
+        ('042126N', '1160702E'),
+        ('042042N', '1160635E'),
+        ('042011N', '1160557E'),
+        ('041931N', '1160452E'),
+        ('041639N', '1160159E'),
+        ('041615N', '1160114E'),
+        ('041636N', '1160014E'),
+        ('041720N', '1155936E'),
+        ('041817N', '1155914E'),
+        ('041917N', '1155900E'),
+        ('041943N', '1155838E'),
+        ('042007N', '1155753E'),
+        ('042039N', '1155627E'),
+        ('042049N', '1155355E'),
+        ('042107N', '1155243E'),
+        ('042200N', '1155209E'),
+        ('042257N', '1155153E'),
+        ('042326N', '1155122E'),
+        ('042321N', '1155038E'),
+        ('042234N', '1154951E'),
+        ('042039N', '1154916E'),
+        ('041840N', '1154918E'),
+        ('041652N', '1154902E'),
+        ('041456N', '1154645E'),
+        ('041409N', '1154631E'),
+        ('041332N', '1154614E'),
+        ('041319N', '1154524E'),
+        ('041339N', '1154449E'),
+        ('041410N', '1154424E'),
+        ('041421N', '1154357E'),
+        ('041159N', '1154123E'),
+        ('041126N', '1154058E'),
+        ('041102N', '1154033E'),
+        ('041043N', '1153921E'),
+        ('041008N', '1153848E'),
+        ('040845N', '1153820E'),
+        ('040742N', '1153759E'),
+        ('040224N', '1153719E'),
+        ('035948N', '1153634E'),
+        ('035728N', '1153525E'),
+        ('035648N', '1153451E'),
+        ('035539N', '1153245E'),
+        ('035514N', '1153219E'),
+        ('035352N', '1153217E'),
+        ('035300N', '1153314E'),
+        ('035219N', '1153428E'),
+        ('035127N', '1153519E'),
+        ('034928N', '1153521E'),
+        ('034229N', '1153301E'),
+        ('034008N', '1153240E'),
+        ('033744N', '1153239E'),
+        ('033619N', '1153254E'),
+        ('033242N', '1153424E'),
+        ('033204N', '1153428E'),
+        ('033051N', '1153420E'),
+        ('033014N', '1153421E'),
+        ('032930N', '1153434E'),
+        ('032743N', '1153533E'),
+        ('032628N', '1153602E'),
+        ('032548N', '1153604E'),
+        ('032515N', '1153543E'),
+        ('032500N', '1153506E'),
+        ('032509N', '1153433E'),
+        ('032525N', '1153401E'),
+        ('032531N', '1153325E'),
+        ('032413N', '1153208E'),
+        ('032125N', '1153103E'),
+        ('031223N', '1152858E'),
+        ('031120N', '1152900E'),
+        ('031011N', '1152957E'),
+        ('030953N', '1153051E'),
+        ('030926N', '1153101E'),
+        ('030639N', '1152855E'),
+        ('030534N', '1152833E'),
+        ('030301N', '1152819E'),
+        ('030150N', '1152750E'),
+        ('030126N', '1152652E'),
+        ('030110N', '1152424E'),
+        ('025928N', '1152029E'),
+        ('025909N', '1151835E'),
+        ('025958N', '1151652E'),
+        ('030214N', '1151521E'),
+        ('030229N', '1151431E'),
+        ('030057N', '1151330E'),
+        ('025850N', '1151228E'),
+        ('025803N', '1151147E'),
+        ('025542N', '1150820E'),
+        ('025446N', '1150722E'),
+        ('025331N', '1150634E'),
+        ('025249N', '1150618E'),
+        ('025211N', '1150609E'),
+        ('025134N', '1150556E'),
+        ('025053N', '1150528E'),
+        ('025011N', '1150439E'),
+        ('024957N', '1150408E'),
+        ('024941N', '1150400E'),
+        ('024853N', '1150418E'),
+        ('024651N', '1150553E'),
+        ('024541N', '1150616E'),
+        ('024413N', '1150536E'),
+        ('024346N', '1150457E'),
+        ('024338N', '1150419E'),
+        ('024325N', '1150347E'),
+        ('024240N', '1150325E'),
+        ('024205N', '1150328E'),
+        ('024053N', '1150407E'),
+        ('024018N', '1150418E'),
+        ('023904N', '1150402E'),
+        ('023743N', '1150331E'),
+        ('023631N', '1150323E'),
+        ('023540N', '1150417E'),
+        ('023539N', '1150457E'),
+        ('023617N', '1150614E'),
+        ('023628N', '1150653E'),
+        ('023624N', '1150736E'),
+        ('023610N', '1150823E'),
+        ('023549N', '1150907E'),
+        ('023525N', '1150942E'),
+        ('023426N', '1151037E'),
+        ('023303N', '1151132E'),
+        ('023139N', '1151213E'),
+        ('023035N', '1151222E'),
+        ('022925N', '1151133E'),
+        ('022859N', '1151018E'),
+        ('022845N', '1150735E'),
+        ('022756N', '1150618E'),
+        ('022523N', '1150402E'),
+        ('022450N', '1150307E'),
+        ('022423N', '1150205E'),
+        ('022211N', '1145931E'),
+        ('022126N', '1145822E'),
+        ('022138N', '1145604E'),
+        ('022114N', '1145519E'),
+        ('021955N', '1145455E'),
+        ('021840N', '1145500E'),
+        ('021744N', '1145510E'),
+        ('021702N', '1145447E'),
+        ('021630N', '1145311E'),
+        ('021552N', '1144832E'),
+        ('021449N', '1144643E'),
+        ('021229N', '1144548E'),
+        ('020912N', '1144507E'),
+        ('020805N', '1144510E'),
+        ('020733N', '1144524E'),
+        ('020636N', '1144604E'),
+        ('020600N', '1144613E'),
+        ('020359N', '1144609E'),
+        ('020329N', '1144613E'),
+        ('020209N', '1144650E'),
+        ('020205N', '1144731E'),
+        ('020231N', '1144829E'),
+        ('020241N', '1144952E'),
+        ('020217N', '1145027E'),
+        ('020129N', '1145043E'),
+        ('020035N', '1145042E'),
+        ('015949N', '1145033E'),
+        ('015836N', '1145001E'),
+        ('015735N', '1144945E'),
+        ('015633N', '1144945E'),
+        ('015516N', '1145001E'),
+        ('015409N', '1144955E'),
+        ('015325N', '1144908E'),
+        ('015207N', '1144546E'),
+        ('015143N', '1144232E'),
+        ('015128N', '1144157E'),
+        ('015100N', '1144119E'),
+        ('015026N', '1144046E'),
+        ('014954N', '1144027E'),
+        ('014915N', '1144016E'),
+        ('014850N', '1144021E'),
+        ('014824N', '1144032E'),
+        ('014739N', '1144044E'),
+        ('014547N', '1144048E'),
+        ('014138N', '1144008E'),
+        ('013829N', '1143901E'),
+        ('013555N', '1143728E'),
+        ('013453N', '1143634E'),
+        ('013312N', '1143428E'),
+        ('013211N', '1143347E'),
+        ('013044N', '1143347E'),
+        ('012927N', '1143403E'),
+        ('012809N', '1143404E'),
+        ('012700N', '1143341E'),
+        ('012605N', '1143244E'),
+        ('012545N', '1143120E'),
+        ('012609N', '1143002E'),
+        ('012931N', '1142516E'),
+        ('013012N', '1142353E'),
+        ('013024N', '1142229E'),
+        ('013007N', '1142120E'),
+        ('012621N', '1141226E'),
+        ('012618N', '1141217E'),
+        ('012524N', '1141059E'),
+        ('012513N', '1141024E'),
+        ('012529N', '1140937E'),
+        ('012603N', '1140900E'),
+        ('012642N', '1140827E'),
+        ('012715N', '1140751E'),
+        ('012756N', '1140539E'),
+        ('012754N', '1140314E'),
+        ('012632N', '1135434E'),
+        ('012605N', '1135328E'),
+        ('012455N', '1135205E'),
+        ('012022N', '1134829E'),
+        ('011359N', '1133858E'),
+        ('011339N', '1133729E'),
+        ('011300N', '1133500E'), # Jakarta FIR merge point
     
-    ('011429N', '1133547E'),
-    ('011805N', '1133246E'),
-    ('011848N', '1133128E'),
-    ('011852N', '1133012E'),
-    ('011831N', '1132856E'),
-    ('011732N', '1132634E'),
-    ('011738N', '1132351E'),
-    ('012105N', '1131925E'),
-    ('012207N', '1131633E'),
-    ('012251N', '1131303E'),
-    ('012301N', '1131021E'),
-    ('012317N', '1130930E'),
-    ('012449N', '1130732E'),
-    ('012552N', '1130520E'),
-    ('012605N', '1130302E'),
-    ('012540N', '1130041E'),
-    ('012454N', '1125823E'),
-    ('012456N', '1125729E'),
-    ('012524N', '1125719E'),
-    ('012603N', '1125740E'),
-    ('012725N', '1125930E'),
-    ('012823N', '1130026E'),
-    ('012932N', '1130106E'),
-    ('013051N', '1130127E'),
-    ('013213N', '1130124E'),
-    ('013302N', '1130050E'),
-    ('013336N', '1125949E'),
-    ('013411N', '1125823E'),
-    ('013420N', '1125721E'),
-    ('013413N', '1125427E'),
-    ('013429N', '1125317E'),
-    ('013450N', '1125216E'),
-    ('013457N', '1125117E'),
-    ('013433N', '1125011E'),
-    ('013401N', '1124935E'),
-    ('013327N', '1124913E'),
-    ('013257N', '1124848E'),
-    ('013237N', '1124805E'),
-    ('013239N', '1124741E'),
-    ('013308N', '1124607E'),
-    ('013403N', '1122813E'),
-    ('013343N', '1122645E'),
-    ('013302N', '1122547E'),
-    ('013211N', '1122457E'),
-    ('013124N', '1122354E'),
-    ('013103N', '1122251E'),
-    ('013042N', '1121908E'),
-    ('013013N', '1121742E'),
-    ('012656N', '1121048E'),
-    ('012604N', '1120941E'),
-    ('012434N', '1120914E'),
-    ('012402N', '1120932E'),
-    ('012400N', '1121054E'),
-    ('012329N', '1121116E'),
-    ('012246N', '1121114E'),
-    ('012208N', '1121102E'),
-    ('011822N', '1120909E'),
-    ('010917N', '1120600E'),
-    ('010835N', '1120534E'),
-    ('010814N', '1120446E'),
-    ('010801N', '1120314E'),
-    ('010802N', '1115824E'),
-    ('010650N', '1115436E'),
-    ('010030N', '1114923E'),
-    ('005934N', '1114546E'),
-    ('010005N', '1114403E'),
-    ('010124N', '1114055E'),
-    ('010150N', '1113918E'),
-    ('010156N', '1113814E'),
-    ('010148N', '1113721E'),
-    ('005951N', '1113219E'),
-    ('005752N', '1113055E'),
-    ('005730N', '1113011E'),
-    ('005851N', '1112931E'),
-    ('005952N', '1112916E'),
-    ('010046N', '1112856E'),
-    ('010119N', '1112819E'),
-    ('010121N', '1112716E'),
-    ('010036N', '1112454E'),
-    ('010022N', '1112343E'),
-    ('010027N', '1112226E'),
-    ('010050N', '1112106E'),
-    ('010423N', '1111303E'),
-    ('010430N', '1111151E'),
-    ('010103N', '1105824E'),
-    ('010056N', '1105438E'),
-    ('010037N', '1105249E'),
-    ('005949N', '1105109E'),
-    ('005658N', '1104749E'),
-    ('005602N', '1104713E'),
-    ('005458N', '1104710E'),
-    ('005429N', '1104702E'),
-    ('005411N', '1104636E'),
-    ('005415N', '1104616E'),
-    ('005446N', '1104540E'),
-    ('005452N', '1104530E'),
-    ('005428N', '1104444E'),
-    ('005418N', '1104441E'),
-    ('005350N', '1104329E'),
-    ('005350N', '1104314E'),
-    ('005405N', '1104234E'),
-    ('005405N', '1104215E'),
-    ('005340N', '1104134E'),
-    ('005237N', '1104027E'),
-    ('005219N', '1103940E'),
-    ('005226N', '1103851E'),
-    ('005250N', '1103819E'),
-    ('005319N', '1103755E'),
-    ('005335N', '1103729E'),
-    ('005338N', '1103648E'),
-    ('005327N', '1103634E'),
-    ('005259N', '1103621E'),
-    ('005215N', '1103545E'),
-    ('005104N', '1103314E'),
-    ('005126N', '1103022E'),
-    ('005247N', '1102736E'),
-    ('005434N', '1102521E'),
-    ('005759N', '1102250E'),
-    ('005852N', '1102150E'),
-    ('005911N', '1102105E'),
-    ('005951N', '1101802E'),
-    ('005943N', '1101710E'),
-    ('005927N', '1101622E'),
-    ('005939N', '1101548E'),
-    ('010052N', '1101542E'),
-    ('010220N', '1101523E'),
-    ('010642N', '1101224E'),
-    ('010915N', '1101106E'),
-    ('011028N', '1101013E'),
-    ('011101N', '1100907E'),
-    ('011129N', '1100536E'),
-    ('011155N', '1100428E'),
-    ('011255N', '1100306E'),
-    ('011512N', '1100150E'),
-    ('011613N', '1100043E'),
-    ('011715N', '1095834E'),
-    ('011754N', '1095749E'),
-    ('011910N', '1095706E'),
-    ('012242N', '1095557E'),
-    ('012341N', '1095512E'),
-    ('012413N', '1095407E'),
-    ('012413N', '1095257E'),
-    ('012405N', '1095146E'),
-    ('012411N', '1095034E'),
-    ('012503N', '1094931E'),
-    ('012735N', '1094828E'),
-    ('012800N', '1094802E'),
-    ('012722N', '1094653E'),
-    ('012728N', '1094631E'),
-    ('012909N', '1094623E'),
-    ('012947N', '1094558E'),
-    ('013422N', '1094038E'),
-    ('013549N', '1093928E'),
-    ('013703N', '1093849E'),
-    ('013813N', '1093830E'),
-    ('014058N', '1093826E'),
-    ('014542N', '1093849E'),
-    ('014651N', '1093830E'),
-    ('014715N', '1093726E'),
-    ('014716N', '1093448E'),
-    ('014733N', '1093401E'),
-    ('014807N', '1093320E'),
-    ('014851N', '1093247E'),
-    ('014935N', '1093223E'),
-    ('015020N', '1093205E'),
-    ('015047N', '1093203E'),
-    ('015114N', '1093205E'),
-    ('015323N', '1093142E'),
-    ('015418N', '1093145E'),
-    ('015503N', '1093216E'),
-    ('015654N', '1093427E'),
-    ('015739N', '1093506E'),
-    ('015859N', '1093600E'),
-    ('020146N', '1093735E'),
-    ('020459N', '1093842E'),
-    ('020426N', '1093806E'),
-    ('020115N', '1093616E'),
-    ('020027N', '1093534E'),
-    ('015951N', '1093443E'),
-    ('015925N', '1093340E'),
-    ('015720N', '1092526E'),
-    ('015653N', '1092132E'),
-    ('015607N', '1092027E'),
-    ('015403N', '1092004E'),
-    ('015204N', '1092011E'),
-    ('015100N', '1092006E'),
-    ('014958N', '1091942E'),
-    ('014901N', '1091852E'),
-    ('014825N', '1091759E'),
-    ('014745N', '1091721E'),
-    ('014641N', '1091712E'),
-    ('014855N', '1092004E'),
-    ('014907N', '1092012E'),
-    ('014911N', '1092030E'),
-    ('014907N', '1092048E'),
-    ('014855N', '1092055E'),
-    ('014834N', '1092052E'),
-    ('014823N', '1092043E'),
-    ('014815N', '1092035E'),
-    ('014806N', '1092031E'),
-    ('014751N', '1092020E'),
-    ('014641N', '1091915E'),
-    ('014509N', '1091812E'),
-    ('014137N', '1091620E'),
-    ('014006N', '1091509E'),
-    ('013338N', '1090545E'),
-    ('013202N', '1090422E'),
-    ('012956N', '1090338E'),
-    ('012301N', '1090338E'),
-    ('012108N', '1090315E'),
-    ('011908N', '1090225E'),
-    ('011626N', '1090021E'),
-    ('011450N', '1085925E'),
-    ('011040N', '1085557E'),
-    ('010950N', '1085527E'),
-    ('010825N', '1085537E'),
-    ('010000N', '1085849E'),
+        ('011429N', '1133547E'),
+        ('011805N', '1133246E'),
+        ('011848N', '1133128E'),
+        ('011852N', '1133012E'),
+        ('011831N', '1132856E'),
+        ('011732N', '1132634E'),
+        ('011738N', '1132351E'),
+        ('012105N', '1131925E'),
+        ('012207N', '1131633E'),
+        ('012251N', '1131303E'),
+        ('012301N', '1131021E'),
+        ('012317N', '1130930E'),
+        ('012449N', '1130732E'),
+        ('012552N', '1130520E'),
+        ('012605N', '1130302E'),
+        ('012540N', '1130041E'),
+        ('012454N', '1125823E'),
+        ('012456N', '1125729E'),
+        ('012524N', '1125719E'),
+        ('012603N', '1125740E'),
+        ('012725N', '1125930E'),
+        ('012823N', '1130026E'),
+        ('012932N', '1130106E'),
+        ('013051N', '1130127E'),
+        ('013213N', '1130124E'),
+        ('013302N', '1130050E'),
+        ('013336N', '1125949E'),
+        ('013411N', '1125823E'),
+        ('013420N', '1125721E'),
+        ('013413N', '1125427E'),
+        ('013429N', '1125317E'),
+        ('013450N', '1125216E'),
+        ('013457N', '1125117E'),
+        ('013433N', '1125011E'),
+        ('013401N', '1124935E'),
+        ('013327N', '1124913E'),
+        ('013257N', '1124848E'),
+        ('013237N', '1124805E'),
+        ('013239N', '1124741E'),
+        ('013308N', '1124607E'),
+        ('013403N', '1122813E'),
+        ('013343N', '1122645E'),
+        ('013302N', '1122547E'),
+        ('013211N', '1122457E'),
+        ('013124N', '1122354E'),
+        ('013103N', '1122251E'),
+        ('013042N', '1121908E'),
+        ('013013N', '1121742E'),
+        ('012656N', '1121048E'),
+        ('012604N', '1120941E'),
+        ('012434N', '1120914E'),
+        ('012402N', '1120932E'),
+        ('012400N', '1121054E'),
+        ('012329N', '1121116E'),
+        ('012246N', '1121114E'),
+        ('012208N', '1121102E'),
+        ('011822N', '1120909E'),
+        ('010917N', '1120600E'),
+        ('010835N', '1120534E'),
+        ('010814N', '1120446E'),
+        ('010801N', '1120314E'),
+        ('010802N', '1115824E'),
+        ('010650N', '1115436E'),
+        ('010030N', '1114923E'),
+        ('005934N', '1114546E'),
+        ('010005N', '1114403E'),
+        ('010124N', '1114055E'),
+        ('010150N', '1113918E'),
+        ('010156N', '1113814E'),
+        ('010148N', '1113721E'),
+        ('005951N', '1113219E'),
+        ('005752N', '1113055E'),
+        ('005730N', '1113011E'),
+        ('005851N', '1112931E'),
+        ('005952N', '1112916E'),
+        ('010046N', '1112856E'),
+        ('010119N', '1112819E'),
+        ('010121N', '1112716E'),
+        ('010036N', '1112454E'),
+        ('010022N', '1112343E'),
+        ('010027N', '1112226E'),
+        ('010050N', '1112106E'),
+        ('010423N', '1111303E'),
+        ('010430N', '1111151E'),
+        ('010103N', '1105824E'),
+        ('010056N', '1105438E'),
+        ('010037N', '1105249E'),
+        ('005949N', '1105109E'),
+        ('005658N', '1104749E'),
+        ('005602N', '1104713E'),
+        ('005458N', '1104710E'),
+        ('005429N', '1104702E'),
+        ('005411N', '1104636E'),
+        ('005415N', '1104616E'),
+        ('005446N', '1104540E'),
+        ('005452N', '1104530E'),
+        ('005428N', '1104444E'),
+        ('005418N', '1104441E'),
+        ('005350N', '1104329E'),
+        ('005350N', '1104314E'),
+        ('005405N', '1104234E'),
+        ('005405N', '1104215E'),
+        ('005340N', '1104134E'),
+        ('005237N', '1104027E'),
+        ('005219N', '1103940E'),
+        ('005226N', '1103851E'),
+        ('005250N', '1103819E'),
+        ('005319N', '1103755E'),
+        ('005335N', '1103729E'),
+        ('005338N', '1103648E'),
+        ('005327N', '1103634E'),
+        ('005259N', '1103621E'),
+        ('005215N', '1103545E'),
+        ('005104N', '1103314E'),
+        ('005126N', '1103022E'),
+        ('005247N', '1102736E'),
+        ('005434N', '1102521E'),
+        ('005759N', '1102250E'),
+        ('005852N', '1102150E'),
+        ('005911N', '1102105E'),
+        ('005951N', '1101802E'),
+        ('005943N', '1101710E'),
+        ('005927N', '1101622E'),
+        ('005939N', '1101548E'),
+        ('010052N', '1101542E'),
+        ('010220N', '1101523E'),
+        ('010642N', '1101224E'),
+        ('010915N', '1101106E'),
+        ('011028N', '1101013E'),
+        ('011101N', '1100907E'),
+        ('011129N', '1100536E'),
+        ('011155N', '1100428E'),
+        ('011255N', '1100306E'),
+        ('011512N', '1100150E'),
+        ('011613N', '1100043E'),
+        ('011715N', '1095834E'),
+        ('011754N', '1095749E'),
+        ('011910N', '1095706E'),
+        ('012242N', '1095557E'),
+        ('012341N', '1095512E'),
+        ('012413N', '1095407E'),
+        ('012413N', '1095257E'),
+        ('012405N', '1095146E'),
+        ('012411N', '1095034E'),
+        ('012503N', '1094931E'),
+        ('012735N', '1094828E'),
+        ('012800N', '1094802E'),
+        ('012722N', '1094653E'),
+        ('012728N', '1094631E'),
+        ('012909N', '1094623E'),
+        ('012947N', '1094558E'),
+        ('013422N', '1094038E'),
+        ('013549N', '1093928E'),
+        ('013703N', '1093849E'),
+        ('013813N', '1093830E'),
+        ('014058N', '1093826E'),
+        ('014542N', '1093849E'),
+        ('014651N', '1093830E'),
+        ('014715N', '1093726E'),
+        ('014716N', '1093448E'),
+        ('014733N', '1093401E'),
+        ('014807N', '1093320E'),
+        ('014851N', '1093247E'),
+        ('014935N', '1093223E'),
+        ('015020N', '1093205E'),
+        ('015047N', '1093203E'),
+        ('015114N', '1093205E'),
+        ('015323N', '1093142E'),
+        ('015418N', '1093145E'),
+        ('015503N', '1093216E'),
+        ('015654N', '1093427E'),
+        ('015739N', '1093506E'),
+        ('015859N', '1093600E'),
+        ('020146N', '1093735E'),
+        ('020459N', '1093842E'),
+        ('020426N', '1093806E'),
+        ('020115N', '1093616E'),
+        ('020027N', '1093534E'),
+        ('015951N', '1093443E'),
+        ('015925N', '1093340E'),
+        ('015720N', '1092526E'),
+        ('015653N', '1092132E'),
+        ('015607N', '1092027E'),
+        ('015403N', '1092004E'),
+        ('015204N', '1092011E'),
+        ('015100N', '1092006E'),
+        ('014958N', '1091942E'),
+        ('014901N', '1091852E'),
+        ('014825N', '1091759E'),
+        ('014745N', '1091721E'),
+        ('014641N', '1091712E'),
+        ('014855N', '1092004E'),
+        ('014907N', '1092012E'),
+        ('014911N', '1092030E'),
+        ('014907N', '1092048E'),
+        ('014855N', '1092055E'),
+        ('014834N', '1092052E'),
+        ('014823N', '1092043E'),
+        ('014815N', '1092035E'),
+        ('014806N', '1092031E'),
+        ('014751N', '1092020E'),
+        ('014641N', '1091915E'),
+        ('014509N', '1091812E'),
+        ('014137N', '1091620E'),
+        ('014006N', '1091509E'),
+        ('013338N', '1090545E'),
+        ('013202N', '1090422E'),
+        ('012956N', '1090338E'),
+        ('012301N', '1090338E'),
+        ('012108N', '1090315E'),
+        ('011908N', '1090225E'),
+        ('011626N', '1090021E'),
+        ('011450N', '1085925E'),
+        ('011040N', '1085557E'),
+        ('010950N', '1085527E'),
+        ('010825N', '1085537E'),
+        ('010000N', '1085849E'),
 
-    # Continue
-    ('010000N', '1085400E'),
-    ('010000N', '1083000E'),
-    ('021500N', '1083000E'),
+        # Continue
+        ('010000N', '1085400E'),
+        ('010000N', '1083000E'),
+        ('021500N', '1083000E'),
 
-    # Closing the loop back to first point
-    ('082500N', '1163000E')
-]
+        # Closing the loop back to first point
+        ('082500N', '1163000E')
+    ]
 
 #endregion
 
 #region Ujung Pandang FIR - WAAF
 
-UJUNG_PANDANG_FIR = [
-    ('011300N', '1133500E'),
+@_dataset
+def _UJUNG_PANDANG_FIR():
+    return [
+        ('011300N', '1133500E'),
     
-    # Along Indonesia-Malaysia boundary
-    ('011300N', '1133500E'),
-    ('011339N', '1133729E'),
-    ('011359N', '1133858E'),
-    ('012022N', '1134829E'),
-    ('012455N', '1135205E'),
-    ('012605N', '1135328E'),
-    ('012632N', '1135434E'),
-    ('012754N', '1140314E'),
-    ('012756N', '1140539E'),
-    ('012715N', '1140751E'),
-    ('012642N', '1140827E'),
-    ('012603N', '1140900E'),
-    ('012529N', '1140937E'),
-    ('012513N', '1141024E'),
-    ('012524N', '1141059E'),
-    ('012618N', '1141217E'),
-    ('012621N', '1141226E'),
-    ('013007N', '1142120E'),
-    ('013024N', '1142229E'),
-    ('013012N', '1142353E'),
-    ('012931N', '1142516E'),
-    ('012609N', '1143002E'),
-    ('012545N', '1143120E'),
-    ('012605N', '1143244E'),
-    ('012700N', '1143341E'),
-    ('012809N', '1143404E'),
-    ('012927N', '1143403E'),
-    ('013044N', '1143347E'),
-    ('013211N', '1143347E'),
-    ('013312N', '1143428E'),
-    ('013453N', '1143634E'),
-    ('013555N', '1143728E'),
-    ('013829N', '1143901E'),
-    ('014138N', '1144008E'),
-    ('014547N', '1144048E'),
-    ('014739N', '1144044E'),
-    ('014824N', '1144032E'),
-    ('014850N', '1144021E'),
-    ('014915N', '1144016E'),
-    ('014954N', '1144027E'),
-    ('015026N', '1144046E'),
-    ('015100N', '1144119E'),
-    ('015128N', '1144157E'),
-    ('015143N', '1144232E'),
-    ('015207N', '1144546E'),
-    ('015325N', '1144908E'),
-    ('015409N', '1144955E'),
-    ('015516N', '1145001E'),
-    ('015633N', '1144945E'),
-    ('015735N', '1144945E'),
-    ('015836N', '1145001E'),
-    ('015949N', '1145033E'),
-    ('020035N', '1145042E'),
-    ('020129N', '1145043E'),
-    ('020217N', '1145027E'),
-    ('020241N', '1144952E'),
-    ('020231N', '1144829E'),
-    ('020205N', '1144731E'),
-    ('020209N', '1144650E'),
-    ('020329N', '1144613E'),
-    ('020359N', '1144609E'),
-    ('020600N', '1144613E'),
-    ('020636N', '1144604E'),
-    ('020733N', '1144524E'),
-    ('020805N', '1144510E'),
-    ('020912N', '1144507E'),
-    ('021229N', '1144548E'),
-    ('021449N', '1144643E'),
-    ('021552N', '1144832E'),
-    ('021630N', '1145311E'),
-    ('021702N', '1145447E'),
-    ('021744N', '1145510E'),
-    ('021840N', '1145500E'),
-    ('021955N', '1145455E'),
-    ('022114N', '1145519E'),
-    ('022138N', '1145604E'),
-    ('022126N', '1145822E'),
-    ('022211N', '1145931E'),
-    ('022423N', '1150205E'),
-    ('022450N', '1150307E'),
-    ('022523N', '1150402E'),
-    ('022756N', '1150618E'),
-    ('022845N', '1150735E'),
-    ('022859N', '1151018E'),
-    ('022925N', '1151133E'),
-    ('023035N', '1151222E'),
-    ('023139N', '1151213E'),
-    ('023303N', '1151132E'),
-    ('023426N', '1151037E'),
-    ('023525N', '1150942E'),
-    ('023549N', '1150907E'),
-    ('023610N', '1150823E'),
-    ('023624N', '1150736E'),
-    ('023628N', '1150653E'),
-    ('023617N', '1150614E'),
-    ('023539N', '1150457E'),
-    ('023540N', '1150417E'),
-    ('023631N', '1150323E'),
-    ('023743N', '1150331E'),
-    ('023904N', '1150402E'),
-    ('024018N', '1150418E'),
-    ('024053N', '1150407E'),
-    ('024205N', '1150328E'),
-    ('024240N', '1150325E'),
-    ('024325N', '1150347E'),
-    ('024338N', '1150419E'),
-    ('024346N', '1150457E'),
-    ('024413N', '1150536E'),
-    ('024541N', '1150616E'),
-    ('024651N', '1150553E'),
-    ('024853N', '1150418E'),
-    ('024941N', '1150400E'),
-    ('024957N', '1150408E'),
-    ('025011N', '1150439E'),
-    ('025053N', '1150528E'),
-    ('025134N', '1150556E'),
-    ('025211N', '1150609E'),
-    ('025249N', '1150618E'),
-    ('025331N', '1150634E'),
-    ('025446N', '1150722E'),
-    ('025542N', '1150820E'),
-    ('025803N', '1151147E'),
-    ('025850N', '1151228E'),
-    ('030057N', '1151330E'),
-    ('030229N', '1151431E'),
-    ('030214N', '1151521E'),
-    ('025958N', '1151652E'),
-    ('025909N', '1151835E'),
-    ('025928N', '1152029E'),
-    ('030110N', '1152424E'),
-    ('030126N', '1152652E'),
-    ('030150N', '1152750E'),
-    ('030301N', '1152819E'),
-    ('030534N', '1152833E'),
-    ('030639N', '1152855E'),
-    ('030926N', '1153101E'),
-    ('030953N', '1153051E'),
-    ('031011N', '1152957E'),
-    ('031120N', '1152900E'),
-    ('031223N', '1152858E'),
-    ('032125N', '1153103E'),
-    ('032413N', '1153208E'),
-    ('032531N', '1153325E'),
-    ('032525N', '1153401E'),
-    ('032509N', '1153433E'),
-    ('032500N', '1153506E'),
-    ('032515N', '1153543E'),
-    ('032548N', '1153604E'),
-    ('032628N', '1153602E'),
-    ('032743N', '1153533E'),
-    ('032930N', '1153434E'),
-    ('033014N', '1153421E'),
-    ('033051N', '1153420E'),
-    ('033204N', '1153428E'),
-    ('033242N', '1153424E'),
-    ('033619N', '1153254E'),
-    ('033744N', '1153239E'),
-    ('034008N', '1153240E'),
-    ('034229N', '1153301E'),
-    ('034928N', '1153521E'),
-    ('035127N', '1153519E'),
-    ('035219N', '1153428E'),
-    ('035300N', '1153314E'),
-    ('035352N', '1153217E'),
-    ('035514N', '1153219E'),
-    ('035539N', '1153245E'),
-    ('035648N', '1153451E'),
-    ('035728N', '1153525E'),
-    ('035948N', '1153634E'),
-    ('040224N', '1153719E'),
-    ('040742N', '1153759E'),
-    ('040845N', '1153820E'),
-    ('041008N', '1153848E'),
-    ('041043N', '1153921E'),
-    ('041102N', '1154033E'),
-    ('041126N', '1154058E'),
-    ('041159N', '1154123E'),
-    ('041421N', '1154357E'),
-    ('041410N', '1154424E'),
-    ('041339N', '1154449E'),
-    ('041319N', '1154524E'),
-    ('041332N', '1154614E'),
-    ('041409N', '1154631E'),
-    ('041456N', '1154645E'),
-    ('041652N', '1154902E'),
-    ('041840N', '1154918E'),
-    ('042039N', '1154916E'),
-    ('042234N', '1154951E'),
-    ('042321N', '1155038E'),
-    ('042326N', '1155122E'),
-    ('042257N', '1155153E'),
-    ('042200N', '1155209E'),
-    ('042107N', '1155243E'),
-    ('042049N', '1155355E'),
-    ('042039N', '1155627E'),
-    ('042007N', '1155753E'),
-    ('041943N', '1155838E'),
-    ('041917N', '1155900E'),
-    ('041817N', '1155914E'),
-    ('041720N', '1155936E'),
-    ('041636N', '1160014E'),
-    ('041615N', '1160114E'),
-    ('041639N', '1160159E'),
-    ('041931N', '1160452E'),
-    ('042011N', '1160557E'),
-    ('042042N', '1160635E'),
-    ('042126N', '1160702E'),
-    ('042244N', '1160732E'),
-    ('042222N', '1160811E'),
-    ('042216N', '1160848E'),
-    ('042211N', '1161012E'),
-    ('042128N', '1161254E'),
-    ('042122N', '1161343E'),
-    ('042150N', '1161526E'),
-    ('042242N', '1161706E'),
-    ('042300N', '1161838E'),
-    ('042126N', '1162015E'),
-    ('042124N', '1162039E'),
-    ('042128N', '1162104E'),
-    ('042119N', '1162129E'),
-    ('042101N', '1162142E'),
-    ('042015N', '1162155E'),
-    ('041740N', '1162327E'),
-    ('041723N', '1162403E'),
-    ('041719N', '1162440E'),
-    ('041730N', '1162518E'),
-    ('041902N', '1162646E'),
-    ('041900N', '1162725E'),
-    ('041844N', '1162806E'),
-    ('041900N', '1162909E'),
-    ('041929N', '1162938E'),
-    ('041952N', '1162930E'),
-    ('042018N', '1162913E'),
-    ('042055N', '1162911E'),
-    ('042147N', '1162939E'),
-    ('042302N', '1163055E'),
-    ('042348N', '1163119E'),
-    ('042343N', '1163159E'),
-    ('041955N', '1163436E'),
-    ('041952N', '1163524E'),
-    ('042038N', '1163655E'),
-    ('042001N', '1163830E'),
-    ('042003N', '1163940E'),
-    ('042023N', '1164048E'),
-    ('042200N', '1164241E'),
-    ('042152N', '1164345E'),
-    ('042018N', '1164558E'),
-    ('041948N', '1164816E'),
-    ('042041N', '1165258E'),
-    ('042041N', '1165527E'),
-    ('041946N', '1165850E'),
-    ('041959N', '1170952E'),
-    ('042018N', '1171027E'),
-    ('042110N', '1171125E'),
-    ('042121N', '1171209E'),
-    ('042112N', '1171301E'),
-    ('042047N', '1171329E'),
-    ('042013N', '1171350E'),
-    ('041936N', '1171419E'),
-    ('041803N', '1171632E'),
-    ('041534N', '1172123E'),
-    ('041200N', '1172446E'),
-    ('041108N', '1172611E'),
-    ('041040N', '1172751E'),
-    ('041021N', '1172954E'),
-    ('041018N', '1173052E'),
-    ('041025N', '1173231E'),
-    ('041003N', '1173329E'),
-    ('041034N', '1173401E'),
-    ('041000N', '1173605E'),
-    ('041000N', '1175400E'),
+        # Along Indonesia-Malaysia boundary
+        ('011300N', '1133500E'),
+        ('011339N', '1133729E'),
+        ('011359N', '1133858E'),
+        ('012022N', '1134829E'),
+        ('012455N', '1135205E'),
+        ('012605N', '1135328E'),
+        ('012632N', '1135434E'),
+        ('012754N', '1140314E'),
+        ('012756N', '1140539E'),
+        ('012715N', '1140751E'),
+        ('012642N', '1140827E'),
+        ('012603N', '1140900E'),
+        ('012529N', '1140937E'),
+        ('012513N', '1141024E'),
+        ('012524N', '1141059E'),
+        ('012618N', '1141217E'),
+        ('012621N', '1141226E'),
+        ('013007N', '1142120E'),
+        ('013024N', '1142229E'),
+        ('013012N', '1142353E'),
+        ('012931N', '1142516E'),
+        ('012609N', '1143002E'),
+        ('012545N', '1143120E'),
+        ('012605N', '1143244E'),
+        ('012700N', '1143341E'),
+        ('012809N', '1143404E'),
+        ('012927N', '1143403E'),
+        ('013044N', '1143347E'),
+        ('013211N', '1143347E'),
+        ('013312N', '1143428E'),
+        ('013453N', '1143634E'),
+        ('013555N', '1143728E'),
+        ('013829N', '1143901E'),
+        ('014138N', '1144008E'),
+        ('014547N', '1144048E'),
+        ('014739N', '1144044E'),
+        ('014824N', '1144032E'),
+        ('014850N', '1144021E'),
+        ('014915N', '1144016E'),
+        ('014954N', '1144027E'),
+        ('015026N', '1144046E'),
+        ('015100N', '1144119E'),
+        ('015128N', '1144157E'),
+        ('015143N', '1144232E'),
+        ('015207N', '1144546E'),
+        ('015325N', '1144908E'),
+        ('015409N', '1144955E'),
+        ('015516N', '1145001E'),
+        ('015633N', '1144945E'),
+        ('015735N', '1144945E'),
+        ('015836N', '1145001E'),
+        ('015949N', '1145033E'),
+        ('020035N', '1145042E'),
+        ('020129N', '1145043E'),
+        ('020217N', '1145027E'),
+        ('020241N', '1144952E'),
+        ('020231N', '1144829E'),
+        ('020205N', '1144731E'),
+        ('020209N', '1144650E'),
+        ('020329N', '1144613E'),
+        ('020359N', '1144609E'),
+        ('020600N', '1144613E'),
+        ('020636N', '1144604E'),
+        ('020733N', '1144524E'),
+        ('020805N', '1144510E'),
+        ('020912N', '1144507E'),
+        ('021229N', '1144548E'),
+        ('021449N', '1144643E'),
+        ('021552N', '1144832E'),
+        ('021630N', '1145311E'),
+        ('021702N', '1145447E'),
+        ('021744N', '1145510E'),
+        ('021840N', '1145500E'),
+        ('021955N', '1145455E'),
+        ('022114N', '1145519E'),
+        ('022138N', '1145604E'),
+        ('022126N', '1145822E'),
+        ('022211N', '1145931E'),
+        ('022423N', '1150205E'),
+        ('022450N', '1150307E'),
+        ('022523N', '1150402E'),
+        ('022756N', '1150618E'),
+        ('022845N', '1150735E'),
+        ('022859N', '1151018E'),
+        ('022925N', '1151133E'),
+        ('023035N', '1151222E'),
+        ('023139N', '1151213E'),
+        ('023303N', '1151132E'),
+        ('023426N', '1151037E'),
+        ('023525N', '1150942E'),
+        ('023549N', '1150907E'),
+        ('023610N', '1150823E'),
+        ('023624N', '1150736E'),
+        ('023628N', '1150653E'),
+        ('023617N', '1150614E'),
+        ('023539N', '1150457E'),
+        ('023540N', '1150417E'),
+        ('023631N', '1150323E'),
+        ('023743N', '1150331E'),
+        ('023904N', '1150402E'),
+        ('024018N', '1150418E'),
+        ('024053N', '1150407E'),
+        ('024205N', '1150328E'),
+        ('024240N', '1150325E'),
+        ('024325N', '1150347E'),
+        ('024338N', '1150419E'),
+        ('024346N', '1150457E'),
+        ('024413N', '1150536E'),
+        ('024541N', '1150616E'),
+        ('024651N', '1150553E'),
+        ('024853N', '1150418E'),
+        ('024941N', '1150400E'),
+        ('024957N', '1150408E'),
+        ('025011N', '1150439E'),
+        ('025053N', '1150528E'),
+        ('025134N', '1150556E'),
+        ('025211N', '1150609E'),
+        ('025249N', '1150618E'),
+        ('025331N', '1150634E'),
+        ('025446N', '1150722E'),
+        ('025542N', '1150820E'),
+        ('025803N', '1151147E'),
+        ('025850N', '1151228E'),
+        ('030057N', '1151330E'),
+        ('030229N', '1151431E'),
+        ('030214N', '1151521E'),
+        ('025958N', '1151652E'),
+        ('025909N', '1151835E'),
+        ('025928N', '1152029E'),
+        ('030110N', '1152424E'),
+        ('030126N', '1152652E'),
+        ('030150N', '1152750E'),
+        ('030301N', '1152819E'),
+        ('030534N', '1152833E'),
+        ('030639N', '1152855E'),
+        ('030926N', '1153101E'),
+        ('030953N', '1153051E'),
+        ('031011N', '1152957E'),
+        ('031120N', '1152900E'),
+        ('031223N', '1152858E'),
+        ('032125N', '1153103E'),
+        ('032413N', '1153208E'),
+        ('032531N', '1153325E'),
+        ('032525N', '1153401E'),
+        ('032509N', '1153433E'),
+        ('032500N', '1153506E'),
+        ('032515N', '1153543E'),
+        ('032548N', '1153604E'),
+        ('032628N', '1153602E'),
+        ('032743N', '1153533E'),
+        ('032930N', '1153434E'),
+        ('033014N', '1153421E'),
+        ('033051N', '1153420E'),
+        ('033204N', '1153428E'),
+        ('033242N', '1153424E'),
+        ('033619N', '1153254E'),
+        ('033744N', '1153239E'),
+        ('034008N', '1153240E'),
+        ('034229N', '1153301E'),
+        ('034928N', '1153521E'),
+        ('035127N', '1153519E'),
+        ('035219N', '1153428E'),
+        ('035300N', '1153314E'),
+        ('035352N', '1153217E'),
+        ('035514N', '1153219E'),
+        ('035539N', '1153245E'),
+        ('035648N', '1153451E'),
+        ('035728N', '1153525E'),
+        ('035948N', '1153634E'),
+        ('040224N', '1153719E'),
+        ('040742N', '1153759E'),
+        ('040845N', '1153820E'),
+        ('041008N', '1153848E'),
+        ('041043N', '1153921E'),
+        ('041102N', '1154033E'),
+        ('041126N', '1154058E'),
+        ('041159N', '1154123E'),
+        ('041421N', '1154357E'),
+        ('041410N', '1154424E'),
+        ('041339N', '1154449E'),
+        ('041319N', '1154524E'),
+        ('041332N', '1154614E'),
+        ('041409N', '1154631E'),
+        ('041456N', '1154645E'),
+        ('041652N', '1154902E'),
+        ('041840N', '1154918E'),
+        ('042039N', '1154916E'),
+        ('042234N', '1154951E'),
+        ('042321N', '1155038E'),
+        ('042326N', '1155122E'),
+        ('042257N', '1155153E'),
+        ('042200N', '1155209E'),
+        ('042107N', '1155243E'),
+        ('042049N', '1155355E'),
+        ('042039N', '1155627E'),
+        ('042007N', '1155753E'),
+        ('041943N', '1155838E'),
+        ('041917N', '1155900E'),
+        ('041817N', '1155914E'),
+        ('041720N', '1155936E'),
+        ('041636N', '1160014E'),
+        ('041615N', '1160114E'),
+        ('041639N', '1160159E'),
+        ('041931N', '1160452E'),
+        ('042011N', '1160557E'),
+        ('042042N', '1160635E'),
+        ('042126N', '1160702E'),
+        ('042244N', '1160732E'),
+        ('042222N', '1160811E'),
+        ('042216N', '1160848E'),
+        ('042211N', '1161012E'),
+        ('042128N', '1161254E'),
+        ('042122N', '1161343E'),
+        ('042150N', '1161526E'),
+        ('042242N', '1161706E'),
+        ('042300N', '1161838E'),
+        ('042126N', '1162015E'),
+        ('042124N', '1162039E'),
+        ('042128N', '1162104E'),
+        ('042119N', '1162129E'),
+        ('042101N', '1162142E'),
+        ('042015N', '1162155E'),
+        ('041740N', '1162327E'),
+        ('041723N', '1162403E'),
+        ('041719N', '1162440E'),
+        ('041730N', '1162518E'),
+        ('041902N', '1162646E'),
+        ('041900N', '1162725E'),
+        ('041844N', '1162806E'),
+        ('041900N', '1162909E'),
+        ('041929N', '1162938E'),
+        ('041952N', '1162930E'),
+        ('042018N', '1162913E'),
+        ('042055N', '1162911E'),
+        ('042147N', '1162939E'),
+        ('042302N', '1163055E'),
+        ('042348N', '1163119E'),
+        ('042343N', '1163159E'),
+        ('041955N', '1163436E'),
+        ('041952N', '1163524E'),
+        ('042038N', '1163655E'),
+        ('042001N', '1163830E'),
+        ('042003N', '1163940E'),
+        ('042023N', '1164048E'),
+        ('042200N', '1164241E'),
+        ('042152N', '1164345E'),
+        ('042018N', '1164558E'),
+        ('041948N', '1164816E'),
+        ('042041N', '1165258E'),
+        ('042041N', '1165527E'),
+        ('041946N', '1165850E'),
+        ('041959N', '1170952E'),
+        ('042018N', '1171027E'),
+        ('042110N', '1171125E'),
+        ('042121N', '1171209E'),
+        ('042112N', '1171301E'),
+        ('042047N', '1171329E'),
+        ('042013N', '1171350E'),
+        ('041936N', '1171419E'),
+        ('041803N', '1171632E'),
+        ('041534N', '1172123E'),
+        ('041200N', '1172446E'),
+        ('041108N', '1172611E'),
+        ('041040N', '1172751E'),
+        ('041021N', '1172954E'),
+        ('041018N', '1173052E'),
+        ('041025N', '1173231E'),
+        ('041003N', '1173329E'),
+        ('041034N', '1173401E'),
+        ('041000N', '1173605E'),
+        ('041000N', '1175400E'),
     
     
-    ('040000N', '1180000E'),
-    ('040000N', '1323200E'),
-    ('033000N', '1330000E'),
-    ('033000N', '1410000E'),
-    ('061914S', '1410000E'),
+        ('040000N', '1180000E'),
+        ('040000N', '1323200E'),
+        ('033000N', '1330000E'),
+        ('033000N', '1410000E'),
+        ('061914S', '1410000E'),
     
-    # Along Indonesia–Papua New Guinea boundary (not specified in detail)
-    ('062006S', '1405836E'),
-    ('062011S', '1405822E'),
-    ('062052S', '1405749E'),
-    ('062205S', '1405731E'),
-    ('062212S', '1405713E'),
-    ('062225S', '1405710E'),
-    ('062246S', '1405717E'),
-    ('062316S', '1405752E'),
-    ('062338S', '1405801E'),
-    ('062415S', '1405747E'),
-    ('062440S', '1405720E'),
-    ('062508S', '1405700E'),
-    ('062554S', '1405710E'),
-    ('062551S', '1405629E'),
-    ('062553S', '1405551E'),
-    ('062602S', '1405516E'),
-    ('062618S', '1405445E'),
-    ('062623S', '1405523E'),
-    ('062641S', '1405547E'),
-    ('062713S', '1405559E'),
-    ('062757S', '1405558E'),
-    ('062755S', '1405654E'),
-    ('062849S', '1405711E'),
-    ('062955S', '1405700E'),
-    ('063027S', '1405636E'),
-    ('063034S', '1405541E'),
-    ('063059S', '1405515E'),
-    ('063140S', '1405507E'),
-    ('063311S', '1405504E'),
-    ('063330S', '1405454E'),
-    ('063340S', '1405435E'),
-    ('063343S', '1405405E'),
-    ('063355S', '1405334E'),
-    ('063422S', '1405347E'),
-    ('063455S', '1405411E'),
-    ('063522S', '1405417E'),
-    ('063559S', '1405325E'),
-    ('063612S', '1405226E'),
-    ('063630S', '1405133E'),
-    ('063724S', '1405101E'),
-    ('063750S', '1405153E'),
-    ('063857S', '1405156E'),
-    ('064055S', '1405125E'),
-    ('064138S', '1405106E'),
-    ('064210S', '1405057E'),
-    ('064246S', '1405101E'),
-    ('064325S', '1405128E'),
-    ('064432S', '1405243E'),
-    ('064514S', '1405304E'),
-    ('064538S', '1405257E'),
-    ('064625S', '1405223E'),
-    ('064642S', '1405215E'),
-    ('064722S', '1405227E'),
-    ('064753S', '1405256E'),
-    ('064843S', '1405405E'),
-    ('064941S', '1405424E'),
-    ('065057S', '1405429E'),
-    ('065145S', '1405457E'),
-    ('065122S', '1405622E'),
-    ('065316S', '1405635E'),
-    ('065352S', '1405743E'),
-    ('065347S', '1405837E'),
+        # Along Indonesia–Papua New Guinea boundary (not specified in detail)
+        ('062006S', '1405836E'),
+        ('062011S', '1405822E'),
+        ('062052S', '1405749E'),
+        ('062205S', '1405731E'),
+        ('062212S', '1405713E'),
+        ('062225S', '1405710E'),
+        ('062246S', '1405717E'),
+        ('062316S', '1405752E'),
+        ('062338S', '1405801E'),
+        ('062415S', '1405747E'),
+        ('062440S', '1405720E'),
+        ('062508S', '1405700E'),
+        ('062554S', '1405710E'),
+        ('062551S', '1405629E'),
+        ('062553S', '1405551E'),
+        ('062602S', '1405516E'),
+        ('062618S', '1405445E'),
+        ('062623S', '1405523E'),
+        ('062641S', '1405547E'),
+        ('062713S', '1405559E'),
+        ('062757S', '1405558E'),
+        ('062755S', '1405654E'),
+        ('062849S', '1405711E'),
+        ('062955S', '1405700E'),
+        ('063027S', '1405636E'),
+        ('063034S', '1405541E'),
+        ('063059S', '1405515E'),
+        ('063140S', '1405507E'),
+        ('063311S', '1405504E'),
+        ('063330S', '1405454E'),
+        ('063340S', '1405435E'),
+        ('063343S', '1405405E'),
+        ('063355S', '1405334E'),
+        ('063422S', '1405347E'),
+        ('063455S', '1405411E'),
+        ('063522S', '1405417E'),
+        ('063559S', '1405325E'),
+        ('063612S', '1405226E'),
+        ('063630S', '1405133E'),
+        ('063724S', '1405101E'),
+        ('063750S', '1405153E'),
+        ('063857S', '1405156E'),
+        ('064055S', '1405125E'),
+        ('064138S', '1405106E'),
+        ('064210S', '1405057E'),
+        ('064246S', '1405101E'),
+        ('064325S', '1405128E'),
+        ('064432S', '1405243E'),
+        ('064514S', '1405304E'),
+        ('064538S', '1405257E'),
+        ('064625S', '1405223E'),
+        ('064642S', '1405215E'),
+        ('064722S', '1405227E'),
+        ('064753S', '1405256E'),
+        ('064843S', '1405405E'),
+        ('064941S', '1405424E'),
+        ('065057S', '1405429E'),
+        ('065145S', '1405457E'),
+        ('065122S', '1405622E'),
+        ('065316S', '1405635E'),
+        ('065352S', '1405743E'),
+        ('065347S', '1405837E'),
     
-    ('065334S', '1410106E'),
-    ('093700S', '1410200E'),
-    ('095000S', '1410000E'),
-    ('095000S', '1394000E'),
-    ('070000S', '1350000E'),
-    ('092000S', '1265000E'),
-    ('120000S', '1232000E'),
-    ('120000S', '1143000E'),
-    ('082000S', '1102300E'),
-    ('030000S', '1102300E'),
-    ('011300N', '1133500E')  # Closing the loop
-]
+        ('065334S', '1410106E'),
+        ('093700S', '1410200E'),
+        ('095000S', '1410000E'),
+        ('095000S', '1394000E'),
+        ('070000S', '1350000E'),
+        ('092000S', '1265000E'),
+        ('120000S', '1232000E'),
+        ('120000S', '1143000E'),
+        ('082000S', '1102300E'),
+        ('030000S', '1102300E'),
+        ('011300N', '1133500E')  # Closing the loop
+    ]
 
 
 #endregion
 
 #region Jakarta FIR - WIIF
 
-JKT_FIR_coordinates = [
-    ('011300N', '1133500E'),
-    ('030000S', '1102300E'),
-    ('082000S', '1102300E'),
-    ('120000S', '1143000E'),
-    ('120000S', '1070000E'),
-    ('020000S', '0920000E'),
-    ('060000N', '0920000E'),
-    ('060000N', '0942500E'),
-    ('060000N', '0973000E'),
-    ('013900N', '1021000E'),
-    ('011300N', '1033000E'),
-    ('011408N', '1033142E'),
-    ('011200N', '1033900E'),
-    ('011046N', '1034015E'),
-    ('010800N', '1034500E'),
-    ('011500N', '1040000E'),
-    ('011800N', '1043000E'),
-    ('012921N', '1043441E'),
-    ('011947N', '1044606E'),
-    ('021838N', '1052205E'),
-    ('023641N', '1051311E'),
-    ('024348N', '1050854E'),
-    ('025010N', '1051210E'),
-    ('031453N', '1052619E'),
-    ('031727N', '1052959E'),
-    ('033045N', '1055130E'),
-    ('041312N', '1071743E'),
-    ('043820N', '1073315E'),
-    ('045203N', '1074625E'),
-    ('045904N', '1075525E'),
-    ('050012N', '1080132E'),
-    ('045700N', '1081619E'),
-    ('025050N', '1091629E'),
-    ('021500N', '1083000E'),
-    ('010000N', '1083000E'),
-    ('010000N', '1085400E'),
+@_dataset
+def _JKT_FIR_coordinates():
+    return [
+        ('011300N', '1133500E'),
+        ('030000S', '1102300E'),
+        ('082000S', '1102300E'),
+        ('120000S', '1143000E'),
+        ('120000S', '1070000E'),
+        ('020000S', '0920000E'),
+        ('060000N', '0920000E'),
+        ('060000N', '0942500E'),
+        ('060000N', '0973000E'),
+        ('013900N', '1021000E'),
+        ('011300N', '1033000E'),
+        ('011408N', '1033142E'),
+        ('011200N', '1033900E'),
+        ('011046N', '1034015E'),
+        ('010800N', '1034500E'),
+        ('011500N', '1040000E'),
+        ('011800N', '1043000E'),
+        ('012921N', '1043441E'),
+        ('011947N', '1044606E'),
+        ('021838N', '1052205E'),
+        ('023641N', '1051311E'),
+        ('024348N', '1050854E'),
+        ('025010N', '1051210E'),
+        ('031453N', '1052619E'),
+        ('031727N', '1052959E'),
+        ('033045N', '1055130E'),
+        ('041312N', '1071743E'),
+        ('043820N', '1073315E'),
+        ('045203N', '1074625E'),
+        ('045904N', '1075525E'),
+        ('050012N', '1080132E'),
+        ('045700N', '1081619E'),
+        ('025050N', '1091629E'),
+        ('021500N', '1083000E'),
+        ('010000N', '1083000E'),
+        ('010000N', '1085400E'),
     
-    # Kinabalu border
-    ('010000N', '1085849E'),
-    ('010825N', '1085537E'),
-    ('010950N', '1085527E'),
-    ('011040N', '1085557E'),
-    ('011450N', '1085925E'),
-    ('011626N', '1090021E'),
-    ('011908N', '1090225E'),
-    ('012108N', '1090315E'),
-    ('012301N', '1090338E'),
-    ('012956N', '1090338E'),
-    ('013202N', '1090422E'),
-    ('013338N', '1090545E'),
-    ('014006N', '1091509E'),
-    ('014137N', '1091620E'),
-    ('014509N', '1091812E'),
-    ('014641N', '1091915E'),
-    ('014751N', '1092020E'),
-    ('014806N', '1092031E'),
-    ('014815N', '1092035E'),
-    ('014823N', '1092043E'),
-    ('014834N', '1092052E'),
-    ('014855N', '1092055E'),
-    ('014907N', '1092048E'),
-    ('014911N', '1092030E'),
-    ('014907N', '1092012E'),
-    ('014855N', '1092004E'),
-    ('014641N', '1091712E'),
-    ('014745N', '1091721E'),
-    ('014825N', '1091759E'),
-    ('014901N', '1091852E'),
-    ('014958N', '1091942E'),
-    ('015100N', '1092006E'),
-    ('015204N', '1092011E'),
-    ('015403N', '1092004E'),
-    ('015607N', '1092027E'),
-    ('015653N', '1092132E'),
-    ('015720N', '1092526E'),
-    ('015925N', '1093340E'),
-    ('015951N', '1093443E'),
-    ('020027N', '1093534E'),
-    ('020115N', '1093616E'),
-    ('020426N', '1093806E'),
-    ('020459N', '1093842E'),
-    ('020146N', '1093735E'),
-    ('015859N', '1093600E'),
-    ('015739N', '1093506E'),
-    ('015654N', '1093427E'),
-    ('015503N', '1093216E'),
-    ('015418N', '1093145E'),
-    ('015323N', '1093142E'),
-    ('015114N', '1093205E'),
-    ('015047N', '1093203E'),
-    ('015020N', '1093205E'),
-    ('014935N', '1093223E'),
-    ('014851N', '1093247E'),
-    ('014807N', '1093320E'),
-    ('014733N', '1093401E'),
-    ('014716N', '1093448E'),
-    ('014715N', '1093726E'),
-    ('014651N', '1093830E'),
-    ('014542N', '1093849E'),
-    ('014058N', '1093826E'),
-    ('013813N', '1093830E'),
-    ('013703N', '1093849E'),
-    ('013549N', '1093928E'),
-    ('013422N', '1094038E'),
-    ('012947N', '1094558E'),
-    ('012909N', '1094623E'),
-    ('012728N', '1094631E'),
-    ('012722N', '1094653E'),
-    ('012800N', '1094802E'),
-    ('012735N', '1094828E'),
-    ('012503N', '1094931E'),
-    ('012411N', '1095034E'),
-    ('012405N', '1095146E'),
-    ('012413N', '1095257E'),
-    ('012413N', '1095407E'),
-    ('012341N', '1095512E'),
-    ('012242N', '1095557E'),
-    ('011910N', '1095706E'),
-    ('011754N', '1095749E'),
-    ('011715N', '1095834E'),
-    ('011613N', '1100043E'),
-    ('011512N', '1100150E'),
-    ('011255N', '1100306E'),
-    ('011155N', '1100428E'),
-    ('011129N', '1100536E'),
-    ('011101N', '1100907E'),
-    ('011028N', '1101013E'),
-    ('010915N', '1101106E'),
-    ('010642N', '1101224E'),
-    ('010220N', '1101523E'),
-    ('010052N', '1101542E'),
-    ('005939N', '1101548E'),
-    ('005927N', '1101622E'),
-    ('005943N', '1101710E'),
-    ('005951N', '1101802E'),
-    ('005911N', '1102105E'),
-    ('005852N', '1102150E'),
-    ('005759N', '1102250E'),
-    ('005434N', '1102521E'),
-    ('005247N', '1102736E'),
-    ('005126N', '1103022E'),
-    ('005104N', '1103314E'),
-    ('005215N', '1103545E'),
-    ('005259N', '1103621E'),
-    ('005327N', '1103634E'),
-    ('005338N', '1103648E'),
-    ('005335N', '1103729E'),
-    ('005319N', '1103755E'),
-    ('005250N', '1103819E'),
-    ('005226N', '1103851E'),
-    ('005219N', '1103940E'),
-    ('005237N', '1104027E'),
-    ('005340N', '1104134E'),
-    ('005405N', '1104215E'),
-    ('005405N', '1104234E'),
-    ('005350N', '1104314E'),
-    ('005350N', '1104329E'),
-    ('005418N', '1104441E'),
-    ('005428N', '1104444E'),
-    ('005452N', '1104530E'),
-    ('005446N', '1104540E'),
-    ('005415N', '1104616E'),
-    ('005411N', '1104636E'),
-    ('005429N', '1104702E'),
-    ('005458N', '1104710E'),
-    ('005602N', '1104713E'),
-    ('005658N', '1104749E'),
-    ('005949N', '1105109E'),
-    ('010037N', '1105249E'),
-    ('010056N', '1105438E'),
-    ('010103N', '1105824E'),
-    ('010430N', '1111151E'),
-    ('010423N', '1111303E'),
-    ('010050N', '1112106E'),
-    ('010027N', '1112226E'),
-    ('010022N', '1112343E'),
-    ('010036N', '1112454E'),
-    ('010121N', '1112716E'),
-    ('010119N', '1112819E'),
-    ('010046N', '1112856E'),
-    ('005952N', '1112916E'),
-    ('005851N', '1112931E'),
-    ('005730N', '1113011E'),
-    ('005752N', '1113055E'),
-    ('005951N', '1113219E'),
-    ('010148N', '1113721E'),
-    ('010156N', '1113814E'),
-    ('010150N', '1113918E'),
-    ('010124N', '1114055E'),
-    ('010005N', '1114403E'),
-    ('005934N', '1114546E'),
-    ('010030N', '1114923E'),
-    ('010650N', '1115436E'),
-    ('010802N', '1115824E'),
-    ('010801N', '1120314E'),
-    ('010814N', '1120446E'),
-    ('010835N', '1120534E'),
-    ('010917N', '1120600E'),
-    ('011822N', '1120909E'),
-    ('012208N', '1121102E'),
-    ('012246N', '1121114E'),
-    ('012329N', '1121116E'),
-    ('012400N', '1121054E'),
-    ('012402N', '1120932E'),
-    ('012434N', '1120914E'),
-    ('012604N', '1120941E'),
-    ('012656N', '1121048E'),
-    ('013013N', '1121742E'),
-    ('013042N', '1121908E'),
-    ('013103N', '1122251E'),
-    ('013124N', '1122354E'),
-    ('013211N', '1122457E'),
-    ('013302N', '1122547E'),
-    ('013343N', '1122645E'),
-    ('013403N', '1122813E'),
-    ('013308N', '1124607E'),
-    ('013239N', '1124741E'),
-    ('013237N', '1124805E'),
-    ('013257N', '1124848E'),
-    ('013327N', '1124913E'),
-    ('013401N', '1124935E'),
-    ('013433N', '1125011E'),
-    ('013457N', '1125117E'),
-    ('013450N', '1125216E'),
-    ('013429N', '1125317E'),
-    ('013413N', '1125427E'),
-    ('013420N', '1125721E'),
-    ('013411N', '1125823E'),
-    ('013336N', '1125949E'),
-    ('013302N', '1130050E'),
-    ('013213N', '1130124E'),
-    ('013051N', '1130127E'),
-    ('012932N', '1130106E'),
-    ('012823N', '1130026E'),
-    ('012725N', '1125930E'),
-    ('012603N', '1125740E'),
-    ('012524N', '1125719E'),
-    ('012456N', '1125729E'),
-    ('012454N', '1125823E'),
-    ('012540N', '1130041E'),
-    ('012605N', '1130302E'),
-    ('012552N', '1130520E'),
-    ('012449N', '1130732E'),
-    ('012317N', '1130930E'),
-    ('012301N', '1131021E'),
-    ('012251N', '1131303E'),
-    ('012207N', '1131633E'),
-    ('012105N', '1131925E'),
-    ('011738N', '1132351E'),
-    ('011732N', '1132634E'),
-    ('011831N', '1132856E'),
-    ('011852N', '1133012E'),
-    ('011848N', '1133128E'),
-    ('011805N', '1133246E'),
-    ('011429N', '1133547E'),
-    ('011300N', '1133500E'),
+        # Kinabalu border
+        ('010000N', '1085849E'),
+        ('010825N', '1085537E'),
+        ('010950N', '1085527E'),
+        ('011040N', '1085557E'),
+        ('011450N', '1085925E'),
+        ('011626N', '1090021E'),
+        ('011908N', '1090225E'),
+        ('012108N', '1090315E'),
+        ('012301N', '1090338E'),
+        ('012956N', '1090338E'),
+        ('013202N', '1090422E'),
+        ('013338N', '1090545E'),
+        ('014006N', '1091509E'),
+        ('014137N', '1091620E'),
+        ('014509N', '1091812E'),
+        ('014641N', '1091915E'),
+        ('014751N', '1092020E'),
+        ('014806N', '1092031E'),
+        ('014815N', '1092035E'),
+        ('014823N', '1092043E'),
+        ('014834N', '1092052E'),
+        ('014855N', '1092055E'),
+        ('014907N', '1092048E'),
+        ('014911N', '1092030E'),
+        ('014907N', '1092012E'),
+        ('014855N', '1092004E'),
+        ('014641N', '1091712E'),
+        ('014745N', '1091721E'),
+        ('014825N', '1091759E'),
+        ('014901N', '1091852E'),
+        ('014958N', '1091942E'),
+        ('015100N', '1092006E'),
+        ('015204N', '1092011E'),
+        ('015403N', '1092004E'),
+        ('015607N', '1092027E'),
+        ('015653N', '1092132E'),
+        ('015720N', '1092526E'),
+        ('015925N', '1093340E'),
+        ('015951N', '1093443E'),
+        ('020027N', '1093534E'),
+        ('020115N', '1093616E'),
+        ('020426N', '1093806E'),
+        ('020459N', '1093842E'),
+        ('020146N', '1093735E'),
+        ('015859N', '1093600E'),
+        ('015739N', '1093506E'),
+        ('015654N', '1093427E'),
+        ('015503N', '1093216E'),
+        ('015418N', '1093145E'),
+        ('015323N', '1093142E'),
+        ('015114N', '1093205E'),
+        ('015047N', '1093203E'),
+        ('015020N', '1093205E'),
+        ('014935N', '1093223E'),
+        ('014851N', '1093247E'),
+        ('014807N', '1093320E'),
+        ('014733N', '1093401E'),
+        ('014716N', '1093448E'),
+        ('014715N', '1093726E'),
+        ('014651N', '1093830E'),
+        ('014542N', '1093849E'),
+        ('014058N', '1093826E'),
+        ('013813N', '1093830E'),
+        ('013703N', '1093849E'),
+        ('013549N', '1093928E'),
+        ('013422N', '1094038E'),
+        ('012947N', '1094558E'),
+        ('012909N', '1094623E'),
+        ('012728N', '1094631E'),
+        ('012722N', '1094653E'),
+        ('012800N', '1094802E'),
+        ('012735N', '1094828E'),
+        ('012503N', '1094931E'),
+        ('012411N', '1095034E'),
+        ('012405N', '1095146E'),
+        ('012413N', '1095257E'),
+        ('012413N', '1095407E'),
+        ('012341N', '1095512E'),
+        ('012242N', '1095557E'),
+        ('011910N', '1095706E'),
+        ('011754N', '1095749E'),
+        ('011715N', '1095834E'),
+        ('011613N', '1100043E'),
+        ('011512N', '1100150E'),
+        ('011255N', '1100306E'),
+        ('011155N', '1100428E'),
+        ('011129N', '1100536E'),
+        ('011101N', '1100907E'),
+        ('011028N', '1101013E'),
+        ('010915N', '1101106E'),
+        ('010642N', '1101224E'),
+        ('010220N', '1101523E'),
+        ('010052N', '1101542E'),
+        ('005939N', '1101548E'),
+        ('005927N', '1101622E'),
+        ('005943N', '1101710E'),
+        ('005951N', '1101802E'),
+        ('005911N', '1102105E'),
+        ('005852N', '1102150E'),
+        ('005759N', '1102250E'),
+        ('005434N', '1102521E'),
+        ('005247N', '1102736E'),
+        ('005126N', '1103022E'),
+        ('005104N', '1103314E'),
+        ('005215N', '1103545E'),
+        ('005259N', '1103621E'),
+        ('005327N', '1103634E'),
+        ('005338N', '1103648E'),
+        ('005335N', '1103729E'),
+        ('005319N', '1103755E'),
+        ('005250N', '1103819E'),
+        ('005226N', '1103851E'),
+        ('005219N', '1103940E'),
+        ('005237N', '1104027E'),
+        ('005340N', '1104134E'),
+        ('005405N', '1104215E'),
+        ('005405N', '1104234E'),
+        ('005350N', '1104314E'),
+        ('005350N', '1104329E'),
+        ('005418N', '1104441E'),
+        ('005428N', '1104444E'),
+        ('005452N', '1104530E'),
+        ('005446N', '1104540E'),
+        ('005415N', '1104616E'),
+        ('005411N', '1104636E'),
+        ('005429N', '1104702E'),
+        ('005458N', '1104710E'),
+        ('005602N', '1104713E'),
+        ('005658N', '1104749E'),
+        ('005949N', '1105109E'),
+        ('010037N', '1105249E'),
+        ('010056N', '1105438E'),
+        ('010103N', '1105824E'),
+        ('010430N', '1111151E'),
+        ('010423N', '1111303E'),
+        ('010050N', '1112106E'),
+        ('010027N', '1112226E'),
+        ('010022N', '1112343E'),
+        ('010036N', '1112454E'),
+        ('010121N', '1112716E'),
+        ('010119N', '1112819E'),
+        ('010046N', '1112856E'),
+        ('005952N', '1112916E'),
+        ('005851N', '1112931E'),
+        ('005730N', '1113011E'),
+        ('005752N', '1113055E'),
+        ('005951N', '1113219E'),
+        ('010148N', '1113721E'),
+        ('010156N', '1113814E'),
+        ('010150N', '1113918E'),
+        ('010124N', '1114055E'),
+        ('010005N', '1114403E'),
+        ('005934N', '1114546E'),
+        ('010030N', '1114923E'),
+        ('010650N', '1115436E'),
+        ('010802N', '1115824E'),
+        ('010801N', '1120314E'),
+        ('010814N', '1120446E'),
+        ('010835N', '1120534E'),
+        ('010917N', '1120600E'),
+        ('011822N', '1120909E'),
+        ('012208N', '1121102E'),
+        ('012246N', '1121114E'),
+        ('012329N', '1121116E'),
+        ('012400N', '1121054E'),
+        ('012402N', '1120932E'),
+        ('012434N', '1120914E'),
+        ('012604N', '1120941E'),
+        ('012656N', '1121048E'),
+        ('013013N', '1121742E'),
+        ('013042N', '1121908E'),
+        ('013103N', '1122251E'),
+        ('013124N', '1122354E'),
+        ('013211N', '1122457E'),
+        ('013302N', '1122547E'),
+        ('013343N', '1122645E'),
+        ('013403N', '1122813E'),
+        ('013308N', '1124607E'),
+        ('013239N', '1124741E'),
+        ('013237N', '1124805E'),
+        ('013257N', '1124848E'),
+        ('013327N', '1124913E'),
+        ('013401N', '1124935E'),
+        ('013433N', '1125011E'),
+        ('013457N', '1125117E'),
+        ('013450N', '1125216E'),
+        ('013429N', '1125317E'),
+        ('013413N', '1125427E'),
+        ('013420N', '1125721E'),
+        ('013411N', '1125823E'),
+        ('013336N', '1125949E'),
+        ('013302N', '1130050E'),
+        ('013213N', '1130124E'),
+        ('013051N', '1130127E'),
+        ('012932N', '1130106E'),
+        ('012823N', '1130026E'),
+        ('012725N', '1125930E'),
+        ('012603N', '1125740E'),
+        ('012524N', '1125719E'),
+        ('012456N', '1125729E'),
+        ('012454N', '1125823E'),
+        ('012540N', '1130041E'),
+        ('012605N', '1130302E'),
+        ('012552N', '1130520E'),
+        ('012449N', '1130732E'),
+        ('012317N', '1130930E'),
+        ('012301N', '1131021E'),
+        ('012251N', '1131303E'),
+        ('012207N', '1131633E'),
+        ('012105N', '1131925E'),
+        ('011738N', '1132351E'),
+        ('011732N', '1132634E'),
+        ('011831N', '1132856E'),
+        ('011852N', '1133012E'),
+        ('011848N', '1133128E'),
+        ('011805N', '1133246E'),
+        ('011429N', '1133547E'),
+        ('011300N', '1133500E'),
 
-    # This closes the loop, assuming it reconnects along the coastline
-    ('011300N', '1133500E')
-]
+        # This closes the loop, assuming it reconnects along the coastline
+        ('011300N', '1133500E')
+    ]
 
 #endregion
 
 #region STARs, SIDs, holdings, and waypoints
-waypoints_all = {
-    'ABVIP': ('010008N', '1035032E'),
-    'ABVON': ('012028N', '1035827E'),
-    'ADNIK': ('011651N', '1035655E'),
-    'ADPON': ('011203N', '1040514E'),
-    # 'ADPON': ('010108N', '1035808E'),
-    'AGROT': ('010108N', '1035808E'),
-    'AGVAR': ('014719N', '1034145E'),
-    'AKDAT': ('032923N', '1054917E'),
-    'AKIPO': ('011356N', '1035542E'),
-    'AKMET': ('015355N', '1034339E'),
-    'AKMON': ('081254N', '1101306E'),
-    'AKOMA': ('014522N', '1035443E'),
-    'AKVOM': ('005620N', '1041514E'),
-    'ANBUS': ('011554N', '1032100E'),
-    'ANITO': ('001700S', '1045200E'),
-    'ANUMA': ('011053N', '1035424E'),
-    'APIPA': ('010618N', '1035228E'),
-    'ARAMA': ('013654N', '1030712E'),
-    'AROSO': ('020846N', '1032421E'),
-    'ASISU': ('055906N', '1132046E'),
-    'ASITI': ('004906N', '1035042E'),
-    'ASOMI': ('010142N', '1040207E'),
-    'ASUNA': ('005948N', '1030954E'),
-    'ATLEX': ('010302N', '1033331E'),
-    'ATLIR': ('011120N', '1035208E'),
-    'ATPOM': ('002425N', '1052114E'),
-    'ATRUM': ('013256N', '1040057E'),
-    'AVLUB': ('003112S', '1042501E'),
-    'AVPIV': ('011207N', '1035349E'),
-    'BAVAL': ('004518N', '1040242E'),
-    'BETBA': ('013302N', '1035331E'),
-    'BIBVI': ('024336N', '1040618E'),
-    'BIDAG': ('073101N', '1135544E'),
-    'BIDUS': ('013554N', '1035755E'),
-    'BIKTA': ('024337N', '1034308E'),
-    'BIMOS': ('011512N', '1035815E'),
-    'BIPOP': ('013122N', '1041018E'),
-    'BISOV': ('004229N', '1025214E'),
-    'BISUT': ('011218N', '1035701E'),
-    'BITAM': ('010813N', '1040757E'),
-    'BOBAG': ('010230N', '1032954E'),
-    'BOBOB': ('022206N', '1070558E'),
-    'BONSU': ('011928N', '1033710E'),
-    'BOPVA': ('025303N', '1051349E'),
-    'BUNTO': ('024200N', '1060000E'),
-    'BUVAL': ('033622N', '1034341E'),
-    'DAKIX': ('070854N', '1145054E'),
-    'DAMOG': ('041225N', '1050014E'),
-    'DODSO': ('012225N', '1061402E'),
-    'DOLOX': ('044841N', '1052247E'),
-    'DOVAN': ('011938N', '1041249E'),
-    'DOVOL': ('033047N', '1034923E'),
-    'DOWON': ('011957N', '1043048E'),
-    'DUBOT': ('010846N', '1040103E'),
-    'DUBSA': ('034901N', '1044540E'),
-    'DUDIS': ('070000N', '1064836E'),
-    'DUMUP': ('005430N', '1035516E'),
-    'EGOLO': ('031934N', '1040047E'),
-    'EGORA': ('013621N', '1040607E'),
-    'ELALO': ('041240N', '1043329E'),
-    'ELALU': ('013440N', '1040524E'),
-    'ELBEB': ('012845N', '1040254E'),
-    'ELBEX': ('013149N', '1040314E'),
-    'ELGAP': ('012820N', '1040146E'),
-    'ELGOR': ('033014N', '1054818E'),
-    'ELMIN': ('012550N', '1040141E'),
-    'EMRIX': ('012606N', '1041040E'),
-    'EMSIB': ('005911N', '1035419E'),
-    'EMSUX': ('024647N', '1051026E'),
-    'EMTAP': ('011656N', '1035657E'),
-    'ENLES': ('010932N', '1035350E'),
-    'ENPUX': ('002859S', '1043434E'),
-    'ENREP': ('045224N', '1041442E'),
-    'ENSUN': ('012603N', '1040048E'),
-    'ENVUM': ('011535N', '1040552E'),
-    'ERVIV': ('010445N', '1041013E'),
-    'ERVOT': ('011120N', '1035436E'),
-    'ESBIT': ('012212N', '1040009E'),
-    'ESBUM': ('045210N', '1042830E'),
-    'ESLUX': ('011844N', '1035840E'),
-    'ESPOB': ('070000N', '1053318E'),
-    'EXOMO': ('010425N', '1040933E'),
-    'GIXEM': ('004920N', '1042539E'),
-    'GOTGA': ('012013N', '1044200E'),
-    'GULGU': ('040141N', '1084242E'),
-    'GULIB': ('041714N', '1110633E'),
-    'GUMPU': ('013000N', '1034243E'),
-    'GUNUD': ('011042N', '1050618E'),
-    'GURES': ('002814N', '1043835E'),
-    'GUTUP': ('045911N', '1075603E'),
-    'HOSBA': ('011948N', '1042418E'),
-    'IBASU': ('005751N', '1033410E'),
-    'IBIVA': ('011351N', '1035637E'),
-    'IBIXU': ('011621N', '1035740E'),
-    'IDBUD': ('001454N', '1050139E'),
-    'IDEMO': ('025431N', '1040603E'),
-    'IDKIV': ('005652N', '1041333E'),
-    'IDMAS': ('004900N', '1041848E'),
-    'IDSEL': ('032432N', '1035544E'),
-    'IDUNA': ('012306N', '1035934E'),
-    'IDURO': ('012640N', '1040104E'),
-    'IDVAS': ('012935N', '1040218E'),
-    'IGARI': ('065612N', '1033506E'),
-    'IGNON': ('010847N', '1041257E'),
-    'IGOSI': ('005645N', '1040644E'),
-    'IGULA': ('013232N', '1040333E'),
-    'IGUTU': ('001331S', '1041857E'),
-    'IKIRO': ('000849N', '1044420E'),
-    'IKUKO': ('054512N', '1031324E'),
-    'IKUMI': ('055338N', '1035509E'),
-    'INVUB': ('002749N', '1051530E'),
-    'IPDOL': ('045111N', '1035920E'),
-    'IPNAK': ('013712N', '1040531E'),
-    'IPRIX': ('070000N', '1040754E'),
-    'IRPUG': ('005813N', '1040127E'),
-    'IRSAB': ('024349N', '1054359E'),
-    'IRTAD': ('010326N', '1041147E'),
-    'ISDEB': ('024440N', '1063011E'),
-    'ISGIL': ('004246N', '1031257E'),
-    'ISNOM': ('010629N', '1035826E'),
-    'JUNHA': ('005413N', '1043052E'),
-    'KAKSA': ('011703N', '1035758E'),
-    'KANLA': ('034556N', '1043606E'),
-    'KARTO': ('011124N', '1053343E'),
-    'KASPO': ('011507N', '1035709E'),
-    'KETOD': ('031042N', '1040942E'),
-    'KEXAS': ('011019N', '1044818E'),
-    'KEXOL': ('043930N', '1040942E'),
-    'KIBOL': ('025224N', '1042818E'),
-    'KILOT': ('030217N', '1044023E'),
-    'KIMER': ('011106N', '1035527E'),
-    'KIRDA': ('000009N', '1045934E'),
-    'LAGOT': ('071632N', '1113243E'),
-    'LAGUS': ('011915N', '1035854E'),
-    'LAPOL': ('012622N', '1034435E'),
-    'LASIN': ('011538N', '1035722E'),
-    'LAVAX': ('010950N', '1042714E'),
-    'LAXOR': ('094937N', '1144829E'),
-    'LEBIN': ('031438N', '1060604E'),
-    'LEDOX': ('011642N', '1035651E'),
-    'LEGOL': ('012053N', '1034723E'),
-    'LELIB': ('012729N', '1032450E'),
-    'LELON': ('011244N', '1035609E'),
-    'LENDA': ('024124N', '1043932E'),
-    'LEPNA': ('010648N', '1035339E'),
-    'LETGO': ('011411N', '1035548E'),
-    'LIDVA': ('010506N', '1035339E'),
-    'LIGVU': ('034417N', '1061859E'),
-    'LIPRO': ('025342N', '1051128E'),
-    'LUSMO': ('033341N', '1065534E'),
-    'LUXOL': ('011803N', '1035823E'),
-    'MABAL': ('032826N', '1051236E'),
-    'MABLI': ('041717N', '1061247E'),
-    'MANIM': ('031430N', '1040554E'),
-    'MASBO': ('020248N', '1025251E'),
-    'MASNI': ('012037N', '1033746E'),
-    'MELAS': ('070518N', '1080912E'),
-    'MIBEL': ('012351N', '1020816E'),
-    'MOLVO': ('012955N', '1040227E'),
-    'MOXIB': ('012933N', '1040315E'),
-    'MUMDU': ('010521N', '1042714E'),
-    'MUMSO': ('034420N', '1053213E'),
-    'NIVAM': ('023650N', '1040228E'),
-    'NIXEB': ('013943N', '1061040E'),
-    'NODIN': ('081100N', '1161142E'),
-    'NOPAT': ('042313N', '1044756E'),
-    'NUFFA': ('025341N', '1033829E'),
-    'NYLON': ('013657N', '1040624E'),
-    'OBDAB': ('031153N', '1040538E'),
-    'OBDOS': ('002503N', '1065551E'),
-    'OBGET': ('012307N', '1064531E'),
-    'ODONO': ('063614N', '1030129E'),
-    'OLKIT': ('045010N', '1115118E'),
-    'OLMUT': ('030306N', '1053558E'),
-    'OLNUB': ('011110N', '1035147E'),
-    'OMDUD': ('005847N', '1035714E'),
-    'OMKOM': ('013112N', '1035910E'),
-    'OMLIV': ('025512N', '1062812E'),
-    'OSERU': ('024450N', '1054334E'),
-    'OTLAL': ('004209N', '1053052E'),
-    'OTLON': ('030752N', '1042006E'),
-    'PADLI': ('030918N', '1033133E'),
-    'PALGA': ('011059N', '1034759E'),
-    'PAMSI': ('010459N', '1034845E')
-}
+@_dataset
+def _waypoints_all():
+    return {
+        'ABVIP': ('010008N', '1035032E'),
+        'ABVON': ('012028N', '1035827E'),
+        'ADNIK': ('011651N', '1035655E'),
+        'ADPON': ('011203N', '1040514E'),
+        # 'ADPON': ('010108N', '1035808E'),
+        'AGROT': ('010108N', '1035808E'),
+        'AGVAR': ('014719N', '1034145E'),
+        'AKDAT': ('032923N', '1054917E'),
+        'AKIPO': ('011356N', '1035542E'),
+        'AKMET': ('015355N', '1034339E'),
+        'AKMON': ('081254N', '1101306E'),
+        'AKOMA': ('014522N', '1035443E'),
+        'AKVOM': ('005620N', '1041514E'),
+        'ANBUS': ('011554N', '1032100E'),
+        'ANITO': ('001700S', '1045200E'),
+        'ANUMA': ('011053N', '1035424E'),
+        'APIPA': ('010618N', '1035228E'),
+        'ARAMA': ('013654N', '1030712E'),
+        'AROSO': ('020846N', '1032421E'),
+        'ASISU': ('055906N', '1132046E'),
+        'ASITI': ('004906N', '1035042E'),
+        'ASOMI': ('010142N', '1040207E'),
+        'ASUNA': ('005948N', '1030954E'),
+        'ATLEX': ('010302N', '1033331E'),
+        'ATLIR': ('011120N', '1035208E'),
+        'ATPOM': ('002425N', '1052114E'),
+        'ATRUM': ('013256N', '1040057E'),
+        'AVLUB': ('003112S', '1042501E'),
+        'AVPIV': ('011207N', '1035349E'),
+        'BAVAL': ('004518N', '1040242E'),
+        'BETBA': ('013302N', '1035331E'),
+        'BIBVI': ('024336N', '1040618E'),
+        'BIDAG': ('073101N', '1135544E'),
+        'BIDUS': ('013554N', '1035755E'),
+        'BIKTA': ('024337N', '1034308E'),
+        'BIMOS': ('011512N', '1035815E'),
+        'BIPOP': ('013122N', '1041018E'),
+        'BISOV': ('004229N', '1025214E'),
+        'BISUT': ('011218N', '1035701E'),
+        'BITAM': ('010813N', '1040757E'),
+        'BOBAG': ('010230N', '1032954E'),
+        'BOBOB': ('022206N', '1070558E'),
+        'BONSU': ('011928N', '1033710E'),
+        'BOPVA': ('025303N', '1051349E'),
+        'BUNTO': ('024200N', '1060000E'),
+        'BUVAL': ('033622N', '1034341E'),
+        'DAKIX': ('070854N', '1145054E'),
+        'DAMOG': ('041225N', '1050014E'),
+        'DODSO': ('012225N', '1061402E'),
+        'DOLOX': ('044841N', '1052247E'),
+        'DOVAN': ('011938N', '1041249E'),
+        'DOVOL': ('033047N', '1034923E'),
+        'DOWON': ('011957N', '1043048E'),
+        'DUBOT': ('010846N', '1040103E'),
+        'DUBSA': ('034901N', '1044540E'),
+        'DUDIS': ('070000N', '1064836E'),
+        'DUMUP': ('005430N', '1035516E'),
+        'EGOLO': ('031934N', '1040047E'),
+        'EGORA': ('013621N', '1040607E'),
+        'ELALO': ('041240N', '1043329E'),
+        'ELALU': ('013440N', '1040524E'),
+        'ELBEB': ('012845N', '1040254E'),
+        'ELBEX': ('013149N', '1040314E'),
+        'ELGAP': ('012820N', '1040146E'),
+        'ELGOR': ('033014N', '1054818E'),
+        'ELMIN': ('012550N', '1040141E'),
+        'EMRIX': ('012606N', '1041040E'),
+        'EMSIB': ('005911N', '1035419E'),
+        'EMSUX': ('024647N', '1051026E'),
+        'EMTAP': ('011656N', '1035657E'),
+        'ENLES': ('010932N', '1035350E'),
+        'ENPUX': ('002859S', '1043434E'),
+        'ENREP': ('045224N', '1041442E'),
+        'ENSUN': ('012603N', '1040048E'),
+        'ENVUM': ('011535N', '1040552E'),
+        'ERVIV': ('010445N', '1041013E'),
+        'ERVOT': ('011120N', '1035436E'),
+        'ESBIT': ('012212N', '1040009E'),
+        'ESBUM': ('045210N', '1042830E'),
+        'ESLUX': ('011844N', '1035840E'),
+        'ESPOB': ('070000N', '1053318E'),
+        'EXOMO': ('010425N', '1040933E'),
+        'GIXEM': ('004920N', '1042539E'),
+        'GOTGA': ('012013N', '1044200E'),
+        'GULGU': ('040141N', '1084242E'),
+        'GULIB': ('041714N', '1110633E'),
+        'GUMPU': ('013000N', '1034243E'),
+        'GUNUD': ('011042N', '1050618E'),
+        'GURES': ('002814N', '1043835E'),
+        'GUTUP': ('045911N', '1075603E'),
+        'HOSBA': ('011948N', '1042418E'),
+        'IBASU': ('005751N', '1033410E'),
+        'IBIVA': ('011351N', '1035637E'),
+        'IBIXU': ('011621N', '1035740E'),
+        'IDBUD': ('001454N', '1050139E'),
+        'IDEMO': ('025431N', '1040603E'),
+        'IDKIV': ('005652N', '1041333E'),
+        'IDMAS': ('004900N', '1041848E'),
+        'IDSEL': ('032432N', '1035544E'),
+        'IDUNA': ('012306N', '1035934E'),
+        'IDURO': ('012640N', '1040104E'),
+        'IDVAS': ('012935N', '1040218E'),
+        'IGARI': ('065612N', '1033506E'),
+        'IGNON': ('010847N', '1041257E'),
+        'IGOSI': ('005645N', '1040644E'),
+        'IGULA': ('013232N', '1040333E'),
+        'IGUTU': ('001331S', '1041857E'),
+        'IKIRO': ('000849N', '1044420E'),
+        'IKUKO': ('054512N', '1031324E'),
+        'IKUMI': ('055338N', '1035509E'),
+        'INVUB': ('002749N', '1051530E'),
+        'IPDOL': ('045111N', '1035920E'),
+        'IPNAK': ('013712N', '1040531E'),
+        'IPRIX': ('070000N', '1040754E'),
+        'IRPUG': ('005813N', '1040127E'),
+        'IRSAB': ('024349N', '1054359E'),
+        'IRTAD': ('010326N', '1041147E'),
+        'ISDEB': ('024440N', '1063011E'),
+        'ISGIL': ('004246N', '1031257E'),
+        'ISNOM': ('010629N', '1035826E'),
+        'JUNHA': ('005413N', '1043052E'),
+        'KAKSA': ('011703N', '1035758E'),
+        'KANLA': ('034556N', '1043606E'),
+        'KARTO': ('011124N', '1053343E'),
+        'KASPO': ('011507N', '1035709E'),
+        'KETOD': ('031042N', '1040942E'),
+        'KEXAS': ('011019N', '1044818E'),
+        'KEXOL': ('043930N', '1040942E'),
+        'KIBOL': ('025224N', '1042818E'),
+        'KILOT': ('030217N', '1044023E'),
+        'KIMER': ('011106N', '1035527E'),
+        'KIRDA': ('000009N', '1045934E'),
+        'LAGOT': ('071632N', '1113243E'),
+        'LAGUS': ('011915N', '1035854E'),
+        'LAPOL': ('012622N', '1034435E'),
+        'LASIN': ('011538N', '1035722E'),
+        'LAVAX': ('010950N', '1042714E'),
+        'LAXOR': ('094937N', '1144829E'),
+        'LEBIN': ('031438N', '1060604E'),
+        'LEDOX': ('011642N', '1035651E'),
+        'LEGOL': ('012053N', '1034723E'),
+        'LELIB': ('012729N', '1032450E'),
+        'LELON': ('011244N', '1035609E'),
+        'LENDA': ('024124N', '1043932E'),
+        'LEPNA': ('010648N', '1035339E'),
+        'LETGO': ('011411N', '1035548E'),
+        'LIDVA': ('010506N', '1035339E'),
+        'LIGVU': ('034417N', '1061859E'),
+        'LIPRO': ('025342N', '1051128E'),
+        'LUSMO': ('033341N', '1065534E'),
+        'LUXOL': ('011803N', '1035823E'),
+        'MABAL': ('032826N', '1051236E'),
+        'MABLI': ('041717N', '1061247E'),
+        'MANIM': ('031430N', '1040554E'),
+        'MASBO': ('020248N', '1025251E'),
+        'MASNI': ('012037N', '1033746E'),
+        'MELAS': ('070518N', '1080912E'),
+        'MIBEL': ('012351N', '1020816E'),
+        'MOLVO': ('012955N', '1040227E'),
+        'MOXIB': ('012933N', '1040315E'),
+        'MUMDU': ('010521N', '1042714E'),
+        'MUMSO': ('034420N', '1053213E'),
+        'NIVAM': ('023650N', '1040228E'),
+        'NIXEB': ('013943N', '1061040E'),
+        'NODIN': ('081100N', '1161142E'),
+        'NOPAT': ('042313N', '1044756E'),
+        'NUFFA': ('025341N', '1033829E'),
+        'NYLON': ('013657N', '1040624E'),
+        'OBDAB': ('031153N', '1040538E'),
+        'OBDOS': ('002503N', '1065551E'),
+        'OBGET': ('012307N', '1064531E'),
+        'ODONO': ('063614N', '1030129E'),
+        'OLKIT': ('045010N', '1115118E'),
+        'OLMUT': ('030306N', '1053558E'),
+        'OLNUB': ('011110N', '1035147E'),
+        'OMDUD': ('005847N', '1035714E'),
+        'OMKOM': ('013112N', '1035910E'),
+        'OMLIV': ('025512N', '1062812E'),
+        'OSERU': ('024450N', '1054334E'),
+        'OTLAL': ('004209N', '1053052E'),
+        'OTLON': ('030752N', '1042006E'),
+        'PADLI': ('030918N', '1033133E'),
+        'PALGA': ('011059N', '1034759E'),
+        'PAMSI': ('010459N', '1034845E')
+    }
 
-STAR_SID_waypoints = {
-    'ABVIP': ('010008N', '1035032E'),
-    'ADPON': ('011203N', '1040514E'),
-    # 'ADPON': ('010108N', '1035808E'),
-    'AGROT': ('010108N', '1035808E'),
-    'AGVAR': ('014719N', '1034145E'),
-    'AKMET': ('015355N', '1034339E'),
-    'AKOMA': ('014522N', '1035443E'),
-    'ALFA' : ('013033N', '1034942E'),
-    'ANITO': ('001700S', '1045200E'),
-    'ARAMA': ('013654N', '1030712E'),
-    'AROSO': ('020846N', '1032421E'),
-    'ASITI': ('004906N', '1035042E'),
-    'ASOMI': ('010142N', '1040207E'),
-    'ASUNA': ('005948N', '1030954E'),
-    'ATLEX': ('010302N', '1033331E'),
-    'ATRUM': ('013256N', '1040057E'),
-    'BETBA': ('013302N', '1035331E'),
-    'BIBVI': ('024336N', '1040618E'),
-    'BIDUS': ('013554N', '1035755E'),
-    'BIPOP': ('013122N', '1041018E'),
-    'BISOV': ('004229N', '1025214E'),
-    'BITAM': ('010813N', '1040757E'),
-    'BOBAG': ('010230N', '1032954E'),
-    'BOKIP': ('010421N', '1034353E'),
-    'BTM'  : ('010813N', '1040758E'),
-    'DODSO': ('012225N', '1061402E'),
-    'DOVAN': ('011938N', '1041249E'),
-    'DUBOT': ('010846N', '1040103E'),
-    'DUMUP': ('005430N', '1035516E'),
-    'ELALO': ('041240N', '1043329E'),
-    'EMRIX': ('012606N', '1041040E'),
-    'ERVIV': ('010445N', '1041013E'),
-    'GIXEM': ('004920N', '1042539E'),
-    'GOTGA': ('012013N', '1044200E'),
-    'GUMPU': ('013000N', '1034243E'),
-    'GUNUD': ('011042N', '1050618E'),
-    'GURES': ('002814N', '1043835E'),
-    'HOSBA': ('011948N', '1042418E'),
-    'IBASU': ('005751N', '1033410E'),
-    'IBIVA': ('011351N', '1035637E'),
-    'IBIXU': ('011621N', '1035740E'),
-    'IDBUD': ('001454N', '1050139E'),
-    'IDKIV': ('005652N', '1041333E'),
-    'IGNON': ('010847N', '1041257E'),
-    'IGOSI': ('005645N', '1040644E'),
-    'IKIRO': ('000849N', '1044420E'),
-    'ISGIL': ('004246N', '1031257E'),
-    'ISNOM': ('010629N', '1035826E'),
-    'KANLA': ('034556N', '1043606E'),
-    'KARTO': ('011124N', '1053343E'),
-    'KEXAS': ('011019N', '1044818E'),
-    'KILOT': ('030217N', '1044023E'),
-    'KIRDA': ('000009N', '1045934E'),
-    'LAMA' : ('013150N', '1035850E'), #Added from ENR 3.6 holding list
-    'LAVAX': ('010950N', '1042714E'),
-    'LEDOX': ('011642N', '1035651E'),
-    'LELIB': ('012729N', '1032450E'),
-    'LETGO': ('011411N', '1035548E'),
-    'MABAL': ('032826N', '1051236E'),
-    'MASBO': ('020248N', '1025251E'),
-    'MIBEL': ('012351N', '1020816E'),
-    'MOLVO': ('012955N', '1040227E'),
-    'MOXIB': ('012933N', '1040315E'),
-    'MUMDU': ('010521N', '1042714E'),
-    'NYLON': ('013657N', '1040624E'),
-    'PALGA': ('011059N', '1034759E'),
-    'PAMSI': ('010459N', '1034845E'),
-    'PASPU': ('015915N', '1040618E'),
-    'PIBAP': ('023023N', '1040618E'),
-    'POSUB': ('012725N', '1040748E'),
-    'POVEB': ('011344N', '1040130E'),
-    'PU'   : ('012524N', '1035600E'),
-    'REMES': ('004342N', '1035735E'),
-    'REPOV': ('001623N', '1040300E'),
-    'RWY 02R DER': ('012122N', '1040051E'),
-    'RWY 02C DER': ('012145N', '1035957E'),
-    'RWY 02L DER': ('012305N', '1035933E'),
-    'RWY 20C DER': ('011942N', '1035905E'),
-    'RWY 20R DER': ('012047N', '1035835E'),
-    'RWY 20L DER': ('011919N', '1035959E'),
-    'SABKA': ('015051N', '1031713E'),
-    'SALRU': ('011701N', '1040802E'),
-    'SAMKO': ('010530N', '1035255E'),
-    'SANAT': ('010749N', '1035930E'),
-    'SEBVO': ('011259N', '1044028E'),
-    'SJ'   : ('011321N', '1035115E'),
-    'SINJON': ('011321N', '1035115E'),
-    'SURGA': ('003657S', '1063119E'),
-    'TAROS': ('004200N', '1021612E'),
-    'TEBUN': ('011455N', '1031557E'),
-    'TOMAN': ('012147N', '1054717E'),
-    'TUSPI': ('003301N', '1040959E'), #Added from ENR 3.6 holding list
-    'UGEBO': ('003813N', '1052432E'),
-    'UKIBO': ('011758N', '1035924E'),
-    'UPTEL': ('005925N', '1040730E'),
-    'VAMPO': ('005833N', '1032525E'),
-    'VANBU': ('010643N', '1042740E'),
-    'VASTI': ('004320N', '1043406E'),
-    'VEBMA': ('012030N', '1045332E'),
-    'VEXEL': ('005904N', '1034254E'),
-    'VIBOG': ('004310N', '1034302E'),
-    'VIGUD': ('011328N', '1035730E'),
-    'VIMAL': ('010942N', '1042353E'),
-    'VIRET': ('003940N', '1043511E'),
-    'VMR'  : ('022318N', '1035218E'),
-    'VOVOS': ('011123N', '1032651E'),
-    'VTK'  : ('012455N', '1040120E'),
-    'TEKONG' : ('012455N', '1040120E')
-}
+@_dataset
+def _STAR_SID_waypoints():
+    return {
+        'ABVIP': ('010008N', '1035032E'),
+        'ADPON': ('011203N', '1040514E'),
+        # 'ADPON': ('010108N', '1035808E'),
+        'AGROT': ('010108N', '1035808E'),
+        'AGVAR': ('014719N', '1034145E'),
+        'AKMET': ('015355N', '1034339E'),
+        'AKOMA': ('014522N', '1035443E'),
+        'ALFA' : ('013033N', '1034942E'),
+        'ANITO': ('001700S', '1045200E'),
+        'ARAMA': ('013654N', '1030712E'),
+        'AROSO': ('020846N', '1032421E'),
+        'ASITI': ('004906N', '1035042E'),
+        'ASOMI': ('010142N', '1040207E'),
+        'ASUNA': ('005948N', '1030954E'),
+        'ATLEX': ('010302N', '1033331E'),
+        'ATRUM': ('013256N', '1040057E'),
+        'BETBA': ('013302N', '1035331E'),
+        'BIBVI': ('024336N', '1040618E'),
+        'BIDUS': ('013554N', '1035755E'),
+        'BIPOP': ('013122N', '1041018E'),
+        'BISOV': ('004229N', '1025214E'),
+        'BITAM': ('010813N', '1040757E'),
+        'BOBAG': ('010230N', '1032954E'),
+        'BOKIP': ('010421N', '1034353E'),
+        'BTM'  : ('010813N', '1040758E'),
+        'DODSO': ('012225N', '1061402E'),
+        'DOVAN': ('011938N', '1041249E'),
+        'DUBOT': ('010846N', '1040103E'),
+        'DUMUP': ('005430N', '1035516E'),
+        'ELALO': ('041240N', '1043329E'),
+        'EMRIX': ('012606N', '1041040E'),
+        'ERVIV': ('010445N', '1041013E'),
+        'GIXEM': ('004920N', '1042539E'),
+        'GOTGA': ('012013N', '1044200E'),
+        'GUMPU': ('013000N', '1034243E'),
+        'GUNUD': ('011042N', '1050618E'),
+        'GURES': ('002814N', '1043835E'),
+        'HOSBA': ('011948N', '1042418E'),
+        'IBASU': ('005751N', '1033410E'),
+        'IBIVA': ('011351N', '1035637E'),
+        'IBIXU': ('011621N', '1035740E'),
+        'IDBUD': ('001454N', '1050139E'),
+        'IDKIV': ('005652N', '1041333E'),
+        'IGNON': ('010847N', '1041257E'),
+        'IGOSI': ('005645N', '1040644E'),
+        'IKIRO': ('000849N', '1044420E'),
+        'ISGIL': ('004246N', '1031257E'),
+        'ISNOM': ('010629N', '1035826E'),
+        'KANLA': ('034556N', '1043606E'),
+        'KARTO': ('011124N', '1053343E'),
+        'KEXAS': ('011019N', '1044818E'),
+        'KILOT': ('030217N', '1044023E'),
+        'KIRDA': ('000009N', '1045934E'),
+        'LAMA' : ('013150N', '1035850E'), #Added from ENR 3.6 holding list
+        'LAVAX': ('010950N', '1042714E'),
+        'LEDOX': ('011642N', '1035651E'),
+        'LELIB': ('012729N', '1032450E'),
+        'LETGO': ('011411N', '1035548E'),
+        'MABAL': ('032826N', '1051236E'),
+        'MASBO': ('020248N', '1025251E'),
+        'MIBEL': ('012351N', '1020816E'),
+        'MOLVO': ('012955N', '1040227E'),
+        'MOXIB': ('012933N', '1040315E'),
+        'MUMDU': ('010521N', '1042714E'),
+        'NYLON': ('013657N', '1040624E'),
+        'PALGA': ('011059N', '1034759E'),
+        'PAMSI': ('010459N', '1034845E'),
+        'PASPU': ('015915N', '1040618E'),
+        'PIBAP': ('023023N', '1040618E'),
+        'POSUB': ('012725N', '1040748E'),
+        'POVEB': ('011344N', '1040130E'),
+        'PU'   : ('012524N', '1035600E'),
+        'REMES': ('004342N', '1035735E'),
+        'REPOV': ('001623N', '1040300E'),
+        'RWY 02R DER': ('012122N', '1040051E'),
+        'RWY 02C DER': ('012145N', '1035957E'),
+        'RWY 02L DER': ('012305N', '1035933E'),
+        'RWY 20C DER': ('011942N', '1035905E'),
+        'RWY 20R DER': ('012047N', '1035835E'),
+        'RWY 20L DER': ('011919N', '1035959E'),
+        'SABKA': ('015051N', '1031713E'),
+        'SALRU': ('011701N', '1040802E'),
+        'SAMKO': ('010530N', '1035255E'),
+        'SANAT': ('010749N', '1035930E'),
+        'SEBVO': ('011259N', '1044028E'),
+        'SJ'   : ('011321N', '1035115E'),
+        'SINJON': ('011321N', '1035115E'),
+        'SURGA': ('003657S', '1063119E'),
+        'TAROS': ('004200N', '1021612E'),
+        'TEBUN': ('011455N', '1031557E'),
+        'TOMAN': ('012147N', '1054717E'),
+        'TUSPI': ('003301N', '1040959E'), #Added from ENR 3.6 holding list
+        'UGEBO': ('003813N', '1052432E'),
+        'UKIBO': ('011758N', '1035924E'),
+        'UPTEL': ('005925N', '1040730E'),
+        'VAMPO': ('005833N', '1032525E'),
+        'VANBU': ('010643N', '1042740E'),
+        'VASTI': ('004320N', '1043406E'),
+        'VEBMA': ('012030N', '1045332E'),
+        'VEXEL': ('005904N', '1034254E'),
+        'VIBOG': ('004310N', '1034302E'),
+        'VIGUD': ('011328N', '1035730E'),
+        'VIMAL': ('010942N', '1042353E'),
+        'VIRET': ('003940N', '1043511E'),
+        'VMR'  : ('022318N', '1035218E'),
+        'VOVOS': ('011123N', '1032651E'),
+        'VTK'  : ('012455N', '1040120E'),
+        'TEKONG' : ('012455N', '1040120E')
+    }
 
 STARs = {
     'ARAMA1A': ['ARAMA', 'BOBAG', 'BOKIP', 'SAMKO'],
@@ -5329,161 +5377,179 @@ SIDs_rwy = {
 holding_pts_app = ['BOBAG', 'HOSBA', 'KEXAS','LAMA', 'NYLON','REMES','SAMKO','SINJON','TUSPI','VAMPO']
 holding_pts_acc = ['ELALO','KARTO','KILOT','MABAL','REPOV','UGEBO'] 
 
-combined_waypoints = waypoints_all | STAR_SID_waypoints
+@_dataset
+def _combined_waypoints():
+    return _load('waypoints_all') | _load('STAR_SID_waypoints')
 
 
 #endregion
 
 #region SINGAPORE FIR SECTORS
-SG_FIR_sector1_coordinates = [
-    # ('004237N', '103523E'),
-    ('003513N', '103540E'),
-    # ('001617N', '103611E'),
-    ('001620S', '1035827E'), # Arc of airspace
-    ('001113S', '1042205E'), # Arc of airspace
-    ('000000N', '1044330E'),
-    ('000000N', '1050340E'), 
-    ('001030N', '1045656E'),
-    # ('001030N', '104605E'),
-    ('001927N', '1050633E'), # merge point of sectors 1, 4, FIR
-    ('003534N', '104414E'),
-    # ('001955N', '105110E'),
-    ('013228N', '104240E'), # merge point of sectors 1, 2, 3
-    # ('013112N', '103633E'),
-    ('013013N', '103502E'),
-    ('012707N', '1032829E'), 
-    # ('012707N', '103321E'),
-    # ('010711N', '103511E'),
-    # ('011543N', '103212E'),
-    ('011554N', '1032109E'),    # merge point of sectors 1, 2
-    ('010711N', '1034717E'),
-    ('003513N', '103540E'),
-    # ('004237N', '103523E')  # closed polygon
-]
+@_dataset
+def _SG_FIR_sector1_coordinates():
+    return [
+        # ('004237N', '103523E'),
+        ('003513N', '103540E'),
+        # ('001617N', '103611E'),
+        ('001620S', '1035827E'), # Arc of airspace
+        ('001113S', '1042205E'), # Arc of airspace
+        ('000000N', '1044330E'),
+        ('000000N', '1050340E'), 
+        ('001030N', '1045656E'),
+        # ('001030N', '104605E'),
+        ('001927N', '1050633E'), # merge point of sectors 1, 4, FIR
+        ('003534N', '104414E'),
+        # ('001955N', '105110E'),
+        ('013228N', '104240E'), # merge point of sectors 1, 2, 3
+        # ('013112N', '103633E'),
+        ('013013N', '103502E'),
+        ('012707N', '1032829E'), 
+        # ('012707N', '103321E'),
+        # ('010711N', '103511E'),
+        # ('011543N', '103212E'),
+        ('011554N', '1032109E'),    # merge point of sectors 1, 2
+        ('010711N', '1034717E'),
+        ('003513N', '103540E'),
+        # ('004237N', '103523E')  # closed polygon
+    ]
 
-SG_FIR_sector2_coordinates = [
-    ('020008N', '1034828E'), 
-    ('013014N', '1035025E'), 
-    ('012707N', '1032829E'), 
-    ('011554N', '1032109E'),    # merge point of sectors 1, 2
-    ('010711N', '1034717E'), 
-    # ('004238N', '1035244E'), 
-    ('003513N', '1035407E'), 
-    ('001620S', '1035827E'), # Arc of airspace
-    # ('001617S', '1035719E'), 
-    ('001113S', '1042205E'), # Arc of airspace
-    ('001620S', '1035827E'), # Arc of airspace
-    ('001458S', '1033419E'), # Arc of airspace
-    ('000714S', '1031124E'), # Arc of airspace
-    ('000618N', '1025123E'), # Arc of airspace
-    ('002442N', '1023541E'), # Arc of airspace
-    ('004636N', '1022528E'), # Arc of airspace
-    ('011026N', '1022126E'), # Arc of airspace
-    ('013429N', '1022353E'), 
-    ('012204N', '1030206E'), 
-    ('014517N', '1031303E'), 
-    ('014215N', '1031717E'),
-    ('020008N', '1034828E')
-]
+@_dataset
+def _SG_FIR_sector2_coordinates():
+    return [
+        ('020008N', '1034828E'), 
+        ('013014N', '1035025E'), 
+        ('012707N', '1032829E'), 
+        ('011554N', '1032109E'),    # merge point of sectors 1, 2
+        ('010711N', '1034717E'), 
+        # ('004238N', '1035244E'), 
+        ('003513N', '1035407E'), 
+        ('001620S', '1035827E'), # Arc of airspace
+        # ('001617S', '1035719E'), 
+        ('001113S', '1042205E'), # Arc of airspace
+        ('001620S', '1035827E'), # Arc of airspace
+        ('001458S', '1033419E'), # Arc of airspace
+        ('000714S', '1031124E'), # Arc of airspace
+        ('000618N', '1025123E'), # Arc of airspace
+        ('002442N', '1023541E'), # Arc of airspace
+        ('004636N', '1022528E'), # Arc of airspace
+        ('011026N', '1022126E'), # Arc of airspace
+        ('013429N', '1022353E'), 
+        ('012204N', '1030206E'), 
+        ('014517N', '1031303E'), 
+        ('014215N', '1031717E'),
+        ('020008N', '1034828E')
+    ]
 
-SG_FIR_sector3_coordinates = [
-    # ('030725N', '1034442E'), 
-    ('030725N', '1041305E'), # merge point of sectors 3, 6, 7
-    ('023600N', '1044500E'), # merge point of sectors 3, 4, 6
-    # ('023558N', '1044459E'), 
-    ('013228N', '1042406E'), # merge point of sectors 1, 2, 3
-    # ('013118N', '1040128E'), # hidden
-    # ('013112N', '1035936E'), # hidden
-    ('013014N', '1035025E'), 
-    ('020008N', '1034828E'), 
-    ('022203N', '1034714E'), 
-    ('025220N', '1033324E'), 
-    ('025418N', '1034606E'),
-    ('030725N', '1034442E')
-]
+@_dataset
+def _SG_FIR_sector3_coordinates():
+    return [
+        # ('030725N', '1034442E'), 
+        ('030725N', '1041305E'), # merge point of sectors 3, 6, 7
+        ('023600N', '1044500E'), # merge point of sectors 3, 4, 6
+        # ('023558N', '1044459E'), 
+        ('013228N', '1042406E'), # merge point of sectors 1, 2, 3
+        # ('013118N', '1040128E'), # hidden
+        # ('013112N', '1035936E'), # hidden
+        ('013014N', '1035025E'), 
+        ('020008N', '1034828E'), 
+        ('022203N', '1034714E'), 
+        ('025220N', '1033324E'), 
+        ('025418N', '1034606E'),
+        ('030725N', '1034442E')
+    ]
 
-SG_FIR_sector4_coordinates = [
-    ('023800N', '1044300E'),    # merge point of sectors 3, 4, 6 [top]
-    ('023935N', '1045028E'), 
-    ('023000N', '1053000E'), 
-    ('023338N', '1054812E'),    # merge point of sectors 4, 6
-    ('012450N', '1061648E'),    # replaced ('012500N', '1061648E'), 
-    ('010831N', '1055908E'), 
-    # ('001956N', '1050603E'), 
-    ('001927N', '1050633E'), # merge point of sectors 1, 4, FIR
-    ('003534N', '104414E'), 
-    ('013228N', '1042406E'), 
-    ('023600N', '1044500E'),    # merge point of sectors 3, 4, 6
-    # ('023558N', '1044459E'),
-    ('023800N', '1044300E')     # merge point of sectors 3, 4, 6 [top]
-]
+@_dataset
+def _SG_FIR_sector4_coordinates():
+    return [
+        ('023800N', '1044300E'),    # merge point of sectors 3, 4, 6 [top]
+        ('023935N', '1045028E'), 
+        ('023000N', '1053000E'), 
+        ('023338N', '1054812E'),    # merge point of sectors 4, 6
+        ('012450N', '1061648E'),    # replaced ('012500N', '1061648E'), 
+        ('010831N', '1055908E'), 
+        # ('001956N', '1050603E'), 
+        ('001927N', '1050633E'), # merge point of sectors 1, 4, FIR
+        ('003534N', '104414E'), 
+        ('013228N', '1042406E'), 
+        ('023600N', '1044500E'),    # merge point of sectors 3, 4, 6
+        # ('023558N', '1044459E'),
+        ('023800N', '1044300E')     # merge point of sectors 3, 4, 6 [top]
+    ]
 
-SG_FIR_sector5_coordinates = [
-    ('035421N', '1063418E'), 
-    ('074214N', '1091208E'), # merge point of sectors 5, 8
-    ('103000N', '1140000E'), 
-    ('082500N', '1163000E'), 
-    ('025050N', '1091629E'), 
-    ('045700N', '1081619E'), 
-    ('050012N', '1080132E'), 
-    ('045904N', '1075525E'), 
-    ('045203N', '1074625E'), 
-    ('043820N', '1073315E'), 
-    ('041312N', '1071743E'), 
-    ('035237N', '1063555E'),
-    ('035421N', '1063418E')
-]
+@_dataset
+def _SG_FIR_sector5_coordinates():
+    return [
+        ('035421N', '1063418E'), 
+        ('074214N', '1091208E'), # merge point of sectors 5, 8
+        ('103000N', '1140000E'), 
+        ('082500N', '1163000E'), 
+        ('025050N', '1091629E'), 
+        ('045700N', '1081619E'), 
+        ('050012N', '1080132E'), 
+        ('045904N', '1075525E'), 
+        ('045203N', '1074625E'), 
+        ('043820N', '1073315E'), 
+        ('041312N', '1071743E'), 
+        ('035237N', '1063555E'),
+        ('035421N', '1063418E')
+    ]
 
-SG_FIR_sector6_coordinates = [
-    ('033600N', '1042208E'), 
-    ('040311N', '1054617E'), 
-    ('041717N', '1061247E'), 
-    ('035421N', '1063418E'),    # merge point of sectors 5, 6, 8
-    ('035237N', '1063555E'), 
-    # ('034417N', '1061959E'),    # moved east 1 min
-    ('033045N', '1055130E'),    # replaced ('033022N', '1055153E'), 
-    ('031727N', '1052959E'), 
-    # ('023431N', '1054716E'), 
-    ('023338N', '1054812E'),    # merge point of sectors 4, 6
-    ('023000N', '1053000E'),    # replaced ('023001N', '1052958E'), 
-    ('023935N', '1045028E'), 
-    ('023800N', '1044300E'),    # merge point of sectors 3, 4, 6 [top]
-    # ('023721N', '1044337E'), 
-    ('030725N', '1041305E'), # merge point of sectors 3, 6, 7
-    # ('030735N', '1041256E'),
-    ('033600N', '1042208E')
-]
+@_dataset
+def _SG_FIR_sector6_coordinates():
+    return [
+        ('033600N', '1042208E'), 
+        ('040311N', '1054617E'), 
+        ('041717N', '1061247E'), 
+        ('035421N', '1063418E'),    # merge point of sectors 5, 6, 8
+        ('035237N', '1063555E'), 
+        # ('034417N', '1061959E'),    # moved east 1 min
+        ('033045N', '1055130E'),    # replaced ('033022N', '1055153E'), 
+        ('031727N', '1052959E'), 
+        # ('023431N', '1054716E'), 
+        ('023338N', '1054812E'),    # merge point of sectors 4, 6
+        ('023000N', '1053000E'),    # replaced ('023001N', '1052958E'), 
+        ('023935N', '1045028E'), 
+        ('023800N', '1044300E'),    # merge point of sectors 3, 4, 6 [top]
+        # ('023721N', '1044337E'), 
+        ('030725N', '1041305E'), # merge point of sectors 3, 6, 7
+        # ('030735N', '1041256E'),
+        ('033600N', '1042208E')
+    ]
 
-SG_FIR_sector7_coordinates = [
-    ('045000N', '1034400E'), 
-    ('045223N', '1041441E'), 
-    ('044841N', '1052247E'), 
-    ('041716N', '1061247E'), 
-    ('040311N', '1054617E'), 
-    ('033600N', '1042208E'), 
-    ('030725N', '1041305E'), # merge point of sectors 3, 6, 7
-    # ('030735N', '1041256E'), 
-    ('030725N', '1034442E'), 
-    ('034000N', '1034000E'),
-    ('045000N', '1034400E')
-]
+@_dataset
+def _SG_FIR_sector7_coordinates():
+    return [
+        ('045000N', '1034400E'), 
+        ('045223N', '1041441E'), 
+        ('044841N', '1052247E'), 
+        ('041716N', '1061247E'), 
+        ('040311N', '1054617E'), 
+        ('033600N', '1042208E'), 
+        ('030725N', '1041305E'), # merge point of sectors 3, 6, 7
+        # ('030735N', '1041256E'), 
+        ('030725N', '1034442E'), 
+        ('034000N', '1034000E'),
+        ('045000N', '1034400E')
+    ]
 
-SG_FIR_sector8_coordinates = [
-    ('064500N', '1024000E'), 
-    ('070000N', '1030000E'), 
-    # ('064459N', '1024001E'), 
-    # ('065955N', '1025953E'), 
-    ('070000N', '1080000E'), 
-    ('074214N', '1091208E'), # merge point of sectors 5, 8
-    ('035421N', '1063418E'), # merge point of sectors 5, 6, 8
-    ('041717N', '1061246E'), 
-    ('044841N', '1052247E'), 
-    ('045223N', '1041441E'), 
-    ('045000N', '1034400E'),
-    ('060000N', '1030504E'),    # SG - KL merge point
-    ('064500N', '1024000E'), 
-    # ('064459N', '1024001E')
-]
+@_dataset
+def _SG_FIR_sector8_coordinates():
+    return [
+        ('064500N', '1024000E'), 
+        ('070000N', '1030000E'), 
+        # ('064459N', '1024001E'), 
+        # ('065955N', '1025953E'), 
+        ('070000N', '1080000E'), 
+        ('074214N', '1091208E'), # merge point of sectors 5, 8
+        ('035421N', '1063418E'), # merge point of sectors 5, 6, 8
+        ('041717N', '1061246E'), 
+        ('044841N', '1052247E'), 
+        ('045223N', '1041441E'), 
+        ('045000N', '1034400E'),
+        ('060000N', '1030504E'),    # SG - KL merge point
+        ('064500N', '1024000E'), 
+        # ('064459N', '1024001E')
+    ]
 #endregion
 
 #endregion
@@ -5707,4 +5773,7 @@ WIDT_09 = [
 ]
 
 lat_list_WIDT_09, lon_list_WIDT_09 = create_latlon_list(WIDT_09)
-#endregion
\ No newline at end of file
+#endregion
+
+# Star imports also export the lazy tables (building them), as they did when every table was a plain list
+__all__ = sorted({name for name in globals() if not name.startswith('_')} | set(_dataset_builders))
@@ -1,68 +1,55 @@
+import sys
 import math
 import base64
+import functools
 import dash
 import pandas as pd
-from dash import dcc, html, Input, Output, State
+from dash import dcc, html, Input, Output, State, Patch
 import plotly.graph_objects as go
 from matplotlib.colors import to_rgba
+from coordinates import LatLon, format_dms, geometry_cache
+from dataset_cache import CACHE_PATH as DATASET_PATH, load_dataset
+from geodesy import destination, polyline_metrics
+from geometry import level_for_zoom, lod_max_zooms, lod_pyramid
+from layers import LayerRegistry
+from payload import quantize, use_fast_encoder
+from procedures import ProcedureTable
 
 
 #region Functions
 
-def parse_coordinates(coordinates):
-    latitudes, longitudes = [], []
-    for lat_str, lon_str in coordinates:
-        lat_str_clean = lat_str[:-1]
-        lon_str_clean = lon_str[:-1]
-        
-        lat_deg = int(lat_str_clean[:2])
-        lat_min = int(lat_str_clean[2:4])
-        lat_sec = int(lat_str_clean[4:6])
-        
-        lon_deg = int(lon_str_clean[:3])
-        lon_min = int(lon_str_clean[3:5])
-        lon_sec = int(lon_str_clean[5:7])
-        
-        lat = lat_deg + lat_min / 60 + lat_sec / 3600
-        lon = lon_deg + lon_min / 60 + lon_sec / 3600
-        
-        if lat_str.endswith('S'):
-            lat *= -1
-        if lon_str.endswith('W'):
-            lon *= -1
-        
-        latitudes.append(round(lat, 6))
-        longitudes.append(round(lon, 6))
-    
-    return latitudes, longitudes
+def as_latlon(coordinates):
+    """
+    Returns (latitudes, longitudes) in decimal degrees for any of the coordinate forms used by the map:
+    a parsed LatLon from the dataset cache, or a list of (lat_dms, lon_dms) tuples / (lat, lon) floats,
+    which are parsed once through the shared geometry cache.
+    """
+    if isinstance(coordinates, LatLon):
+        return coordinates
+    return geometry_cache.coordinates(coordinates)
 
 
 def round_latlon(latitude, longitude):
     """Rounds decimal degrees latitude and longitude to 5 decimal places. """
     return round(latitude, 5), round(longitude, 5)
 
-def decimal_to_dms_str(lat, lon):
-    def to_dms(val, is_lat):
-        direction = 'N' if is_lat else 'E'
-        if val < 0:
-            direction = 'S' if is_lat else 'W'
-        val = abs(val)
-        deg = int(val)
-        minutes_float = (val - deg) * 60
-        minutes = int(minutes_float)
-        seconds = int(round((minutes_float - minutes) * 60))
-
-        # Correct rollover
-        if seconds == 60:
-            seconds = 0
-            minutes += 1
-            if minutes == 60:
-                minutes = 0
-                deg += 1
-
-        return f"{deg:02d}{minutes:02d}{seconds:02d}{direction}"
-
-    return f"({to_dms(lat, True)}, {to_dms(lon, False)})"
+def vertex_hovertext(name, lat_list, lon_list, source_index=None):
+    """
+    Per-vertex debug hover text ('name<br>(DMS)<br>#index'), formatted for the whole boundary at once.
+
+    Parameters:
+    - source_index: Position of each vertex in its aerodromes.py list (see dataset_ring); default: its position in lat_list
+    """
+    if source_index is None:
+        source_index = range(len(lat_list))
+    return [f"{name}<br>{dms}<br>#{i}" for i, dms in zip(source_index, format_dms(lat_list, lon_list))]
+
+def dataset_ring(dataset_name):
+    """
+    Returns the add_sector / add_FIR arguments drawing a coordinate list of the aerodromes dataset:
+    its normalized ring, and where each vertex is in aerodromes.py for the hover_detail vertex numbers.
+    """
+    return dict(coordinates=aero[dataset_name], source_index=aero.source_index(dataset_name))
 
 def css_to_rgba(color: str, opacity: float) -> str:
     """
@@ -80,14 +67,14 @@ def css_to_rgba(color: str, opacity: float) -> str:
     return f'rgba({r}, {g}, {b}, {opacity})'
 
 def add_sector(fig, name, coordinates, fillcolor, linecolor, opacity=0.3, linewidth=1, 
-               legendgroup=None, legendgrouptitle_text=None, legendrank=None, showlegend=True):
+               legendgroup=None, legendgrouptitle_text=None, legendrank=None, showlegend=True, source_index=None):
     """
     Adds an airspace sector polygon to a Plotly map.
 
     Parameters:
     - fig: Plotly figure object
     - name: Legend label
-    - coordinates: List of (lat_dms, lon_dms) tuples (e.g., '013112N', '1035936E')
+    - coordinates: LatLon from the dataset cache, or list of (lat_dms, lon_dms) tuples (e.g., '013112N', '1035936E')
     - fillcolor: CSS color name or rgba() string
     - linecolor: Polygon outline color
     - opacity: Polygon fill transparency (0.0 - 1.0)
@@ -96,20 +83,18 @@ def add_sector(fig, name, coordinates, fillcolor, linecolor, opacity=0.3, linewi
     - legendgroup: Optional legend group
     - legendrank: Controls order in legend (lower = higher up)
     - legendgrouptitle_text: Optional group title for legend section
+    - source_index: Position of each vertex in aerodromes.py, numbering the hover_detail vertices (see dataset_ring)
     """
 
     # Convert DMS to decimal degrees
-    lat_list, lon_list = parse_coordinates(coordinates)
+    lat_list, lon_list = as_latlon(coordinates)
+
+    perimeter_nm = polyline_metrics(lat_list, lon_list).along_track_nm[-1]
 
     # Round coordinates
     lat_list = [round_latlon(lat, lon)[0] for lat, lon in zip(lat_list, lon_list)]
     lon_list = [round_latlon(lat, lon)[1] for lat, lon in zip(lat_list, lon_list)]
 
-    hovertext = [
-        f"{name}<br>{decimal_to_dms_str(lat, lon)}<br>#{i}"
-        for i, (lat, lon) in enumerate(zip(lat_list, lon_list))
-    ]
-
     # Convert CSS color to rgba if needed
     if ',' not in fillcolor and not fillcolor.startswith('rgba'):
         fillcolor = css_to_rgba(fillcolor, opacity)
@@ -118,7 +103,6 @@ def add_sector(fig, name, coordinates, fillcolor, linecolor, opacity=0.3, linewi
     fig.add_trace(go.Scattermap(
         lat=lat_list,
         lon=lon_list,
-        mode='lines',
         fill='toself',
         fillcolor=fillcolor,
         line=dict(color=linecolor, width=linewidth),
@@ -126,9 +110,11 @@ def add_sector(fig, name, coordinates, fillcolor, linecolor, opacity=0.3, linewi
         legendgroup=legendgroup,
         legendgrouptitle_text=legendgrouptitle_text,
         legendrank=legendrank,
-        text=hovertext,
+        # Per-vertex DMS hover text is only built and sent in hover_detail mode
+        mode='markers+lines' if hover_detail else 'lines',
+        text=vertex_hovertext(name, lat_list, lon_list, source_index) if hover_detail else None,
         hoverinfo='none',
-        hovertemplate='%{fullData.name}<extra></extra>',     #text
+        hovertemplate='%{text}<extra></extra>' if hover_detail else f'%{{fullData.name}}<br>{perimeter_nm:.0f} NM perimeter<extra></extra>',
         showlegend=showlegend,
         customdata=['SECTOR']
     ))
@@ -215,35 +201,35 @@ def add_rectangle_with_label(fig, center_lat, center_lon, width_km, height_km, t
     ))
 
 
-def add_FIR(fig, name, coordinates, linecolor='black', linewidth=1.5, legendgroup="FIR", legendrank=1, showlegend=True, legendgrouptitle_text="FIR", label=True, label_lat=None, label_lon=None):
+def add_FIR(fig, name, coordinates, linecolor='black', linewidth=1.5, legendgroup="FIR", legendrank=1, showlegend=True, legendgrouptitle_text="FIR", label=True, label_lat=None, label_lon=None, zoom=None, source_index=None):
     """
     Adds an FIR (Flight Information Region) boundary polygon to a Plotly map.
 
     Parameters:
     - fig: Plotly figure object
     - name: Name of the FIR to display in the legend
-    - coordinates: List of (lat_dms, lon_dms) tuples in DMS format (e.g., '011543N', '1032139E')
+    - coordinates: LatLon from the dataset cache, or list of (lat_dms, lon_dms) tuples in DMS format (e.g., '011543N', '1032139E')
     - linecolor: Outline color of the FIR boundary (default: 'black')
     - linewidth: Thickness of the FIR boundary line (default: 1.5)
     - legendgroup: Legend group name for grouping traces (default: 'FIR')
     - legendrank: Rank to control order in the legend (default: 1)
     - showlegend: Whether to show the trace in the legend (default: True)
     - legendgrouptitle_text: Title to group legend entries (default: 'FIR')
+    - zoom: Map zoom the boundary is drawn at; picks the simplified LOD level with sub-pixel error (default: None, full resolution).
+      hover_detail mode always draws every vertex
+    - source_index: Position of each vertex in aerodromes.py, numbering the hover_detail vertices (see dataset_ring)
     """
     
-    lat_list, lon_list = parse_coordinates(coordinates)
-    hovertext = [
-        f"{name}<br>{decimal_to_dms_str(lat, lon)}<br>#{i}"
-        for i, (lat, lon) in enumerate(zip(lat_list, lon_list))
-    ]
+    lat_list, lon_list = as_latlon(coordinates)
+    if zoom is not None and not hover_detail:
+        lat_list, lon_list = lod_pyramid(lat_list, lon_list).for_zoom(zoom)
     
     fig.add_trace(go.Scattermap(
         lat=lat_list,
         lon=lon_list,
-        # mode='markers+lines',   # Debugging
-        # hovertemplate='%{text}<extra></extra>', # Set to text for debugging
-        mode='lines',   # Production
-        hovertemplate='%{fullData.name}<extra></extra>',   # Set to fullData.name for production
+        # Per-vertex DMS hover text is only built and sent in hover_detail mode
+        mode='markers+lines' if hover_detail else 'lines',
+        hovertemplate='%{text}<extra></extra>' if hover_detail else '%{fullData.name}<extra></extra>',
         fill='none',
         line=dict(color=linecolor, width=linewidth),
         name=name,
@@ -251,7 +237,7 @@ def add_FIR(fig, name, coordinates, linecolor='black', linewidth=1.5, legendgrou
         legendrank=legendrank,
         legendgrouptitle_text=legendgrouptitle_text,
         hoverinfo= 'name',
-        text=hovertext,
+        text=vertex_hovertext(name, lat_list, lon_list, source_index) if hover_detail else None,
         showlegend=showlegend,
         customdata=['FIR']
     ))
@@ -275,50 +261,117 @@ def add_FIR(fig, name, coordinates, linecolor='black', linewidth=1.5, legendgrou
             showlegend=False,
         ))
 
+
+
+def add_FIR_batch(fig, name, firs, linecolor='black', linewidth=1.5, legendgroup="FIR", legendrank=1, showlegend=True, legendgrouptitle_text=None, zoom=None):
+    """
+    Adds several FIR boundaries sharing one line style as a single trace, with rings separated by None.
+    Each vertex carries its FIR name in customdata, so hovering still identifies the individual FIR.
+    Labels of the FIRs that have one are added as a single text trace.
+
+    Parameters:
+    - fig: Plotly figure object
+    - name: Legend entry for the batch (e.g., "FIR boundaries")
+    - firs: List of dicts with the add_FIR arguments of each FIR (name, coordinates, source_index, label, label_lat, label_lon)
+    - linecolor, linewidth, legendgroup, legendrank, showlegend, legendgrouptitle_text, zoom: as in add_FIR
+    """
+    rings = [as_latlon(fir['coordinates']) for fir in firs]
+    if zoom is not None and not hover_detail:
+        # One level for the whole trace, as update_fir_level switches them (see fir_lod)
+        level = level_for_zoom(lod_max_zooms(rings), zoom)
+        rings = [lod_pyramid(lat, lon).levels[level] for lat, lon in rings]
+
+    lat_list, lon_list, fir_names, hovertext = [], [], [], []
+    for fir, (lat, lon) in zip(firs, rings):
+        if lat_list:
+            lat_list.append(None), lon_list.append(None), fir_names.append(None), hovertext.append(None)
+        lat_list.extend(lat.tolist()), lon_list.extend(lon.tolist())
+        fir_names.extend([fir['name']] * len(lat))
+        if hover_detail:
+            hovertext.extend(vertex_hovertext(fir['name'], lat, lon, fir.get('source_index')))
+
+    fig.add_trace(go.Scattermap(
+        lat=lat_list,
+        lon=lon_list,
+        # Per-vertex DMS hover text is only built and sent in hover_detail mode
+        mode='markers+lines' if hover_detail else 'lines',
+        text=hovertext if hover_detail else None,
+        hovertemplate='%{text}<extra></extra>' if hover_detail else '%{customdata}<extra></extra>',
+        fill='none',
+        line=dict(color=linecolor, width=linewidth),
+        name=name,
+        legendgroup=legendgroup,
+        legendrank=legendrank,
+        legendgrouptitle_text=legendgrouptitle_text,
+        showlegend=showlegend,
+        customdata=fir_names,
+    ))
+
+    labelled = [fir for fir in firs if fir.get('label', True)]
+    if labelled:
+        fig.add_trace(go.Scattermap(
+            lat=[fir['label_lat'] for fir in labelled],
+            lon=[fir['label_lon'] for fir in labelled],
+            mode='markers+text',
+            name=f'{name} labels',
+            text=["FIR<br>" + fir['name'].replace("FIR", "").strip() for fir in labelled],
+            textfont=dict(size=15, color='black', family='Open Sans Bold, Verdana Bold, Arial Black, sans-serif'),
+            textposition='top center',
+            marker=dict(size=30, symbol='x'),
+            legendgroup=legendgroup,
+            hoverinfo='none',
+            showlegend=False,
+        ))
+
     
-def add_airport(fig, name, code, lat, lon, color, size, legendgroup, showlegend=True):
+def add_airports(fig, name, airports, color, size, legendgroup='airports', legendgrouptitle_text=None, showlegend=True):
     """
-    Adds an airport marker with a text label and hover popup.
+    Adds a table of airports as a single marker trace with a hover popup per airport.
     
     Parameters:
     - fig: the plotly figure object
-    - name: full airport name (e.g., "Seletar Airport")
-    - code: ICAO code (e.g., "WSSL")
-    - lat, lon: coordinates
+    - name: legend entry for the set (e.g., "Airports")
+    - airports: DataFrame with Name, ICAO, Latitude and Longitude columns
     - color: marker color
     - size: marker size
     - legendgroup: group name for legend grouping
     - showlegend: whether to display this item in the legend
     """
     fig.add_trace(go.Scattermap(
-        lat=[lat],
-        lon=[lon],
-        mode='markers+text',
+        lat=airports['Latitude'].to_numpy(dtype=float),
+        lon=airports['Longitude'].to_numpy(dtype=float),
+        mode='markers',
         marker=dict(size=size, color=color, symbol='circle'),
-        textposition='top right',
-        name=f'{name} ({code})',
-        hovertext=code,
+        name=name,
+        hovertext=(airports['Name'] + ' (' + airports['ICAO'] + ')').tolist(),
         legendgroup=legendgroup,
-        legendgrouptitle_text=f"<b>{name}<b>",
+        legendgrouptitle_text=legendgrouptitle_text,
         showlegend=showlegend,
         customdata=['static'],
-        hovertemplate='📍 %{fullData.name}<extra></extra>'
+        hovertemplate='📍 %{hovertext}<extra></extra>'
     ))
 
-def add_runway(fig, name, lat_list, lon_list, fillcolor, linecolor, linewidth, legendgroup, legendgrouptitle_text = None, showlegend=True, ):
+def add_runways(fig, name, runways, fillcolor, linecolor, linewidth, legendgroup, legendgrouptitle_text = None, showlegend=True):
     """
-    Adds a filled polygon to represent a runway.
+    Adds a set of runways sharing one style as a single filled trace, with outlines separated by None.
     
     Parameters:
     - fig: the plotly figure object
-    - name: runway label (e.g., "RWY 03/21")
-    - lat_list, lon_list: lists of coordinates outlining the runway
+    - name: legend entry for the set (e.g., "Runways")
+    - runways: list of (label, lat_list, lon_list) outlining each runway (e.g., ("WSSS RWY 02L/20R", [...], [...]))
     - fillcolor: polygon fill
     - linecolor: boundary line color
     - linewidth: boundary line width
     - legendgroup: group name for legend grouping
     - showlegend: whether to display this item in the legend
     """
+    lat_list, lon_list, labels = [], [], []
+    for label, lats, lons in runways:
+        if lat_list:
+            lat_list.append(None), lon_list.append(None), labels.append(None)
+        lat_list.extend(lats), lon_list.extend(lons)
+        labels.extend([label] * len(lats))
+
     fig.add_trace(go.Scattermap(
         lat=lat_list,
         lon=lon_list,
@@ -327,43 +380,39 @@ def add_runway(fig, name, lat_list, lon_list, fillcolor, linecolor, linewidth, l
         fillcolor=fillcolor,
         line=dict(color=linecolor, width=linewidth),
         name=name,
+        text=labels,
+        hovertemplate='(%{lat}, %{lon})<extra>%{text}</extra>',
         legendgroup=legendgroup,
         legendgrouptitle_text=legendgrouptitle_text,
         showlegend=showlegend,
         customdata=['static']
     ))
 
-def add_waypoint(fig, name, coordinates, color='royalblue',legendgrouptitle_text= None):
+def add_waypoints(fig, name, waypoints, color='royalblue', size=9, legendgrouptitle_text=None):
     """
-    Adds a waypoint marker to the map.
+    Adds a set of waypoints to the map as a single marker trace.
     
     Parameters:
     - fig: Plotly figure object
-    - name: Waypoint name (e.g., "WSSS")
-    - coordinates: Tuple of (latitude, longitude)
+    - name: Legend entry for the set (e.g., "DME")
+    - waypoints: Mapping of waypoint name to (latitude, longitude), in DMS or decimal degrees; blank ('', '') entries are skipped
+    - color: Marker color
+    - size: Marker size
     """
-    if coordinates == ('',''):
-        lat, lon = [None], [None]
-        hovertext = [None]
-    else:
-        lat, lon = parse_coordinates([coordinates])
-        hovertext = [decimal_to_dms_str(lat[0], lon[0])]
-    
-    # hovertext = [
-    #     f"{name}<br>{decimal_to_dms_str(lat, lon)}<br>#{i}"
-    #     for i, (lat, lon) in enumerate(zip(lat_list, lon_list))
-    # ]
+    waypoints = {name: coordinates for name, coordinates in waypoints.items() if coordinates != ('', '')}
+    points = [geometry_cache.point(coordinates) for coordinates in waypoints.values()]
+    lat = [point[0] for point in points]
+    lon = [point[1] for point in points]
     
     fig.add_trace(go.Scattermap(
         lat=lat,
         lon=lon,
         mode='markers',
-        marker=dict(size=waypoint_marker_size, color= color),
-        textposition='top right',
+        marker=dict(size=size, color=color),
         name=name,
-        text=hovertext,
-        hovertemplate='%{text}',     #fullData.name
-        # legendgroup='Waypoints',
+        text=format_dms(lat, lon),
+        hovertext=list(waypoints),
+        hovertemplate='%{text}<extra>%{hovertext}</extra>',
         legendgrouptitle_text=legendgrouptitle_text,
         showlegend=True,
         customdata=['WAYPOINT'],
@@ -383,6 +432,15 @@ color_rwy_inactive = 'red'
 color_rwy_inactive_fill = 'rgba(255, 0, 0, 0.7)'
 
 # Other customisation
+map_zoom = 6.5               # Initial zoom; the FIR boundary detail then follows the zoom (see fir_lod and update_fir_level)
+hover_detail = False         # Debugging: vertex markers with per-vertex DMS hover text on sectors and FIRs
+parallel_layer_build = False # Build the startup layers in forked worker processes on a cold start (see python parallel_layers.py)
+batch_fir_traces = True     # Draw FIRs sharing a line style as one trace (False: one trace and legend entry per FIR)
+# Decimal places kept in the served coordinates (4: ~11 m, 5: ~1 m; see payload.py); None keeps full precision
+layer_precision = dict(SECTOR=4, FIR=4, AERO=5, PROCEDURE=5, WAYPOINT=5, NOTE=None)
+radius_circle_precision = 4
+default_radius_nm = 50
+response_cache_size = 1024  # update_map responses kept in memory (LRU, see map_response); 0 disables the cache
 normal_waypoint_marker_size = 9
 holding_dme_waypoint_marker_size = 12
 
@@ -390,268 +448,293 @@ holding_dme_waypoint_marker_size = 12
 version = '1.4.1'   # Toggling layers will reset map view. Much better performance compared to 1.4.0, especially with waypoints toggled. 
 
 
-# Dash app
+# Aerodrome datasets (memory-mapped compiled cache, rebuilt from aerodromes.py when stale)
+aero = load_dataset()
+procedures = ProcedureTable.from_dataset(aero)
+
+# Dash app; figures and callback responses are encoded with orjson when it is installed
 app = dash.Dash(__name__)
-fig = go.Figure()
+use_fast_encoder()
 
 #region Singapore FIR Sectors
-from aerodromes import SG_FIR_sector1_coordinates, SG_FIR_sector2_coordinates, SG_FIR_sector3_coordinates, SG_FIR_sector4_coordinates
-from aerodromes import SG_FIR_sector5_coordinates, SG_FIR_sector6_coordinates, SG_FIR_sector7_coordinates, SG_FIR_sector8_coordinates
-
-# Sector 1
-add_sector(
-    fig=fig,
-    name='Sector 1',
-    coordinates=SG_FIR_sector1_coordinates,
-    fillcolor='mediumslateblue',
-    linecolor='grey',
-    opacity=0.3,
-    linewidth=1,
-    legendgroup='SG FIR',
-    legendgrouptitle_text='<b>Singapore FIR Sectors</b>',
-    legendrank=2,
-    showlegend=True
-)
+def build_sectors(fig):
+    """Adds the eight Singapore FIR sectors."""
+    # Sector 1
+    add_sector(
+        fig=fig,
+        name='Sector 1',
+        **dataset_ring('SG_FIR_sector1_coordinates'),
+        fillcolor='mediumslateblue',
+        linecolor='grey',
+        opacity=0.3,
+        linewidth=1,
+        legendgroup='SG FIR',
+        legendgrouptitle_text='<b>Singapore FIR Sectors</b>',
+        legendrank=2,
+        showlegend=True
+    )
 
-# Sector 2
-add_sector(
-    fig=fig,
-    name='Sector 2',
-    coordinates=SG_FIR_sector2_coordinates,
-    fillcolor='aqua',
-    linecolor='grey',
-    opacity=0.3,
-    linewidth=1,
-    legendgroup='SG FIR',
-    showlegend=True
-)
+    # Sector 2
+    add_sector(
+        fig=fig,
+        name='Sector 2',
+        **dataset_ring('SG_FIR_sector2_coordinates'),
+        fillcolor='aqua',
+        linecolor='grey',
+        opacity=0.3,
+        linewidth=1,
+        legendgroup='SG FIR',
+        showlegend=True
+    )
 
-# Sector 3
-add_sector(
-    fig=fig,
-    name='Sector 3',
-    coordinates=SG_FIR_sector3_coordinates,
-    fillcolor='violet',
-    linecolor='grey',
-    opacity=0.3,
-    linewidth=1,
-    legendgroup='SG FIR',
-    showlegend=True
-)
+    # Sector 3
+    add_sector(
+        fig=fig,
+        name='Sector 3',
+        **dataset_ring('SG_FIR_sector3_coordinates'),
+        fillcolor='violet',
+        linecolor='grey',
+        opacity=0.3,
+        linewidth=1,
+        legendgroup='SG FIR',
+        showlegend=True
+    )
 
-# Sector 4
-add_sector(
-    fig=fig,
-    name='Sector 4',
-    coordinates=SG_FIR_sector4_coordinates,
-    fillcolor='yellow',
-    linecolor='grey',
-    opacity=0.3,
-    linewidth=1,
-    legendgroup='SG FIR',
-    showlegend=True
-)
+    # Sector 4
+    add_sector(
+        fig=fig,
+        name='Sector 4',
+        **dataset_ring('SG_FIR_sector4_coordinates'),
+        fillcolor='yellow',
+        linecolor='grey',
+        opacity=0.3,
+        linewidth=1,
+        legendgroup='SG FIR',
+        showlegend=True
+    )
 
-# Sector 5
-add_sector(
-    fig=fig,
-    name='Sector 5',
-    coordinates=SG_FIR_sector5_coordinates,
-    fillcolor='cornflowerblue',
-    linecolor='grey',
-    opacity=0.3,
-    linewidth=1,
-    legendgroup='SG FIR',
-    showlegend=True
-)
+    # Sector 5
+    add_sector(
+        fig=fig,
+        name='Sector 5',
+        **dataset_ring('SG_FIR_sector5_coordinates'),
+        fillcolor='cornflowerblue',
+        linecolor='grey',
+        opacity=0.3,
+        linewidth=1,
+        legendgroup='SG FIR',
+        showlegend=True
+    )
 
-# Sector 6
-add_sector(
-    fig=fig,
-    name='Sector 6',
-    coordinates=SG_FIR_sector6_coordinates,
-    fillcolor='lightgreen',
-    linecolor='grey',
-    opacity=0.3,
-    linewidth=1,
-    legendgroup='SG FIR',
-    showlegend=True
-)
+    # Sector 6
+    add_sector(
+        fig=fig,
+        name='Sector 6',
+        **dataset_ring('SG_FIR_sector6_coordinates'),
+        fillcolor='lightgreen',
+        linecolor='grey',
+        opacity=0.3,
+        linewidth=1,
+        legendgroup='SG FIR',
+        showlegend=True
+    )
 
-# Sector 7
-add_sector(
-    fig=fig,
-    name='Sector 7',
-    coordinates=SG_FIR_sector7_coordinates,
-    fillcolor='lightskyblue',
-    linecolor='grey',
-    opacity=0.3,
-    linewidth=1,
-    legendgroup='SG FIR',
-    showlegend=True
-)
+    # Sector 7
+    add_sector(
+        fig=fig,
+        name='Sector 7',
+        **dataset_ring('SG_FIR_sector7_coordinates'),
+        fillcolor='lightskyblue',
+        linecolor='grey',
+        opacity=0.3,
+        linewidth=1,
+        legendgroup='SG FIR',
+        showlegend=True
+    )
 
-# Sector 8
-add_sector(
-    fig=fig,
-    name='Sector 8',
-    coordinates=SG_FIR_sector8_coordinates,
-    fillcolor='navajowhite',
-    linecolor='grey',
-    opacity=0.4,
-    linewidth=1,
-    legendgroup='SG FIR',
-    showlegend=True
-)
+    # Sector 8
+    add_sector(
+        fig=fig,
+        name='Sector 8',
+        **dataset_ring('SG_FIR_sector8_coordinates'),
+        fillcolor='navajowhite',
+        linecolor='grey',
+        opacity=0.4,
+        linewidth=1,
+        legendgroup='SG FIR',
+        showlegend=True
+    )
 
 #endregion
 
 #region FIR boundaries
-from aerodromes import SG_FIR_coordinates, KL_FIR_vested1_coordinates, KL_FIR_vested2_coordinates, JAKARTA_FIR_delegated_coordinates
-from aerodromes import KL_FIR_coordinates, BKK_FIR_coordinates, PP_FIR_coordinates, HCM_FIR_coordinates, KOTA_KINABALU_FIR_coordinates, UJUNG_PANDANG_FIR, JKT_FIR_coordinates
-
-# Kuala Lumpur FIR
-add_FIR(fig, 'KUALA LUMPUR FIR (GND/SEA - FL150)', KL_FIR_vested1_coordinates, linecolor='grey', linewidth=1.5, legendgroup='FIR', legendrank=2, showlegend=True, label=False)
-add_FIR(fig, 'KUALA LUMPUR FIR (GND/SEA - FL200)', KL_FIR_vested2_coordinates, linecolor='grey', linewidth=1.5, legendgroup='FIR', legendrank=2, showlegend=True, label=False)
-add_FIR(fig, 'KUALA LUMPUR FIR', KL_FIR_coordinates, linecolor='black', linewidth=1.5, legendgroup='FIR', legendrank=2, showlegend=True, label_lat=6.5, label_lon=96.5)
-
-# Bangkok FIR
-add_FIR(fig, 'BANGKOK FIR', BKK_FIR_coordinates, linecolor='black', linewidth=1.5, legendgroup='FIR', legendrank=3, showlegend=True, label_lat=9.5, label_lon=101)
-
-# Phnom Penh FIR
-add_FIR(fig, 'PHNOM PENH FIR', PP_FIR_coordinates, linecolor='black', linewidth=1.5, legendgroup='FIR', legendrank=4, showlegend=True, label_lat=12, label_lon=104.5)
-
-# Ho Chi Minh FIR
-add_FIR(fig, 'HO CHI MINH FIR', HCM_FIR_coordinates, linecolor='black', linewidth=1.5, legendgroup='FIR', legendrank=5, showlegend=True, label_lat=8, label_lon=107.5)
-
-# Kota Kinabalu FIR
-add_FIR(fig, 'KOTA KINABALU FIR', KOTA_KINABALU_FIR_coordinates, linecolor='black', linewidth=1.5, legendgroup='FIR', legendrank=6, showlegend=True, label_lat=2.5, label_lon=113)
+def fir_groups():
+    """
+    Returns the FIR boundary traces build_firs draws, in order, as {trace name: [add_FIR arguments of each FIR in it]}:
+    one trace per line style (batch_fir_traces), otherwise one per FIR.
+    """
+    firs = [
+        # Kuala Lumpur FIR
+        dict(name='KUALA LUMPUR FIR (GND/SEA - FL150)', **dataset_ring('KL_FIR_vested1_coordinates'), linecolor='grey', legendrank=2, label=False),
+        dict(name='KUALA LUMPUR FIR (GND/SEA - FL200)', **dataset_ring('KL_FIR_vested2_coordinates'), linecolor='grey', legendrank=2, label=False),
+        dict(name='KUALA LUMPUR FIR', **dataset_ring('KL_FIR_coordinates'), linecolor='black', legendrank=2, label_lat=6.5, label_lon=96.5),
+        # Bangkok FIR
+        dict(name='BANGKOK FIR', **dataset_ring('BKK_FIR_coordinates'), linecolor='black', legendrank=3, label_lat=9.5, label_lon=101),
+        # Phnom Penh FIR
+        dict(name='PHNOM PENH FIR', **dataset_ring('PP_FIR_coordinates'), linecolor='black', legendrank=4, label_lat=12, label_lon=104.5),
+        # Ho Chi Minh FIR
+        dict(name='HO CHI MINH FIR', **dataset_ring('HCM_FIR_coordinates'), linecolor='black', legendrank=5, label_lat=8, label_lon=107.5),
+        # Kota Kinabalu FIR
+        dict(name='KOTA KINABALU FIR', **dataset_ring('KOTA_KINABALU_FIR_coordinates'), linecolor='black', legendrank=6, label_lat=2.5, label_lon=113),
+        # Ujung Pandang FIR
+        dict(name='UJUNG PANDANG FIR', **dataset_ring('UJUNG_PANDANG_FIR'), linecolor='black', legendrank=7, label_lat=-2, label_lon=115.5),
+        # Jakarta FIR
+        dict(name='JAKARTA FIR (DELEGATED)', **dataset_ring('JAKARTA_FIR_delegated_coordinates'), linecolor='grey', legendrank=8, label=False),
+        dict(name='JAKARTA FIR', **dataset_ring('JKT_FIR_coordinates'), linecolor='black', legendrank=8, label_lat=-1.75, label_lon=102.5),
+        # Singapore FIR
+        dict(name='SINGAPORE FIR', **dataset_ring('SG_FIR_coordinates'), linecolor='black', legendrank=1, legendgrouptitle_text='<b>FIRs</b>', label_lat=6.5, label_lon=111),
+    ]
 
-# Ujung Pandang FIR
-add_FIR(fig, 'UJUNG PANDANG FIR', UJUNG_PANDANG_FIR, linecolor='black', linewidth=1.5, legendgroup='FIR', legendrank=7, showlegend=True, label_lat=-2, label_lon=115.5)
+    if batch_fir_traces:
+        return {'FIR boundaries': [fir for fir in firs if fir['linecolor'] == 'black'],
+                'FIR (vested / delegated airspace)': [fir for fir in firs if fir['linecolor'] == 'grey']}
+    return {fir['name']: [fir] for fir in firs}
+
+
+def build_firs(fig):
+    """Adds the FIR boundaries and labels."""
+    groups = fir_groups()
+    if batch_fir_traces:
+        # One trace per line style; the legend shows one entry per style instead of per FIR
+        add_FIR_batch(fig, 'FIR boundaries', groups['FIR boundaries'], linecolor='black',
+                      legendrank=1, legendgrouptitle_text='<b>FIRs</b>', zoom=map_zoom)
+        add_FIR_batch(fig, 'FIR (vested / delegated airspace)', groups['FIR (vested / delegated airspace)'], linecolor='grey',
+                      legendrank=2, zoom=map_zoom)
+    else:
+        for [fir] in groups.values():
+            add_FIR(fig, linewidth=1.5, legendgroup='FIR', showlegend=True, zoom=map_zoom, **fir)
 
-# Jakarta FIR
-add_FIR(fig, 'JAKARTA FIR (DELEGATED)', JAKARTA_FIR_delegated_coordinates, linecolor='grey', linewidth=1.5, legendgroup='FIR', legendrank=8, showlegend=True, label=False)
-add_FIR(fig, 'JAKARTA FIR', JKT_FIR_coordinates, linecolor='black', linewidth=1.5, legendgroup='FIR', legendrank=8, showlegend=True, label_lat=-1.75, label_lon=102.5)
 
-# Singapore FIR
-add_FIR(fig, 'SINGAPORE FIR', SG_FIR_coordinates, linecolor='black', linewidth=1.5, legendgroup='FIR', legendgrouptitle_text= '<b>FIRs</b>',legendrank=1, showlegend=True, label_lat=6.5, label_lon=111)
+def fir_lod(traces):
+    """
+    Returns the LOD levels of the FIR boundary traces, from which update_fir_level redraws the boundaries as the map
+    zooms. Derived from the built FIR layer and cached with it, so a warm start runs no simplification:
+    {'traces': [{'offset', 'max_zoom', 'level', 'lat', 'lon', 'levels', 'names'}]} with
+    - offset: Position of the trace in the FIR layer
+    - max_zoom: Highest zoom each level is drawn at (None: any zoom)
+    - level: Level drawn in the initial figure, at map_zoom
+    - lat, lon: Full-resolution coordinates of the trace, rings separated by None
+    - levels: Positions in lat/lon of the vertices (and separators) kept at each level (None: all of them)
+    - names: FIR name of each ring, for the per-vertex customdata of batched traces (None for single FIR traces)
+    hover_detail mode draws every vertex, so there are no levels.
 
+    Parameters:
+    - traces: Trace dicts of the FIR layer as built
+    """
+    if hover_detail:
+        return dict(traces=[])
+    groups = fir_groups()
+    precision = layer_precision['FIR']
+    lod_traces = []
+    for offset, trace in enumerate(traces):
+        # A FIR's label trace has its name too and comes after the boundary
+        firs = groups.pop(trace['name'], None)
+        if firs is None:
+            continue
+        rings = [as_latlon(fir['coordinates']) for fir in firs]
+        pyramids = [lod_pyramid(lat, lon) for lat, lon in rings]
+        max_zooms = lod_max_zooms(rings)
+        lat_list, lon_list = [], []
+        levels = [[] for _ in max_zooms]
+        for pyramid in pyramids:
+            if lat_list:
+                lat_list.append(None), lon_list.append(None)
+                for kept in levels:
+                    kept.append(len(lat_list) - 1)
+            for kept, indices in zip(levels, pyramid.indices):
+                kept.extend((indices + len(lat_list)).tolist())
+            lat_list.extend(pyramid.levels[0].lat.tolist()), lon_list.extend(pyramid.levels[0].lon.tolist())
+        lod_traces.append(dict(
+            offset=offset,
+            max_zoom=[None if math.isinf(max_zoom) else max_zoom for max_zoom in max_zooms],
+            level=level_for_zoom(max_zooms, map_zoom),
+            lat=lat_list if precision is None else quantize(lat_list, precision),
+            lon=lon_list if precision is None else quantize(lon_list, precision),
+            levels=[None] + levels[1:],
+            names=[fir['name'] for fir in firs] if batch_fir_traces else None,
+        ))
+    return dict(traces=lod_traces)
 
 #endregion
 
 #region Airports and runways
+def build_airports(fig):
+    """Adds the airports and runways."""
+    # Aerodromes from aerodromes.py, then the other popular airports from airports.csv
+    aerodrome_table = pd.DataFrame([
+        # Singapore
+        ('Singapore Changi Airport', 'WSSS', aero.WSSS_lat, aero.WSSS_lon),
+        ('Seletar Airport', 'WSSL', aero.WSSL_lat, aero.WSSL_lon),
+        ('Paya Lebar Air Base', 'WSAP', aero.WSAP_lat, aero.WSAP_lon),
+        ('Tengah Air Base', 'WSAT', aero.WSAT_lat, aero.WSAT_lon),
+        ('Sembawang Air Base', 'WSAG', aero.WSAG_lat, aero.WSAG_lon),
+        # Malaysia
+        ('Senai Intl Airport', 'WMKJ', aero.WMKJ_lat, aero.WMKJ_lon),
+        # Indonesia
+        ('Hang Nadim Intl Airport', 'WIDD', aero.WIDD_lat, aero.WIDD_lon),
+        ('Raja Haji Fisabilillah Intl Airport', 'WIDN', aero.WIDN_lat, aero.WIDN_lon),
+        ('Raja Haji Abdullah Airport', 'WIDT', aero.WIDT_lat, aero.WIDT_lon),
+    ], columns=['Name', 'ICAO', 'Latitude', 'Longitude'])
+
+    airports = pd.read_csv('airports.csv')
+
+    add_airports(fig, 'Airports', pd.concat([aerodrome_table, airports], ignore_index=True), color_airport, airport_marker_size,
+                 legendgroup='airports', legendgrouptitle_text='<b>Airports</b>')
+
+    # (label, lat_list, lon_list, active)
+    runways = [
+        # Singapore
+        ('WSSS RWY 02L/20R', aero.lat_list_WSSS_02L, aero.lon_list_WSSS_02L, True),
+        ('WSSS RWY 02C/20C', aero.lat_list_WSSS_02C, aero.lon_list_WSSS_02C, True),
+        ('WSSS RWY 02R/20L', aero.lat_list_WSSS_02R, aero.lon_list_WSSS_02R, False),
+        ('WSSL RWY 03/21', aero.lat_list_WSSL_03, aero.lon_list_WSSL_03, True),
+        ('WSAP RWY 02/20', aero.lat_list_WSAP_02, aero.lon_list_WSAP_02, False),
+        ('WSAT RWY 18/36', aero.lat_list_WSAT_18, aero.lon_list_WSAT_18, False),
+        ('WSAT Military Airstrip', aero.lat_list_WSAT_36, aero.lon_list_WSAT_36, False),
+        ('WSAG RWY 04/22', aero.lat_list_WSAG_04, aero.lon_list_WSAG_04, False),
+        ('WSAG RWY H05/H23', aero.lat_list_WSAG_H05, aero.lon_list_WSAG_H05, False),
+        ('Pulau Sudong Military Airstrip RWY 09/27', aero.lat_list_sudong_09, aero.lon_list_sudong_09, False),
+        # Malaysia
+        ('WMKJ RWY 16/34', aero.lat_list_WMKJ_16, aero.lon_list_WMKJ_16, True),
+        # Indonesia
+        ('WIDD RWY 04/22', aero.lat_list_WIDD_04, aero.lon_list_WIDD_04, True),
+        ('WIDN RWY 04/22', aero.lat_list_WIDN_04, aero.lon_list_WIDN_04, True),
+        ('WIDT RWY 09/27', aero.lat_list_WIDT_09, aero.lon_list_WIDT_09, True),
+    ]
 
-#region Singapore
-from aerodromes import WSSS_lat, WSSS_lon, WSSL_lat, WSSL_lon, WSAP_lat, WSAP_lon, WSAT_lat, WSAT_lon, WSAG_lat, WSAG_lon
-
-add_airport(fig, 'Singapore Changi Airport', 'WSSS', WSSS_lat, WSSS_lon, color_airport, airport_marker_size, 'changi')
-add_airport(fig, 'Seletar Airport', 'WSSL', WSSL_lat, WSSL_lon, color_airport, airport_marker_size, 'seletar')
-add_airport(fig, 'Paya Lebar Air Base', 'WSAP', WSAP_lat, WSAP_lon, color_airport, airport_marker_size, 'payalebar')
-add_airport(fig, 'Tengah Air Base', 'WSAT', WSAT_lat, WSAT_lon, color_airport, airport_marker_size, 'tengah')
-add_airport(fig, 'Sembawang Air Base', 'WSAG', WSAG_lat, WSAG_lon, color_airport, airport_marker_size, 'sembawang')
-
-# Add runways
-
-from aerodromes import lat_list_WSSS_02L, lon_list_WSSS_02L, lat_list_WSSS_02C, lon_list_WSSS_02C, lat_list_WSSS_02R, lon_list_WSSS_02R
-add_runway(fig, 'RWY 02L/20R', lat_list_WSSS_02L, lon_list_WSSS_02L, color_rwy_fill, color_rwy, rwy_width, 'changi')
-add_runway(fig, 'RWY 02C/20C', lat_list_WSSS_02C, lon_list_WSSS_02C, color_rwy_fill, color_rwy, rwy_width, 'changi')
-add_runway(fig, 'RWY 02R/20L', lat_list_WSSS_02R, lon_list_WSSS_02R, color_rwy_inactive_fill, color_rwy_inactive, rwy_width, 'changi')
-
-from aerodromes import lat_list_WSSL_03, lon_list_WSSL_03
-add_runway(fig, 'RWY 03/21', lat_list_WSSL_03, lon_list_WSSL_03, color_rwy_fill, color_rwy, rwy_width, 'seletar')
-
-from aerodromes import lat_list_WSAP_02, lon_list_WSAP_02
-add_runway(fig, 'RWY 02/20', lat_list_WSAP_02, lon_list_WSAP_02, color_rwy_inactive_fill, color_rwy_inactive, rwy_width, 'payalebar')
-
-from aerodromes import lat_list_WSAT_18, lon_list_WSAT_18, lat_list_WSAT_36, lon_list_WSAT_36
-add_runway(fig, 'RWY 18/36', lat_list_WSAT_18, lon_list_WSAT_18, color_rwy_inactive_fill, color_rwy_inactive, rwy_width, 'tengah')
-add_runway(fig, 'Military Airstrip', lat_list_WSAT_36, lon_list_WSAT_36, color_rwy_inactive_fill, color_rwy_inactive, rwy_width, 'tengah')
-
-from aerodromes import lat_list_WSAG_04, lon_list_WSAG_04, lat_list_WSAG_H05, lon_list_WSAG_H05
-add_runway(fig, 'RWY 04/22', lat_list_WSAG_04, lon_list_WSAG_04, color_rwy_inactive_fill, color_rwy_inactive, rwy_width, 'sembawang')
-add_runway(fig, 'RWY H05/H23', lat_list_WSAG_H05, lon_list_WSAG_H05, color_rwy_inactive_fill, color_rwy_inactive, rwy_width, 'sembawang')
-
-from aerodromes import lat_list_sudong_09, lon_list_sudong_09
-add_runway(
-    fig=fig,
-    name='RWY 09/27',
-    lat_list=lat_list_sudong_09,
-    lon_list=lon_list_sudong_09,
-    fillcolor=color_rwy_inactive_fill,
-    linecolor=color_rwy_inactive,
-    linewidth=rwy_width,
-    legendgroup='sudong',
-    legendgrouptitle_text = '<b>Pulau Sudong Military Airstrip</b>',
-    showlegend=True
-)
-
-#endregion
-
-#region Malaysia
-from aerodromes import WMKJ_lat, WMKJ_lon
-
-add_airport(fig, 'Senai Intl Airport', 'WMKJ', WMKJ_lat, WMKJ_lon, color_airport, airport_marker_size, 'senai')
-
-from aerodromes import lat_list_WMKJ_16, lon_list_WMKJ_16
-add_runway(fig, 'RWY 16/34', lat_list_WMKJ_16, lon_list_WMKJ_16, color_rwy_fill, color_rwy, rwy_width, 'senai')
-
-#endregion
-
-#region Indonesia
-from aerodromes import WIDD_lat, WIDD_lon, WIDN_lat, WIDN_lon, WIDT_lat, WIDT_lon
-
-add_airport(fig, 'Hang Nadim Intl Airport', 'WIDD', WIDD_lat, WIDD_lon, color_airport, airport_marker_size, 'hangnadim')
-add_airport(fig, 'Raja Haji Fisabilillah Intl Airport', 'WIDN', WIDN_lat, WIDN_lon, color_airport, airport_marker_size, 'tanjungpinang')
-add_airport(fig, 'Raja Haji Abdullah Airport', 'WIDT', WIDT_lat, WIDT_lon, color_airport, airport_marker_size, 'tanjungbalai')
-
-from aerodromes import lat_list_WIDD_04, lon_list_WIDD_04, lat_list_WIDN_04, lon_list_WIDN_04, lat_list_WIDT_09, lon_list_WIDT_09
-add_runway(fig, 'RWY 04/22', lat_list_WIDD_04, lon_list_WIDD_04, color_rwy_fill, color_rwy, rwy_width, 'hangnadim')
-add_runway(fig, 'RWY 04/22', lat_list_WIDN_04, lon_list_WIDN_04, color_rwy_fill, color_rwy, rwy_width, 'tanjungpinang')
-add_runway(fig, 'RWY 09/27', lat_list_WIDT_09, lon_list_WIDT_09, color_rwy_fill, color_rwy, rwy_width, 'tanjungbalai')
-
-#endregion
-
-#region Other popular airports
-
-airports = pd.read_csv('airports.csv')
-
-for idx, apt in airports.iterrows():
-    name = apt['Name']
-    icao = apt['ICAO']
-    lat, lon = apt['Latitude'], apt['Longitude']
-    add_airport(fig, name, icao, lat, lon, color_airport, airport_marker_size, icao)
-
+    add_runways(fig, 'Runways', [(label, lats, lons) for label, lats, lons, active in runways if active],
+                color_rwy_fill, color_rwy, rwy_width, 'airports')
 
-#endregion
-
-# Add notes for restricted/military runways
-add_runway(
-    fig=fig,
-    name='Red RWY: Restricted/Military',
-    lat_list=[None],
-    lon_list=[None],
-    fillcolor=color_rwy_inactive_fill,
-    linecolor=color_rwy_inactive,
-    linewidth=rwy_width,
-    legendgroup='note',
-    legendgrouptitle_text = '<b>Note:</b>',
-    showlegend=True
-)
+    # Restricted/military runways double as the legend note
+    add_runways(fig, 'Red RWY: Restricted/Military', [(label, lats, lons) for label, lats, lons, active in runways if not active],
+                color_rwy_inactive_fill, color_rwy_inactive, rwy_width, 'note', legendgrouptitle_text='<b>Note:</b>')
 
 #endregion
 
 #region Add STARs and SIDs
-from aerodromes import STARs, SIDs, STAR_SID_waypoints, runway_procedures
-
-for rwy, procs in runway_procedures.items():
-    for proc_type, proc_dict in [("STARs", STARs), ("SIDs", SIDs)]:
-        for proc_name in procs[proc_type]:
-            if proc_name in proc_dict:
-                waypoints = proc_dict[proc_name]
-                coords = [STAR_SID_waypoints[wp] for wp in waypoints if wp in STAR_SID_waypoints]
-                if coords:
-                    lat_list, lon_list = parse_coordinates(coords)
+def build_procedures(fig):
+    """Adds one hidden trace per runway and STAR/SID, shown by update_map for the selected runways."""
+    for rwy, procs in aero.runway_procedures.items():
+        for proc_type, proc_dict in [("STARs", aero.STARs), ("SIDs", aero.SIDs)]:
+            for proc_name in procs[proc_type]:
+                # Procedures without any resolved fix are listed in procedures.problems()
+                if proc_name in proc_dict and proc_name not in procedures.empty:
+                    waypoints = procedures.fixes_of(proc_name)
+                    lat_list, lon_list = procedures.route(proc_name)
+                    along_track = procedures.along_track_nm(proc_name)
+                    # Each fix with the leg flown to it and the distance from the first fix
+                    hover_text = [waypoints[0]] + [f'{fix}<br>{total - previous:.1f} NM leg, {total:.1f} NM total'
+                                                   for fix, previous, total in zip(waypoints[1:], along_track, along_track[1:])]
                     fig.add_trace(go.Scattermap(
                         lat=lat_list,
                         lon=lon_list,
@@ -664,71 +747,137 @@ for rwy, procs in runway_procedures.items():
                                                             else '',
                         customdata=[rwy, proc_type],
                         hoverinfo='name+text',
-                        text=waypoints,
+                        text=hover_text,
                         line=dict(width=2, color= 'salmon' if proc_type == "STARs" else 'mediumseagreen')
                     ))
-#endregion
 
-# Add a version info trace to legend
-fig.add_trace(go.Scattermap(
-    lat=[None], lon=[None], mode='lines', line=dict(color='black', width=2),
-    name=f'🗺️ map version: {version}', showlegend=True, hoverinfo='skip', legendgroup='note', 
-))
+
+def procedure_tag(trace):
+    """Returns the (runway, 'STARs' or 'SIDs') tag update_map shows a procedure trace by, from its customdata."""
+    rwy, proc_type = trace['customdata']
+    return rwy, proc_type
+
+#endregion
 
 #region Waypoints
-from aerodromes import combined_waypoints
+def build_waypoints(fig):
+    """Adds the waypoints, one trace per category."""
+    entry_exit_wpts = ['KEXAS', 'PASPU', 'REMES', 'VAMPO']          # ENTRY AND EXIT GATES
+    holding_wpts = ['NYLON', 'KEXAS', 'REMES', 'BOBAG', 'VAMPO']    # Holding Fix - AIP SINGAPORE 20 FEB 2025
+    dme_wpts = ['BTM', 'PU', 'SJ', 'TPG', 'VJB', 'VMR', 'VTK']
+
+
+    # One trace per category, in the original colour precedence: holding/entry-exit first, then DME
+    holding_entry_exit = {}
+    dme = {}
+    normal = {}
+    for waypoint_name, waypoint_coordinates in aero.combined_waypoints.items():
+        if waypoint_name in entry_exit_wpts or waypoint_name in holding_wpts:
+            holding_entry_exit[waypoint_name] = waypoint_coordinates
+        elif waypoint_name in dme_wpts:
+            dme[waypoint_name] = waypoint_coordinates
+        else:
+            normal[waypoint_name] = waypoint_coordinates
+
+    add_waypoints(fig, 'Waypoints', normal, size=normal_waypoint_marker_size, legendgrouptitle_text='<b>Waypoints</b>')
+    add_waypoints(fig, 'Holding Fix / Entry-Exit Gate', holding_entry_exit, color='orangered', size=holding_dme_waypoint_marker_size)
+    add_waypoints(fig, 'DME', dme, color='orange', size=holding_dme_waypoint_marker_size)
 
-entry_exit_wpts = ['KEXAS', 'PASPU', 'REMES', 'VAMPO']          # ENTRY AND EXIT GATES
-holding_wpts = ['NYLON', 'KEXAS', 'REMES', 'BOBAG', 'VAMPO']    # Holding Fix - AIP SINGAPORE 20 FEB 2025
-dme_wpts = ['BTM', 'PU', 'SJ', 'TPG', 'VJB', 'VMR', 'VTK']
+#endregion
 
+#region Map and Dash layout
 
-for waypoint_name, waypoint_coordinates in combined_waypoints.items():
-    # Waypoints distinction
-    waypoint_marker_size = normal_waypoint_marker_size
-    if waypoint_name == 'ABVIP':    # Set legend title for first waypoint
-        add_waypoint(fig, waypoint_name, waypoint_coordinates, legendgrouptitle_text='<b>Waypoints</b>')
-        
-    elif waypoint_name in entry_exit_wpts or waypoint_name in holding_wpts:
-        # Highlight entry/exit gates and holding fix   
-        waypoint_marker_size = holding_dme_waypoint_marker_size
-        add_waypoint(fig, waypoint_name, waypoint_coordinates, color='orangered')
-        
-    elif waypoint_name in dme_wpts:
-        # Highlight DME waypoints
-        waypoint_marker_size = holding_dme_waypoint_marker_size
-        add_waypoint(fig, waypoint_name, waypoint_coordinates, color='orange')
-        
-    else:   # Normal waypoints
-        add_waypoint(fig, waypoint_name, waypoint_coordinates)
+def build_version_note(fig):
+    """Adds the map version entry to the legend."""
+    fig.add_trace(go.Scattermap(
+        lat=[None], lon=[None], mode='lines', line=dict(color='black', width=2),
+        name=f'🗺️ map version: {version}', showlegend=True, hoverinfo='skip', legendgroup='note', 
+    ))
 
-add_waypoint(fig, name= 'Red: Holding Fix',  color= 'orangered', coordinates= ('',''), legendgrouptitle_text='<b>Note:</b>')
-add_waypoint(fig, name= 'Orange: DME', color= 'orange', coordinates= ('',''))
 
-#endregion
+def radius_circle(radius_nm):
+    """Returns the lat, lon and name of the range ring: the point radius_nm from WSSS on each of 101 bearings (great circle)."""
+    bearings = [360 * i / 100 for i in range(101)]
+    lat_circ, lon_circ = destination(aero.WSSS_lat, aero.WSSS_lon, bearings, radius_nm)
+    return dict(lat=quantize(lat_circ, radius_circle_precision), lon=quantize(lon_circ, radius_circle_precision),
+                name=f'{radius_nm} NM Radius Circle')
+
+
+# Everything the built layers depend on; editing any of these rebuilds the cached layers. The compiled
+# dataset stands for aerodromes.py, which a deployment may leave out (see dataset_cache.py).
+figure_inputs = [__file__, 'airports.csv', DATASET_PATH] + [
+    sys.modules[name].__file__
+    for name in ('coordinates', 'dataset_cache', 'figure_cache', 'geodesy', 'geometry', 'hashing', 'layers', 'parallel_layers', 'payload', 'procedures')
+]
+
+# Layers by layer-toggle value, in trace order. PROCEDURE and NOTE have no toggle: update_map always needs them.
+layers = LayerRegistry(figure_inputs)
+layers.register('SECTOR', build_sectors, precision=layer_precision['SECTOR'])
+layers.register('FIR', build_firs, precision=layer_precision['FIR'], derive=fir_lod)
+layers.register('AERO', build_airports, precision=layer_precision['AERO'])
+layers.register('PROCEDURE', build_procedures, precision=layer_precision['PROCEDURE'], tag=procedure_tag)
+layers.register('NOTE', build_version_note, precision=layer_precision['NOTE'])
+layers.register('WAYPOINT', build_waypoints, precision=layer_precision['WAYPOINT'])
+
+default_layers = ['AERO', 'FIR']
+always_layers = ['PROCEDURE', 'NOTE']
 
-#region Map and Dash layout
 
-fig.update_layout(
-    map=dict(
-        style="carto-positron",
-        center=dict(lat=WSSS_lat + 0.5, lon=WSSS_lon),
-        zoom=6.5
-    ),
-    width=1700,
-    height=780,
-    margin={"r": 0, "t": 0, "l": 0, "b": 0},
-    legend=dict(
-        title='<b>Legend</b>',
-        x=1.0,
-        y=1.0,
-        bgcolor='white',
-        bordercolor='black',
-        borderwidth=0,
-        itemclick='toggle',
-        itemdoubleclick='toggleothers'
+def build_figure():
+    """
+    Builds the map figure from every layer built so far (hidden where update_map decides) and the layout.
+    The last trace is the radius circle: the one trace update_map redraws in place when the radius changes.
+    """
+    fig = go.Figure(data=layers.traces())
+    fig.add_trace(go.Scattermap(
+        **radius_circle(default_radius_nm),
+        mode='lines', line=dict(color='mediumblue', width=2), hoverinfo='name', hovertemplate='%{fullData.name}<extra></extra>',
+        showlegend=True, legendgroup='note'
+    ))
+    fig.update_layout(
+        map=dict(
+            style="carto-positron",
+            center=dict(lat=aero.WSSS_lat + 0.5, lon=aero.WSSS_lon),
+            zoom=map_zoom
+        ),
+        uirevision='map',   # keep the user's pan and zoom when callbacks patch the figure
+        width=1700,
+        height=780,
+        margin={"r": 0, "t": 0, "l": 0, "b": 0},
+        legend=dict(
+            title='<b>Legend</b>',
+            x=1.0,
+            y=1.0,
+            bgcolor='white',
+            bordercolor='black',
+            borderwidth=0,
+            itemclick='toggle',
+            itemdoubleclick='toggleothers'
+        )
     )
-)
+    return fig
+
+
+def map_index(keys, radius_nm):
+    """
+    Returns the compact index of a client's figure holding the given layers and range ring, shipped to the
+    browser in the map-index store: the layers held (keys), trace ranges per layer, procedure traces by
+    'runway|type', and the radius drawn in the circle trace (at index size; None while the ring is hidden).
+    """
+    return dict(keys=keys, radius=radius_nm, **layers.index(keys).compact(tag_layers=['PROCEDURE']))
+
+
+# Only the default layers are built at startup; the rest are built the first time update_map needs them
+layers.ensure(default_layers + always_layers, parallel=parallel_layer_build)
+# Shared by every session and never modified after startup: callbacks only return patches of each
+# client's own copy, computed from that client's stores
+base_figure = build_figure()
+initial_map_index = map_index(layers.built, default_radius_nm)
+initial_map_visible = dict(keys=layers.built, visible=sorted(layers.index().initially_visible))
+# The browser only gets the zoom thresholds of each FIR boundary trace; the vertices of other levels are sent
+# by update_fir_level once the zoom calls for them
+initial_fir_zooms = [dict(offset=trace['offset'], max_zoom=trace['max_zoom']) for trace in layers.derived('FIR')['traces']]
+initial_fir_level = [trace['level'] for trace in layers.derived('FIR')['traces']]
 
 label_style_rwy = {
     "fontFamily": "Open Sans, Verdana, Arial, sans-serif",
@@ -752,8 +901,8 @@ app.layout = html.Div([
         html.Div([
             dcc.Dropdown(
                 id='arrival-runway-select',
-                options=[{"label": rwy, "value": rwy} for rwy in runway_procedures.keys()],
-                value=list(runway_procedures.keys())[0],
+                options=[{"label": rwy, "value": rwy} for rwy in aero.runway_procedures.keys()],
+                value=list(aero.runway_procedures.keys())[0],
                 style={
                     "fontFamily": "Open Sans, Verdana, Arial, sans-serif",
                     "fontSize": "14px",
@@ -765,8 +914,8 @@ app.layout = html.Div([
             ),
             dcc.Dropdown(
                 id='departure-runway-select',
-                options=[{"label": rwy, "value": rwy} for rwy in runway_procedures.keys()],
-                value=list(runway_procedures.keys())[4],
+                options=[{"label": rwy, "value": rwy} for rwy in aero.runway_procedures.keys()],
+                value=list(aero.runway_procedures.keys())[4],
                 style={
                     "fontFamily": "Open Sans, Verdana, Arial, sans-serif",
                     "fontSize": "14px",
@@ -780,7 +929,7 @@ app.layout = html.Div([
             dcc.Input(
                 id='radius-nm',
                 type='number',
-                value=50,
+                value=default_radius_nm,
                 step=1,
                 style={
                     "fontFamily": "Open Sans, Verdana, Arial, sans-serif",
@@ -800,7 +949,7 @@ app.layout = html.Div([
                     {'label': 'Sectors', 'value': 'SECTOR'},
                     {'label': 'Waypoints', 'value': 'WAYPOINT'},
                 ],
-                value=['AERO', 'FIR'],
+                value=default_layers,
                 labelStyle={
                     "fontFamily": "Open Sans, Verdana, Arial, sans-serif",
                     "fontSize": "14px",
@@ -823,8 +972,18 @@ app.layout = html.Div([
     ], style={'padding': 2, 'width': '100%'}),
 
     html.Div([
-        dcc.Graph(id='map', figure=fig)
+        dcc.Graph(id='map', figure=base_figure)
     ], style={'width': '80%', 'display': 'inline-block'}),
+    # map-index: what the figure holds (set by update_map); map-visible: its visible traces (set in the browser);
+    # layer-request: selected layers the figure lacks, for update_map to insert
+    dcc.Store(id='map-index', data=initial_map_index),
+    dcc.Store(id='map-visible', data=initial_map_visible),
+    dcc.Store(id='layer-request'),
+    # fir-zoom: highest zoom of each LOD level per FIR boundary trace (see fir_lod); fir-level: level drawn of each
+    # boundary trace (set by update_fir_level); fir-level-request: levels the zoom calls for (set in the browser)
+    dcc.Store(id='fir-zoom', data=initial_fir_zooms),
+    dcc.Store(id='fir-level', data=initial_fir_level),
+    dcc.Store(id='fir-level-request', data=initial_fir_level),
 ])
 
 
@@ -832,57 +991,207 @@ app.layout = html.Div([
 #endregion
 
 # Callbacks
-@app.callback(
+
+# Layer toggles and runway selections are handled in the browser: visibility is decided from the map-index store,
+# and only the flags that flip are patched. Selected layers the figure does not hold yet go to update_map.
+# sessions.browser_visibility is its Python twin (test_sessions.py checks that both agree).
+visibility_js = """
+    function(arrival, departure, selectedLayers, mapIndex, mapVisible) {
+        const no_update = window.dash_clientside.no_update;
+        const selected = selectedLayers || [];
+        if (selected.some(key => !(key in mapIndex.layers))) {
+            return [no_update, no_update, selected];
+        }
+
+        const visible = new Set();
+        for (const key of selected.concat(['NOTE'])) {
+            const [start, stop] = mapIndex.layers[key];
+            for (let i = start; i < stop; i++) visible.add(i);
+        }
+        for (const tag of [arrival + '|STARs', departure + '|SIDs']) {
+            for (const i of mapIndex.tagged[tag] || []) visible.add(i);
+        }
+
+        // Inserted layers shift the indices of the old traces, so every flag is sent then
+        const patch = new window.dash_clientside.Patch();
+        const sameFigure = mapVisible.keys.join() === mapIndex.keys.join();
+        const shown = new Set(mapVisible.visible);
+        for (let i = 0; i < mapIndex.size; i++) {
+            if (!sameFigure || shown.has(i) !== visible.has(i)) patch.assign(['data', i, 'visible'], visible.has(i));
+        }
+        return [patch.build(), {keys: mapIndex.keys, visible: Array.from(visible)}, no_update];
+    }
+"""
+app.clientside_callback(
+    visibility_js,
     Output('map', 'figure'),
+    Output('map-visible', 'data'),
+    Output('layer-request', 'data'),
     Input('arrival-runway-select', 'value'),
     Input('departure-runway-select', 'value'),
     Input('layer-toggle', 'value'),
+    Input('map-index', 'data'),
+    State('map-visible', 'data'),
+)
+
+
+# FIR boundary detail follows the zoom: the browser picks, for each boundary trace, the coarsest LOD level that
+# stays within half a pixel at the new zoom, and asks update_fir_level for its vertices only when that level changes.
+app.clientside_callback(
+    """
+    function(relayoutData, firZoom, firLevelRequest) {
+        const zoom = relayoutData && relayoutData['map.zoom'];
+        if (zoom === undefined) {
+            return window.dash_clientside.no_update;
+        }
+        const levels = firZoom.map(trace => trace.max_zoom.reduce(
+            (coarsest, maxZoom, level) => (maxZoom === null || zoom <= maxZoom) ? level : coarsest, 0));
+        return levels.join() === firLevelRequest.join() ? window.dash_clientside.no_update : levels;
+    }
+    """,
+    Output('fir-level-request', 'data'),
+    Input('map', 'relayoutData'),
+    State('fir-zoom', 'data'),
+    State('fir-level-request', 'data'),
+    prevent_initial_call=True,
+)
+
+
+@app.callback(
+    Output('map', 'figure', allow_duplicate=True),
+    Output('fir-level', 'data'),
+    Input('fir-level-request', 'data'),
+    State('map-index', 'data'),
+    State('fir-level', 'data'),
+    prevent_initial_call=True,
+)
+def update_fir_level(requested_levels, map_index_data, fir_level):
+    """
+    Returns a Patch redrawing the FIR boundary traces whose requested LOD level differs from the one drawn,
+    and the levels now drawn. Patches only depend on where the FIR layer starts and the levels changed,
+    so fir_level_response serves them from its LRU cache.
+    """
+    if 'FIR' not in map_index_data['layers']:
+        return dash.no_update, dash.no_update
+    changes = tuple((j, level) for j, (level, drawn) in enumerate(zip(requested_levels, fir_level)) if level != drawn)
+    if not changes:
+        return dash.no_update, dash.no_update
+    return fir_level_response(map_index_data['layers']['FIR'][0], changes), requested_levels
+
+
+@functools.lru_cache(maxsize=response_cache_size)
+def fir_level_response(start, changes):
+    """
+    Builds the update_fir_level Patch as plain JSON data. Responses are shared between sessions through the LRU cache,
+    so callers must not modify them.
+
+    Parameters:
+    - start: Index of the first FIR layer trace in the client's figure
+    - changes: Tuple of (position in layers.derived('FIR')['traces'], level to draw)
+    """
+    lod = layers.derived('FIR')['traces']
+    patch = Patch()
+    for j, level in changes:
+        trace = lod[j]
+        i = start + trace['offset']
+        kept = trace['levels'][level]
+        lat = trace['lat'] if kept is None else [trace['lat'][k] for k in kept]
+        patch['data'][i]['lat'] = lat
+        patch['data'][i]['lon'] = trace['lon'] if kept is None else [trace['lon'][k] for k in kept]
+        if trace['names']:
+            # Batched traces name the FIR of every vertex; rings are separated by None
+            ring_names = iter(trace['names'])
+            name = next(ring_names)
+            customdata = []
+            for value in lat:
+                if value is None:
+                    name = next(ring_names)
+                customdata.append(None if value is None else name)
+            patch['data'][i]['customdata'] = customdata
+    return patch.to_plotly_json()
+
+
+@app.callback(
+    Output('map', 'figure', allow_duplicate=True),
+    Output('map-index', 'data'),
+    Input('layer-request', 'data'),
     Input('radius-nm', 'value'),
+    State('map-index', 'data'),
+    prevent_initial_call=True,
 )
 
 
-def update_map(selected_runway_arrival, selected_runway_departure, selected_layers, radius_nm):
+def update_map(requested_layers, radius_nm, map_index_data):
+    """
+    Returns a Patch of the client's figure and its new map-index: the traces of requested layers the
+    figure lacks, and the range ring when the radius changed (hidden while the radius is empty or negative).
+    The browser then sets the visibility.
+
+    Responses only depend on the normalized control state (layers and radius held, layers requested,
+    new radius), so map_response serves them from its LRU cache when another session already asked for them.
+    Nothing shared is modified (the layer registry and the cache only under their locks), so
+    concurrent sessions cannot see each other's selections.
+    """
+    if isinstance(radius_nm, float) and radius_nm.is_integer():
+        radius_nm = int(radius_nm)
+    held = [key for key in layers.builders if key in map_index_data['keys']]
+    requested = [key for key in layers.builders if key in (requested_layers or [])]
+    return map_response(tuple(held), map_index_data['radius'], tuple(requested), radius_nm)
 
-    # Toggle visibility based on selected layers and runways
-    
-    for i, trace in enumerate(fig.data):
-        trace_name = trace.name.lower()
-        is_sector = 'sector' in trace_name
-        is_fir = 'fir' in trace_name
-        
-        trace_data = trace.customdata if trace.customdata else [None, None]
-        trace_rwy = trace_data[0] if len(trace_data) > 0 else None
-        trace_type = trace_data[1] if len(trace_data) > 1 else None
-        
-        show = (
-            (trace_type == "STARs" and trace_rwy == selected_runway_arrival) or
-            (trace_type == "SIDs" and trace_rwy== selected_runway_departure) or
-            (trace_rwy == 'static' and 'AERO' in selected_layers) or
-            (trace_rwy in selected_layers) or
-            (trace_rwy == 'WAYPOINT' and 'WAYPOINT' in selected_layers) or
-            (is_sector and 'SECTOR' in selected_layers) or
-            (is_fir and 'FIR' in selected_layers) or
-            (trace.name == 'Radius Circle') or
-            '🗺️' in trace.name
-        )
-        fig.data[i].visible = show
 
+@functools.lru_cache(maxsize=response_cache_size)
+def map_response(held, held_radius_nm, requested_layers, radius_nm):
+    """
+    Builds the update_map response as plain JSON data (the Patch as its to_plotly_json() dict).
+    Responses are shared between sessions through the LRU cache, so callers must not modify them.
+
+    Parameters:
+    - held: Tuple of the layer keys the client's figure holds, in registration order
+    - held_radius_nm: Radius of the client's range ring (None while it is hidden)
+    - requested_layers: Tuple of the requested layer keys
+    - radius_nm: New radius (None, or negative, hides the ring)
+    """
+    patch = Patch()
+
+    # Build layers on first use and insert the ones this figure lacks at their registration-order position
+    wanted = set(requested_layers) | set(always_layers) | set(held)
+    layers.ensure(wanted)     # another worker process may have served this figure
+    keys = [key for key in layers.builders if key in wanted]
+    position = 0
+    for key in keys:
+        traces = layers.traces([key])
+        if key not in held:
+            for offset, trace in enumerate(traces):
+                patch['data'].insert(position + offset, trace)
+        position += len(traces)
+
+    # An empty or negative radius hides the ring until the next valid one
     try:
-        if radius_nm >= 0:
-            radius_deg = radius_nm / 60
-            theta = [2 * math.pi * i / 100 for i in range(101)]
-            lat_circ = [WSSS_lat + radius_deg * math.sin(t) for t in theta]
-            lon_circ = [WSSS_lon + radius_deg * math.cos(t) for t in theta]
-            fig.data = [t for t in fig.data if t.name != 'Radius Circle']
-            fig.add_trace(go.Scattermap(
-                lat=lat_circ, lon=lon_circ,
-                mode='lines', line=dict(color='mediumblue', width=2), hoverinfo='name', hovertemplate='%{fullData.name}<extra></extra>',
-                name=f'{radius_nm} NM Radius Circle', showlegend=True, legendgroup='note'
-            ))
+        radius = radius_nm if radius_nm >= 0 else None
     except TypeError:
-        pass
-    
-    return fig
+        radius = None
+    if radius != held_radius_nm:
+        # The circle is the reserved trace after the layers; its coordinates and name are replaced
+        circle = patch['data'][position]
+        if radius is None:
+            circle['visible'] = False
+        else:
+            for prop, value in radius_circle(radius).items():
+                circle[prop] = value
+            if held_radius_nm is None:
+                circle['visible'] = True
+
+    if tuple(keys) == held and radius == held_radius_nm:
+        return dash.no_update, dash.no_update
+    return patch.to_plotly_json(), map_index(keys, radius)
+
+
+# Hit rate of the update_map response cache, as JSON
+@app.server.route('/response-cache')
+def response_cache_stats():
+    info = map_response.cache_info()
+    requests = info.hits + info.misses
+    return dict(info._asdict(), hit_rate=info.hits / requests if requests else 0.0)
 
 if __name__ == '__main__':
     app.run(debug=True)  # Set to True for development
@@ -0,0 +1,186 @@
+"""
+Batch point-in-airspace classification for the FIR and SG FIR sector polygons.
+
+Each polygon is preprocessed once into
+- a bounding box, used to reject points early, and
+- latitude bands: the polygon's lat range is cut into equal-height bands and every edge is listed
+  under the bands it spans, padded into (band, edge) arrays.
+
+A point then only ray-casts against the few edges of its own band, and all points are tested
+together one edge slot at a time in NumPy. The test is planar in lat/lon, matching how the outlines are drawn.
+
+Rings are normalized first (geometry.normalize_ring). A ring left open there (PP_FIR_coordinates,
+whose last vertex is ~223 NM from its first) has no defined inside, so it is left out of the
+classifier with a warning rather than closed by a made-up straight edge.
+"""
+
+import warnings
+
+import numpy as np
+
+from coordinates import LatLon, geometry_cache
+from geometry import normalize_ring
+
+
+# Name shown on the map -> aerodromes dataset, in classification priority order
+FIR_DATASETS = {
+    'SINGAPORE FIR': 'SG_FIR_coordinates',
+    'KUALA LUMPUR FIR': 'KL_FIR_coordinates',
+    'BANGKOK FIR': 'BKK_FIR_coordinates',
+    'PHNOM PENH FIR': 'PP_FIR_coordinates',
+    'HO CHI MINH FIR': 'HCM_FIR_coordinates',
+    'KOTA KINABALU FIR': 'KOTA_KINABALU_FIR_coordinates',
+    'UJUNG PANDANG FIR': 'UJUNG_PANDANG_FIR',
+    'JAKARTA FIR': 'JKT_FIR_coordinates',
+}
+
+SECTOR_DATASETS = {f'Sector {i}': f'SG_FIR_sector{i}_coordinates' for i in range(1, 9)}
+
+
+class _Polygon:
+    def __init__(self, lat, lon, max_bands=4096):
+        lat = np.asarray(lat, dtype=float)
+        lon = np.asarray(lon, dtype=float)
+        if lat[0] != lat[-1] or lon[0] != lon[-1]:
+            raise ValueError('Polygon ring is not closed')
+
+        self.lat_min, self.lat_max = lat.min(), lat.max()
+        self.lon_min, self.lon_max = lon.min(), lon.max()
+
+        y0, x0, y1, x1 = lat[:-1], lon[:-1], lat[1:], lon[1:]
+        n_bands = int(np.clip(len(y0), 1, max_bands))
+        self.band_height = (self.lat_max - self.lat_min) / n_bands or 1.0
+
+        # Band range spanned by each edge
+        first = np.clip(((np.minimum(y0, y1) - self.lat_min) / self.band_height).astype(int), 0, n_bands - 1)
+        last = np.clip(((np.maximum(y0, y1) - self.lat_min) / self.band_height).astype(int), 0, n_bands - 1)
+        span = last - first + 1
+        band_of = np.repeat(first, span) + (np.arange(span.sum()) - np.repeat(np.cumsum(span) - span, span))
+        edge_of = np.repeat(np.arange(len(y0)), span)
+
+        # Pad per-band edge lists into (band, slot) arrays; counts[band] slots are filled
+        order = np.argsort(band_of, kind='stable')
+        band_of, edge_of = band_of[order], edge_of[order]
+        counts = np.bincount(band_of, minlength=n_bands)
+        slot = np.arange(len(band_of)) - np.repeat(np.cumsum(counts) - counts, counts)
+        shape = (n_bands, max(counts.max(), 1))
+        self.y0, self.x0, self.y1, self.x1 = (np.full(shape, np.nan) for _ in range(4))
+        self.y0[band_of, slot], self.x0[band_of, slot] = y0[edge_of], x0[edge_of]
+        self.y1[band_of, slot], self.x1[band_of, slot] = y1[edge_of], x1[edge_of]
+        self.counts = counts
+        self.n_bands = n_bands
+
+    def contains(self, lat, lon):
+        inside = np.zeros(len(lat), dtype=bool)
+        idx = np.flatnonzero(
+            (lat >= self.lat_min) & (lat <= self.lat_max) & (lon >= self.lon_min) & (lon <= self.lon_max)
+        )
+        band = np.clip(((lat[idx] - self.lat_min) / self.band_height).astype(int), 0, self.n_bands - 1)
+        n_edges = self.counts[band]
+
+        # Even-odd ray casting towards +lon, one edge slot at a time. Points drop out once their
+        # band has no more edges, so the work is proportional to the edges actually in each band.
+        active = np.arange(len(idx))
+        for slot in range(self.y0.shape[1]):
+            active = active[n_edges[active] > slot]
+            if not len(active):
+                break
+            y, x = lat[idx[active]], lon[idx[active]]
+            b = band[active]
+            y0, x0, y1, x1 = self.y0[b, slot], self.x0[b, slot], self.y1[b, slot], self.x1[b, slot]
+            with np.errstate(divide='ignore', invalid='ignore'):    # horizontal edges never straddle
+                crosses = ((y0 > y) != (y1 > y)) & (x < (x1 - x0) * (y - y0) / (y1 - y0) + x0)
+            inside[idx[active[crosses]]] ^= True
+        return inside
+
+
+class AirspaceClassifier:
+    """
+    Classifies batches of positions against a set of airspace polygons.
+
+    Parameters:
+    - polygons: Mapping of airspace name to coordinates (LatLon or (lat_list, lon_list)),
+      in priority order: where polygons overlap, classify() reports the first match.
+      Rings normalize_ring leaves open are skipped with a warning and listed in open_rings (name -> gap in NM)
+    """
+
+    def __init__(self, polygons):
+        self.names = []
+        self.open_rings = {}
+        self._polygons = []
+        for name, (lat, lon) in polygons.items():
+            ring, report = normalize_ring(lat, lon)
+            if 'open_gap_nm' in report:
+                self.open_rings[name] = report['open_gap_nm']
+                warnings.warn(f"{name} is not a closed ring ({report['open_gap_nm']} NM gap); it is not classified",
+                              stacklevel=2)
+                continue
+            self.names.append(name)
+            self._polygons.append(_Polygon(ring.lat, ring.lon))
+
+    def membership(self, lat, lon):
+        """Returns a (n_polygons, n_points) boolean matrix of point-in-polygon results."""
+        lat = np.asarray(lat, dtype=float)
+        lon = np.asarray(lon, dtype=float)
+        return np.array([polygon.contains(lat, lon) for polygon in self._polygons]).reshape(len(self.names), len(lat))
+
+    def contains(self, name, lat, lon):
+        """Returns a boolean array: which points fall inside the named airspace."""
+        polygon = self._polygons[self.names.index(name)]
+        return polygon.contains(np.asarray(lat, dtype=float), np.asarray(lon, dtype=float))
+
+    def classify(self, lat, lon):
+        """Returns the index into self.names of the first airspace containing each point, or -1."""
+        lat = np.asarray(lat, dtype=float)
+        lon = np.asarray(lon, dtype=float)
+        result = np.full(len(lat), -1)
+        remaining = np.arange(len(lat))
+        for i, polygon in enumerate(self._polygons):
+            if not len(remaining):
+                break
+            inside = polygon.contains(lat[remaining], lon[remaining])
+            result[remaining[inside]] = i
+            remaining = remaining[~inside]
+        return result
+
+    def labels(self, lat, lon, outside=None):
+        """Returns the airspace name for each point (outside for points in none of them)."""
+        names = np.array(self.names + [outside], dtype=object)
+        return names[self.classify(lat, lon)]
+
+    @classmethod
+    def from_dataset(cls, dataset, datasets):
+        """
+        Builds a classifier from aerodromes coordinate lists.
+
+        Parameters:
+        - dataset: aerodromes datasets (dataset_cache.CompiledDataset or the aerodromes module)
+        - datasets: Mapping of airspace name to dataset name, e.g. FIR_DATASETS or SECTOR_DATASETS
+        """
+        polygons = {}
+        for name, dataset_name in datasets.items():
+            coordinates = getattr(dataset, dataset_name)
+            polygons[name] = coordinates if isinstance(coordinates, LatLon) else geometry_cache.coordinates(coordinates)
+        return cls(polygons)
+
+
+if __name__ == '__main__':
+    # python airspace.py -> classification throughput on random positions around the SG FIR
+    import time
+    from dataset_cache import load_dataset
+
+    aero = load_dataset()
+    firs = AirspaceClassifier.from_dataset(aero, FIR_DATASETS)
+    sectors = AirspaceClassifier.from_dataset(aero, SECTOR_DATASETS)
+
+    rng = np.random.default_rng(0)
+    n = 1_000_000
+    lat = rng.uniform(-6, 16, n)
+    lon = rng.uniform(94, 120, n)
+
+    for label, classifier in [('FIR', firs), ('sector', sectors)]:
+        start = time.perf_counter()
+        result = classifier.classify(lat, lon)
+        elapsed = time.perf_counter() - start
+        counts = {name: int((result == i).sum()) for i, name in enumerate(classifier.names)}
+        print(f'{label:6s}: {n / elapsed / 1e6:5.2f} M points/s ({elapsed * 1e3:.0f} ms) {counts}')
@@ -0,0 +1,268 @@
+"""
+Coordinate parsing engine shared by aerodromes.py and the Dash app.
+
+Coordinates in aerodromes.py are DMS strings: 'DDMMSSN' latitudes and 'DDDMMSSE' longitudes.
+A few sector vertices carry irregular 6-digit longitudes (e.g. '103523E'); these are read
+field by field exactly like the original string-slicing parser, so '103523E' is 103 deg 52 min 3 sec.
+"""
+
+import threading
+from typing import NamedTuple
+from collections import OrderedDict
+
+import numpy as np
+
+
+class LatLon(NamedTuple):
+    """Parsed geometry: parallel arrays of decimal latitudes and longitudes."""
+    lat: np.ndarray
+    lon: np.ndarray
+
+
+def _dms_fields(strings, deg_digits):
+    """
+    Splits an array of DMS strings into integer degree/minute/second fields and a sign.
+
+    Each field is the integer value of the string slice the scalar parser used
+    (clean[:deg], clean[deg:deg+2], clean[deg+2:deg+4] with clean = s[:-1]), so short
+    strings yield truncated fields rather than errors.
+    """
+    raw = np.array(strings, dtype='S')
+    lengths = np.char.str_len(raw)
+    chars = raw.view(np.uint8).reshape(len(raw), -1)
+    digits = chars.astype(np.int64) - ord('0')
+    clean_lengths = lengths - 1
+
+    def field(start, stop):
+        value = np.zeros(len(raw), dtype=np.int64)
+        for j in range(start, min(stop, digits.shape[1])):
+            present = clean_lengths > j
+            value = np.where(present, value * 10 + digits[:, j], value)
+        return value
+
+    deg = field(0, deg_digits)
+    minutes = field(deg_digits, deg_digits + 2)
+    seconds = field(deg_digits + 2, deg_digits + 4)
+
+    hemisphere = chars[np.arange(len(raw)), lengths - 1]
+    negative = (hemisphere == ord('S')) | (hemisphere == ord('W'))
+    return deg, minutes, seconds, negative
+
+
+def _to_decimal(deg, minutes, seconds, negative):
+    """
+    Whole-second DMS fields to decimal degrees rounded to 6 decimal places.
+
+    Works in integer seconds: x = T / 3600 is never exactly halfway between two
+    6-decimal values (T * 2500 / 9 has no .5 fraction), so rounding the exact
+    rational matches Python's round(deg + min / 60 + sec / 3600, 6) bit for bit.
+    """
+    total_seconds = deg * 3600 + minutes * 60 + seconds
+    micro_degrees = (total_seconds * 5000 + 9) // 18
+    decimal = micro_degrees / 1e6
+    return np.where(negative, -decimal, decimal)
+
+
+def parse_coordinates_array(coordinates):
+    """
+    Converts a whole list of DMS coordinate pairs to decimal degrees in one pass.
+
+    Parameters:
+    - coordinates: List (or any iterable) of (lat_dms, lon_dms) tuples (e.g., '013112N', '1035936E')
+
+    Returns:
+    - LatLon of float64 arrays, rounded to 6 decimal places
+    """
+    coordinates = list(coordinates)
+    if not coordinates:
+        return LatLon(np.empty(0), np.empty(0))
+
+    lat_strings, lon_strings = zip(*coordinates)
+    lat = _to_decimal(*_dms_fields(lat_strings, deg_digits=2))
+    lon = _to_decimal(*_dms_fields(lon_strings, deg_digits=3))
+    return LatLon(lat, lon)
+
+
+def _dms_fields_of(values):
+    # Same float steps as the scalar DMS formatting the app used before format_dms, so the strings are unchanged:
+    # seconds rounded, then 60 s / 60 min rolled over.
+    # Returns DDMMSS (or DDDMMSS) packed into one integer per value, and whether the value is negative.
+    values = np.asarray(values, dtype=float)
+    negative = values < 0
+    values = np.abs(values)
+    deg = np.trunc(values)
+    minutes_float = (values - deg) * 60
+    minutes = np.trunc(minutes_float)
+    seconds = np.round((minutes_float - minutes) * 60)
+
+    # Correct rollover
+    rollover = seconds == 60
+    seconds[rollover] = 0
+    minutes[rollover] += 1
+    rollover = minutes == 60
+    minutes[rollover] = 0
+    deg[rollover] += 1
+    return (deg * 10000 + minutes * 100 + seconds).astype(np.int64), negative
+
+
+def format_dms(lat, lon):
+    """
+    Formats whole arrays of decimal degrees as DMS strings, with the arithmetic done in one NumPy pass.
+
+    Parameters:
+    - lat, lon: Decimal degrees
+
+    Returns:
+    - List of '(DDMMSSN, DDDMMSSE)' strings, one per point
+    """
+    lat_dms, south = _dms_fields_of(lat)
+    lon_dms, west = _dms_fields_of(lon)
+    return [f"({la:06d}{'S' if s else 'N'}, {lo:06d}{'W' if w else 'E'})"
+            for la, s, lo, w in zip(lat_dms.tolist(), south.tolist(), lon_dms.tolist(), west.tolist())]
+
+
+def _read_only(lat, lon):
+    # Cached arrays are shared between callers, so keep them read-only
+    lat = np.asarray(lat, dtype=float)
+    lon = np.asarray(lon, dtype=float)
+    lat.setflags(write=False)
+    lon.setflags(write=False)
+    return LatLon(lat, lon)
+
+
+class GeometryCache:
+    """
+    Process-wide bounded LRU cache of parsed geometry, shared by every layer builder.
+
+    Coordinate lists are keyed by their tuple of coordinate pairs and single waypoints by
+    their coordinate pair, so a waypoint shared by many STARs/SIDs is parsed once.
+    Coordinates may be DMS strings ('013112N', '1035936E') or decimal degrees.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, build):
+        """Returns the cached value for key, calling build() to create it on a miss."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        value = build()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def coordinates(self, coordinates):
+        """
+        Returns the LatLon of a coordinate list.
+
+        Parameters:
+        - coordinates: List of (lat, lon) pairs, in DMS strings or decimal degrees
+        """
+        key = tuple(coordinates)
+
+        def build():
+            if key and isinstance(key[0][0], str):
+                return _read_only(*parse_coordinates_array(key))
+            return _read_only([c[0] for c in key], [c[1] for c in key])
+
+        return self.get(('coordinates', key), build)
+
+    def point(self, coordinate):
+        """Returns (lat, lon) in decimal degrees for a single coordinate pair."""
+        def build():
+            if isinstance(coordinate[0], str):
+                lat, lon = parse_coordinates_array([coordinate])
+                return float(lat[0]), float(lon[0])
+            return float(coordinate[0]), float(coordinate[1])
+
+        return self.get(('point', tuple(coordinate)), build)
+
+    def stats(self):
+        """Returns hit/miss counters and the current size of the cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+geometry_cache = GeometryCache()
+
+
+def parse_coordinates(coordinates):
+    """
+    Converts DMS coordinates to decimal degrees (seconds included, 6 decimal places).
+    Results are held in the shared geometry_cache, so repeated layers and rebuilds parse each list once.
+
+    Parameters:
+    - coordinates: List of (lat_dms, lon_dms) tuples (e.g., '013112N', '1035936E')
+
+    Returns:
+    - LatLon of read-only float64 arrays; unpacks as latitudes, longitudes
+    """
+    return geometry_cache.coordinates(coordinates)
+
+
+def _parse_coordinates_scalar(coordinates):
+    # Per-tuple reference parser (the implementation parse_coordinates replaced), kept for the benchmark
+    latitudes, longitudes = [], []
+    for lat_str, lon_str in coordinates:
+        lat_str_clean = lat_str[:-1]
+        lon_str_clean = lon_str[:-1]
+        lat = int(lat_str_clean[:2]) + int(lat_str_clean[2:4]) / 60 + int(lat_str_clean[4:6]) / 3600
+        lon = int(lon_str_clean[:3]) + int(lon_str_clean[3:5]) / 60 + int(lon_str_clean[5:7]) / 3600
+        if lat_str.endswith('S'):
+            lat *= -1
+        if lon_str.endswith('W'):
+            lon *= -1
+        latitudes.append(round(lat, 6))
+        longitudes.append(round(lon, 6))
+    return latitudes, longitudes
+
+
+if __name__ == '__main__':
+    # python coordinates.py -> parity check and benchmark against the per-tuple parser
+    import timeit
+    import aerodromes
+
+    values = {name: getattr(aerodromes, name) for name in dir(aerodromes) if not name.startswith('_')}
+    datasets = {name: value for name, value in values.items()
+                if isinstance(value, list) and value and isinstance(value[0], tuple) and isinstance(value[0][0], str)}
+    total = sum(len(v) for v in datasets.values())
+
+    for name, value in datasets.items():
+        reference = _parse_coordinates_scalar(value)
+        parsed = parse_coordinates_array(value)
+        assert reference == (parsed.lat.tolist(), parsed.lon.tolist()), name
+
+    runs = 20
+    scalar = timeit.timeit(lambda: [_parse_coordinates_scalar(v) for v in datasets.values()], number=runs) / runs
+    vectorized = timeit.timeit(lambda: [parse_coordinates_array(v) for v in datasets.values()], number=runs) / runs
+    cached = timeit.timeit(lambda: [parse_coordinates(v) for v in datasets.values()], number=runs) / runs
+
+    print(f'{len(datasets)} coordinate lists, {total} vertices (identical output)')
+    print(f'per-tuple parser   : {scalar * 1e3:7.2f} ms')
+    print(f'vectorized parser  : {vectorized * 1e3:7.2f} ms')
+    print(f'parse_coordinates  : {cached * 1e3:7.2f} ms (cached)')
+    print(f'geometry_cache     : {geometry_cache.stats()}')
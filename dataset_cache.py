@@ -0,0 +1,316 @@
+"""
+Compiled columnar cache for the aerodromes.py datasets.
+
+aerodromes.py is a large module of DMS string literals that has to be executed and
+re-parsed on every start of the map. build_cache() compiles every coordinate list,
+waypoint dict, runway polygon and procedure table into a single binary file:
+
+    magic (8 bytes) | header length (uint64) | JSON header | padding | lat float64[n] | lon float64[n]
+
+All vertices live in two contiguous float64 columns. The JSON header holds the
+hash of its inputs, the offset table of every dataset into the columns and the
+non-numeric tables (STARs, SIDs, runway_procedures, ...). The inputs are aerodromes.py
+and the code that compiles it (this module, coordinates.py and geometry.py), so a
+change to the parser or ring normalization makes the cache stale as well.
+
+The columns are memory-mapped on load: warm starts only hash the input files, without
+importing or executing aerodromes.py. A deployment that ships aerodromes.bin without
+aerodromes.py uses the cache as it is.
+"""
+
+import os
+import json
+import types
+import struct
+import importlib
+
+import numpy as np
+
+import coordinates
+import geometry
+from coordinates import LatLon, parse_coordinates_array
+from hashing import inputs_hash
+from geometry import normalize_ring
+
+
+MAGIC = b'SGAIRNAV'
+FORMAT_VERSION = 2
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SOURCE_PATH = os.path.join(HERE, 'aerodromes.py')
+CACHE_PATH = os.path.join(HERE, 'aerodromes.bin')
+
+# Code whose output is stored in the cache, hashed together with the dataset source
+COMPILER_PATHS = [os.path.abspath(__file__), coordinates.__file__, geometry.__file__]
+
+
+#region Compilation
+
+def _is_dms_pair(value):
+    return isinstance(value, tuple) and len(value) == 2 and all(isinstance(v, str) for v in value)
+
+
+def _is_blank_pair(value):
+    # ('', ''): a placeholder with no position (the map used to draw such entries as legend-only markers)
+    return value == ('', '')
+
+
+def _is_float_pair(value):
+    return isinstance(value, tuple) and len(value) == 2 and all(isinstance(v, (int, float)) for v in value)
+
+
+def _is_float_list(value):
+    return isinstance(value, list) and value and all(isinstance(v, (int, float)) for v in value)
+
+
+def source_hash(source_path=SOURCE_PATH):
+    """Returns the sha256 hex digest of the dataset source file and the compiler code (see hashing.inputs_hash)."""
+    return inputs_hash([source_path] + COMPILER_PATHS)
+
+
+def compile_module(module, digest):
+    """
+    Compiles the public datasets of a module into the cache file format.
+
+    Parameters:
+    - module: the imported aerodromes module (or any module with the same kind of data)
+    - digest: source_hash() written into the header
+
+    Returns:
+    - bytes of the compiled cache file
+    """
+    lat_column, lon_column = [], []
+    entries, tables, normalization = {}, {}, {}
+
+    def append(name, kind, lats, lons, **extra):
+        start = len(lat_column)
+        lat_column.extend(lats)
+        lon_column.extend(lons)
+        entries[name] = dict(kind=kind, start=start, stop=len(lat_column), **extra)
+
+    # dir() + getattr() so lazily built datasets (module __getattr__) are materialised too
+    values = {k: getattr(module, k) for k in dir(module) if not k.startswith('_')}
+    values = {k: v for k, v in values.items() if not isinstance(v, (types.FunctionType, types.ModuleType, type))}
+
+    for name, value in values.items():
+        if name in entries or name in tables:
+            continue
+
+        # Coordinate lists: [('012133N', '1035922E'), ...], normalized into minimal closed rings
+        if isinstance(value, list) and value and all(_is_dms_pair(v) for v in value):
+            # Blank pairs have no position and are left out; source_index still counts them
+            positions = [i for i, v in enumerate(value) if not _is_blank_pair(v)]
+            ring, report = normalize_ring(*parse_coordinates_array([value[i] for i in positions]))
+            if len(positions) < len(value):
+                report['source_index'] = [positions[i] for i in report.get('source_index', range(len(ring.lat)))]
+            append(name, 'coordinates', *ring)
+            if len(positions) >= 3:
+                normalization[name] = report
+
+        # Runway polygons: [(1.34886, 103.97769), ...]
+        elif isinstance(value, list) and value and all(_is_float_pair(v) for v in value):
+            append(name, 'polygon', [v[0] for v in value], [v[1] for v in value])
+
+        # Waypoint dicts: {'ABVIP': ('010008N', '1035032E'), ...}; blank entries have no position and are left out
+        elif isinstance(value, dict) and value and all(_is_dms_pair(v) for v in value.values()):
+            value = {wp: v for wp, v in value.items() if not _is_blank_pair(v)}
+            append(name, 'waypoints', *parse_coordinates_array(value.values()), names=list(value))
+
+        # Split lat/lon pairs: lat_list_X/lon_list_X and X_lat/X_lon
+        elif 'lat' in name and (_is_float_list(value) or isinstance(value, float)):
+            lon_name = name.replace('lat', 'lon')
+            lon_value = values.get(lon_name)
+            if lon_value is None:
+                tables[name] = value
+                continue
+            scalar = isinstance(value, float)
+            lats = [value] if scalar else value
+            lons = [lon_value] if scalar else lon_value
+            append(name, 'split', lats, lons, lon_name=lon_name, scalar=scalar)
+            entries[lon_name] = dict(kind='alias', target=name)
+            tables.pop(lon_name, None)
+
+        # Everything else (procedure tables, runway mappings, holding lists) goes in the header
+        else:
+            try:
+                json.dumps(value)
+            except TypeError:
+                continue
+            tables[name] = value
+
+    header = json.dumps({
+        'version': FORMAT_VERSION,
+        'source_hash': digest,
+        'size': len(lat_column),
+        'entries': entries,
+        'tables': tables,
+        'normalization': normalization,
+    }).encode()
+
+    prefix = MAGIC + struct.pack('<Q', len(header)) + header
+    prefix += b'\0' * (-len(prefix) % 8)
+    columns = np.asarray(lat_column, dtype='<f8').tobytes() + np.asarray(lon_column, dtype='<f8').tobytes()
+    return prefix + columns
+
+
+def build_cache(source_path=SOURCE_PATH, cache_path=CACHE_PATH):
+    """
+    Imports aerodromes.py, compiles it and writes the cache file next to it.
+
+    Returns:
+    - bytes of the compiled cache file
+    """
+    digest = source_hash(source_path)
+    module_name = os.path.splitext(os.path.basename(source_path))[0]
+    module = importlib.import_module(module_name)
+    data = compile_module(module, digest)
+
+    # Write to a temp file first so concurrent workers never map a half-written cache
+    tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return data
+
+#endregion
+
+#region Loading
+
+class CompiledDataset:
+    """
+    Read-only view over a compiled cache. Datasets are accessed by their aerodromes.py name,
+    either as attributes (dataset.BKK_FIR_coordinates) or items (dataset['STARs']).
+
+    - coordinate lists and runway polygons -> LatLon of float64 arrays
+      (coordinate lists are normalized rings; see the normalization report per dataset)
+    - waypoint dicts -> {name: (lat, lon)}
+    - lat_list_X / lon_list_X -> float64 arrays, X_lat / X_lon -> floats
+    - everything else -> the original JSON value
+    """
+
+    def __init__(self, buffer):
+        if bytes(buffer[:8]) != MAGIC:
+            raise ValueError('Not an sg-airnav dataset cache')
+        (header_len,) = struct.unpack('<Q', bytes(buffer[8:16]))
+        header = json.loads(bytes(buffer[16:16 + header_len]))
+        if header['version'] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported cache version {header['version']}")
+
+        data_start = 16 + header_len
+        data_start += -data_start % 8
+        size = header['size']
+        columns = np.frombuffer(buffer, dtype='<f8', count=2 * size, offset=data_start)
+
+        self.source_hash = header['source_hash']
+        self.lat = columns[:size]
+        self.lon = columns[size:]
+        self._entries = header['entries']
+        self._tables = header['tables']
+        self.normalization = header['normalization']
+        self._values = {}
+
+    def __contains__(self, name):
+        return name in self._entries or name in self._tables
+
+    def __iter__(self):
+        yield from self._entries
+        yield from self._tables
+
+    def __dir__(self):
+        return list(self)
+
+    def __getitem__(self, name):
+        if name not in self._values:
+            self._values[name] = self._materialize(name)
+        return self._values[name]
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(f"Dataset has no attribute '{name}'") from None
+
+    def source_index(self, name):
+        """
+        Returns the position in aerodromes.py of each vertex of a coordinate list, as normalized
+        (vertices are dropped, repeated or reversed by normalization; see geometry.normalize_ring).
+        """
+        report = self.normalization.get(name, {})
+        if 'source_index' in report:
+            return report['source_index']
+        return list(range(len(self[name].lat)))
+
+    def _materialize(self, name):
+        if name in self._tables:
+            return self._tables[name]
+
+        entry = self._entries[name]
+        kind = entry['kind']
+        if kind == 'alias':
+            target = self._entries[entry['target']]
+            lon = self.lon[target['start']:target['stop']]
+            return float(lon[0]) if target['scalar'] else lon
+
+        lat = self.lat[entry['start']:entry['stop']]
+        lon = self.lon[entry['start']:entry['stop']]
+        if kind in ('coordinates', 'polygon'):
+            return LatLon(lat, lon)
+        if kind == 'waypoints':
+            return {wp: (float(la), float(lo)) for wp, la, lo in zip(entry['names'], lat, lon)}
+        if kind == 'split':
+            return float(lat[0]) if entry['scalar'] else lat
+        raise ValueError(f'Unknown dataset kind {kind!r}')
+
+
+def load_cache(cache_path=CACHE_PATH, source_path=SOURCE_PATH):
+    """
+    Memory-maps the cache file.
+
+    Returns:
+    - CompiledDataset, or None if the cache is missing, unreadable or stale.
+      Without the source file, there is nothing to rebuild from and the cache is used as it is.
+    """
+    try:
+        buffer = np.memmap(cache_path, dtype=np.uint8, mode='r')
+        dataset = CompiledDataset(buffer)
+    except (OSError, ValueError, KeyError):
+        return None
+    if not os.path.exists(source_path):
+        return dataset
+    try:
+        if dataset.source_hash != source_hash(source_path):
+            return None
+    except OSError:
+        return None
+    return dataset
+
+
+def load_dataset(cache_path=CACHE_PATH, source_path=SOURCE_PATH):
+    """
+    Returns the compiled aerodromes dataset, rebuilding the cache from aerodromes.py
+    only when it is missing or stale.
+    """
+    dataset = load_cache(cache_path, source_path)
+    if dataset is None:
+        dataset = CompiledDataset(build_cache(source_path, cache_path))
+    return dataset
+
+#endregion
+
+
+if __name__ == '__main__':
+    # python dataset_cache.py -> (re)build the cache ahead of deployment
+    data = build_cache()
+    print(f'Wrote {CACHE_PATH} ({len(data) / 1024:.1f} KiB)')
+    for name, report in CompiledDataset(data).normalization.items():
+        changes = [f"{report['duplicates_removed']} duplicate(s) removed"] if report['duplicates_removed'] else []
+        changes += ['closed'] * report['closed'] + ['winding reversed'] * report['reversed']
+        if 'open_gap_nm' in report:
+            changes.append(f"left open ({report['open_gap_nm']} NM gap)")
+        print(f"  {name:38s} {', '.join(changes) or 'unchanged'}")
@@ -0,0 +1,81 @@
+"""
+On-disk cache of the built map layers, one file per layer.
+
+Building a layer runs its builder (sectors, FIRs, airports, procedures, waypoints) on each worker
+start. LayerRegistry writes every built layer once as Plotly JSON to figure_cache.<KEY>.json (e.g.
+figure_cache.FIR.json), prefixed with a header line holding the hash of every input the layers are
+built from (hashing.inputs_hash), and followed by the JSON of the data derived from the layer, if any
+(see LayerRegistry.register(derive=)):
+
+    {"version": 2, "plotly": "<plotly version>", "key": "<sha256>"}\n<figure JSON of the layer's traces>\n<derived JSON>
+
+Warm starts read the traces back without calling the builder. Any change to the datasets,
+airports.csv or the builder code changes the key, and the layers are rebuilt and rewritten.
+"""
+
+import os
+import json
+
+import plotly
+
+
+FORMAT_VERSION = 2
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+# {} is replaced by the layer key
+CACHE_PATH = os.path.join(HERE, 'figure_cache.{}.json')
+
+
+def _header(key):
+    # The plotly version is part of the header: figure JSON is only read back by the version that wrote it
+    return {'version': FORMAT_VERSION, 'plotly': plotly.__version__, 'key': key}
+
+
+def _read_cached(key, cache_path):
+    # Text after the header if the cache file was written for key, otherwise None
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            if json.loads(f.readline()) != _header(key):
+                return None
+            return f.read()
+    except (OSError, ValueError):
+        return None
+
+
+def load_cached_layer(key, cache_path):
+    """
+    Returns the traces cached in cache_path as plain dicts, without plotly validation, and the data derived
+    from them (None if the layer has none) if they were built from inputs with this key, otherwise None.
+    Validation then happens once, when the traces are added to the figure that is served.
+
+    Returns:
+    - (traces, derived) or None
+    """
+    text = _read_cached(key, cache_path)
+    if text is None:
+        return None
+    try:
+        # Neither JSON document holds a raw newline
+        figure_json, derived_json = text.split('\n', 1)
+        return json.loads(figure_json)['data'], json.loads(derived_json)
+    except (ValueError, KeyError):
+        return None
+
+
+def save_figure(fig, key, cache_path, derived=None):
+    """
+    Writes the figure (a layer's traces) to cache_path under key; failures (e.g., a read-only directory) are ignored.
+
+    Parameters:
+    - derived: JSON-serializable data derived from the layer, read back with it by load_cached_layer
+    """
+    header = json.dumps(_header(key))
+    tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(header + '\n' + fig.to_json() + '\n' + json.dumps(derived))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
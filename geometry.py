@@ -0,0 +1,208 @@
+"""
+Polygon geometry for the map layers.
+
+Normalization: the aerodromes.py rings are hand-entered, with repeated vertices, mixed winding and
+some rings left open for fill='toself' to close. normalize_ring() turns them into minimal, closed,
+counter-clockwise rings (the GeoJSON exterior ring convention) and reports what it changed.
+
+Level-of-detail pyramids: the neighbouring FIR boundaries follow the coastline with thousands of
+vertices that render at sub-pixel resolution at the default zoom. Each polygon is simplified with
+Douglas-Peucker at a fixed set of tolerances in metres, and the renderer picks the coarsest level
+whose error stays under half a pixel at the zoom it is drawn for. max_zooms() gives the highest zoom
+each level may be drawn at, so the browser can switch levels as the map zooms (see lod_max_zooms).
+"""
+
+import math
+
+import numpy as np
+
+from coordinates import LatLon, geometry_cache
+
+
+EARTH_CIRCUMFERENCE_M = 40075016.686
+TILE_SIZE_PX = 512      # MapLibre (go.Scattermap) zoom levels use 512 px tiles
+
+# Simplification tolerances in metres; level 0 is the original geometry
+LOD_TOLERANCES_M = (0, 50, 150, 400, 1000, 2500)
+
+
+def metres_per_pixel(zoom, lat=0.0):
+    """Web Mercator ground resolution at a zoom level and latitude."""
+    return EARTH_CIRCUMFERENCE_M * math.cos(math.radians(lat)) / (TILE_SIZE_PX * 2 ** zoom)
+
+
+def _project_m(lat, lon):
+    """Local equirectangular projection to metres around the mean latitude."""
+    lat0 = math.radians(float(np.mean(lat)))
+    return np.asarray(lon) * 111320.0 * math.cos(lat0), np.asarray(lat) * 110574.0
+
+
+def signed_area(lat, lon):
+    """Shoelace area in square degrees (lon as x, lat as y); positive for counter-clockwise rings."""
+    lat = np.asarray(lat, dtype=float)
+    lon = np.asarray(lon, dtype=float)
+    return 0.5 * float(np.sum(lon * np.roll(lat, -1) - np.roll(lon, -1) * lat))
+
+
+def normalize_ring(lat, lon, close_tolerance_nm=60):
+    """
+    Drops consecutive duplicate vertices, closes the ring and makes it counter-clockwise.
+
+    Parameters:
+    - lat, lon: Decimal degrees
+    - close_tolerance_nm: Rings whose first and last vertices are further apart than this are left
+      open and reported, since a long straight closing edge would invent a boundary
+
+    Returns:
+    - (LatLon, report) where report is a dict of what changed:
+      duplicates_removed, closed, reversed, open_gap_nm (only for rings left open) and
+      source_index, the position of each returned vertex in the input (only when it differs from its own)
+    """
+    lat = np.asarray(lat, dtype=float)
+    lon = np.asarray(lon, dtype=float)
+    report = {'duplicates_removed': 0, 'closed': False, 'reversed': False}
+    if len(lat) < 3:
+        return LatLon(lat, lon), report
+
+    index = np.arange(len(lat))
+    repeated = np.zeros(len(lat), dtype=bool)
+    repeated[1:] = (lat[1:] == lat[:-1]) & (lon[1:] == lon[:-1])
+    report['duplicates_removed'] = int(repeated.sum())
+    lat, lon, index = lat[~repeated], lon[~repeated], index[~repeated]
+
+    if lat[0] != lat[-1] or lon[0] != lon[-1]:
+        gap_nm = 60 * math.hypot(lat[-1] - lat[0], (lon[-1] - lon[0]) * math.cos(math.radians(lat[0])))
+        if gap_nm <= close_tolerance_nm:
+            lat, lon, index = np.append(lat, lat[0]), np.append(lon, lon[0]), np.append(index, index[0])
+            report['closed'] = True
+        else:
+            report['open_gap_nm'] = round(gap_nm, 1)
+
+    if signed_area(lat, lon) < 0:
+        lat, lon, index = lat[::-1].copy(), lon[::-1].copy(), index[::-1]
+        report['reversed'] = True
+    if len(index) != len(repeated) or np.any(index != np.arange(len(index))):
+        report['source_index'] = index.tolist()
+    return LatLon(lat, lon), report
+
+
+def douglas_peucker(lat, lon, tolerance_m):
+    """
+    Simplifies a polyline or closed ring, keeping every vertex needed to stay within tolerance_m.
+
+    Parameters:
+    - lat, lon: Decimal degrees; a closed ring repeats its first vertex at the end
+    - tolerance_m: Maximum distance in metres between the original and simplified lines
+
+    Returns:
+    - Boolean mask of the vertices to keep (first and last are always kept)
+    """
+    x, y = _project_m(lat, lon)
+    n = len(x)
+    keep = np.zeros(n, dtype=bool)
+    if n == 0:
+        return keep
+    keep[0] = keep[-1] = True
+
+    stack = [(0, n - 1)]
+    while stack:
+        i, j = stack.pop()
+        if j <= i + 1:
+            continue
+        xs, ys = x[i + 1:j], y[i + 1:j]
+        dx, dy = x[j] - x[i], y[j] - y[i]
+        seg2 = dx * dx + dy * dy
+        if seg2 == 0:
+            # Closed ring (or repeated vertex): measure from the anchor point
+            distances = np.hypot(xs - x[i], ys - y[i])
+        else:
+            t = np.clip(((xs - x[i]) * dx + (ys - y[i]) * dy) / seg2, 0, 1)
+            distances = np.hypot(xs - (x[i] + t * dx), ys - (y[i] + t * dy))
+        k = int(np.argmax(distances))
+        if distances[k] > tolerance_m:
+            split = i + 1 + k
+            keep[split] = True
+            stack.append((i, split))
+            stack.append((split, j))
+    return keep
+
+
+class LODPyramid:
+    """
+    Precomputed simplification levels of one polygon.
+
+    Parameters:
+    - lat, lon: Decimal degrees of the full-resolution polygon
+    - tolerances_m: Tolerance of each level in metres, ascending; the first should be 0
+    """
+
+    def __init__(self, lat, lon, tolerances_m=LOD_TOLERANCES_M):
+        lat = np.asarray(lat, dtype=float)
+        lon = np.asarray(lon, dtype=float)
+        closed = len(lat) > 2 and lat[0] == lat[-1] and lon[0] == lon[-1]
+
+        self.tolerances_m = tuple(tolerances_m)
+        self.levels = []
+        self.indices = []   # positions of each level's vertices in the original polygon
+        for tolerance in self.tolerances_m:
+            keep = douglas_peucker(lat, lon, tolerance) if tolerance > 0 else np.ones(len(lat), dtype=bool)
+            # Never collapse a ring below a triangle; reuse the previous level instead
+            if closed and keep.sum() < 4 and self.levels:
+                self.levels.append(self.levels[-1])
+                self.indices.append(self.indices[-1])
+                continue
+            self.levels.append(LatLon(lat[keep], lon[keep]))
+            self.indices.append(np.flatnonzero(keep))
+        self.lat_mid = float((lat.min() + lat.max()) / 2) if len(lat) else 0.0
+
+    def max_zooms(self, max_pixel_error=0.5):
+        """Returns the highest zoom at which each level stays within max_pixel_error (math.inf for the original geometry)."""
+        # tolerance <= max_pixel_error * metres_per_pixel(zoom, lat_mid), solved for zoom
+        metres = max_pixel_error * metres_per_pixel(0, self.lat_mid)
+        return [math.inf if tolerance == 0 else math.log2(metres / tolerance) for tolerance in self.tolerances_m]
+
+    def level_for_zoom(self, zoom, max_pixel_error=0.5):
+        """Returns the index of the coarsest level whose tolerance fits within max_pixel_error at zoom."""
+        return level_for_zoom(self.max_zooms(max_pixel_error), zoom)
+
+    def for_zoom(self, zoom, max_pixel_error=0.5):
+        """Returns the LatLon of the level to draw at zoom."""
+        return self.levels[self.level_for_zoom(zoom, max_pixel_error)]
+
+
+def level_for_zoom(max_zooms, zoom):
+    """Returns the coarsest level that may be drawn at zoom, given the highest zoom of each level (see max_zooms)."""
+    return max(level for level, max_zoom in enumerate(max_zooms) if zoom <= max_zoom)
+
+
+def lod_max_zooms(rings, max_pixel_error=0.5):
+    """
+    Returns the highest zoom at which each LOD level stays within max_pixel_error for every one of several rings,
+    for drawing them as one trace at a common level.
+
+    Parameters:
+    - rings: LatLon (or (lat, lon)) of each ring
+    """
+    return np.min([lod_pyramid(lat, lon).max_zooms(max_pixel_error) for lat, lon in rings], axis=0).tolist()
+
+
+def lod_pyramid(lat, lon):
+    """Returns the LOD pyramid of a polygon, built once per distinct geometry via the shared geometry cache."""
+    lat = np.ascontiguousarray(lat, dtype=float)
+    lon = np.ascontiguousarray(lon, dtype=float)
+    return geometry_cache.get(('lod', lat.tobytes(), lon.tobytes()), lambda: LODPyramid(lat, lon))
+
+
+if __name__ == '__main__':
+    # python geometry.py -> vertex counts per LOD level for the FIR boundaries
+    from dataset_cache import load_dataset
+
+    aero = load_dataset()
+    names = ['SG_FIR_coordinates', 'KL_FIR_coordinates', 'BKK_FIR_coordinates', 'PP_FIR_coordinates',
+             'HCM_FIR_coordinates', 'KOTA_KINABALU_FIR_coordinates', 'UJUNG_PANDANG_FIR', 'JKT_FIR_coordinates']
+    print(f"{'dataset':32s}" + ''.join(f'{t:>8d}m' for t in LOD_TOLERANCES_M))
+    for name in names:
+        pyramid = lod_pyramid(*aero[name])
+        print(f'{name:32s}' + ''.join(f'{len(level.lat):>9d}' for level in pyramid.levels))
+    for zoom in (5, 6.5, 8, 10):
+        print(f'zoom {zoom}: {metres_per_pixel(zoom, 5):.0f} m/px at 5N -> level {pyramid.level_for_zoom(zoom)}')
@@ -0,0 +1,19 @@
+"""
+Content hashes of input files, keying the on-disk caches (dataset_cache, figure_cache).
+
+Standard library only, so the low-level data loader can key its cache without importing the
+figure layer.
+"""
+
+import os
+import hashlib
+
+
+def inputs_hash(paths):
+    """Returns one sha256 hex digest over the names and contents of the given files, in order."""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(os.path.basename(path).encode() + b'\0')
+        with open(path, 'rb') as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
@@ -0,0 +1,256 @@
+"""
+Declarative registry of the map layers.
+
+Each layer is registered with the key of its layer-toggle Checklist value ('AERO', 'FIR', 'SECTOR',
+'WAYPOINT', ...) and a builder function that adds its traces to a figure. A layer is only built
+the first time it is needed, then kept for the life of the process and, when input paths are given,
+on disk next to the figure cache, so a warm start does not build it again either. Data derived from a
+layer's traces (such as the FIR boundaries' LOD levels) is computed with it and cached in the same file.
+
+Traces are always returned in registration order, whichever order the layers were built in.
+index() maps layer keys (and tagged groups such as runway procedures) to trace indices of that
+order, so visibility can be decided with set operations instead of inspecting every trace.
+"""
+
+import threading
+
+import plotly.graph_objects as go
+
+from figure_cache import CACHE_PATH, load_cached_layer, save_figure
+from hashing import inputs_hash
+from parallel_layers import build_layers, layer_traces
+from payload import quantize_traces
+
+
+class TraceIndex:
+    """
+    Trace indices of a figure built from a LayerRegistry, computed once per set of built layers.
+
+    - layers: layer key -> range of trace indices
+    - tagged: (layer key, tag) -> trace indices, for the traces of layers registered with a tag function,
+      such as ('RWY 02L', 'STARs') for runway procedures
+    - initially_visible: indices of the traces that are visible as built
+
+    Parameters:
+    - layer_traces: Layer key -> trace dicts, in trace order
+    - tags: Layer key -> function returning a trace's tag (tuple of strings), or None to leave it untagged
+    """
+
+    def __init__(self, layer_traces, tags=None):
+        tags = tags or {}
+        self.layers = {}
+        self.tagged = {}
+        self.initially_visible = set()
+        start = 0
+        for key, traces in layer_traces.items():
+            self.layers[key] = range(start, start + len(traces))
+            tag_of = tags.get(key)
+            for i, trace in enumerate(traces, start):
+                tag = tag_of(trace) if tag_of else None
+                if tag is not None:
+                    self.tagged.setdefault((key, tuple(tag)), []).append(i)
+                if trace.get('visible', True) is not False:
+                    self.initially_visible.add(i)
+            start += len(traces)
+        self.size = start
+
+    def indices(self, keys=(), tags=()):
+        """Returns the set of trace indices of the given layer keys and (layer key, tag) groups."""
+        result = set()
+        for key in keys:
+            result.update(self.layers.get(key, ()))
+        for tag in tags:
+            result.update(self.tagged.get(tag, ()))
+        return result
+
+    def compact(self, tag_layers=()):
+        """
+        Returns the index as plain JSON data for the browser:
+        {'size': n, 'layers': {key: [start, stop]}, 'tagged': {'<tag joined by |>': [indices]}},
+        with the tagged groups of tag_layers only.
+        """
+        return {
+            'size': self.size,
+            'layers': {key: [r.start, r.stop] for key, r in self.layers.items()},
+            'tagged': {'|'.join(tag): indices for (key, tag), indices in self.tagged.items() if key in tag_layers},
+        }
+
+
+class LayerRegistry:
+    """
+    Parameters:
+    - input_paths: Files the layers are built from (see hashing.inputs_hash); None disables the disk cache
+    - cache_path: Path of the cache files, with {} standing for the layer key (see figure_cache)
+    """
+
+    def __init__(self, input_paths=None, cache_path=CACHE_PATH):
+        self.builders = {}
+        self.precision = {}
+        self.tags = {}
+        self.derivers = {}
+        self.cache_path = cache_path
+        self._input_paths = input_paths
+        self._cache_key = None
+        self._traces = {}
+        self._derived = {}
+        self._indexes = {}
+        self._lock = threading.Lock()
+
+    def register(self, key, builder, precision=None, tag=None, derive=None):
+        """
+        Declares a layer; builder(fig) adds its traces to fig.
+
+        Parameters:
+        - precision: Decimal places the layer's coordinates are rounded to once built (see payload); None keeps full precision
+        - tag: Function returning the tag (tuple of strings) a built trace dict is indexed by in TraceIndex.tagged,
+          or None for an untagged trace; None leaves the whole layer untagged
+        - derive: Function of the layer's built trace dicts returning JSON-serializable data about them, computed when
+          the layer is built and cached with it (see derived()); it runs under the registry lock, so must not call back
+        """
+        self.builders[key] = builder
+        self.precision[key] = precision
+        if tag is not None:
+            self.tags[key] = tag
+        if derive is not None:
+            self.derivers[key] = derive
+
+    def __contains__(self, key):
+        return key in self.builders
+
+    @property
+    def built(self):
+        """Keys of the layers built so far, in registration order."""
+        return [key for key in self.builders if key in self._traces]
+
+    def _layer_cache_path(self, key):
+        return self.cache_path.format(key)
+
+    def _load(self, key):
+        if self._input_paths is None:
+            return None
+        return load_cached_layer(self._cache_key, self._layer_cache_path(key))
+
+    def _save(self, key, traces, derived):
+        if self._input_paths is not None:
+            save_figure(go.Figure(data=traces), self._cache_key, self._layer_cache_path(key), derived)
+
+    def ensure(self, keys, parallel=False):
+        """
+        Builds every layer in keys that has not been built yet.
+
+        Parameters:
+        - parallel: Build several missing layers at once in forked worker processes (see parallel_layers).
+          Only for the startup call: forking from a request thread while holding the lock is unsafe
+
+        Returns:
+        - List of the keys built by this call (empty when all were already available)
+        """
+        with self._lock:
+            missing = [key for key in self.builders if key in keys and key not in self._traces]
+            if not missing:
+                return []
+            if self._input_paths is not None and self._cache_key is None:
+                self._cache_key = inputs_hash(self._input_paths)
+
+            to_build = []
+            for key in missing:
+                cached = self._load(key)
+                if cached is None:
+                    to_build.append(key)
+                else:
+                    self._traces[key], self._derived[key] = cached
+
+            builders = [self.builders[key] for key in to_build]
+            if parallel:
+                built = build_layers(builders)
+            else:
+                built = [layer_traces(builder) for builder in builders]
+            for key, traces in zip(to_build, built):
+                traces = quantize_traces(traces, self.precision[key])
+                derive = self.derivers.get(key)
+                self._traces[key] = traces
+                self._derived[key] = derive(traces) if derive else None
+                self._save(key, traces, self._derived[key])
+            return missing
+
+    def traces(self, keys=None):
+        """Returns the trace dicts of the built layers (restricted to keys if given), in registration order."""
+        with self._lock:
+            return [trace for key in self.builders if key in self._traces and (keys is None or key in keys)
+                    for trace in self._traces[key]]
+
+    def derived(self, key):
+        """Returns the data derived from a built layer by its derive function (None if it has none or is not built)."""
+        with self._lock:
+            return self._derived.get(key)
+
+    def index(self, keys=None):
+        """
+        Returns the TraceIndex of a figure made of the given built layers (default: every layer built so far).
+        Indexes are cached per set of layers: a layer's traces never change once built.
+        """
+        with self._lock:
+            keys = tuple(key for key in self.builders if key in self._traces and (keys is None or key in keys))
+            if keys not in self._indexes:
+                self._indexes[keys] = TraceIndex({key: self._traces[key] for key in keys}, self.tags)
+            return self._indexes[keys]
+
+if __name__ == '__main__':
+    # python layers.py -> update_map visibility: per-trace name/customdata checks vs the trace index, at 1x and 10x traces
+    import time
+    import itertools
+    from sessions import load_app
+
+    airnav = load_app()
+    airnav.layers.ensure(list(airnav.layers.builders))
+    runways = list(airnav.aero.runway_procedures)
+    states = [(arrival, departure, list(selected))
+              for arrival, departure in itertools.product(runways[:3], runways[3:])
+              for selected in (['AERO', 'FIR'], ['AERO', 'FIR', 'WAYPOINT'], ['SECTOR'], ['AERO', 'FIR', 'SECTOR', 'WAYPOINT'])]
+
+    def by_name(fig, arrival, departure, selected_layers):
+        # The per-trace checks update_map used before the index
+        for trace in fig.data:
+            trace_name = trace.name.lower()
+            trace_data = trace.customdata if trace.customdata else [None, None]
+            trace_rwy = trace_data[0] if len(trace_data) > 0 else None
+            trace_type = trace_data[1] if len(trace_data) > 1 else None
+            trace.visible = bool(
+                (trace_type == 'STARs' and trace_rwy == arrival) or
+                (trace_type == 'SIDs' and trace_rwy == departure) or
+                (trace_rwy == 'static' and 'AERO' in selected_layers) or
+                (trace_rwy in selected_layers) or
+                ('sector' in trace_name and 'SECTOR' in selected_layers) or
+                ('fir' in trace_name and 'FIR' in selected_layers) or
+                '🗺️' in trace.name
+            )
+
+    def by_index(fig, index, shown, arrival, departure, selected_layers):
+        visible = index.indices(
+            keys=[key for key in selected_layers if key in index.layers] + ['NOTE'],
+            tags=[('PROCEDURE', (arrival, 'STARs')), ('PROCEDURE', (departure, 'SIDs'))],
+        )
+        for i in shown ^ visible:
+            fig.data[i].visible = i in visible
+        return visible
+
+    for scale in (1, 10):
+        layer_traces = {key: airnav.layers.traces([key]) * scale for key in airnav.layers.built}
+        fig = go.Figure(data=[trace for traces in layer_traces.values() for trace in traces])
+
+        start = time.perf_counter()
+        for state in states:
+            by_name(fig, *state)
+        name_time = (time.perf_counter() - start) / len(states)
+
+        start = time.perf_counter()
+        index = TraceIndex(layer_traces, airnav.layers.tags)
+        index_build = time.perf_counter() - start
+        shown = index.initially_visible
+        start = time.perf_counter()
+        for state in states:
+            shown = by_index(fig, index, shown, *state)
+        index_time = (time.perf_counter() - start) / len(states)
+
+        print(f'{scale:2d}x ({len(fig.data):4d} traces): name checks {name_time * 1e3:6.2f} ms, '
+              f'index {index_time * 1e3:6.2f} ms per callback (index built once in {index_build * 1e3:.1f} ms)')
@@ -0,0 +1,93 @@
+"""
+Parallel construction of the map layers at startup.
+
+Each layer builder adds its traces to a figure of its own inside a worker process and sends them
+back as plain trace dicts. The parent concatenates them in builder order, so the figure is the same
+whatever order the workers finish in.
+
+Workers are forked: they inherit the already loaded datasets and the builder functions themselves,
+so nothing but the returned trace dicts crosses the process boundary. Where fork is unavailable
+(Windows, macOS defaults) or only one worker would run, the builders run serially instead.
+"""
+
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import plotly.graph_objects as go
+
+
+# Builders of the current build_layers() call, inherited by the forked workers
+_builders = []
+
+
+def layer_traces(builder):
+    """Runs one layer builder on an empty figure and returns its traces as plain dicts."""
+    fig = go.Figure()
+    builder(fig)
+    return [trace.to_plotly_json() for trace in fig.data]
+
+
+def _run(index):
+    return layer_traces(_builders[index])
+
+
+def build_layers(builders, max_workers=None):
+    """
+    Builds every layer and returns their trace dicts, one list per builder in builder order.
+
+    Parameters:
+    - builders: Functions taking a plotly figure and adding one layer's traces to it
+    - max_workers: Worker processes (default: one per builder, capped at the CPU count)
+    """
+    global _builders
+    workers = min(max_workers or os.cpu_count() or 1, len(builders))
+    if workers <= 1 or 'fork' not in multiprocessing.get_all_start_methods():
+        return [layer_traces(builder) for builder in builders]
+
+    _builders = list(builders)
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork')) as pool:
+            return list(pool.map(_run, range(len(builders))))
+    finally:
+        _builders = []
+
+
+if __name__ == '__main__':
+    # python parallel_layers.py -> serial vs parallel layer construction of the map
+    import time
+    from sessions import load_app
+    from coordinates import geometry_cache
+
+    airnav = load_app()
+    builders = list(airnav.layers.builders.values())
+
+    def timed(build):
+        geometry_cache.clear()      # every run starts from unparsed geometry
+        start = time.perf_counter()
+        fig = build()
+        return time.perf_counter() - start, fig
+
+    def serial():
+        fig = go.Figure()
+        for builder in builders:
+            builder(fig)
+        return fig
+
+    def parallel(workers):
+        return go.Figure(data=[trace for traces in build_layers(builders, workers) for trace in traces])
+
+    serial_time, reference = timed(serial)
+    print(f'{os.cpu_count()} CPU(s), {len(builders)} layers, {len(reference.data)} traces')
+    print(f'serial             : {serial_time * 1e3:6.0f} ms')
+
+    # Lower bound for parallel: slowest layer plus merging the returned dicts into one figure
+    layer_times, layers = zip(*(timed(lambda: layer_traces(builder)) for builder in builders))
+    merge_time, _ = timed(lambda: go.Figure(data=[trace for traces in layers for trace in traces]))
+    print('per layer          : ' + ', '.join(f'{b.__name__} {t * 1e3:.0f}' for b, t in zip(builders, layer_times)) + ' ms')
+    print(f'merge              : {merge_time * 1e3:6.0f} ms -> parallel lower bound '
+          f'{(max(layer_times) + merge_time) * 1e3:.0f} ms with one core per layer')
+    for workers in sorted({2, len(builders)}):
+        elapsed, fig = timed(lambda: parallel(workers))
+        identical = fig.to_json() == reference.to_json()
+        print(f'parallel ({workers} workers): {elapsed * 1e3:6.0f} ms (identical: {identical})')
@@ -0,0 +1,95 @@
+"""
+Size and encoding of the figure payload sent to the browser.
+
+Builders keep coordinates at full float precision, so every vertex is serialized with up to 17
+significant digits, or as a base64 float64 array. Far fewer decimals are needed on the map:
+
+    decimals   resolution
+       3         ~110 m
+       4          ~11 m      FIR and sector outlines
+       5         ~1.1 m      runways, airports, procedures, waypoints
+
+quantize_traces() rounds the lat/lon arrays of a layer's trace dicts once, when the layer is built
+(LayerRegistry.register(..., precision=)), so the cached layers, the initial figure and every
+callback response carry the short form. Rounded arrays are plain lists: a 5 decimal coordinate is
+~10 characters of JSON, about as small as a base64 float32 and without float32 rounding artefacts.
+
+Dash serializes callback responses through plotly.io.json.to_json_plotly; use_fast_encoder() makes
+it use orjson rather than the json module whenever orjson is installed.
+"""
+
+import numpy as np
+import plotly.io as pio
+
+
+COORDINATE_KEYS = ('lat', 'lon')
+
+
+def quantize(values, decimals):
+    """
+    Returns coordinate values rounded to decimals, as a plain list.
+
+    Parameters:
+    - values: NumPy array or list of decimal degrees; None entries (gaps between rings) are kept
+    - decimals: Decimal places to keep
+    """
+    if isinstance(values, np.ndarray):
+        return np.round(values.astype(float), decimals).tolist()
+    return [None if value is None else round(float(value), decimals) for value in values]
+
+
+def quantize_traces(traces, decimals):
+    """Returns copies of the trace dicts with lat/lon rounded to decimals (decimals=None: traces unchanged)."""
+    if decimals is None:
+        return traces
+    return [{**trace, **{key: quantize(trace[key], decimals) for key in COORDINATE_KEYS if trace.get(key) is not None}}
+            for trace in traces]
+
+
+def use_fast_encoder():
+    """
+    Makes plotly, and therefore Dash responses, encode JSON with orjson when it is installed.
+
+    Returns:
+    - Name of the engine in use ('orjson' or 'json')
+    """
+    try:
+        import orjson  # noqa: F401
+    except ImportError:
+        pio.json.config.default_engine = 'json'
+        return 'json'
+    pio.json.config.default_engine = 'orjson'
+    return 'orjson'
+
+
+if __name__ == '__main__':
+    # python payload.py -> figure size and encode time: full precision vs quantized, json vs orjson
+    import time
+    from sessions import load_app
+    import plotly.graph_objects as go
+    from plotly.io.json import to_json_plotly
+    from parallel_layers import layer_traces
+
+    airnav = load_app()
+    airnav.layers.ensure(list(airnav.layers.builders))
+
+    def encode_time(fig, engine, repeat=20):
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            to_json_plotly(fig, engine=engine)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    full = {key: layer_traces(builder) for key, builder in airnav.layers.builders.items()}
+    for label, keys in (('startup figure', airnav.initial_map_index['keys']), ('all layers', list(full))):
+        figures = {
+            'full precision': go.Figure(data=[trace for key in keys for trace in full[key]]),
+            'quantized': go.Figure(data=airnav.layers.traces(keys)),
+        }
+        print(f'{label} ({len(figures["quantized"].data)} traces):')
+        for name, fig in figures.items():
+            size = len(to_json_plotly(fig).encode())
+            times = ', '.join(f'{engine} {encode_time(fig, engine) * 1e3:5.2f} ms' for engine in ('json', 'orjson'))
+            print(f'  {name:14s}: {size / 1024:6.1f} KiB, {times}')
+    print(f'engine used by the app: {pio.json.config.default_engine}')
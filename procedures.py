@@ -0,0 +1,135 @@
+"""
+Compiled polyline table for the STARs and SIDs.
+
+Every procedure's waypoint names are resolved through STAR_SID_waypoints once, and all routes are
+stored back to back in two contiguous float64 arrays. offsets[i]:offsets[i + 1] is the slice of
+procedure i, so rendering, distance and routing code all read the same arrays without re-parsing.
+The leg distances and along-track distances of all procedures are computed from them once, in
+metrics (geodesy.procedure_metrics).
+
+Fixes missing from STAR_SID_waypoints are not silently dropped: they are listed per procedure in
+unresolved, and procedures that resolve to no points at all (e.g. an empty SID entry) in empty.
+"""
+
+import functools
+
+import numpy as np
+
+from coordinates import LatLon, geometry_cache
+from geodesy import procedure_metrics
+
+
+PROCEDURE_TYPES = ('STARs', 'SIDs')
+
+
+class ProcedureTable:
+    """
+    Parameters:
+    - procedures: Mapping of procedure type ('STARs', 'SIDs') to {procedure name: [fix names]}
+    - waypoints: Mapping of fix name to coordinate pair (e.g., STAR_SID_waypoints)
+    """
+
+    def __init__(self, procedures, waypoints):
+        self.names, self.types, self.fixes = [], [], []
+        self.unresolved = {}
+        lats, lons, offsets = [], [], [0]
+
+        for proc_type, proc_dict in procedures.items():
+            for name, fix_names in proc_dict.items():
+                resolved = [fix for fix in fix_names if fix in waypoints]
+                missing = [fix for fix in fix_names if fix not in waypoints]
+                if missing:
+                    self.unresolved[name] = missing
+                for fix in resolved:
+                    lat, lon = geometry_cache.point(waypoints[fix])
+                    lats.append(lat), lons.append(lon)
+                self.names.append(name)
+                self.types.append(proc_type)
+                self.fixes.append(resolved)
+                offsets.append(len(lats))
+
+        self.lat = np.array(lats, dtype=float)
+        self.lon = np.array(lons, dtype=float)
+        self.offsets = np.array(offsets, dtype=np.int64)
+        for array in (self.lat, self.lon, self.offsets):
+            array.setflags(write=False)
+        self._index = {name: i for i, name in enumerate(self.names)}
+
+        lengths = np.diff(self.offsets)
+        self.empty = [name for name, n in zip(self.names, lengths) if n == 0]
+        # Leg and along-track distances of every procedure (haversine), in one vectorized pass
+        self.metrics = procedure_metrics(self)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def _slice(self, name):
+        i = self._index[name]
+        return slice(self.offsets[i], self.offsets[i + 1])
+
+    def route(self, name):
+        """Returns the LatLon of a procedure (read-only views into the table arrays)."""
+        s = self._slice(name)
+        return LatLon(self.lat[s], self.lon[s])
+
+    def fixes_of(self, name):
+        """Returns the resolved fix names of a procedure, parallel to route(name)."""
+        return self.fixes[self._index[name]]
+
+    def along_track_nm(self, name):
+        """Returns the distance flown to each fix of a procedure from its first fix, parallel to route(name)."""
+        return self.metrics.along_track_nm[self._slice(name)]
+
+    def type_of(self, name):
+        """Returns 'STARs' or 'SIDs'."""
+        return self.types[self._index[name]]
+
+    def legs(self):
+        """
+        Returns (start, stop) vertex indices of every leg in the table, as two int arrays.
+        A leg joins consecutive fixes of the same procedure, so no leg crosses between procedures.
+        """
+        stops = np.arange(1, len(self.lat))
+        same_procedure = np.isin(stops, self.offsets[1:-1], invert=True)
+        return stops[same_procedure] - 1, stops[same_procedure]
+
+    def problems(self):
+        """Returns a list of human-readable messages for procedures with missing or no fixes."""
+        messages = [f'{self.type_of(name)} {name}: no fixes resolved' for name in self.empty]
+        messages += [f'{self.type_of(name)} {name}: unresolved fixes {missing}'
+                     for name, missing in self.unresolved.items() if name not in self.empty]
+        return messages
+
+    @classmethod
+    def from_dataset(cls, dataset):
+        """
+        Builds the table from the aerodromes STARs, SIDs and STAR_SID_waypoints.
+
+        Parameters:
+        - dataset: aerodromes datasets (dataset_cache.CompiledDataset or the aerodromes module)
+        """
+        procedures = {proc_type: getattr(dataset, proc_type) for proc_type in PROCEDURE_TYPES}
+        return cls(procedures, dataset.STAR_SID_waypoints)
+
+
+@functools.lru_cache(maxsize=1)
+def load_procedure_table():
+    """Returns the process-wide procedure table, built on first call."""
+    from dataset_cache import load_dataset
+    return ProcedureTable.from_dataset(load_dataset())
+
+
+if __name__ == '__main__':
+    # python procedures.py -> table summary and any broken procedures
+    table = load_procedure_table()
+    start, stop = table.legs()
+    print(f'{len(table)} procedures, {len(table.lat)} fixes, {len(start)} legs, '
+          f'{table.metrics.legs.distance_nm.sum():.0f} NM in total')
+    for message in table.problems() or ['all procedures resolved']:
+        print(f'  {message}')
@@ -0,0 +1,252 @@
+"""
+Simulated browser sessions of the Dash app, for checking update_map without a browser.
+
+A Session holds what one browser tab holds: its own copy of the figure and of the map-index,
+map-visible and layer-request stores. interact() runs the visibility callback through its Python
+twin (browser_visibility), calls update_map with the tab's inputs and applies the returned Patches
+to the copy the way dash-renderer does, so the figure a user would see can be compared across runs
+and threads.
+"""
+
+import os
+import gc
+import json
+import random
+import hashlib
+import functools
+import importlib.util
+import tracemalloc
+
+import dash
+from dash._utils import to_json
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(HERE, 'airnav_1.4.1.py')
+
+# Layers a user can toggle
+TOGGLES = ['AERO', 'FIR', 'SECTOR', 'WAYPOINT']
+
+# Memory a soak may gain per update_map call after its first checkpoint: allocator noise stays around 1 KiB
+# over thousands of calls, while anything update_map keeps for good costs at least an object (~50 bytes) per call
+SOAK_GROWTH_PER_CALL = 16
+
+
+@functools.lru_cache(maxsize=1)
+def load_app():
+    """Returns the app module (airnav_1.4.1.py, whose file name is not importable), loaded once per process."""
+    spec = importlib.util.spec_from_file_location('airnav', APP_PATH)
+    app = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(app)
+    return app
+
+
+def apply_patch(figure, patch):
+    """
+    Applies a serialized dash.Patch to a plain figure dict in place, like dash-renderer does.
+
+    Parameters:
+    - figure: Figure as plain JSON data (e.g., json.loads(to_json(fig)))
+    - patch: Patch as plain JSON data; only the Assign and Insert operations update_map uses are supported
+    """
+    for operation in patch['operations']:
+        *path, last = operation['location']
+        target = figure
+        for key in path:
+            target = target[key]
+        if operation['operation'] == 'Assign':
+            target[last] = operation['params']['value']
+        elif operation['operation'] == 'Insert':
+            target[last].insert(operation['params']['index'], operation['params']['value'])
+        else:
+            raise ValueError(f"Unsupported patch operation {operation['operation']!r}")
+    return figure
+
+
+def browser_visibility(arrival, departure, selected_layers, map_index, map_visible):
+    """
+    Python twin of the app's clientside visibility callback (airnav visibility_js), for running sessions without a browser.
+
+    Returns:
+    - (patch, map-visible, layer-request) as the callback returns them, with None for no_update
+    """
+    selected = selected_layers or []
+    if any(key not in map_index['layers'] for key in selected):
+        return None, None, selected
+
+    visible = set()
+    for key in selected + ['NOTE']:
+        visible.update(range(*map_index['layers'][key]))
+    for tag in (f'{arrival}|STARs', f'{departure}|SIDs'):
+        visible.update(map_index['tagged'].get(tag, []))
+
+    same_figure = map_visible['keys'] == map_index['keys']
+    shown = set(map_visible['visible'])
+    operations = [{'operation': 'Assign', 'location': ['data', i, 'visible'], 'params': {'value': i in visible}}
+                  for i in range(map_index['size']) if not same_figure or (i in shown) != (i in visible)]
+    patch = {'__dash_patch_update': '__dash_patch_update', 'operations': operations}
+    return patch, {'keys': map_index['keys'], 'visible': sorted(visible)}, None
+
+
+class Session:
+    """
+    Parameters:
+    - app: The loaded airnav module (base_figure, the initial stores and update_map)
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.figure = json.loads(to_json(app.base_figure))
+        self.map_index = json.loads(to_json(app.initial_map_index))
+        self.map_visible = json.loads(to_json(app.initial_map_visible))
+        self.layer_request = None
+        self.radius_nm = app.default_radius_nm
+        self.server_calls = 0
+
+    def _browser(self, arrival, departure, selected_layers):
+        patch, map_visible, layer_request = browser_visibility(arrival, departure, selected_layers, self.map_index, self.map_visible)
+        if patch is not None:
+            apply_patch(self.figure, patch)
+            self.map_visible = map_visible
+        changed = layer_request is not None and layer_request != self.layer_request
+        if layer_request is not None:
+            self.layer_request = layer_request
+        return changed
+
+    def _server(self):
+        self.server_calls += 1
+        patch, map_index = self.app.update_map(self.layer_request, self.radius_nm, self.map_index)
+        if map_index is dash.no_update:
+            return False
+        # Round trip through JSON: the browser only ever sees the serialized response
+        apply_patch(self.figure, json.loads(to_json(patch)))
+        self.map_index = json.loads(to_json(map_index))
+        return True
+
+    def interact(self, arrival, departure, selected_layers, radius_nm):
+        """
+        Sets the controls as a user would and runs the callbacks Dash would fire: the browser visibility callback,
+        and update_map when the radius or the layer request changes (then the browser callback again for a new map-index).
+        """
+        request_changed = self._browser(arrival, departure, selected_layers)
+        radius_changed = radius_nm != self.radius_nm
+        self.radius_nm = radius_nm
+        if (request_changed or radius_changed) and self._server():
+            self._browser(arrival, departure, selected_layers)
+
+
+def random_interactions(app, seed, steps, radii=(None, 0, 25, 50, 75, 100)):
+    """Returns steps random Session.interact() arguments (runways, toggled layers and radius), reproducible from seed."""
+    rng = random.Random(seed)
+    runways = list(app.aero.runway_procedures)
+    return [(rng.choice(runways), rng.choice(runways), rng.sample(TOGGLES, rng.randint(0, len(TOGGLES))), rng.choice(radii))
+            for _ in range(steps)]
+
+
+def run_session(app, interactions):
+    """Runs the interactions in a new Session and returns its final figure as JSON text."""
+    session = Session(app)
+    for inputs in interactions:
+        session.interact(*inputs)
+    return to_json(session.figure)
+
+
+def soak(app, steps, checkpoint, seed=0):
+    """
+    Runs one session through steps random interactions, most of them with a new radius, and samples the figure's
+    trace count and the memory traced by tracemalloc every checkpoint steps. map_response's LRU cache is bypassed,
+    since the responses it keeps (up to response_cache_size) would otherwise count as growth.
+
+    Returns:
+    - List of (step, update_map calls so far, traces in the session's figure, bytes traced) samples
+    """
+    rng = random.Random(seed)
+    runways = list(app.aero.runway_procedures)
+    session = Session(app)
+    samples = []
+    cached = app.map_response
+    app.map_response = cached.__wrapped__
+    tracemalloc.start()
+    try:
+        for step in range(1, steps + 1):
+            session.interact(rng.choice(runways), rng.choice(runways), rng.sample(TOGGLES, rng.randint(0, len(TOGGLES))),
+                             rng.choice([None, rng.randint(0, 500)]))
+            if step % checkpoint == 0:
+                gc.collect()
+                samples.append((step, session.server_calls, len(session.figure['data']), tracemalloc.get_traced_memory()[0]))
+    finally:
+        tracemalloc.stop()
+        app.map_response = cached
+    return samples
+
+
+def figure_digest(figure):
+    """Returns the sha256 hex digest of a figure's JSON, for checking that it was not modified."""
+    return hashlib.sha256(to_json(figure).encode()).hexdigest()
+
+
+if __name__ == '__main__':
+    # python sessions.py -> parallel sessions with different selections end with the same figures as serial ones,
+    # a 10,000 callback soak keeps the trace count and memory flat, and the update_map response cache's hit rate
+    import sys
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    airnav = load_app()
+    base_digest = figure_digest(airnav.base_figure)
+    runways = list(airnav.aero.runway_procedures)
+    sessions, steps = 16, 200
+    scripts = [random_interactions(airnav, seed, steps) for seed in range(sessions)]
+
+    # All sessions at once (switching threads as often as possible, while layers are still being built),
+    # then the same scripts one session at a time as the reference
+    sys.setswitchinterval(1e-6)
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        concurrent = list(pool.map(lambda script: run_session(airnav, script), scripts))
+    sys.setswitchinterval(0.005)
+    expected = [run_session(airnav, script) for script in scripts]
+
+    differing = [seed for seed in range(sessions) if concurrent[seed] != expected[seed]]
+    print(f'{sessions} sessions x {steps} interactions in parallel threads: '
+          f'{sessions - len(differing)} identical to their serial run, differing: {differing or "none"}')
+    print(f'distinct final figures: {len(set(expected))}; base figure unchanged: {figure_digest(airnav.base_figure) == base_digest}')
+    assert not differing and figure_digest(airnav.base_figure) == base_digest
+
+    # Soak: one session, a new radius (and random selections) on most callbacks
+    soak_steps, checkpoint = 10_000, 2_000
+    samples = soak(airnav, soak_steps, checkpoint)
+    _, baseline_calls, _, baseline = samples[0]
+    for step, calls, traces, traced in samples:
+        print(f'soak {step:6d} callbacks ({calls} update_map calls): {traces} traces, '
+              f'{traced / 1024:8.1f} KiB traced ({(traced - baseline) / 1024:+.1f} KiB since {checkpoint})')
+    assert len({traces for _, _, traces, _ in samples}) == 1, 'the trace count changed during the soak'
+    assert all(traced - baseline < SOAK_GROWTH_PER_CALL * (calls - baseline_calls) for _, calls, _, traced in samples[1:]), \
+        'memory grew during the soak'
+
+    # Response cache: server time per update_map call (including Dash's encoding) without and with map_response's LRU
+    timings = []
+    update_map, map_response = airnav.update_map, airnav.map_response
+
+    def timed_update_map(*args):
+        start = time.perf_counter()
+        figure, map_index = update_map(*args)
+        to_json({'multi': True, 'response': {'map': {'figure': figure}, 'map-index': {'data': map_index}}})
+        timings.append(time.perf_counter() - start)
+        return figure, map_index
+
+    airnav.update_map = timed_update_map
+    radii = [None, 25, 50, 100, 150, 200, 250]
+    for label, response in (('uncached', map_response.__wrapped__), ('cached', map_response)):
+        airnav.map_response = response
+        map_response.cache_clear()
+        rng = random.Random(0)
+        timings.clear()
+        for user in range(50):
+            session = Session(airnav)
+            for _ in range(40):
+                session.interact(rng.choice(runways), rng.choice(runways),
+                                 rng.sample(TOGGLES, rng.randint(0, len(TOGGLES))), rng.choice(radii))
+        info = map_response.cache_info()
+        print(f'{label:8s}: {len(timings)} update_map calls, {sum(timings) / len(timings) * 1e3:.3f} ms each '
+              f'(total {sum(timings) * 1e3:.0f} ms), {info.hits} cache hits, {info.currsize} responses cached')
+    airnav.update_map, airnav.map_response = update_map, map_response
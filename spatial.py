@@ -0,0 +1,168 @@
+"""
+Uniform-grid spatial index for point features (waypoints, airports, aerodrome reference points).
+
+Points are bucketed into fixed-size lat/lon cells. A query only scans the cells covering the
+bounding box of the search circle and then filters candidates by great-circle distance, so
+radius and k-nearest lookups stay well under a millisecond for click-to-identify and range queries.
+"""
+
+import os
+import math
+import functools
+from typing import NamedTuple
+
+import numpy as np
+
+from coordinates import geometry_cache
+from geodesy import EARTH_RADIUS_NM, haversine_nm
+
+
+class Match(NamedTuple):
+    name: str
+    kind: str
+    lat: float
+    lon: float
+    distance_nm: float
+
+
+class SpatialIndex:
+    """
+    Parameters:
+    - names: Point names (e.g., 'ABVIP', 'WMKK')
+    - lat, lon: Decimal degrees
+    - kinds: Optional category per point (e.g., 'WAYPOINT', 'AIRPORT')
+    - cell_deg: Grid cell size in degrees
+    """
+
+    def __init__(self, names, lat, lon, kinds=None, cell_deg=0.25):
+        self.names = list(names)
+        self.kinds = list(kinds) if kinds is not None else [''] * len(self.names)
+        self.lat = np.asarray(lat, dtype=float)
+        self.lon = np.asarray(lon, dtype=float)
+        self.cell_deg = cell_deg
+
+        # Cell -> indices of the points it contains
+        rows = np.floor(self.lat / cell_deg).astype(np.int64)
+        cols = np.floor(self.lon / cell_deg).astype(np.int64)
+        cells = {}
+        for i, cell in enumerate(zip(rows.tolist(), cols.tolist())):
+            cells.setdefault(cell, []).append(i)
+        self._cells = {cell: np.array(idx, dtype=np.int64) for cell, idx in cells.items()}
+
+    def __len__(self):
+        return len(self.names)
+
+    def _candidates(self, lat, lon, radius_nm):
+        """Indices of all points inside the lat/lon bounding box of the search circle."""
+        dlat = radius_nm / 60
+        # Widest longitude span of a small circle of angular radius d at latitude lat: asin(sin d / cos lat)
+        d = radius_nm / EARTH_RADIUS_NM
+        max_lat = min(abs(lat) + dlat, 90)
+        ratio = math.sin(d) / math.cos(math.radians(max_lat)) if max_lat < 90 else 2
+        dlon = math.degrees(math.asin(ratio)) if ratio < 1 else 180
+
+        row_min, row_max = math.floor((lat - dlat) / self.cell_deg), math.floor((lat + dlat) / self.cell_deg)
+        col_min, col_max = math.floor((lon - dlon) / self.cell_deg), math.floor((lon + dlon) / self.cell_deg)
+
+        # A box spanning more cells than the index has occupied ones is cheaper to brute force
+        if (row_max - row_min + 1) * (col_max - col_min + 1) > len(self._cells):
+            return np.arange(len(self.names))
+
+        found = [self._cells[(r, c)]
+                 for r in range(row_min, row_max + 1)
+                 for c in range(col_min, col_max + 1)
+                 if (r, c) in self._cells]
+        return np.concatenate(found) if found else np.empty(0, dtype=np.int64)
+
+    def _matches(self, idx, distances):
+        order = np.argsort(distances, kind='stable')
+        return [Match(self.names[i], self.kinds[i], float(self.lat[i]), float(self.lon[i]), float(distances[j]))
+                for j, i in ((j, idx[j]) for j in order)]
+
+    def within_radius(self, lat, lon, radius_nm):
+        """
+        Returns every point within radius_nm (great-circle) of (lat, lon), nearest first.
+        """
+        idx = self._candidates(lat, lon, radius_nm)
+        distances = haversine_nm(lat, lon, self.lat[idx], self.lon[idx])
+        inside = distances <= radius_nm
+        return self._matches(idx[inside], distances[inside])
+
+    def nearest(self, lat, lon, k=1):
+        """
+        Returns the k points nearest to (lat, lon), nearest first.
+        The search radius starts at one grid cell and doubles until it holds k points,
+        at which point all of the k nearest are guaranteed to be inside it.
+        """
+        k = min(k, len(self.names))
+        if k <= 0:
+            return []
+        radius_nm = self.cell_deg * 60
+        while True:
+            idx = self._candidates(lat, lon, radius_nm)
+            distances = haversine_nm(lat, lon, self.lat[idx], self.lon[idx])
+            inside = distances <= radius_nm
+            if inside.sum() >= k:
+                break
+            if len(idx) == len(self.names):
+                inside[:] = True
+                break
+            radius_nm *= 2
+        idx, distances = idx[inside], distances[inside]
+        nearest = np.argsort(distances, kind='stable')[:k]
+        return self._matches(idx[nearest], distances[nearest])
+
+    @classmethod
+    def from_sources(cls, dataset, airports, **kwargs):
+        """
+        Builds the index from the map's point sources.
+
+        Parameters:
+        - dataset: aerodromes datasets (dataset_cache.CompiledDataset or the aerodromes module)
+        - airports: DataFrame read from airports.csv (Name, ICAO, Latitude, Longitude)
+        """
+        names, lats, lons, kinds = [], [], [], []
+
+        for name, coordinate in dataset.combined_waypoints.items():
+            lat, lon = geometry_cache.point(coordinate)
+            names.append(name), lats.append(lat), lons.append(lon), kinds.append('WAYPOINT')
+
+        # Aerodrome reference points: X_lat / X_lon pairs (WSSS_lat, WSSL_lat, ..., sudong_lat)
+        for name in dir(dataset):
+            if name.endswith('_lat') and name.count('_') == 1:
+                names.append(name[:-4]), kinds.append('AERODROME')
+                lats.append(float(getattr(dataset, name)))
+                lons.append(float(getattr(dataset, name[:-4] + '_lon')))
+
+        names += airports['ICAO'].tolist()
+        lats += airports['Latitude'].astype(float).tolist()
+        lons += airports['Longitude'].astype(float).tolist()
+        kinds += ['AIRPORT'] * len(airports)
+
+        return cls(names, lats, lons, kinds, **kwargs)
+
+
+@functools.lru_cache(maxsize=1)
+def load_point_index(airports_path=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'airports.csv')):
+    """Returns the process-wide index of waypoints, aerodromes and airports.csv, built on first call."""
+    import pandas as pd
+    from dataset_cache import load_dataset
+    return SpatialIndex.from_sources(load_dataset(), pd.read_csv(airports_path))
+
+
+if __name__ == '__main__':
+    # python spatial.py -> query latency benchmark
+    import timeit
+
+    index = load_point_index()
+    lat, lon = 1.359189613098253, 103.98934153635464    # WSSS
+    runs = 2000
+    for label, query in [
+        ('nearest k=1', lambda: index.nearest(lat, lon, k=1)),
+        ('nearest k=10', lambda: index.nearest(lat, lon, k=10)),
+        ('within 25 NM', lambda: index.within_radius(lat, lon, 25)),
+        ('within 250 NM', lambda: index.within_radius(lat, lon, 250)),
+    ]:
+        seconds = timeit.timeit(query, number=runs) / runs
+        print(f'{label:14s}: {seconds * 1e6:7.1f} us ({len(query())} results)')
+    print(f'{len(index)} points indexed; nearest to WSSS: {index.nearest(lat, lon, k=3)}')
@@ -0,0 +1,41 @@
+"""
+Point-in-airspace classification must agree with matplotlib's Path.contains_points, and rings
+that cannot be closed must be left out.
+"""
+
+import warnings
+
+import numpy as np
+import pytest
+from matplotlib.path import Path
+
+from airspace import FIR_DATASETS, SECTOR_DATASETS, AirspaceClassifier
+from dataset_cache import load_dataset
+
+
+@pytest.fixture(scope='module')
+def aero():
+    return load_dataset()
+
+
+@pytest.mark.parametrize('datasets', [FIR_DATASETS, SECTOR_DATASETS], ids=['FIRs', 'sectors'])
+def test_membership_matches_matplotlib(aero, datasets):
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        classifier = AirspaceClassifier.from_dataset(aero, datasets)
+
+    rng = np.random.default_rng(0)
+    lat, lon = rng.uniform(-6, 16, 5_000), rng.uniform(94, 120, 5_000)
+    membership = classifier.membership(lat, lon)
+    for row, name in zip(membership, classifier.names):
+        ring = aero[datasets[name]]
+        expected = Path(np.column_stack([ring.lon, ring.lat])).contains_points(np.column_stack([lon, lat]))
+        assert np.array_equal(row, expected), name
+
+
+def test_open_ring_is_left_out(aero):
+    with pytest.warns(UserWarning, match='PHNOM PENH FIR'):
+        classifier = AirspaceClassifier.from_dataset(aero, FIR_DATASETS)
+    assert 'PHNOM PENH FIR' in classifier.open_rings
+    assert 'PHNOM PENH FIR' not in classifier.names
+    assert classifier.open_rings['PHNOM PENH FIR'] > 60
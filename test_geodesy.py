@@ -0,0 +1,37 @@
+"""
+Geodesic reference values, and along-track distances of the compiled procedure table.
+"""
+
+import numpy as np
+
+from geodesy import METRES_PER_NM, haversine_nm, inverse, procedure_metrics
+from procedures import ProcedureTable
+
+
+def dms(degrees, minutes, seconds):
+    sign = -1 if degrees < 0 else 1
+    return sign * (abs(degrees) + minutes / 60 + seconds / 3600)
+
+
+def test_vincenty_flinders_peak_to_buninyong():
+    # Geoscience Australia's worked example of Vincenty's inverse formula on the WGS84/GRS80 ellipsoid
+    flinders_peak = dms(-37, 57, 3.72030), dms(144, 25, 29.52440)
+    buninyong = dms(-37, 39, 10.15610), dms(143, 55, 35.38390)
+    legs = inverse(*flinders_peak, *buninyong, method='vincenty')
+
+    assert abs(legs.distance_nm * METRES_PER_NM - 54972.271) < 0.001
+    assert abs(legs.initial_bearing - dms(306, 52, 5.37)) < 1e-5
+
+
+def test_procedure_metrics_restart_at_each_procedure():
+    waypoints = {'A': (1.0, 103.0), 'B': (1.5, 103.0), 'C': (1.5, 104.0), 'D': (2.0, 104.0), 'E': (2.0, 105.0)}
+    table = ProcedureTable({'STARs': {'ONE': ['A', 'B', 'C'], 'EMPTY': ['X'], 'TWO': ['D', 'E', 'C']}}, waypoints)
+    metrics = procedure_metrics(table)
+
+    # One leg per pair of consecutive fixes within a procedure, none across procedures
+    assert len(metrics.legs.distance_nm) == 4
+    for name in ('ONE', 'TWO'):
+        lat, lon = table.route(name)
+        legs = haversine_nm(lat[:-1], lon[:-1], lat[1:], lon[1:])
+        np.testing.assert_allclose(table.along_track_nm(name), np.concatenate(([0.0], np.cumsum(legs))))
+    assert len(table.along_track_nm('EMPTY')) == 0
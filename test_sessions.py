@@ -0,0 +1,142 @@
+"""
+Sessions of the Dash app must stay independent: run concurrently, every session ends with the
+same figure as when it runs alone, and the shared base figure is never modified. A long session
+keeps its trace count and memory flat. The sessions run the visibility callback through its Python
+twin, which must agree with the JavaScript the browser runs.
+"""
+
+import sys
+import json
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+import dash
+import pytest
+from dash._utils import to_json
+
+import sessions
+from sessions import SOAK_GROWTH_PER_CALL, Session, apply_patch, figure_digest, load_app, random_interactions, run_session, soak
+
+
+# Runs a clientside callback on every input list of cases.json, with the parts of window.dash_clientside
+# it uses (Patch.build() gives the serialized form dash-renderer applies), and prints the outputs
+NODE_HARNESS = """
+const fs = require('fs');
+const [source, cases] = process.argv.slice(2).map(path => fs.readFileSync(path, 'utf8'));
+class Patch {
+    constructor() { this.operations = []; }
+    assign(location, value) { this.operations.push({operation: 'Assign', location, params: {value}}); }
+    build() { return {__dash_patch_update: '__dash_patch_update', operations: this.operations}; }
+}
+global.window = {dash_clientside: {no_update: {no_update: true}, Patch}};
+const callback = eval('(' + source + ')');
+const results = JSON.parse(cases).map(args => callback(...args).map(value => value === window.dash_clientside.no_update ? null : value));
+process.stdout.write(JSON.stringify(results));
+"""
+
+
+@pytest.fixture(scope='module')
+def app():
+    return load_app()
+
+
+@pytest.fixture
+def fast_thread_switching():
+    # Switch threads as often as possible so that callbacks of different sessions interleave
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def test_concurrent_sessions_match_serial_runs(app, fast_thread_switching):
+    base_digest = figure_digest(app.base_figure)
+    scripts = [random_interactions(app, seed, steps=200) for seed in range(16)]
+
+    with ThreadPoolExecutor(max_workers=len(scripts)) as pool:
+        concurrent = list(pool.map(lambda script: run_session(app, script), scripts))
+    serial = [run_session(app, script) for script in scripts]
+
+    assert concurrent == serial
+    assert len(set(serial)) > 1, 'the sessions should end with different figures'
+    assert figure_digest(app.base_figure) == base_digest
+
+
+
+def test_invalid_radius_hides_the_ring_until_the_next_valid_one(app):
+    session = Session(app)
+    runway = next(iter(app.aero.runway_procedures))
+    circle = lambda: session.figure['data'][session.map_index['size']]
+
+    for radius_nm in (None, -10):
+        session.interact(runway, runway, app.default_layers, radius_nm)
+        assert circle()['visible'] is False and session.map_index['radius'] is None
+
+    session.interact(runway, runway, app.default_layers, 75)
+    assert circle()['visible'] is True and session.map_index['radius'] == 75
+    assert circle()['name'] == app.radius_circle(75)['name']
+
+
+def test_fir_level_patches_redraw_the_boundaries(app):
+    session = Session(app)
+    fir = range(*session.map_index['layers']['FIR'])
+    initial = [{key: session.figure['data'][i].get(key) for key in ('lat', 'lon', 'customdata')} for i in fir]
+    lod = app.layers.derived('FIR')['traces']
+    levels = app.initial_fir_level
+
+    # Every level of every boundary trace, then back to the level the initial figure draws
+    for level in [*range(len(lod[0]['max_zoom'])), app.initial_fir_level[0]]:
+        requested = [level] * len(lod)
+        patch, levels = app.update_fir_level(requested, session.map_index, levels)
+        if patch is not dash.no_update:
+            apply_patch(session.figure, json.loads(to_json(patch)))
+        for trace in lod:
+            drawn = session.figure['data'][fir.start + trace['offset']]
+            kept = trace['levels'][level] or range(len(trace['lat']))
+            assert drawn['lat'] == [trace['lat'][k] for k in kept] and drawn['lon'] == [trace['lon'][k] for k in kept]
+            assert len(drawn['customdata']) == len(drawn['lat'])
+
+    assert [{key: session.figure['data'][i].get(key) for key in ('lat', 'lon', 'customdata')} for i in fir] == initial
+
+
+def test_soak_keeps_trace_count_and_memory_flat(app):
+    samples = soak(app, steps=4_000, checkpoint=1_000)
+    _, baseline_calls, _, baseline = samples[0]
+
+    assert len({traces for _, _, traces, _ in samples}) == 1
+    # The growth allowed scales with the update_map calls since the baseline, so a short soak is as strict as a long one
+    for _, calls, _, traced in samples[1:]:
+        assert traced - baseline < SOAK_GROWTH_PER_CALL * (calls - baseline_calls)
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='node is not installed')
+def test_browser_visibility_matches_clientside_js(app, monkeypatch, tmp_path):
+    # Record the inputs and outputs of the Python twin over a few random sessions
+    cases, expected = [], []
+
+    def recording_visibility(*args):
+        result = browser_visibility(*args)
+        cases.append(json.loads(json.dumps(args)))
+        expected.append(result)
+        return result
+
+    browser_visibility = sessions.browser_visibility
+    monkeypatch.setattr(sessions, 'browser_visibility', recording_visibility)
+    for seed in range(4):
+        run_session(app, random_interactions(app, seed, steps=100))
+
+    (tmp_path / 'harness.js').write_text(NODE_HARNESS)
+    (tmp_path / 'callback.js').write_text(app.visibility_js)
+    (tmp_path / 'cases.json').write_text(json.dumps(cases))
+    output = subprocess.run(['node', tmp_path / 'harness.js', tmp_path / 'callback.js', tmp_path / 'cases.json'],
+                            capture_output=True, text=True, check=True).stdout
+
+    for (patch, map_visible, layer_request), (js_patch, js_visible, js_request) in zip(expected, json.loads(output), strict=True):
+        assert js_patch == patch
+        assert js_request == layer_request
+        # The browser keeps visible indices in insertion order
+        if map_visible is None:
+            assert js_visible is None
+        else:
+            assert js_visible['keys'] == map_visible['keys'] and sorted(js_visible['visible']) == map_visible['visible']
@@ -0,0 +1,41 @@
+"""
+SpatialIndex queries must return exactly what a brute-force scan of every point returns.
+"""
+
+import numpy as np
+import pytest
+
+from geodesy import haversine_nm
+from spatial import SpatialIndex, load_point_index
+
+
+def random_index(seed, n=2_000):
+    # Dense around the SG FIR with a sparse tail, so some queries stop early and some fall back to brute force
+    rng = np.random.default_rng(seed)
+    lat = np.concatenate([rng.normal(1.5, 1.5, n // 2), rng.uniform(-20, 30, n // 2)])
+    lon = np.concatenate([rng.normal(104, 1.5, n // 2), rng.uniform(80, 130, n // 2)])
+    return SpatialIndex([f'P{i}' for i in range(n)], lat, lon)
+
+
+def queries(seed, n=2_000):
+    rng = np.random.default_rng(seed)
+    return zip(rng.uniform(-25, 35, n), rng.uniform(75, 135, n),
+               rng.integers(1, 25, n).tolist(), rng.uniform(0, 600, n))
+
+
+@pytest.mark.parametrize('index', [random_index(0), load_point_index()], ids=['random', 'map points'])
+def test_queries_match_brute_force(index):
+    for lat, lon, k, radius_nm in queries(1):
+        distances = haversine_nm(lat, lon, index.lat, index.lon)
+
+        found = index.within_radius(lat, lon, radius_nm)
+        assert sorted(match.name for match in found) == sorted(np.array(index.names)[distances <= radius_nm])
+        assert [match.distance_nm for match in found] == sorted(match.distance_nm for match in found)
+
+        nearest = index.nearest(lat, lon, k=k)
+        assert len(nearest) == k
+        np.testing.assert_allclose([match.distance_nm for match in nearest], np.sort(distances)[:k])
+
+
+def test_nearest_without_points():
+    assert SpatialIndex([], [], []).nearest(1.3, 103.9, k=3) == []